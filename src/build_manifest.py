@@ -0,0 +1,189 @@
+"""
+빌드 매니페스트 모듈
+생성된 사이트의 파일 목록과 내용 해시를 기록하고, 두 빌드 사이의 변경분(추가/변경/삭제)을 계산
+"""
+
+import os
+import sys
+import json
+import shutil
+import argparse
+from typing import Iterable, Optional
+
+from src.file_sync import FileHashCache
+
+
+MANIFEST_VERSION = 1
+# 출력 디렉터리 안의 매니페스트 파일 (점 파일은 매니페스트 대상에서 제외)
+MANIFEST_NAME = ".build-manifest.json"
+
+
+def _is_hidden(rel_path: str) -> bool:
+    return any(part.startswith('.') for part in rel_path.split('/'))
+
+
+def build_manifest(site_dir: str, hash_cache: Optional[FileHashCache] = None) -> dict:
+    """
+    사이트 디렉터리의 파일 매니페스트 구성 (배포 디렉터리 스냅숏용, 생성기는 `manifest_from_entries` 사용)
+
+    점으로 시작하는 파일/디렉터리(매니페스트 자신, 임시 파일, 캐시)는 제외한다.
+    hash_cache를 주면 크기/mtime이 같은 파일(복사만 된 오디오 등)은 다시 읽지 않는다.
+
+    Returns:
+        {"version": 1, "files": {상대 경로: {"sha256": 해시, "size": 바이트}}} (경로 정렬)
+    """
+    hasher = hash_cache or FileHashCache()
+    files: dict[str, dict] = {}
+    for root, dirs, names in os.walk(site_dir):
+        dirs[:] = sorted(d for d in dirs if not d.startswith('.'))
+        for name in sorted(names):
+            if name.startswith('.'):
+                continue
+            path = os.path.join(root, name)
+            rel = os.path.relpath(path, site_dir).replace(os.sep, '/')
+            files[rel] = {"sha256": hasher.sha256(path), "size": os.path.getsize(path)}
+    return {"version": MANIFEST_VERSION, "files": dict(sorted(files.items()))}
+
+
+def manifest_from_entries(entries: dict[str, tuple[str, int]]) -> dict:
+    """(경로 → (해시, 크기)) 기록으로 매니페스트 구성 (출력 싱크의 entries: 이번 빌드가 내보낸 파일만)"""
+    files = {rel: {"sha256": digest, "size": size}
+             for rel, (digest, size) in entries.items() if not _is_hidden(rel)}
+    return {"version": MANIFEST_VERSION, "files": dict(sorted(files.items()))}
+
+
+def write_manifest(manifest: dict, path: str) -> None:
+    """매니페스트 기록 (정렬된 키, 시각 정보 없음, 임시 파일 후 교체)"""
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=1, sort_keys=True)
+        f.write('\n')
+    os.replace(tmp_path, path)
+
+
+def load_manifest(path: str) -> dict:
+    """매니페스트 읽기 (파일이 없으면 빈 매니페스트 → 모든 파일이 추가로 보임)"""
+    if not os.path.exists(path):
+        return {"version": MANIFEST_VERSION, "files": {}}
+    with open(path, 'r', encoding='utf-8') as f:
+        manifest = json.load(f)
+    if manifest.get("version") != MANIFEST_VERSION:
+        raise ValueError(f"지원하지 않는 매니페스트 버전: {manifest.get('version')} ({path})")
+    return manifest
+
+
+def diff_manifests(old: dict, new: dict) -> dict[str, list[str]]:
+    """
+    두 매니페스트 비교
+
+    Returns:
+        {"added": [...], "changed": [...], "removed": [...]} (각 목록은 경로 정렬)
+    """
+    old_files = old.get("files", {})
+    new_files = new.get("files", {})
+    added = sorted(set(new_files) - set(old_files))
+    removed = sorted(set(old_files) - set(new_files))
+    changed = sorted(rel for rel in set(old_files) & set(new_files)
+                     if old_files[rel]["sha256"] != new_files[rel]["sha256"])
+    return {"added": added, "changed": changed, "removed": removed}
+
+
+def previous_manifest_path(manifest_path: str) -> str:
+    """직전 빌드 매니페스트 경로 (`.build-manifest.json` → `.build-manifest.prev.json`)"""
+    stem, ext = os.path.splitext(manifest_path)
+    return f"{stem}.prev{ext}"
+
+
+def rotate_and_write(manifest_path: str, manifest: dict) -> Optional[dict]:
+    """
+    기존 매니페스트를 직전 빌드 매니페스트(`*.prev.json`)로 옮기고 새 매니페스트 기록
+
+    Returns:
+        직전 매니페스트와의 차이 (직전 매니페스트가 없으면 None)
+    """
+    delta = None
+    if os.path.exists(manifest_path):
+        delta = diff_manifests(load_manifest(manifest_path), manifest)
+        os.replace(manifest_path, previous_manifest_path(manifest_path))
+    write_manifest(manifest, manifest_path)
+    return delta
+
+
+def stage_delta(site_dir: str, paths: Iterable[str], staging_dir: str) -> int:
+    """변경분(추가/변경 파일)만 스테이징 디렉터리로 복사 (디렉터리 구조 유지)"""
+    count = 0
+    for rel in paths:
+        src = os.path.join(site_dir, *rel.split('/'))
+        dst = os.path.join(staging_dir, *rel.split('/'))
+        os.makedirs(os.path.dirname(dst), exist_ok=True)
+        shutil.copy2(src, dst)
+        count += 1
+    return count
+
+
+def main():
+    """CLI: 빌드 매니페스트 생성/비교"""
+    parser = argparse.ArgumentParser(description="공동번역성서 빌드 매니페스트")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    snap = sub.add_parser("snapshot", help="사이트 디렉터리의 매니페스트 생성")
+    snap.add_argument("site_dir", help="생성된 사이트 루트 (예: output/html)")
+    snap.add_argument(
+        "--output",
+        default=None,
+        help=f"매니페스트 경로 (기본: <site_dir>/{MANIFEST_NAME})",
+    )
+
+    diff = sub.add_parser("diff", help="두 매니페스트의 추가/변경/삭제 파일 출력")
+    diff.add_argument("old", help="이전 빌드 매니페스트 (없으면 모든 파일이 추가)")
+    diff.add_argument("new", help="새 빌드 매니페스트")
+    diff.add_argument(
+        "--stage",
+        default=None,
+        help="추가/변경 파일만 이 디렉터리로 복사 (디렉터리 출력 빌드용)",
+    )
+    diff.add_argument(
+        "--site-dir",
+        default=None,
+        help="새 빌드 사이트 루트 (기본: 새 매니페스트가 있는 디렉터리)",
+    )
+    diff.add_argument(
+        "--json",
+        action="store_true",
+        help="결과를 JSON으로 출력",
+    )
+
+    args = parser.parse_args()
+
+    if args.command == "snapshot":
+        if not os.path.isdir(args.site_dir):
+            print(f"❌ 사이트 디렉터리가 없습니다: {args.site_dir}")
+            sys.exit(1)
+        manifest = build_manifest(args.site_dir)
+        write_manifest(manifest, args.output or os.path.join(args.site_dir, MANIFEST_NAME))
+        print(f"🧾 매니페스트 생성: 파일 {len(manifest['files'])}개")
+        return
+
+    if args.command == "diff":
+        if not os.path.exists(args.new):
+            print(f"❌ 매니페스트가 없습니다: {args.new}")
+            sys.exit(1)
+        delta = diff_manifests(load_manifest(args.old), load_manifest(args.new))
+        if args.json:
+            print(json.dumps(delta, ensure_ascii=False, indent=2))
+        else:
+            for label, key in (("+", "added"), ("~", "changed"), ("-", "removed")):
+                for rel in delta[key]:
+                    print(f"{label} {rel}")
+            print(
+                f"추가 {len(delta['added'])}개, 변경 {len(delta['changed'])}개, 삭제 {len(delta['removed'])}개",
+                file=sys.stderr)
+        if args.stage:
+            site_dir = args.site_dir or os.path.dirname(os.path.abspath(args.new))
+            staged = stage_delta(site_dir, delta["added"] + delta["changed"], args.stage)
+            print(f"📦 스테이징: {staged}개 → {args.stage}", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
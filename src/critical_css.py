@@ -0,0 +1,194 @@
+"""
+크리티컬 CSS 추출 모듈
+장 페이지 첫 화면(고정 헤더, 제목 행, 본문 단락)에 필요한 규칙만 전체 스타일시트에서 골라낸다
+"""
+
+import re
+import hashlib
+
+
+# 생성기가 템플릿 밖에서 만들어 넣는 마크업 (절 span, 이전/다음 버튼, 브레드크럼 목록)
+# 템플릿에는 자리표시자만 있으므로 선택자 판정용 토큰을 여기서 보충한다
+GENERATED_LAYOUT_MARKUP = (
+    '<p class="scripture-paragraph"><span id="v">'
+    '<span aria-hidden="true" class="verse-number">1</span> '
+    '<span class="paragraph-marker" aria-hidden="true">¶</span></span></p>'
+    '<a class="nav-btn" href="#"><svg><path/></svg></a>'
+    '<span class="nav-btn disabled" aria-disabled="true"></span>'
+    '<nav id="bible-breadcrumb"><ul><li><a href="#"></a></li></ul></nav>'
+    '<div class="hidden"></div>'
+)
+
+# 장 템플릿에서 첫 화면으로 보는 구간: <body>부터 본문 자리표시자까지 (head, 본문 뒤 스크립트 제외)
+_FOLD_START = '<body'
+_FOLD_END = '${verses_content}'
+
+# 첫 페인트와 무관한 상호작용/상태 의사 클래스 (해당 선택자는 전체 스타일시트에 맡긴다)
+_DEFERRED_PSEUDO_RE = re.compile(
+    r':(?:hover|focus|focus-visible|focus-within|active|visited|target)\b|::?highlight\(')
+
+_COMMENT_OR_STRING_RE = re.compile(
+    r'("(?:\\.|[^"\\])*"|\'(?:\\.|[^\'\\])*\')|/\*.*?\*/', re.S)
+_TAG_ATTR_RE = re.compile(r'<([a-zA-Z][a-zA-Z0-9-]*)([^>]*)>')
+_CLASS_ATTR_RE = re.compile(r'\bclass\s*=\s*"([^"]*)"')
+_ID_ATTR_RE = re.compile(r'\bid\s*=\s*"([^"$]*)"')
+
+# 결과 캐시: 스타일시트/레이아웃이 같으면 모든 장이 같은 크리티컬 CSS를 쓴다
+_critical_cache: dict[str, str] = {}
+
+
+def _strip_comments(css: str) -> str:
+    """주석 제거 (문자열 리터럴 내부는 보존)"""
+    return _COMMENT_OR_STRING_RE.sub(lambda m: m.group(1) or '', css)
+
+
+def _parse_blocks(css: str) -> list[tuple[str, object]]:
+    """
+    CSS를 최상위 블록 목록으로 분해
+
+    Returns:
+        (프렐류드, 본문) 목록. 본문은 일반 규칙이면 선언 문자열,
+        블록을 가진 @규칙(@media 등)이면 중첩 블록 목록, 세미콜론으로 끝나는 @규칙이면 None
+    """
+    blocks: list[tuple[str, object]] = []
+    i = 0
+    n = len(css)
+    start = 0
+    while i < n:
+        ch = css[i]
+        if ch in '"\'':
+            # 문자열 건너뛰기
+            j = i + 1
+            while j < n and css[j] != ch:
+                j += 2 if css[j] == '\\' else 1
+            i = j + 1
+            continue
+        if ch == ';':
+            prelude = css[start:i].strip()
+            if prelude:
+                blocks.append((prelude, None))
+            start = i + 1
+        elif ch == '{':
+            prelude = css[start:i].strip()
+            depth = 1
+            j = i + 1
+            while j < n and depth:
+                c = css[j]
+                if c in '"\'':
+                    k = j + 1
+                    while k < n and css[k] != c:
+                        k += 2 if css[k] == '\\' else 1
+                    j = k + 1
+                    continue
+                if c == '{':
+                    depth += 1
+                elif c == '}':
+                    depth -= 1
+                j += 1
+            body = css[i + 1:j - 1]
+            if prelude.startswith('@') and '{' in body:
+                blocks.append((prelude, _parse_blocks(body)))
+            else:
+                blocks.append((prelude, body))
+            i = j
+            start = j
+            continue
+        i += 1
+    return blocks
+
+
+def collect_layout_tokens(html: str) -> set[str]:
+    """레이아웃 HTML에서 태그 이름/클래스(.x)/ID(#x) 토큰 수집"""
+    tokens: set[str] = set()
+    for m in _TAG_ATTR_RE.finditer(html):
+        tokens.add(m.group(1).lower())
+        attrs = m.group(2)
+        class_match = _CLASS_ATTR_RE.search(attrs)
+        if class_match:
+            tokens.update('.' + c for c in class_match.group(1).split())
+        id_match = _ID_ATTR_RE.search(attrs)
+        if id_match and id_match.group(1):
+            tokens.add('#' + id_match.group(1))
+    return tokens
+
+
+def above_the_fold_markup(template_html: str) -> str:
+    """
+    장 템플릿의 첫 화면 구간(고정 헤더, 제목 행, 오디오 자리)과 생성 마크업(첫 절, 이전/다음 버튼, 브레드크럼)
+
+    검색 결과 패널/바텀시트/페이지 이동처럼 스크립트가 나중에 만드는 UI는 여기에 없으므로
+    해당 규칙은 크리티컬 CSS에서 빠지고 비동기로 읽는 전체 스타일시트가 적용한다.
+    """
+    start = template_html.find(_FOLD_START)
+    end = template_html.find(_FOLD_END)
+    if start < 0:
+        start = 0
+    if end < start:
+        end = len(template_html)
+    return template_html[start:end] + GENERATED_LAYOUT_MARKUP
+
+
+def _selector_is_critical(selector: str, tokens: set[str]) -> bool:
+    """선택자의 모든 태그/클래스/ID가 레이아웃에 존재하고 상호작용 상태가 아니면 크리티컬"""
+    if _DEFERRED_PSEUDO_RE.search(selector):
+        return False
+    # 속성 선택자/함수 인자는 판정에서 제외
+    simplified = re.sub(r'\[[^\]]*\]|\([^)]*\)', '', selector)
+    for token in re.findall(r'[.#]?-?[_a-zA-Z][_a-zA-Z0-9-]*|:+[a-zA-Z-]+', simplified):
+        if token.startswith(':'):
+            continue
+        if token[0] in '.#':
+            if token not in tokens:
+                return False
+        elif token.lower() not in tokens:
+            return False
+    return True
+
+
+def _compact(text: str) -> str:
+    return ' '.join(text.split())
+
+
+def _select(blocks: list[tuple[str, object]], tokens: set[str]) -> list[str]:
+    out: list[str] = []
+    for prelude, body in blocks:
+        if prelude.startswith('@'):
+            # @media print 등 화면 외 미디어, @import/@keyframes/@font-face는 전체 스타일시트에 맡김
+            if not prelude.lower().startswith('@media') or not isinstance(body, list):
+                continue
+            if re.search(r'\bprint\b', prelude) and not re.search(r'\bscreen\b|\ball\b', prelude):
+                continue
+            inner = _select(body, tokens)
+            if inner:
+                out.append(f"{_compact(prelude)}{{{''.join(inner)}}}")
+            continue
+        selectors = [s.strip() for s in prelude.split(',') if s.strip()]
+        kept = [_compact(s) for s in selectors if _selector_is_critical(s, tokens)]
+        if kept:
+            out.append(f"{','.join(kept)}{{{_compact(str(body))}}}")
+    return out
+
+
+def extract_critical_css(css: str, layout_html: str) -> str:
+    """
+    전체 스타일시트에서 레이아웃 HTML이 쓰는 규칙만 추출
+
+    원본 규칙 순서를 그대로 유지하므로 같은 입력이면 항상 같은 결과를 낸다.
+    결과는 (스타일시트, 레이아웃) 내용 해시로 캐시한다.
+
+    Args:
+        css: 전체 스타일시트 원문
+        layout_html: 첫 화면 레이아웃 HTML (장 템플릿 + 생성 마크업)
+
+    Returns:
+        인라인용으로 공백을 정리한 CSS 문자열
+    """
+    key = hashlib.sha256(
+        css.encode('utf-8') + b'\0' + layout_html.encode('utf-8')).hexdigest()
+    cached = _critical_cache.get(key)
+    if cached is not None:
+        return cached
+    tokens = collect_layout_tokens(layout_html)
+    result = ''.join(_select(_parse_blocks(_strip_comments(css)), tokens))
+    _critical_cache[key] = result
+    return result
@@ -0,0 +1,144 @@
+"""
+파일 동기화 모듈
+정적/오디오 자원을 출력 디렉터리로 복사할 때 바뀌지 않은 파일을 빠르게 건너뛴다
+"""
+
+import os
+import json
+import shutil
+import hashlib
+import threading
+from typing import Optional
+
+
+# 복사 방식: copy(기본) / hardlink(같은 파일 시스템이면 하드 링크) / reflink(CoW 복제 지원 시)
+COPY_MODES = ("copy", "hardlink", "reflink")
+
+# Linux FICLONE ioctl (btrfs/XFS 등 CoW 파일 시스템의 reflink)
+_FICLONE = 0x40049409
+
+
+def sha256_of_file(file_path: str) -> str:
+    """파일의 SHA-256 해시 (1MiB 단위로 읽음)"""
+    hash_obj = hashlib.sha256()
+    with open(file_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b''):
+            hash_obj.update(chunk)
+    return hash_obj.hexdigest()
+
+
+class FileHashCache:
+    """
+    (크기, 수정 시각)으로 검증하는 파일 해시 캐시 (JSON 파일로 유지)
+
+    크기와 mtime이 기록과 같으면 파일을 다시 읽지 않고 기록된 해시를 쓴다.
+    """
+
+    def __init__(self, cache_path: Optional[str] = None):
+        """
+        Args:
+            cache_path: 캐시 JSON 경로 (None이면 메모리만 사용)
+        """
+        self.cache_path = cache_path
+        self._entries: dict[str, list] = {}
+        self._lock = threading.Lock()
+        self._dirty = False
+        if cache_path and os.path.exists(cache_path):
+            try:
+                with open(cache_path, 'r', encoding='utf-8') as f:
+                    self._entries = json.load(f)
+            except (OSError, ValueError):
+                # 손상된 캐시는 버리고 다시 만든다
+                self._entries = {}
+
+    def sha256(self, path: str) -> str:
+        """파일 해시 (크기/mtime이 기록과 같으면 캐시 사용)"""
+        key = os.path.abspath(path)
+        st = os.stat(path)
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry and entry[0] == st.st_size and entry[1] == st.st_mtime_ns:
+            return entry[2]
+        digest = sha256_of_file(path)
+        with self._lock:
+            self._entries[key] = [st.st_size, st.st_mtime_ns, digest]
+            self._dirty = True
+        return digest
+
+    def save(self) -> None:
+        """변경이 있으면 캐시 파일을 원자적으로 기록"""
+        if not self.cache_path or not self._dirty:
+            return
+        os.makedirs(os.path.dirname(self.cache_path) or '.', exist_ok=True)
+        tmp_path = self.cache_path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self._entries, f, ensure_ascii=False, separators=(',', ':'), sort_keys=True)
+        os.replace(tmp_path, self.cache_path)
+        self._dirty = False
+
+
+def same_metadata(src_file: str, dst_file: str) -> bool:
+    """크기와 mtime(ns)이 같으면 같은 파일로 간주 (copy2/copystat이 mtime을 보존하므로)"""
+    try:
+        src_st = os.stat(src_file)
+        dst_st = os.stat(dst_file)
+    except OSError:
+        return False
+    if (src_st.st_dev, src_st.st_ino) == (dst_st.st_dev, dst_st.st_ino):
+        # 이미 같은 파일을 가리키는 하드 링크
+        return True
+    return src_st.st_size == dst_st.st_size and src_st.st_mtime_ns == dst_st.st_mtime_ns
+
+
+def _reflink(src_file: str, dst_file: str) -> bool:
+    """reflink 복제 시도 (미지원 플랫폼/파일 시스템이면 False)"""
+    try:
+        import fcntl
+    except ImportError:
+        return False
+    try:
+        with open(src_file, 'rb') as src, open(dst_file, 'wb') as dst:
+            fcntl.ioctl(dst.fileno(), _FICLONE, src.fileno())
+    except OSError:
+        try:
+            os.remove(dst_file)
+        except OSError:
+            pass
+        return False
+    shutil.copystat(src_file, dst_file)
+    return True
+
+
+def place_file(src_file: str, dst_file: str, mode: str = "copy") -> str:
+    """
+    대상 파일을 소스와 같은 내용으로 만든다
+
+    기존 대상은 먼저 지운다. 대상이 소스의 하드 링크일 때 제자리에 덮어쓰면
+    소스까지 바뀌기 때문이다. hardlink/reflink가 불가능하면 복사로 대체한다.
+
+    Returns:
+        실제 사용한 방식 ("copy" | "hardlink" | "reflink")
+    """
+    if os.path.lexists(dst_file):
+        os.remove(dst_file)
+    if mode == "hardlink":
+        try:
+            os.link(src_file, dst_file)
+            return "hardlink"
+        except OSError:
+            # 다른 파일 시스템/권한 문제 → 복사
+            pass
+    elif mode == "reflink" and _reflink(src_file, dst_file):
+        return "reflink"
+    shutil.copy2(src_file, dst_file)
+    return "copy"
+
+
+def write_bytes(dst_file: str, data: bytes, stat_source: Optional[str] = None) -> None:
+    """대상 파일을 새 내용으로 교체 (하드 링크 대상이면 링크를 끊고 새 파일로 기록)"""
+    if os.path.lexists(dst_file):
+        os.remove(dst_file)
+    with open(dst_file, 'wb') as f:
+        f.write(data)
+    if stat_source:
+        shutil.copystat(stat_source, dst_file)
@@ -5,14 +5,30 @@ HTML 생성기 모듈
 
 import os
 import re
+import sys
 import shutil
+import io
 import hashlib
+import struct
+import tempfile
+from array import array
 from urllib.parse import urlparse
+import atexit
 import argparse
+from concurrent.futures import ThreadPoolExecutor
 from string import Template
-from typing import Optional
+from typing import BinaryIO, Callable, Iterable, Iterator, Optional
 import json
 from src.parser import Chapter, Verse
+from src.critical_css import above_the_fold_markup, extract_critical_css
+from src.minify import MinifyCache, minifier_kind
+from src.file_sync import COPY_MODES, FileHashCache, same_metadata
+from src.output_sink import ArchiveSink, DirectorySink, OutputSink, archive_format, open_sink
+from src.build_manifest import MANIFEST_NAME, manifest_from_entries, rotate_and_write
+from src.pwa_builder import (
+    precache_manifest, render_service_worker, select_book_chapter_files, select_shell_files,
+    stale_precache_manifests,
+)
 
 
 class HtmlGenerator:
@@ -28,6 +44,20 @@ class HtmlGenerator:
         with open(template_path, 'r', encoding='utf-8') as f:
             self.template = Template(f.read())
 
+    def extract_critical_css(self, css_path: str) -> str:
+        """
+        장 템플릿 첫 화면에 필요한 규칙만 스타일시트에서 추출 (모든 장이 레이아웃을 공유하므로 빌드당 1회)
+
+        Args:
+            css_path: 전체 스타일시트 파일 경로
+
+        Returns:
+            `<style>`에 인라인할 CSS 문자열
+        """
+        with open(css_path, 'r', encoding='utf-8') as f:
+            css = f.read()
+        return extract_critical_css(css, above_the_fold_markup(self.template.template))
+
     @staticmethod
     def get_book_order_index(book_abbr: str) -> int:
         """공동번역 약칭/외경 포함 순서를 `data/book_mappings.json`의 나열 순서로 정의한다."""
@@ -52,6 +82,11 @@ class HtmlGenerator:
         books_meta: Optional[list[dict]] = None,
         prev_button_html: str = "",
         next_button_html: str = "",
+        search_meta: Optional[dict] = None,
+        critical_css: Optional[str] = None,
+        asset_manifest: Optional[dict[str, str]] = None,
+        service_worker_url: Optional[str] = None,
+        prefetch_html: str = "",
     ) -> str:
         """
         장을 HTML로 변환
@@ -59,6 +94,11 @@ class HtmlGenerator:
         Args:
             chapter: 변환할 장 데이터
             audio_base_url: 오디오 파일 기본 URL
+            search_meta: 검색 워커에 전달할 인덱스 메타(`window.BIBLE_SEARCH_META`로 주입)
+            critical_css: head에 인라인할 크리티컬 CSS (지정 시 `css_href`는 비동기 로드)
+            asset_manifest: 원래 파일명 → 내용 해시 파일명 매핑 (지정 시 CSS/JS 참조를 해시 이름으로 치환)
+            service_worker_url: 등록할 서비스 워커 URL (지정 시 페이지 로드 후 등록)
+            prefetch_html: `</head>` 앞에 넣을 다음 장 미리 가져오기 힌트 (`_prefetch_hint_html`)
 
         Returns:
             생성된 HTML 문자열
@@ -66,15 +106,190 @@ class HtmlGenerator:
         # 절 HTML 생성 (오디오 슬러그 계산 전, 본문부터 생성)
         verses_html = self._generate_verses_html(chapter)
 
-        # 별칭/슬러그 매핑 주입 데이터 구성 (공동번역 약칭/외경 포함)
+        alias_payload = self._alias_payload()
+        alias_data_script = self._inline_data_script(
+            alias_payload, books_meta, search_meta, service_worker_url)
+
+        audio_path, audio_exists = self._resolve_audio(
+            chapter, audio_base_url, audio_check_base, alias_payload['abbrToSlug'])
+
+        # 템플릿 렌더링
+        css_link_tag, js_script_tag = self._asset_tags(
+            css_href, js_src, critical_css, asset_manifest)
+
+        html = self.template.substitute(
+            book_name=chapter.book_name,
+            chapter_number=chapter.chapter_number,
+            chapter_id=f"{chapter.book_abbr}-{chapter.chapter_number}",
+            verses_content=verses_html,
+            audio_path=audio_path if audio_exists else "#",
+            audio_title=f"{chapter.book_name} {chapter.chapter_number}장 오디오",
+            static_base=static_base,
+            alias_data_script=alias_data_script,
+            css_link_tag=css_link_tag,
+            js_script_tag=js_script_tag,
+            prev_button_html=prev_button_html,
+            next_button_html=next_button_html,
+        )
+
+        # 오디오 파일 존재 여부에 따라 CSS 클래스 조정
+        if audio_exists:
+            html = html.replace('class="audio-unavailable-notice"',
+                                'class="audio-unavailable-notice hidden"')
+        else:
+            html = html.replace('class="audio-player-container"',
+                                'class="audio-player-container hidden"')
+
+        if prefetch_html:
+            # 스타일시트/스크립트보다 뒤에 두어 현재 페이지 자원보다 먼저 요청되지 않게 함
+            html = html.replace('</head>', f'  {prefetch_html}\n  </head>', 1)
+
+        return html
+
+    def generate_shell_html(
+        self,
+        shell_meta: dict,
+        static_base: str = "../static",
+        css_href: Optional[str] = None,
+        js_src: Optional[str] = None,
+        books_meta: Optional[list[dict]] = None,
+        prev_button_html: str = "",
+        next_button_html: str = "",
+        search_meta: Optional[dict] = None,
+        critical_css: Optional[str] = None,
+        asset_manifest: Optional[dict[str, str]] = None,
+        service_worker_url: Optional[str] = None,
+        title: str = "공동번역 성서",
+    ) -> str:
+        """
+        셸 출력 모드의 단일 페이지 생성 (장 본문은 verse-navigator.js가 장 JSON으로 렌더링)
+
+        Args:
+            shell_meta: `window.BIBLE_SHELL`로 주입할 메타 (장 JSON 경로, 첫 장 ID 등)
+            prev_button_html/next_button_html: 렌더링 전 이전/다음 자리에 둘 (비활성) 버튼
+            그 밖의 인자는 `generate_chapter_html`과 같다
+
+        Returns:
+            셸 HTML 문자열
+        """
+        alias_data_script = self._inline_data_script(
+            self._alias_payload(), books_meta, search_meta, service_worker_url, shell_meta)
+        css_link_tag, js_script_tag = self._asset_tags(
+            css_href, js_src, critical_css, asset_manifest)
+
+        html = self.template.substitute(
+            book_name="",
+            chapter_number="",
+            chapter_id="",
+            verses_content="",
+            audio_path="#",
+            audio_title="",
+            static_base=static_base,
+            alias_data_script=alias_data_script,
+            css_link_tag=css_link_tag,
+            js_script_tag=js_script_tag,
+            prev_button_html=prev_button_html,
+            next_button_html=next_button_html,
+        )
+        # 장 정보가 없는 자리표시 텍스트 정리 (제목/검색 예시는 렌더링 시 갱신)
+        html = re.sub(r'<title>.*?</title>', f'<title>{title}</title>', html, count=1, flags=re.S)
+        html = re.sub(r'(<h1 class="chapter-title">).*?(</h1>)', r'\1\2', html, count=1, flags=re.S)
+        # 오디오 영역은 장 JSON을 받은 뒤 결정
+        html = html.replace('class="audio-unavailable-notice"',
+                            'class="audio-unavailable-notice hidden"')
+        html = html.replace('class="audio-player-container"',
+                            'class="audio-player-container hidden"')
+        return html
+
+    def chapter_payload(
+        self,
+        chapter: Chapter,
+        audio_base_url: str = "data/audio",
+        audio_check_base: str | None = None,
+        prev_id: Optional[str] = None,
+        next_id: Optional[str] = None,
+    ) -> dict:
+        """
+        셸 출력 모드의 장 JSON 데이터
+
+        Returns:
+            {"a": 약칭, "b": 책 이름, "c": 장, "v": [[절, 본문, 단락 시작 여부(0/1)], ...],
+             "au": 오디오 URL 또는 None, "p"/"n": 이전/다음 장 ID(`<slug>-<장>`) 또는 None}
+        """
+        audio_path, audio_exists = self._resolve_audio(
+            chapter, audio_base_url, audio_check_base, self._alias_payload()['abbrToSlug'])
+        return {
+            "a": chapter.book_abbr,
+            "b": chapter.book_name,
+            "c": chapter.chapter_number,
+            "v": [[v.number, v.text, 1 if v.has_paragraph else 0] for v in chapter.verses],
+            "au": audio_path if audio_exists else None,
+            "p": prev_id,
+            "n": next_id,
+        }
+
+    def generate_wordpress_fragment(
+        self,
+        chapter: Chapter,
+        audio_url: Optional[str] = None,
+        prev_href: Optional[str] = None,
+        next_href: Optional[str] = None,
+    ) -> str:
+        """
+        워드프레스 게시물 본문(`content`)용 조각: 이전/다음 버튼 + 오디오 + 본문 article
+
+        문서 껍데기(doctype/head/고정 헤더/인라인 별칭 스크립트)는 넣지 않는다.
+        CSS/JS와 검색·브레드크럼은 테마가 제공하고, 제목은 게시물 제목이 대신한다.
+
+        Args:
+            chapter: 변환할 장 데이터
+            audio_url: 미디어 라이브러리의 오디오 URL (없으면 준비 중 안내만 넣음)
+            prev_href/next_href: 이전/다음 장 게시물 URL (없으면 비활성 버튼)
+
+        Returns:
+            게시물 본문 HTML 조각
+        """
+        parts = [
+            '<nav class="chapter-title-row" aria-label="장 이동">',
+            nav_button_html(prev_href, True),
+            nav_button_html(next_href, False),
+            '</nav>',
+            f'<article id="{chapter.book_abbr}-{chapter.chapter_number}">',
+        ]
+        if audio_url:
+            # 오디오가 있는 장은 플레이어만, 없는 장은 안내만 넣는다 (숨김 요소를 싣지 않음)
+            parts += [
+                '<div class="audio-player-container" id="audio-container">',
+                '<h2 class="screen-reader-text">성경 오디오</h2>',
+                '<span class="audio-label" aria-hidden="true">오디오 듣기</span>',
+                f'<audio controls preload="metadata" class="bible-audio" '
+                f'aria-label="{chapter.book_name} {chapter.chapter_number}장 오디오">',
+                f'<source src="{audio_url}" type="audio/mpeg" />',
+                f'<p>브라우저가 오디오 재생을 지원하지 않습니다. <a href="{audio_url}">오디오 파일 다운로드</a></p>',
+                '</audio>',
+                '</div>',
+            ]
+        else:
+            parts += [
+                '<div class="audio-unavailable-notice" id="audio-unavailable">',
+                '<p class="notice-text" aria-live="polite"><span class="icon" aria-hidden="true">🎵</span> '
+                '이 장의 오디오는 현재 준비 중입니다.</p>',
+                '</div>',
+            ]
+        parts.append(self._generate_verses_html(chapter))
+        parts.append('</article>')
+        return '\n'.join(parts)
+
+    def _alias_payload(self) -> dict:
+        """별칭/슬러그 매핑 주입 데이터 구성 (공동번역 약칭/외경 포함, 인스턴스당 1회)"""
+        cached = getattr(self, '_alias_payload_cache', None)
+        if cached is not None:
+            return cached
         alias_to_abbr = {}
         abbr_to_slug = {}
         try:
-            # parser의 매핑 사용 (약칭 키)
-            from src.parser import BibleParser  # type: ignore
             # 안전: 생성기에서는 외부 주입이 없으므로 로컬 파일에서 읽음
             with open('data/book_mappings.json', 'r', encoding='utf-8') as f:
-                import json
                 books = json.load(f)
             for b in books:
                 abbr = b.get('약칭')
@@ -92,7 +307,7 @@ class HtmlGenerator:
                     slug = self._get_book_slug(abbr)
                 abbr_to_slug[abbr] = slug
                 # 모든 별칭→약칭
-                for name in set([abbr, full, *aliases]):
+                for name in dict.fromkeys([abbr, full, *aliases]):
                     if name:
                         alias_to_abbr[name] = abbr
         except Exception:
@@ -100,33 +315,57 @@ class HtmlGenerator:
             alias_to_abbr = {}
             abbr_to_slug = {}
 
-        import json as _json
-        import re as _re
-        alias_payload = {
+        self._alias_payload_cache = {
             'aliasToAbbr': alias_to_abbr,
             'abbrToSlug': abbr_to_slug,
         }
-        # 별칭/슬러그 + 브레드크럼 메타 주입
+        return self._alias_payload_cache
+
+    def _inline_data_script(
+        self,
+        alias_payload: dict,
+        books_meta: Optional[list[dict]],
+        search_meta: Optional[dict],
+        service_worker_url: Optional[str],
+        shell_meta: Optional[dict] = None,
+    ) -> str:
+        """별칭/슬러그 + 브레드크럼/검색/셸 메타 주입 스크립트"""
         script_parts = [
             'window.BIBLE_ALIAS = ' +
-            _json.dumps(alias_payload, ensure_ascii=False) + ';'
+            json.dumps(alias_payload, ensure_ascii=False) + ';'
         ]
         if books_meta:
             script_parts.append('window.BIBLE_BOOKS = ' +
-                                _json.dumps(books_meta, ensure_ascii=False) + ';')
-        alias_data_script = '<script>' + ''.join(script_parts) + '</script>'
-
+                                json.dumps(books_meta, ensure_ascii=False) + ';')
+        if search_meta:
+            script_parts.append('window.BIBLE_SEARCH_META = ' +
+                                json.dumps(search_meta, ensure_ascii=False) + ';')
+        if shell_meta:
+            script_parts.append('window.BIBLE_SHELL = ' +
+                                json.dumps(shell_meta, ensure_ascii=False) + ';')
+        if service_worker_url:
+            script_parts.append(_service_worker_register_js(service_worker_url))
+        return '<script>' + ''.join(script_parts) + '</script>'
+
+    def _resolve_audio(
+        self,
+        chapter: Chapter,
+        audio_base_url: str,
+        audio_check_base: str | None,
+        abbr_to_slug: dict[str, str],
+    ) -> tuple[str, bool]:
+        """장 오디오 URL과 파일 존재 여부"""
         # 오디오 파일 슬러그 계산: 매핑 우선, 없으면 영문 이름 기반
         # abbr_to_english 맵 구성
         abbr_to_english = {}
         try:
             with open('data/book_mappings.json', 'r', encoding='utf-8') as _f:
-                _books = _json.load(_f)
+                _books = json.load(_f)
             for _b in _books:
                 _abbr = _b.get('약칭')
                 _eng = _b.get('영문 이름') or ''
                 if _abbr and _eng:
-                    _slug = _re.sub(r'[^a-z0-9]+', '', _eng.lower())
+                    _slug = re.sub(r'[^a-z0-9]+', '', _eng.lower())
                     abbr_to_english[_abbr] = _slug
         except Exception:
             pass
@@ -147,40 +386,45 @@ class HtmlGenerator:
         else:
             fs_path = os.path.join(check_base, audio_filename)
             audio_exists = self._check_audio_exists(fs_path)
+        return audio_path, audio_exists
 
-        # 템플릿 렌더링
+    def _asset_tags(
+        self,
+        css_href: Optional[str],
+        js_src: Optional[str],
+        critical_css: Optional[str],
+        asset_manifest: Optional[dict[str, str]],
+    ) -> tuple[str, str]:
+        """CSS 링크/JS 스크립트 태그 구성"""
+        # 해시 파일명으로 복사한 정적 자원이면 참조도 해시 이름으로 치환
+        css_href = _hashed_asset_url(css_href, asset_manifest)
+        js_src = _hashed_asset_url(js_src, asset_manifest)
         # CSS/JS 태그 구성 (차일드 테마에서 로드하는 경우 None로 두어 템플릿에서 비움)
         css_link_tag = (
             f'<link rel="stylesheet" href="{css_href}">' if css_href else ""
         )
-        js_script_tag = (
-            f'<script src="{js_src}"></script>' if js_src else ""
-        )
-
-        html = self.template.substitute(
-            book_name=chapter.book_name,
-            chapter_number=chapter.chapter_number,
-            chapter_id=f"{chapter.book_abbr}-{chapter.chapter_number}",
-            verses_content=verses_html,
-            audio_path=audio_path if audio_exists else "#",
-            audio_title=f"{chapter.book_name} {chapter.chapter_number}장 오디오",
-            static_base=static_base,
-            alias_data_script=alias_data_script,
-            css_link_tag=css_link_tag,
-            js_script_tag=js_script_tag,
-            prev_button_html=prev_button_html,
-            next_button_html=next_button_html,
-        )
-
-        # 오디오 파일 존재 여부에 따라 CSS 클래스 조정
-        if audio_exists:
-            html = html.replace('class="audio-unavailable-notice"',
-                                'class="audio-unavailable-notice hidden"')
-        else:
-            html = html.replace('class="audio-player-container"',
-                                'class="audio-player-container hidden"')
-
-        return html
+        if css_href and critical_css:
+            # 첫 화면 규칙은 인라인, 전체 스타일시트는 preload 후 onload에서 적용 (렌더 차단 없음)
+            inline_css = critical_css.replace('</', '<\\/')
+            css_link_tag = (
+                f'<style>{inline_css}</style>'
+                f'<link rel="preload" href="{css_href}" as="style" '
+                f'onload="this.onload=null;this.rel=\'stylesheet\'">'
+                f'<noscript>{css_link_tag}</noscript>'
+            )
+        # 검색 UI 모듈(verse-search.js)은 코어 스크립트와 같은 위치에서 지연 로드한다
+        js_script_tag = ""
+        if js_src:
+            assets = asset_manifest or {}
+            search_src = _sibling_url(js_src, assets.get("verse-search.js", "verse-search.js"))
+            worker_attr = ""
+            if "search-worker.js" in assets:
+                # 해시 이름이면 코어가 파일명을 추정할 수 없으므로 워커 경로도 명시
+                worker_attr = f' data-worker-src="{_sibling_url(js_src, assets["search-worker.js"])}"'
+            js_script_tag = (
+                f'<script src="{js_src}" defer data-search-src="{search_src}"{worker_attr}></script>'
+            )
+        return css_link_tag, js_script_tag
 
     def generate_index_html(
         self,
@@ -188,6 +432,8 @@ class HtmlGenerator:
         static_base: str,
         title: str = "공동번역 성서 - 목차",
         books_meta: Optional[list[dict]] = None,
+        asset_manifest: Optional[dict[str, str]] = None,
+        service_worker_url: Optional[str] = None,
     ) -> str:
         """생성된 장 목록을 기반으로 간단한 목차(index.html) 생성
 
@@ -247,7 +493,8 @@ class HtmlGenerator:
 
         # 링크 파일명 계산: 이미 main에서 사용하는 규칙과 동일하게 slug는 외부에서 계산하도록 함
         # 여기서는 파일명만 비워두고, 호출하는 쪽에서 치환한다.
-        css_link_tag = f'<link rel="stylesheet" href="{static_base}/verse-style.css">' if static_base else ""
+        css_name = (asset_manifest or {}).get("verse-style.css", "verse-style.css")
+        css_link_tag = f'<link rel="stylesheet" href="{static_base}/{css_name}">' if static_base else ""
 
         # 본문: 구약/신약 두 섹션으로 나눠 렌더링
         html_parts: list[str] = [
@@ -284,6 +531,9 @@ class HtmlGenerator:
         html_parts.append('</ul>')
         html_parts.append('</section>')
 
+        if service_worker_url:
+            html_parts.append(
+                f"<script>{_service_worker_register_js(service_worker_url)}</script>")
         html_parts.extend(["</body>", "</html>"])
         return "\n".join(html_parts)
 
@@ -379,7 +629,8 @@ class HtmlGenerator:
         slug = self._get_book_slug(chapter.book_abbr)
         return f"{slug}-{chapter.chapter_number}.mp3"
 
-    def _get_book_slug(self, book_abbr: str) -> str:
+    @staticmethod
+    def _get_book_slug(book_abbr: str) -> str:
         """책 약칭을 영문 슬러그로 변환 (파일명/오디오 공통 사용)"""
         mapping = {
             "창세": "genesis",
@@ -464,43 +715,705 @@ class HtmlGenerator:
         return os.path.exists(audio_path)
 
 
-def _sha256_of_file(file_path: str) -> str:
-    """파일의 SHA-256 해시를 계산하여 반환"""
-    hash_obj = hashlib.sha256()
-    with open(file_path, 'rb') as f:
-        for chunk in iter(lambda: f.read(8192), b''):
-            hash_obj.update(chunk)
-    return hash_obj.hexdigest()
+def _sibling_url(url: str, filename: str) -> str:
+    """같은 디렉터리의 다른 파일 URL (쿼리/프래그먼트 제외): `a/b/x.js` → `a/b/<filename>`"""
+    path = url.split('?', 1)[0].split('#', 1)[0]
+    head, sep, _ = path.rpartition('/')
+    return f"{head}{sep}{filename}"
+
+
+def nav_button_html(href: Optional[str], is_prev: bool) -> str:
+    """이전/다음 장 버튼 (href가 없으면 비활성 span)"""
+    if is_prev:
+        svg = '<svg viewBox="0 0 24 24" aria-hidden="true"><path d="M15.41 7.41 14 6l-6 6 6 6 1.41-1.41L10.83 12z"/></svg>'
+    else:
+        svg = '<svg viewBox="0 0 24 24" aria-hidden="true"><path d="M8.59 16.59 10 18l6-6-6-6-1.41 1.41L13.17 12z"/></svg>'
+    if not href:
+        return f'<span class="nav-btn disabled" aria-disabled="true">{svg}</span>'
+    aria_label = ("이전 장" if is_prev else "다음 장")
+    return f'<a class="nav-btn" href="{href}" aria-label="{aria_label}">{svg}</a>'
+
+
+def chapter_file_slug(generator: Optional["HtmlGenerator"], book_mappings: dict, book_abbr: str) -> str:
+    """장 파일명 슬러그 (기본 슬러그가 비ASCII면 파서 매핑의 영문 이름으로 보정, generator가 없으면 기본 표 사용)"""
+    slug = (generator or HtmlGenerator)._get_book_slug(book_abbr)
+    # 비ASCII(예: 한글)인 경우 영어 이름 기반으로 보정
+    if not slug.isascii() or re.search(r"[가-힣]", slug):
+        info = book_mappings.get(book_abbr)
+        if info and info.get('english_name'):
+            fallback = info['english_name'].lower()
+            # 공백/구두점 제거, 숫자/영문만 유지
+            fallback = re.sub(r"[^a-z0-9]+", "", fallback)
+            if fallback:
+                return fallback
+    return slug
+
+
+class NavigationTable:
+    """
+    이전/다음 장 계산용 압축 표
+
+    책별 마지막 장 번호와 존재하는 장 ID만 보관하고, 이웃 장은 조회할 때 계산한다(절 데이터 불필요).
+    책 순서는 books_meta(book_mappings.json) 순서, 장 수는 추가된 전체 장 기준.
+    책의 첫 장/마지막 장은 이전 책 마지막 장/다음 책 첫 장으로 이어진다.
+    """
+
+    def __init__(self, books_meta: Optional[list[dict]], slug_for: Callable[[str], str]):
+        book_list: list[dict] = books_meta or []
+        # 별칭 → 표준 약칭(books_meta의 "약칭") 매핑
+        self._alias_to_canonical: dict[str, str] = {}
+        for b in book_list:
+            can = b.get('약칭')
+            if isinstance(can, str) and can:
+                self._alias_to_canonical[can] = can
+                full = b.get('전체 이름')
+                if isinstance(full, str) and full:
+                    self._alias_to_canonical[full] = can
+                for al in (b.get('aliases') or []):
+                    if isinstance(al, str) and al:
+                        self._alias_to_canonical[al] = can
+
+        # 표준 약칭 순서 (메타 순서 그대로)
+        self._abbr_sequence: list[str] = []
+        for b in book_list:
+            can = b.get('약칭')
+            if isinstance(can, str) and can:
+                self._abbr_sequence.append(can)
+        self._position = {abbr: idx for idx, abbr in reversed(list(enumerate(self._abbr_sequence)))}
+
+        self._slug_for = slug_for
+        self._slugs: dict[str, str] = {}
+        # 각 책의 총 장 수 (표준 약칭 키) 및 대표 약칭(실제 파일명 슬러그 계산 시 사용)
+        self._total_by_book: dict[str, int] = {}
+        self._canonical_to_actual_abbr: dict[str, str] = {}
+        # 장 ID → (약칭, 장)
+        self._chapters: dict[str, tuple[str, int]] = {}
+
+    def _slug(self, book_abbr: str) -> str:
+        slug = self._slugs.get(book_abbr)
+        if slug is None:
+            slug = self._slug_for(book_abbr)
+            self._slugs[book_abbr] = slug
+        return slug
+
+    def chapter_id(self, book_abbr: str, chapter_number: int) -> str:
+        """장 ID (`<slug>-<장>`, 출력 파일명의 확장자 앞부분)"""
+        return f"{self._slug(book_abbr)}-{chapter_number}"
+
+    def add(self, book_abbr: str, chapter_number: int) -> None:
+        """장 등록 (모든 장을 등록한 뒤 조회)"""
+        canonical = self._alias_to_canonical.get(book_abbr, book_abbr)
+        self._total_by_book[canonical] = max(self._total_by_book.get(canonical, 0), chapter_number)
+        self._canonical_to_actual_abbr.setdefault(canonical, book_abbr)
+        self._chapters[self.chapter_id(book_abbr, chapter_number)] = (book_abbr, chapter_number)
+
+    def _target_id(self, canonical: str, chapter_number: int) -> str:
+        # 실제 생성 파일의 약칭(로컬 약칭)으로 매핑
+        return self.chapter_id(self._canonical_to_actual_abbr.get(canonical, canonical), chapter_number)
+
+    def neighbours(self, chapter_id: str) -> tuple[Optional[str], Optional[str]]:
+        """(이전 장 ID, 다음 장 ID) (등록되지 않은 장이면 둘 다 None)"""
+        entry = self._chapters.get(chapter_id)
+        if entry is None:
+            return (None, None)
+        book_abbr, chapter_number = entry
+        current = self._alias_to_canonical.get(book_abbr, book_abbr)
+        idx = self._position.get(current, 0)
+        prev_id: Optional[str] = None
+        next_id: Optional[str] = None
+
+        # 이전 장 (1장이면 이전 책 마지막 장)
+        if chapter_number > 1:
+            prev_id = self._target_id(current, chapter_number - 1)
+        elif idx > 0:
+            prev_abbr = self._abbr_sequence[idx - 1]
+            if self._total_by_book.get(prev_abbr, 0) > 0:
+                prev_id = self._target_id(prev_abbr, self._total_by_book[prev_abbr])
+
+        # 다음 장 (마지막 장이면 다음 책 1장)
+        total_current = self._total_by_book.get(current, 0)
+        if total_current and chapter_number < total_current:
+            next_id = self._target_id(current, chapter_number + 1)
+        elif idx < len(self._abbr_sequence) - 1:
+            next_abbr = self._abbr_sequence[idx + 1]
+            if self._total_by_book.get(next_abbr, 0) > 0:
+                next_id = self._target_id(next_abbr, 1)
+        return (prev_id, next_id)
+
+    def as_dict(self) -> dict[str, tuple[Optional[str], Optional[str]]]:
+        """장 ID → (이전 장 ID, 다음 장 ID) 전체 표"""
+        return {chapter_id: self.neighbours(chapter_id) for chapter_id in self._chapters}
+
+
+def build_navigation(
+    all_chapters: list[Chapter],
+    books_meta: Optional[list[dict]],
+    slug_for: Callable[[str], str],
+) -> dict[str, tuple[Optional[str], Optional[str]]]:
+    """장 ID(`<slug>-<장>`) → (이전 장 ID, 다음 장 ID) 표 (NavigationTable 참고)"""
+    table = NavigationTable(books_meta, slug_for)
+    for ch in all_chapters:
+        table.add(ch.book_abbr, ch.chapter_number)
+    return table.as_dict()
+
+
+def index_with_file_slugs(
+    generator: "HtmlGenerator",
+    index_html: str,
+    chapters: list[Chapter],
+    slug_for: Callable[[str], str],
+) -> str:
+    """목차 링크의 기본 슬러그 파일명을 실제 장 파일명(slug_for 규칙)으로 치환"""
+    # 책별 첫 장 계산
+    first_chapter_by_book: dict[str, int] = {}
+    for ch in chapters:
+        if ch.book_abbr not in first_chapter_by_book or ch.chapter_number < first_chapter_by_book[ch.book_abbr]:
+            first_chapter_by_book[ch.book_abbr] = ch.chapter_number
+
+    for book_abbr, first_ch in first_chapter_by_book.items():
+        real_slug = slug_for(book_abbr)
+        base_slug = generator._get_book_slug(book_abbr)
+        # generate_index_html에서 사용한 기본 파일명을 실제 파일명으로 교체
+        src_name = f"{base_slug}-{first_ch}.html"
+        dst_name = f"{real_slug}-{first_ch}.html"
+        if src_name != dst_name:
+            index_html = index_html.replace(src_name, dst_name)
+    return index_html
+
+
+def _service_worker_register_js(url: str) -> str:
+    """서비스 워커 등록 스크립트 (미지원 브라우저는 무시, 첫 렌더링과 경쟁하지 않도록 load 이후 등록)"""
+    return ('if("serviceWorker" in navigator){window.addEventListener("load",function(){'
+            f'navigator.serviceWorker.register({json.dumps(url)}).catch(function(){{}});}});}}')
+
+
+def _prefetch_hint_html(urls: list[str], mode: str, preconnect_origin: Optional[str] = None) -> str:
+    """
+    다음 장 미리 가져오기 힌트
+
+    Args:
+        urls: 미리 가져올 장 페이지 URL (읽는 순서대로)
+        mode: "link"(`<link rel="prefetch">`) 또는 "speculation"(Speculation Rules, 미지원 브라우저는 무시)
+        preconnect_origin: 미리 연결할 오디오 출처 (다른 출처 CDN일 때만)
+    """
+    tags: list[str] = []
+    if preconnect_origin:
+        tags.append(f'<link rel="preconnect" href="{preconnect_origin}" crossorigin>')
+    if urls:
+        if mode == "speculation":
+            rules = {"prefetch": [{"source": "list", "urls": urls}]}
+            tags.append('<script type="speculationrules">' +
+                        json.dumps(rules, ensure_ascii=False) + '</script>')
+        else:
+            tags.extend(f'<link rel="prefetch" href="{url}">' for url in urls)
+    return '\n    '.join(tags)
+
+
+# 셸 출력 모드의 페이지/장 JSON 디렉터리 이름 (출력 디렉터리 기준)
+SHELL_PAGE = "reader.html"
+SHELL_CHAPTER_DIR = "chapters"
+# 검색 워커 풀 크기 상한 (verse-search.js의 SEARCH_WORKER_POOL_MAX와 같게 유지)
+SEARCH_WORKER_POOL_MAX = 4
+# 다음 장 미리 가져오기 힌트 수 상한 (순차 읽기에서 쓰이지 않을 장까지 받지 않도록)
+PREFETCH_LIMIT_MAX = 3
+
+
+# 이미 내용 해시가 붙은 파일명 (예: verse-navigator.3f9a1c2b.js)
+_HASHED_ASSET_RE = re.compile(r'^.+\.[0-9a-f]{8}\.(?:js|css)$')
+
+
+def _hashed_asset_url(url: Optional[str], asset_manifest: Optional[dict[str, str]]) -> Optional[str]:
+    """URL의 파일명이 매니페스트에 있으면 해시 파일명으로 치환 (경로/쿼리는 유지)"""
+    if not url or not asset_manifest:
+        return url
+    path = url.split('?', 1)[0].split('#', 1)[0]
+    hashed = asset_manifest.get(path.rpartition('/')[2])
+    if not hashed:
+        return url
+    return _sibling_url(path, hashed) + url[len(path):]
+
+
+def _hash_static_assets(sink: DirectorySink, prefix: str = "static") -> dict[str, str]:
+    """싱크에 기록한 정적 디렉터리 최상위 CSS/JS를 내용 해시 파일명으로도 기록하고 원래 이름 → 해시 이름 매핑을 반환
+
+    - 해시는 최종(복사/최소화된) 파일 내용의 SHA-256 앞 8자리 (싱크 항목 기준)
+    - 원래 이름 파일도 함께 출력하고, 디스크에 남은 이전 해시 파일은 지우지 않는다(이전 배포 페이지/테마 enqueue 호환)
+    """
+    manifest: dict[str, str] = {}
+    for rel in sorted(sink.paths()):
+        parts = rel.split('/')
+        if len(parts) != 2 or parts[0] != prefix:
+            continue
+        fname = parts[1]
+        stem, ext = os.path.splitext(fname)
+        if ext.lower() not in ('.js', '.css') or _HASHED_ASSET_RE.match(fname):
+            continue
+        hashed = f"{stem}.{sink.entry(rel)[0][:8]}{ext}"
+        hashed_rel = f"{prefix}/{hashed}"
+        if os.path.exists(sink.path(hashed_rel)):
+            # 파일명이 곧 내용 해시이므로 이미 있으면 같은 내용
+            sink.keep(hashed_rel)
+        else:
+            sink.add_copy(hashed_rel, rel)
+        manifest[fname] = hashed
+    return manifest
+
+
+def build_search_entries(
+    chapters: list[Chapter],
+    slug_by_abbr: dict[str, str],
+    order_by_abbr: Optional[dict[str, int]] = None,
+) -> list[dict]:
+    """장 목록으로 전역 검색 인덱스 엔트리(절 단위) 목록을 구성
+
+    엔트리는 정규 순서(책 순서 `bo` → 장 → 절)로 정렬해 반환한다. 워커는 인덱스 헤더의
+    `sorted` 플래그를 보고 쿼리마다의 정렬을 생략하고, 페이지가 채워지는 즉시 응답한다.
+    order_by_abbr를 주면 책 순서 조회 결과를 호출 간에 재사용한다(장 단위로 여러 번 호출할 때).
+    """
+    entries: list[dict] = []
+    if order_by_abbr is None:
+        order_by_abbr = {}
+    for chapter in chapters:
+        abbr = chapter.book_abbr
+        if abbr not in order_by_abbr:
+            order_by_abbr[abbr] = HtmlGenerator.get_book_order_index(abbr)
+        slug = slug_by_abbr[abbr]
+        for verse in chapter.verses:
+            verse_id = f"{abbr}-{chapter.chapter_number}-{verse.number}"
+            href = f"{slug}-{chapter.chapter_number}.html#{verse_id}"
+            # 텍스트에서 접근성 기호는 검색 품질을 위해 제거/단순화
+            verse_text = verse.text.replace(
+                '\u00B6', ' ').replace('¶', ' ').strip()
+            entries.append({
+                "i": verse_id,
+                "t": verse_text,
+                "h": href,
+                "b": abbr,
+                "c": chapter.chapter_number,
+                "v": verse.number,
+                "bo": order_by_abbr[abbr],
+            })
+    entries.sort(key=lambda e: (e["bo"], e["c"], e["v"]))
+    return entries
+
+
+def _serialize_search_index(entries: list[dict]) -> str:
+    """검색 인덱스 JSON 직렬화: 헤더(포맷 버전/정렬 플래그) + 엔트리 배열"""
+    payload = {"format": 2, "sorted": True, "entries": entries}
+    return json.dumps(payload, ensure_ascii=False, separators=(',', ':'))
+
+
+class _VerseCountsBuilder:
+    """정규 순서로 들어오는 (책, 장, 절)로 절 수 테이블 구성 (절 번호만 장별 배열로 보관)"""
+
+    def __init__(self):
+        self._verses: dict[str, dict[int, array]] = {}
+        self._order_by_abbr: dict[str, int] = {}
+
+    def add(self, abbr: str, book_order: int, chapter_number: int, verse_number: int) -> None:
+        self._order_by_abbr.setdefault(abbr, book_order)
+        chapters = self._verses.setdefault(abbr, {})
+        verses = chapters.get(chapter_number)
+        if verses is None:
+            verses = chapters[chapter_number] = array('I')
+        verses.append(verse_number)
+
+    def result(self, slug_by_abbr: dict[str, str]) -> dict:
+        books: list[dict] = []
+        for abbr in sorted(self._verses, key=lambda a: self._order_by_abbr[a]):
+            chapters = self._verses[abbr]
+            counts = [0] * max(chapters)
+            gaps: dict[str, list[int]] = {}
+            for chapter_number, numbers in chapters.items():
+                verses = set(numbers)
+                last = max(verses)
+                counts[chapter_number - 1] = last
+                missing = [v for v in range(1, last) if v not in verses]
+                if missing:
+                    gaps[str(chapter_number)] = missing
+            book = {"b": abbr, "s": slug_by_abbr.get(abbr, abbr), "bo": self._order_by_abbr[abbr], "c": counts}
+            if gaps:
+                book["x"] = gaps
+            books.append(book)
+        return {"books": books}
+
+
+def build_verse_counts(entries: list[dict], slug_by_abbr: dict[str, str]) -> dict:
+    """검색 인덱스 엔트리로 책 → 장 → 절 수 테이블을 구성 (수 KB)
+
+    절 존재 확인(`창세 50:27`)과 브레드크럼 장 드롭다운은 전문 인덱스 없이 이 테이블만으로
+    산술 비교로 답한다. `c[장-1]`은 해당 장의 마지막 절 번호(없는 장은 0)이며,
+    중간에 빠진 절이 있으면 `x`에 `{"장": [빠진 절, ...]}`으로 기록한다.
+    """
+    builder = _VerseCountsBuilder()
+    for e in entries:
+        builder.add(e["b"], e["bo"], e["c"], e["v"])
+    return builder.result(slug_by_abbr)
+
+
+_BINARY_INDEX_MAGIC = b"CBSI"
+_BINARY_INDEX_VERSION = 2
+# 헤더 플래그: 엔트리가 (bo, c, v) 정규 순서로 정렬되어 있음
+_INDEX_FLAG_SORTED = 0x1
+# 헤더 플래그: 텍스트 블롭이 이미 소문자 (워커가 블롭을 그대로 스캔)
+_INDEX_FLAG_CASELESS = 0x2
+# 헤더 플래그: 텍스트 블롭 뒤에 소문자로 접은 검색용 열(오프셋 + 블롭)이 있음
+_INDEX_FLAG_FOLDED = 0x4
+
+
+def _build_binary_search_index(entries: list[dict], slug_by_abbr: dict[str, str]) -> bytes:
+    """검색 인덱스 엔트리를 바이너리 포맷으로 직렬화 (메모리 버전, `_write_binary_search_index` 참고)"""
+    out = io.BytesIO()
+    _write_binary_search_index(entries, slug_by_abbr, out, io.BytesIO(), io.BytesIO())
+    return out.getvalue()
+
+
+def _write_binary_search_index(
+    entries: Iterable[dict],
+    slug_by_abbr: dict[str, str],
+    out: BinaryIO,
+    blob_spool: BinaryIO,
+    folded_spool: BinaryIO,
+) -> None:
+    """검색 인덱스 엔트리를 typed array로 바로 읽을 수 있는 바이너리 포맷으로 직렬화
+
+    JSON.parse 없이 `fetch().arrayBuffer()`만으로 로드할 수 있도록 열(column) 단위로 저장한다.
+    절 ID/링크는 책 테이블(약칭/슬러그)과 장/절 번호로 워커에서 재구성한다.
+    `entries`는 `build_search_entries`의 결과(정규 순서로 정렬됨)를 그대로 받는다.
+    열은 메모리에 모으고 텍스트 블롭은 blob_spool(빈 파일 객체)에 흘려 쓴 뒤 out에 이어 붙인다.
+    검색용 소문자 텍스트(JSON 모드 normalizeForSearch와 같은 접기)는 folded_spool에 함께 쓰고,
+    원문과 다른 절이 있을 때만 접은 열로 싣는다(없으면 CASELESS 플래그만). 워커는 로드 시 텍스트를
+    디코딩하지 않고 바이트를 그대로 스캔하며, 결과로 보여 줄 절만 디코딩한다.
+
+    레이아웃(리틀 엔디언):
+    - 0: 매직 `CBSI`, 4: 버전(u16), 6: 플래그(u16, `_INDEX_FLAG_SORTED`), 8: 엔트리 수 N(u32), 12: 헤더 길이 H(u32)
+    - 16: 헤더 JSON(UTF-8, 4바이트 정렬용 공백 패딩 포함) — `{"books": [{b, s, bo}]}`
+    - Uint16 책 번호[N], Uint16 장[N], Uint16 절[N], 4바이트 정렬 패딩
+    - Uint32 텍스트 오프셋[N+1] (블롭 내 바이트 위치), 이후 UTF-8 텍스트 블롭
+    - (`_INDEX_FLAG_FOLDED`일 때) 4바이트 정렬 패딩, Uint32 접은 텍스트 오프셋[N+1], 접은 UTF-8 블롭
+    """
+    books: list[dict] = []
+    book_index: dict[str, int] = {}
+    book_col = array('H')
+    chapter_col = array('H')
+    verse_col = array('H')
+    offset_col = array('I', [0])
+    folded_col = array('I', [0])
+    blob_size = 0
+    folded_size = 0
+    caseless = True
+    count = 0
+
+    for e in entries:
+        abbr = e["b"]
+        if abbr not in book_index:
+            book_index[abbr] = len(books)
+            books.append({"b": abbr, "s": slug_by_abbr.get(abbr, abbr), "bo": e["bo"]})
+        book_col.append(book_index[abbr])
+        chapter_col.append(e["c"])
+        verse_col.append(e["v"])
+        text = e["t"].encode('utf-8')
+        blob_spool.write(text)
+        blob_size += len(text)
+        offset_col.append(blob_size)
+        lower = e["t"].lower()
+        if lower != e["t"]:
+            caseless = False
+        folded = lower.encode('utf-8')
+        folded_spool.write(folded)
+        folded_size += len(folded)
+        folded_col.append(folded_size)
+        count += 1
+
+    if sys.byteorder == 'big':
+        for col in (book_col, chapter_col, verse_col, offset_col, folded_col):
+            col.byteswap()
+    flags = _INDEX_FLAG_SORTED | (_INDEX_FLAG_CASELESS if caseless else _INDEX_FLAG_FOLDED)
+
+    header = json.dumps({"books": books}, ensure_ascii=False,
+                        separators=(',', ':')).encode('utf-8')
+    header += b' ' * (-len(header) % 4)
+
+    out.write(_BINARY_INDEX_MAGIC)
+    out.write(struct.pack('<HHII', _BINARY_INDEX_VERSION, flags, count, len(header)))
+    out.write(header)
+    out.write(book_col.tobytes())
+    out.write(chapter_col.tobytes())
+    out.write(verse_col.tobytes())
+    # Uint32Array 시작 위치를 4바이트 경계에 맞춘다
+    out.write(b'\0' * (-(count * 6) % 4))
+    out.write(offset_col.tobytes())
+    blob_spool.seek(0)
+    shutil.copyfileobj(blob_spool, out, 1024 * 1024)
+    if not caseless:
+        out.write(b'\0' * (-blob_size % 4))
+        out.write(folded_col.tobytes())
+        folded_spool.seek(0)
+        shutil.copyfileobj(folded_spool, out, 1024 * 1024)
+
+
+class SearchIndexSpool:
+    """
+    저메모리 검색 인덱스 빌더: 장 단위 엔트리를 임시 파일에 흘려 쓰고 마지막에 정규 순서로 합친다
+
+    메모리에는 장마다 (책 순서, 장, 입력 순번, 파일 위치)와 절 번호 배열만 남긴다.
+    결과는 `_serialize_search_index(build_search_entries(전체 장))`과 같은 바이트다.
+    책 순서와 장이 같은 장이 여럿이면(순서 미정의 책 등) 그 장들만 읽어 절 순서로 병합한다.
+    """
+
+    def __init__(self, spool_dir: Optional[str] = None):
+        self._spool = tempfile.TemporaryFile(dir=spool_dir)
+        self._size = 0
+        # (책 순서, 장, 입력 순번, 위치, 길이, 약칭, 절 번호)
+        self._records: list[tuple[int, int, int, int, int, str, array]] = []
+        self._order_by_abbr: dict[str, int] = {}
+        self._counts = _VerseCountsBuilder()
+        self.entry_count = 0
+
+    def add_chapter(self, chapter: Chapter, slug: str) -> None:
+        """장 하나의 엔트리를 JSON 조각으로 임시 파일에 추가"""
+        entries = build_search_entries(
+            [chapter], {chapter.book_abbr: slug}, self._order_by_abbr)
+        if not entries:
+            return
+        data = ','.join(json.dumps(e, ensure_ascii=False, separators=(',', ':'))
+                        for e in entries).encode('utf-8')
+        self._spool.seek(self._size)
+        self._spool.write(data)
+        self._records.append((entries[0]["bo"], chapter.chapter_number, len(self._records),
+                              self._size, len(data), chapter.book_abbr,
+                              array('I', (e["v"] for e in entries))))
+        self._size += len(data)
+        self.entry_count += len(entries)
+
+    def _read(self, record: tuple) -> bytes:
+        self._spool.seek(record[3])
+        return self._spool.read(record[4])
+
+    def _groups(self) -> Iterator[list[tuple]]:
+        """(책 순서, 장)이 같은 기록 묶음을 정규 순서로 반환"""
+        group: list[tuple] = []
+        for record in sorted(self._records, key=lambda r: (r[0], r[1], r[2])):
+            if group and (group[0][0], group[0][1]) != (record[0], record[1]):
+                yield group
+                group = []
+            group.append(record)
+        if group:
+            yield group
+
+    def _merged_entries(self, group: list[tuple]) -> list[dict]:
+        entries: list[dict] = []
+        for record in group:
+            entries.extend(json.loads(b'[' + self._read(record) + b']'))
+        # 안정 정렬: 같은 절 번호는 입력 순서 유지 (전체 정렬과 같은 결과)
+        entries.sort(key=lambda e: e["v"])
+        return entries
+
+    def write_json(self, out: BinaryIO) -> str:
+        """
+        정규 순서 인덱스 JSON을 out에 기록하고 절 수 테이블을 함께 집계
+
+        Returns:
+            기록한 내용의 SHA-256 (hex)
+        """
+        digest = hashlib.sha256()
+
+        def write(data: bytes) -> None:
+            digest.update(data)
+            out.write(data)
+
+        self._counts = _VerseCountsBuilder()
+        write(b'{"format":2,"sorted":true,"entries":[')
+        first = True
+        for group in self._groups():
+            if len(group) == 1:
+                record = group[0]
+                data = self._read(record)
+                for verse_number in record[6]:
+                    self._counts.add(record[5], record[0], record[1], verse_number)
+            else:
+                entries = self._merged_entries(group)
+                data = ','.join(json.dumps(e, ensure_ascii=False, separators=(',', ':'))
+                                for e in entries).encode('utf-8')
+                for e in entries:
+                    self._counts.add(e["b"], e["bo"], e["c"], e["v"])
+            if not first:
+                write(b',')
+            write(data)
+            first = False
+        write(b']}')
+        return digest.hexdigest()
+
+    def verse_counts(self, slug_by_abbr: dict[str, str]) -> dict:
+        """절 수 테이블 (write_json 이후 호출)"""
+        return self._counts.result(slug_by_abbr)
+
+    def iter_entries(self) -> Iterator[dict]:
+        """엔트리를 정규 순서로 하나씩 반환 (바이너리 인덱스용, 한 번에 한 묶음만 메모리에 올림)"""
+        for group in self._groups():
+            if len(group) == 1:
+                yield from json.loads(b'[' + self._read(group[0]) + b']')
+            else:
+                yield from self._merged_entries(group)
 
+    def close(self) -> None:
+        self._spool.close()
 
-def _copy_dir_dedup(src_dir: str, dst_dir: str) -> None:
-    """디렉터리를 복사하되, 동일한 파일은 건너뛰고 다른 내용이면 덮어쓴다.
+
+def _parse_chapter_numbers(spec: str) -> set[int]:
+    """장 번호 목록/구간 문자열(예: 1,2,5-7) → 장 번호 집합 (해석할 수 없는 항목은 무시)"""
+    wanted_numbers: set[int] = set()
+    for token in spec.split(','):
+        token = token.strip()
+        if not token:
+            continue
+        if '-' in token:
+            a, b = token.split('-', 1)
+            try:
+                start = int(a)
+                end = int(b)
+                for n in range(min(start, end), max(start, end) + 1):
+                    wanted_numbers.add(n)
+            except ValueError:
+                pass
+        else:
+            try:
+                wanted_numbers.add(int(token))
+            except ValueError:
+                pass
+    return wanted_numbers
+
+
+def _select_chapters(
+    chapters: Iterable[Chapter],
+    book_abbr: Optional[str],
+    chapter_numbers: Optional[set[int]],
+    limit: Optional[int],
+) -> Iterator[Chapter]:
+    """
+    생성 대상 장 선택: 책 약칭 → 장 번호 필터 후 앞에서부터 limit개
+
+    limit에 도달해도 입력은 끝까지 소비한다 (스트리밍 입력에 걸린 이전/다음 표 등록이 빠지지 않도록).
+    """
+    count = 0
+    for chapter in chapters:
+        if book_abbr and chapter.book_abbr != book_abbr:
+            continue
+        if chapter_numbers is not None and chapter.chapter_number not in chapter_numbers:
+            continue
+        if limit is not None and limit >= 0 and count >= limit:
+            continue
+        count += 1
+        yield chapter
+
+
+def copy_dir_dedup(
+    src_dir: str,
+    sink: DirectorySink,
+    prefix: str,
+    minifier: Optional[MinifyCache] = None,
+    jobs: int = 1,
+) -> dict[str, int]:
+    """디렉터리를 싱크의 `<prefix>/` 아래로 복사하되, 동일한 파일은 다시 쓰지 않는다.
 
     - 디렉터리 구조는 유지한다
     - 대상에 기존 파일이 있어도 제거하지 않으며, 소스에 없는 대상 파일은 남겨둔다
+    - 바뀐 파일만 싱크에 기록하고(commit 때 반영), 같은 파일은 keep으로 이번 출력에 포함만 한다
+    - minifier를 주면 CSS/JS/HTML은 최소화한 내용을 기준으로 비교/저장한다
+    - 크기와 mtime이 같으면 내용을 읽지 않고 건너뛴다 (복사 시 mtime을 보존하므로 재실행은 대부분 여기서 끝남)
+    - 크기만 같은 애매한 경우에만 해시로 비교하며, 싱크의 해시 캐시로 파일 해시를 실행 간에 재사용한다
+    - 싱크의 copy_mode가 hardlink/reflink면 복사 대신 링크/CoW 복제 (불가능하면 복사로 대체)
+    - jobs > 1이면 비교/복사를 스레드 풀에서 병렬로 처리 (최소화 대상은 순차 처리)
+
+    Returns:
+        처리 결과 집계 {"copied", "linked", "skipped"}
     """
-    os.makedirs(dst_dir, exist_ok=True)
+    stats = {"copied": 0, "linked": 0, "skipped": 0}
+    hasher = sink.hash_cache
+    plain: list[tuple[str, str]] = []  # (출력 상대 경로, 소스 파일)
+
     for root, dirs, files in os.walk(src_dir):
-        rel = os.path.relpath(root, src_dir)
-        target_root = dst_dir if rel == '.' else os.path.join(dst_dir, rel)
-        os.makedirs(target_root, exist_ok=True)
+        dirs.sort()
+        rel_root = os.path.relpath(root, src_dir)
+        for fname in sorted(files):
+            rel = fname if rel_root == '.' else os.path.join(rel_root, fname)
+            rel = f"{prefix}/{rel.replace(os.sep, '/')}"
+            src_file = os.path.join(root, fname)
+            dst_file = sink.path(rel)
+            kind = minifier_kind(fname) if minifier else None
+            if kind:
+                with open(src_file, 'r', encoding='utf-8') as f:
+                    data = minifier.minify_output(kind, f.read()).encode('utf-8')
+                if os.path.exists(dst_file):
+                    try:
+                        if (os.path.getsize(dst_file) == len(data)
+                                and hashlib.sha256(data).hexdigest() == hasher.sha256(dst_file)):
+                            sink.keep(rel)
+                            stats["skipped"] += 1
+                            continue
+                    except Exception:
+                        pass
+                sink.write_bytes(rel, data)
+                stats["copied"] += 1
+                continue
+            plain.append((rel, src_file))
+
+    def sync_one(item: tuple[str, str]) -> str:
+        rel, src_file = item
+        dst_file = sink.path(rel)
+        if os.path.exists(dst_file):
+            if same_metadata(src_file, dst_file):
+                # 크기+mtime 일치 → 내용을 읽지 않고 생략
+                sink.keep(rel)
+                return "skipped"
+            try:
+                if (os.path.getsize(src_file) == os.path.getsize(dst_file)
+                        and hasher.sha256(src_file) == hasher.sha256(dst_file)):
+                    # 내용은 같고 mtime만 다름 → 다음 실행부터 빠른 경로를 타도록 commit 때 mtime 맞춤 (내용은 그대로)
+                    sink.keep(rel, stat_src=src_file)
+                    return "skipped"
+            except Exception:
+                # 해시 실패 시 안전하게 덮어쓰기
+                pass
+        # 신규 또는 다른 내용 → 싱크에 기록
+        used = sink.add_file(rel, src_file)
+        return "copied" if used == "copy" else "linked"
+
+    if jobs > 1 and len(plain) > 1:
+        with ThreadPoolExecutor(max_workers=jobs) as pool:
+            results = list(pool.map(sync_one, plain))
+    else:
+        results = [sync_one(item) for item in plain]
+    for result in results:
+        stats[result] += 1
+    return stats
 
-        for d in dirs:
-            os.makedirs(os.path.join(target_root, d), exist_ok=True)
 
-        for fname in files:
+def _add_dir_to_sink(sink: OutputSink, src_dir: str, prefix: str,
+                     minifier: Optional[MinifyCache] = None) -> None:
+    """디렉터리를 싱크(아카이브)에 추가 (경로 정렬 순서, minifier가 있으면 CSS/JS/HTML 최소화)"""
+    for root, dirs, files in os.walk(src_dir):
+        dirs.sort()
+        rel_root = os.path.relpath(root, src_dir)
+        for fname in sorted(files):
+            rel = fname if rel_root == '.' else os.path.join(rel_root, fname)
+            rel = f"{prefix}/{rel.replace(os.sep, '/')}"
             src_file = os.path.join(root, fname)
-            dst_file = os.path.join(target_root, fname)
-            if os.path.exists(dst_file):
-                try:
-                    if _sha256_of_file(src_file) == _sha256_of_file(dst_file):
-                        # 동일 파일 → 복사 생략
-                        continue
-                except Exception:
-                    # 해시 실패 시 안전하게 덮어쓰기
-                    pass
-            # 신규 또는 다른 내용 → 덮어쓰기
-            shutil.copy2(src_file, dst_file)
+            kind = minifier_kind(fname) if minifier else None
+            if kind:
+                with open(src_file, 'r', encoding='utf-8') as f:
+                    sink.write_text(rel, minifier.minify_output(kind, f.read()))
+            else:
+                sink.add_file(rel, src_file)
+
+
+def _format_copy_stats(label: str, stats: dict[str, int]) -> str:
+    """복사 집계 한 줄 요약"""
+    parts = [f"복사 {stats['copied']}개"]
+    if stats["linked"]:
+        parts.append(f"링크 {stats['linked']}개")
+    parts.append(f"변경 없음 {stats['skipped']}개")
+    return f"📁 {label}: " + ", ".join(parts)
 
 
 def main():
@@ -561,6 +1474,14 @@ def main():
         default=None,
         help="본문에 삽입할 CSS 링크 URL (차일드 테마에서 자동 로드하면 지정하지 않음)",
     )
+    parser.add_argument(
+        "--inline-critical-css",
+        nargs="?",
+        const="static/verse-style.css",
+        default=None,
+        metavar="CSS_PATH",
+        help="첫 화면용 크리티컬 CSS를 장 HTML에 인라인하고 --css-href 스타일시트는 비동기 로드 (기본 원본: static/verse-style.css)",
+    )
     parser.add_argument(
         "--js-src",
         dest="js_src",
@@ -572,11 +1493,44 @@ def main():
         action="store_true",
         help="생성된 출력 디렉터리에 static/ 디렉터리를 복사",
     )
+    parser.add_argument(
+        "--minify",
+        action="store_true",
+        help="생성 HTML과 복사되는 정적 CSS/JS의 주석/공백 제거 (결과는 내용 해시로 캐시)",
+    )
+    parser.add_argument(
+        "--minify-cache-dir",
+        dest="minify_cache_dir",
+        default=None,
+        help="정적 자원 최소화 결과 캐시 디렉터리 (기본: <output_dir>/.minify-cache)",
+    )
+    parser.add_argument(
+        "--hash-assets",
+        action="store_true",
+        help="--copy-static으로 복사한 CSS/JS를 내용 해시 파일명으로도 저장하고 HTML 참조를 치환 (static/asset-manifest.json 생성)",
+    )
     parser.add_argument(
         "--copy-audio",
         action="store_true",
         help="생성된 출력 디렉터리에 data/audio/ 디렉터리를 복사",
     )
+    parser.add_argument(
+        "--copy-mode",
+        choices=COPY_MODES,
+        default="copy",
+        help="정적/오디오 복사 방식: copy (기본) / hardlink (같은 파일 시스템이면 하드 링크) / reflink (CoW 복제 지원 시). 불가능하면 복사로 대체",
+    )
+    parser.add_argument(
+        "--copy-jobs",
+        type=int,
+        default=8,
+        help="정적/오디오 파일 비교·복사 병렬 스레드 수 (기본: 8)",
+    )
+    parser.add_argument(
+        "--copy-hash-cache",
+        default=None,
+        help="복사 비교용 파일 해시 캐시 (크기/mtime으로 검증, 기본: <output_dir>/.copy-hash-cache.json, 빈 문자열이면 사용 안 함)",
+    )
     # 기본: 전역 검색 인덱스 생성 활성화
     parser.add_argument(
         "--emit-search-index",
@@ -596,11 +1550,75 @@ def main():
         default=None,
         help="검색 인덱스 출력 경로 (기본: <output_dir>/static/search/search-index.json)",
     )
+    parser.add_argument(
+        "--emit-binary-index",
+        action="store_true",
+        help="검색 인덱스를 바이너리(typed array) 포맷으로도 생성 (<인덱스 경로>.bin)",
+    )
+    parser.add_argument(
+        "--shared-search-worker",
+        action="store_true",
+        help="검색 워커를 SharedWorker로 띄워 탭/페이지 간 인덱스 한 벌을 공유 (미지원 브라우저는 전용 Worker)",
+    )
+    parser.add_argument(
+        "--search-worker-pool",
+        nargs="?",
+        type=int,
+        const=0,
+        default=None,
+        metavar="N",
+        help="검색을 워커 N개가 인덱스 구간을 나눠 병렬 스캔 (N 생략 시 브라우저 코어 수 기준 최대 2, 지정 시 최대 4). "
+             "워커마다 인덱스 사본을 메모리에 올림",
+    )
+    parser.add_argument(
+        "--service-worker",
+        action="store_true",
+        help="출력 디렉터리에 sw.js와 프리캐시 매니페스트(precache-manifest.<버전>.json)를 생성하고 페이지에서 등록",
+    )
+    parser.add_argument(
+        "--precache-books",
+        dest="precache_books",
+        default="",
+        help="서비스 워커가 모든 장을 미리 캐시할 책 약칭 (쉼표 구분, 예: 창세,마태)",
+    )
+    parser.add_argument(
+        "--output-mode",
+        choices=("static", "shell"),
+        default="static",
+        help="static: 장마다 완성된 HTML (기본) / shell: 셸 HTML 하나(reader.html) + 장별 JSON(chapters/*.json)을 클라이언트에서 렌더링",
+    )
+    parser.add_argument(
+        "--prefetch",
+        choices=("none", "link", "speculation"),
+        default="none",
+        help="장 HTML에 다음 장 미리 가져오기 힌트 삽입: link(<link rel=prefetch>) / speculation(Speculation Rules) / none (기본)",
+    )
+    parser.add_argument(
+        "--prefetch-limit",
+        type=int,
+        default=1,
+        help=f"미리 가져올 다음 장 수 (기본: 1, 최대 {PREFETCH_LIMIT_MAX}, 넘으면 경고 후 줄임)",
+    )
+    parser.add_argument(
+        "--archive",
+        default=None,
+        help="출력 디렉터리 대신 사이트 전체를 아카이브 하나로 기록 (.tar/.tar.gz/.tgz/.tar.bz2/.tar.xz/.zip, 확장자로 형식 결정)",
+    )
+    parser.add_argument(
+        "--no-build-manifest",
+        action="store_true",
+        help=f"빌드 매니페스트(<output_dir>/{MANIFEST_NAME}, 아카이브는 <archive>.manifest.json) 기록 비활성화 (기본: 기록)",
+    )
     parser.add_argument(
         "--no-index",
         action="store_true",
         help="index.html 생성을 비활성화 (기본: 생성)",
     )
+    parser.add_argument(
+        "--low-memory",
+        action="store_true",
+        help="저메모리 생성: 파서 JSON을 장 단위로 두 번 스트리밍하고(이전/다음 표·검색 인덱스 → 장 생성) 검색 인덱스는 임시 파일로 흘려 씀 (출력은 기본 모드와 동일)",
+    )
 
     args = parser.parse_args()
 
@@ -614,12 +1632,48 @@ def main():
     static_base_arg: str = args.static_base
     copy_static: bool = args.copy_static
     copy_audio: bool = args.copy_audio
+    hash_assets: bool = args.hash_assets
+    copy_mode: str = args.copy_mode
+    copy_jobs: int = max(1, args.copy_jobs)
+    # 캐시 기본 경로는 출력 디렉터리 아래 (다른 출력 트리의 해시/최소화 결과를 섞어 쓰지 않음)
+    copy_hash_cache: str = (os.path.join(output_dir, ".copy-hash-cache.json")
+                            if args.copy_hash_cache is None else args.copy_hash_cache)
+    minify_cache_dir: str = args.minify_cache_dir or os.path.join(output_dir, ".minify-cache")
+    # 복사 비교와 빌드 매니페스트가 같은 해시 캐시를 공유 (복사만 된 오디오는 다시 읽지 않음)
+    file_hash_cache: Optional[FileHashCache] = FileHashCache(
+        copy_hash_cache) if copy_hash_cache else None
+    emit_build_manifest: bool = not args.no_build_manifest
+    # 최소화: 정적 자원은 디스크 캐시, 장 HTML은 메모리 캐시(인라인 스크립트 재사용)만 사용
+    minifier: Optional[MinifyCache] = MinifyCache(
+        minify_cache_dir) if args.minify else None
     # 기본 활성화, --no-emit-search-index로 비활성화
     emit_search_index: bool = not args.no_emit_search_index
     search_index_out: Optional[str] = args.search_index_out
+    emit_binary_index: bool = emit_search_index and args.emit_binary_index
+    shared_search_worker: bool = args.shared_search_worker
+    search_worker_pool: Optional[int] = args.search_worker_pool
     css_href: Optional[str] = args.css_href
+    critical_css_path: Optional[str] = args.inline_critical_css
     js_src: Optional[str] = args.js_src
     emit_index: bool = not args.no_index
+    low_memory: bool = args.low_memory
+    emit_service_worker: bool = args.service_worker
+    shell_mode: bool = args.output_mode == "shell"
+    # 셸 모드는 verse-navigator.js가 다음 장 JSON을 직접 미리 받으므로 힌트 불필요
+    prefetch_mode: Optional[str] = None if args.prefetch == "none" or shell_mode else args.prefetch
+    prefetch_limit: int = max(0, args.prefetch_limit)
+    if prefetch_mode and prefetch_limit > PREFETCH_LIMIT_MAX:
+        print(f"⚠️ --prefetch-limit 값({prefetch_limit})을 최대 {PREFETCH_LIMIT_MAX}개로 줄입니다.")
+    prefetch_limit = min(prefetch_limit, PREFETCH_LIMIT_MAX)
+    precache_books: list[str] = [
+        b.strip() for b in args.precache_books.split(',') if b.strip()]
+    # 장 HTML이 출력 디렉터리 루트에 있으므로 같은 위치의 sw.js가 사이트 전체를 스코프로 가진다
+    service_worker_url: Optional[str] = "sw.js" if emit_service_worker else None
+
+    archive_path: Optional[str] = args.archive
+    if archive_path and archive_format(archive_path) is None:
+        print(f"❌ 지원하지 않는 아카이브 형식입니다: {archive_path}")
+        raise SystemExit(1)
 
     if not os.path.exists(json_path):
         print(f"❌ 파서 결과 JSON이 없습니다: {json_path}")
@@ -627,7 +1681,8 @@ def main():
         print("   python src/parser.py data/common-bible-kr.txt --save-json output/parsed_bible.json")
         raise SystemExit(1)
 
-    os.makedirs(output_dir, exist_ok=True)
+    if not archive_path:
+        os.makedirs(output_dir, exist_ok=True)
 
     # 출력 디렉터리 기준 상대 경로 자동 보정
     output_abs = os.path.abspath(output_dir)
@@ -644,248 +1699,343 @@ def main():
     if audio_base == "data/audio":
         audio_base = os.path.relpath(project_audio_abs, start=output_abs)
 
-    # 파서 JSON 로드
+    # HTML 생성기
+    generator = HtmlGenerator(template_path)
     bible_parser = BibleParser('data/book_mappings.json')
-    all_chapters = bible_parser.load_from_json(json_path)
-    chapters = list(all_chapters)
-
-    # 필터링: 책 약칭
-    if book_filter:
-        chapters = [c for c in chapters if c.book_abbr == book_filter]
-
-    # 필터링: 장 번호 목록/구간
-    if chapters_filter:
-        wanted_numbers: set[int] = set()
-        for token in chapters_filter.split(','):
-            token = token.strip()
-            if not token:
-                continue
-            if '-' in token:
-                a, b = token.split('-', 1)
-                try:
-                    start = int(a)
-                    end = int(b)
-                    for n in range(min(start, end), max(start, end) + 1):
-                        wanted_numbers.add(n)
-                except ValueError:
-                    pass
-            else:
-                try:
-                    wanted_numbers.add(int(token))
-                except ValueError:
-                    pass
-        chapters = [c for c in chapters if c.chapter_number in wanted_numbers]
 
-    # 제한
-    if limit is not None and limit >= 0:
-        chapters = chapters[:limit]
+    def compute_slug(book_abbr: str) -> str:
+        return chapter_file_slug(generator, bible_parser.book_mappings, book_abbr)
+
+    # 브레드크럼 메타: 책 목록 그대로 주입 (구분/약칭/전체 이름/영문 이름/aliases)
+    books_meta: list[dict] | None = None
+    try:
+        with open('data/book_mappings.json', 'r', encoding='utf-8') as _bmf:
+            books_meta = json.load(_bmf)
+    except Exception as e:
+        print(f"⚠️ 책 목록(data/book_mappings.json)을 읽지 못했습니다: {e}")
+        books_meta = None
+
+    # 이전/다음 장 표 (전체 본문 기준, 필터와 무관)
+    navigation = NavigationTable(books_meta, compute_slug)
+    wanted_numbers: Optional[set[int]] = _parse_chapter_numbers(
+        chapters_filter) if chapters_filter else None
+    slug_by_abbr: dict[str, str] = {}
+    search_spool: Optional[SearchIndexSpool] = None
+    scratch_dir: Optional[str] = None
+
+    if low_memory:
+        # 저메모리: 1차 스트리밍으로 이전/다음 표, 생성 대상 장 요약(절 없음), 검색 인덱스 조각을 만들고
+        # 장 페이지는 2차 스트리밍에서 한 장씩 생성한다 (전체 장/엔트리를 동시에 들고 있지 않음)
+        scratch_dir = tempfile.mkdtemp(prefix='.bible-build-')
+        atexit.register(shutil.rmtree, scratch_dir, True)
+        if emit_search_index:
+            search_spool = SearchIndexSpool(scratch_dir)
+
+        def scan_all() -> Iterator[Chapter]:
+            for chapter in bible_parser.iter_json(json_path):
+                navigation.add(chapter.book_abbr, chapter.chapter_number)
+                yield chapter
+
+        chapters: list[Chapter] = []
+        for chapter in _select_chapters(scan_all(), book_filter, wanted_numbers, limit):
+            if chapter.book_abbr not in slug_by_abbr:
+                slug_by_abbr[chapter.book_abbr] = compute_slug(chapter.book_abbr)
+            if search_spool:
+                search_spool.add_chapter(chapter, slug_by_abbr[chapter.book_abbr])
+            chapters.append(Chapter(chapter.book_name, chapter.book_abbr, chapter.chapter_number, []))
+
+        def chapter_stream() -> Iterable[Chapter]:
+            return _select_chapters(bible_parser.iter_json(json_path),
+                                    book_filter, wanted_numbers, limit)
+    else:
+        # 파서 JSON 로드
+        all_chapters = bible_parser.load_from_json(json_path)
+        for chapter in all_chapters:
+            navigation.add(chapter.book_abbr, chapter.chapter_number)
+        # 필터링: 책 약칭 → 장 번호 목록/구간 → 제한
+        chapters = list(_select_chapters(all_chapters, book_filter, wanted_numbers, limit))
+        for chapter in chapters:
+            if chapter.book_abbr not in slug_by_abbr:
+                slug_by_abbr[chapter.book_abbr] = compute_slug(chapter.book_abbr)
+
+        def chapter_stream() -> Iterable[Chapter]:
+            return chapters
 
     if not chapters:
         print("⚠️ 생성할 장이 없습니다. 필터 조건을 확인하세요.")
         raise SystemExit(0)
 
+    # 생성 출력은 모두 싱크를 거친다 (디렉터리: 임시 파일 후 일괄 이름 변경 / 아카이브: 단일 파일)
+    # commit 전에 종료되면(예외/중단) 임시 파일을 지워 기존 출력을 그대로 둔다
+    sink: OutputSink = open_sink(output_dir, archive_path, file_hash_cache, copy_mode)
+    atexit.register(sink.abort)
+    # 출력 디렉터리 밖 경로(예: --search-index-out)는 디렉터리별 보조 싱크에 모아 두고
+    # 주 싱크와 함께 commit/abort한다 (생성 도중에 먼저 반영되지 않음)
+    outside_sinks: dict[str, DirectorySink] = {}
+
+    def outside_sink(path: str) -> tuple[Optional[DirectorySink], str]:
+        """출력 디렉터리 밖 경로면 (보조 싱크, 파일 이름), 안쪽이면 (None, 상대 경로)"""
+        rel = os.path.relpath(os.path.abspath(path), output_abs)
+        if not (rel.startswith('..') or os.path.isabs(rel)):
+            return None, rel.replace(os.sep, '/')
+        directory = os.path.dirname(os.path.abspath(path))
+        if directory not in outside_sinks:
+            outside_sinks[directory] = DirectorySink(directory)
+            atexit.register(outside_sinks[directory].abort)
+        return outside_sinks[directory], os.path.basename(path)
+
+    def emit(path: str, data: str | bytes) -> None:
+        """출력 경로(출력 디렉터리 기준 또는 임의 경로)에 기록"""
+        payload = data.encode('utf-8') if isinstance(data, str) else data
+        outside, rel = outside_sink(path)
+        (outside or sink).write_bytes(rel, payload)
+
+    def emit_file(path: str, src_path: str) -> None:
+        """emit과 같되 내용을 메모리에 올리지 않고 기존 파일째 기록"""
+        outside, rel = outside_sink(path)
+        (outside or sink).add_file(rel, src_path)
+
     # 필요 시 정적/오디오 복사
     if copy_static:
-        dst = os.path.join(output_abs, "static")
-        _copy_dir_dedup(project_static_abs, dst)
+        if archive_path:
+            _add_dir_to_sink(sink, project_static_abs, "static", minifier)
+        else:
+            copy_stats = copy_dir_dedup(project_static_abs, sink, "static", minifier, copy_jobs)
+            print(_format_copy_stats("static", copy_stats))
         # 복사했으면 HTML에서 로컬 static 경로 사용
         static_base = "static"
+    # 내용 해시 파일명: 파일명이 내용과 함께 바뀌므로 immutable 캐시 헤더로 서빙 가능
+    asset_manifest: Optional[dict[str, str]] = None
+    if hash_assets:
+        if not copy_static:
+            print("⚠️ --hash-assets는 --copy-static과 함께 사용해야 합니다. 해시 파일명을 건너뜁니다.")
+        elif archive_path:
+            print("⚠️ --hash-assets는 --archive와 함께 사용할 수 없습니다. 해시 파일명을 건너뜁니다.")
+        else:
+            asset_manifest = _hash_static_assets(sink)
+            sink.write_text("static/asset-manifest.json",
+                            json.dumps(asset_manifest, ensure_ascii=False, indent=2, sort_keys=True))
+            print(f"🔖 해시 자원 {len(asset_manifest)}개: static/asset-manifest.json")
     if copy_audio:
         src_audio = project_audio_abs
-        dst_audio = os.path.join(output_abs, "audio")
-        _copy_dir_dedup(src_audio, dst_audio)
+        if archive_path:
+            _add_dir_to_sink(sink, src_audio, "audio")
+        else:
+            copy_stats = copy_dir_dedup(src_audio, sink, "audio", None, copy_jobs)
+            print(_format_copy_stats("audio", copy_stats))
         # 복사했으면 HTML에서 로컬 audio 경로 사용
         audio_base = "audio"
 
-    # HTML 생성기
-    generator = HtmlGenerator(template_path)
+    # 오디오 존재 확인 위치 (복사한 audio/는 commit 전까지 출력에 없으므로 원본에서 확인)
+    audio_check_base: str = audio_base if urlparse(
+        audio_base).scheme else os.path.join(output_abs, audio_base)
+    if copy_audio:
+        audio_check_base = project_audio_abs
 
-    def compute_slug(book_abbr: str) -> str:
-        slug = generator._get_book_slug(book_abbr)
-        # 비ASCII(예: 한글)인 경우 영어 이름 기반으로 보정
-        if not slug.isascii() or re.search(r"[가-힣]", slug):
-            info = bible_parser.book_mappings.get(book_abbr)
-            if info and info.get('english_name'):
-                fallback = info['english_name'].lower()
-                # 공백/구두점 제거, 숫자/영문만 유지
-                fallback = re.sub(r"[^a-z0-9]+", "", fallback)
-                if fallback:
-                    return fallback
-        return slug
+    # 크리티컬 CSS: 모든 장이 같은 레이아웃을 쓰므로 한 번만 추출해 재사용
+    critical_css: Optional[str] = None
+    if critical_css_path:
+        if not css_href:
+            print("⚠️ --inline-critical-css는 --css-href와 함께 사용해야 합니다. 인라인을 건너뜁니다.")
+        else:
+            try:
+                critical_css = generator.extract_critical_css(critical_css_path)
+                if minifier:
+                    critical_css = minifier.minify('css', critical_css)
+                print(f"🎨 크리티컬 CSS 추출: {critical_css_path} ({len(critical_css)}자 인라인)")
+            except Exception as e:
+                print(f"❌ 크리티컬 CSS 추출 실패(일반 링크로 대체): {e}")
 
     print(f"HTML 생성 시작... ({len(chapters)}개 장)")
 
     # 전역 검색 인덱스: 전체 절을 하나의 JSON으로 직렬화
+    # 페이지에 인덱스 내용 해시를 주입해야 하므로 장 HTML 생성 전에 먼저 구성한다
     search_entries: list[dict] = []
-    for i, chapter in enumerate(chapters, start=1):
+    search_index_json = ""
+    # 저메모리 모드: 인덱스를 임시 파일에 완성해 두고 출력에는 파일째 추가
+    search_index_file: Optional[str] = None
+    search_entry_count = 0
+    # 검색 워커에 전달할 인덱스 메타 (내용 해시: 워커의 IndexedDB 캐시 키/캐시 무효화용)
+    search_meta: dict | None = None
+    if emit_search_index:
+        if search_spool:
+            search_index_file = os.path.join(scratch_dir, 'search-index.json')
+            with open(search_index_file, 'wb') as f:
+                index_digest = search_spool.write_json(f)
+            search_entry_count = search_spool.entry_count
+        else:
+            search_entries = build_search_entries(chapters, slug_by_abbr)
+            search_index_json = _serialize_search_index(search_entries)
+            index_digest = hashlib.sha256(search_index_json.encode('utf-8')).hexdigest()
+            search_entry_count = len(search_entries)
+        search_meta = {
+            "hash": index_digest[:16],
+        }
+        if emit_binary_index:
+            search_meta["format"] = "binary"
+        if shared_search_worker:
+            search_meta["sharedWorker"] = True
+        if search_worker_pool is not None and shared_search_worker:
+            print("⚠️ --search-worker-pool은 --shared-search-worker와 함께 사용할 수 없습니다. 워커 풀을 건너뜁니다.")
+        elif search_worker_pool is not None:
+            if search_worker_pool > SEARCH_WORKER_POOL_MAX:
+                print(f"⚠️ --search-worker-pool 값({search_worker_pool})을 최대 {SEARCH_WORKER_POOL_MAX}개로 줄입니다 "
+                      "(워커마다 검색 인덱스 사본을 메모리에 올림).")
+                search_worker_pool = SEARCH_WORKER_POOL_MAX
+            # 0: 브라우저가 navigator.hardwareConcurrency로 크기 결정
+            search_meta["workerPool"] = search_worker_pool or True
+        # 절 수 테이블(search/verse-counts.json)을 함께 생성함을 알림
+        search_meta["counts"] = True
+
+    # 오디오가 다른 출처(CDN)에 있으면 다음 장 재생을 위해 미리 연결.
+    # 다음 장 MP3의 메타데이터만 미리 받을 방법은 없다(<link rel=prefetch>는 Range 요청을 못 해
+    # 파일 전체를 받음). 같은 출처 오디오는 이미 연결이 열려 있으므로 힌트를 넣지 않는다.
+    audio_origin: Optional[str] = None
+    if prefetch_mode:
+        _audio_url = urlparse(audio_base)
+        if _audio_url.scheme in ('http', 'https') and _audio_url.netloc:
+            audio_origin = f"{_audio_url.scheme}://{_audio_url.netloc}"
+
+    for i, chapter in enumerate(chapter_stream(), start=1):
         try:
-            # 브레드크럼 메타: 책 목록 그대로 주입 (구분/약칭/전체 이름/영문 이름/aliases)
-            books_meta: list[dict] | None = None
-            try:
-                with open('data/book_mappings.json', 'r', encoding='utf-8') as _bmf:
-                    books_meta = json.load(_bmf)
-            except Exception:
-                books_meta = None
-
-            # 이전/다음 장 링크 계산
-            # 책 순서 목록과 각 책의 장 수 계산 (전체 본문 기준)
-            book_list: list[dict] = books_meta or []
-            # 별칭 → 표준 약칭(books_meta의 "약칭") 매핑
-            alias_to_canonical: dict[str, str] = {}
-            for b in book_list:
-                can = b.get('약칭')
-                if isinstance(can, str) and can:
-                    alias_to_canonical[can] = can
-                    full = b.get('전체 이름')
-                    if isinstance(full, str) and full:
-                        alias_to_canonical[full] = can
-                    for al in (b.get('aliases') or []):
-                        if isinstance(al, str) and al:
-                            alias_to_canonical[al] = can
-
-            # 표준 약칭 순서 (메타 순서 그대로)
-            abbr_sequence: list[str] = []
-            for b in book_list:
-                can = b.get('약칭')
-                if isinstance(can, str) and can:
-                    abbr_sequence.append(can)
-
-            # 각 책의 총 장 수 계산 (전체 장 컬렉션 기준, 표준 약칭 키)
-            chapters_by_book: dict[str, set[int]] = {}
-            canonical_to_actual_abbr: dict[str, str] = {}
-            for ch2 in all_chapters:
-                canonical = alias_to_canonical.get(
-                    ch2.book_abbr, ch2.book_abbr)
-                chapters_by_book.setdefault(
-                    canonical, set()).add(ch2.chapter_number)
-                # 대표 약칭(실제 파일명 슬러그 계산 시 사용)을 기록
-                canonical_to_actual_abbr.setdefault(canonical, ch2.book_abbr)
-
-            def get_total_chapters(abbr: str) -> int:
-                nums = chapters_by_book.get(abbr)
-                if not nums:
-                    return 0
-                return max(nums)
-
-            def compute_prev_next(current_abbr: str, current_ch: int) -> tuple[tuple[str, int] | None, tuple[str, int] | None]:
-                # 이전
-                prev_target: tuple[str, int] | None = None
-                next_target: tuple[str, int] | None = None
-
-                if current_abbr in abbr_sequence:
-                    idx = abbr_sequence.index(current_abbr)
-                else:
-                    idx = 0
+            slug = slug_by_abbr[chapter.book_abbr]
+            prev_id, next_id = navigation.neighbours(f"{slug}-{chapter.chapter_number}")
+            if shell_mode:
+                # 셸 모드: 장 HTML 대신 장 JSON만 기록
+                payload = generator.chapter_payload(
+                    chapter,
+                    audio_base_url=audio_base,
+                    audio_check_base=audio_check_base,
+                    prev_id=prev_id,
+                    next_id=next_id,
+                )
+                filename = f"{slug}-{chapter.chapter_number}.json"
+                sink.write_text(f"{SHELL_CHAPTER_DIR}/{filename}",
+                                json.dumps(payload, ensure_ascii=False, separators=(',', ':')))
+                print(
+                    f"[{i}/{len(chapters)}] {chapter.book_name} {chapter.chapter_number}장 → chapters/{filename}")
+                continue
 
-                # 이전 장
-                if current_ch > 1:
-                    prev_target = (current_abbr, current_ch - 1)
-                else:
-                    # 이전 책 마지막 장으로
-                    if idx > 0:
-                        prev_abbr = abbr_sequence[idx - 1]
-                        prev_total = get_total_chapters(prev_abbr)
-                        if prev_total > 0:
-                            prev_target = (prev_abbr, prev_total)
-
-                # 다음 장
-                total_current = get_total_chapters(current_abbr)
-                if total_current and current_ch < total_current:
-                    next_target = (current_abbr, current_ch + 1)
-                else:
-                    # 다음 책 1장
-                    if idx < len(abbr_sequence) - 1:
-                        next_abbr = abbr_sequence[idx + 1]
-                        if get_total_chapters(next_abbr) > 0:
-                            next_target = (next_abbr, 1)
-
-                return prev_target, next_target
-
-            current_canonical = alias_to_canonical.get(
-                chapter.book_abbr, chapter.book_abbr)
-            prev_target, next_target = compute_prev_next(
-                current_canonical, chapter.chapter_number)
-
-            def btn_svg(direction: str) -> str:
-                if direction == 'left':
-                    return '<svg viewBox="0 0 24 24" aria-hidden="true"><path d="M15.41 7.41 14 6l-6 6 6 6 1.41-1.41L10.83 12z"/></svg>'
-                else:
-                    return '<svg viewBox="0 0 24 24" aria-hidden="true"><path d="M8.59 16.59 10 18l6-6-6-6-1.41 1.41L13.17 12z"/></svg>'
-
-            def build_nav_button(target: tuple[str, int] | None, is_prev: bool) -> str:
-                if not target:
-                    # 비활성 버튼
-                    return f'<span class="nav-btn disabled" aria-disabled="true">{btn_svg("left" if is_prev else "right")}</span>'
-                t_canonical, t_ch = target
-                # 실제 생성 파일의 약칭(로컬 약칭)으로 매핑
-                t_actual_abbr = canonical_to_actual_abbr.get(
-                    t_canonical, t_canonical)
-                t_slug = compute_slug(t_actual_abbr)
-                href = f"{t_slug}-{t_ch}.html"
-                aria_label = ("이전 장" if is_prev else "다음 장")
-                return f'<a class="nav-btn" href="{href}" aria-label="{aria_label}">{btn_svg("left" if is_prev else "right")}</a>'
-
-            prev_btn_html = build_nav_button(prev_target, True)
-            next_btn_html = build_nav_button(next_target, False)
+            prev_btn_html = nav_button_html(f"{prev_id}.html" if prev_id else None, True)
+            next_btn_html = nav_button_html(f"{next_id}.html" if next_id else None, False)
+
+            # 다음 장 미리 가져오기 힌트 (순차 읽기 기준, 최대 prefetch_limit개)
+            prefetch_html = ""
+            if prefetch_mode:
+                prefetch_urls: list[str] = []
+                ahead = next_id
+                while ahead and len(prefetch_urls) < prefetch_limit:
+                    prefetch_urls.append(f"{ahead}.html")
+                    ahead = navigation.neighbours(ahead)[1]
+                prefetch_html = _prefetch_hint_html(
+                    prefetch_urls, prefetch_mode, audio_origin)
 
             html = generator.generate_chapter_html(
                 chapter,
                 audio_base_url=audio_base,
                 static_base=static_base,
-                audio_check_base=(os.path.join(output_abs, audio_base) if not urlparse(
-                    audio_base).scheme else audio_base),
+                audio_check_base=audio_check_base,
                 css_href=css_href,
                 js_src=js_src,
                 books_meta=books_meta,
                 prev_button_html=prev_btn_html,
                 next_button_html=next_btn_html,
+                search_meta=search_meta,
+                critical_css=critical_css,
+                asset_manifest=asset_manifest,
+                service_worker_url=service_worker_url,
+                prefetch_html=prefetch_html,
             )
-            slug = compute_slug(chapter.book_abbr)
+            if minifier:
+                html = minifier.minify_output('html', html, persist=False)
             filename = f"{slug}-{chapter.chapter_number}.html"
-            filepath = os.path.join(output_dir, filename)
-            with open(filepath, 'w', encoding='utf-8') as f:
-                f.write(html)
+            sink.write_text(filename, html)
             print(
                 f"[{i}/{len(chapters)}] {chapter.book_name} {chapter.chapter_number}장 → {filename}")
 
-            # 검색 인덱스 엔트리 적재
-            if emit_search_index:
-                for verse in chapter.verses:
-                    verse_id = f"{chapter.book_abbr}-{chapter.chapter_number}-{verse.number}"
-                    href = f"{slug}-{chapter.chapter_number}.html#{verse_id}"
-                    # 텍스트에서 접근성 기호는 검색 품질을 위해 제거/단순화
-                    verse_text = verse.text.replace(
-                        '\u00B6', ' ').replace('¶', ' ').strip()
-                    search_entries.append({
-                        "i": verse_id,
-                        "t": verse_text,
-                        "h": href,
-                        "b": chapter.book_abbr,
-                        "c": chapter.chapter_number,
-                        "v": verse.number,
-                        "bo": HtmlGenerator.get_book_order_index(chapter.book_abbr),
-                    })
         except Exception as e:
             print(
                 f"❌ 생성 실패: {chapter.book_name} {chapter.chapter_number}장 - {e}")
 
+    # 셸 모드: 모든 장이 공유하는 단일 셸 페이지
+    if shell_mode:
+        try:
+            if not books_meta:
+                # 셸은 책/장 이동을 books_meta로만 그리므로 없으면 알림
+                print("⚠️ 책 목록(data/book_mappings.json)이 없어 셸 페이지의 책 이동 메뉴가 비어 있습니다.")
+            first = chapters[0]
+            shell_html = generator.generate_shell_html(
+                {
+                    "chapterBase": f"{SHELL_CHAPTER_DIR}/",
+                    "first": f"{slug_by_abbr[first.book_abbr]}-{first.chapter_number}",
+                },
+                static_base=static_base,
+                css_href=css_href,
+                js_src=js_src,
+                books_meta=books_meta,
+                prev_button_html=nav_button_html(None, True),
+                next_button_html=nav_button_html(None, False),
+                search_meta=search_meta,
+                critical_css=critical_css,
+                asset_manifest=asset_manifest,
+                service_worker_url=service_worker_url,
+            )
+            if minifier:
+                shell_html = minifier.minify_output('html', shell_html, persist=False)
+            sink.write_text(SHELL_PAGE, shell_html)
+            print(f"📄 셸 페이지 생성: {SHELL_PAGE} (장 JSON {len(chapters)}개: {SHELL_CHAPTER_DIR}/)")
+        except Exception as e:
+            print(f"❌ 셸 페이지 생성 실패: {e}")
+
     # 검색 인덱스 파일 저장
     if emit_search_index:
         # 기본 경로: <output_dir>/static/search/search-index.json
         if not search_index_out:
             search_index_out = os.path.join(
                 output_dir, 'static', 'search', 'search-index.json')
-        # 출력 디렉터리 생성
-        os.makedirs(os.path.dirname(search_index_out), exist_ok=True)
         try:
-            with open(search_index_out, 'w', encoding='utf-8') as f:
-                json.dump(search_entries, f, ensure_ascii=False,
-                          separators=(',', ':'))
+            if search_index_file:
+                emit_file(search_index_out, search_index_file)
+            else:
+                emit(search_index_out, search_index_json)
             print(
-                f"🗂️  전역 검색 인덱스 생성: {search_index_out} (엔트리 {len(search_entries)}개)")
+                f"🗂️  전역 검색 인덱스 생성: {search_index_out} (엔트리 {search_entry_count}개)")
         except Exception as e:
             print(f"❌ 검색 인덱스 생성 실패: {e}")
 
+        # 절 수 테이블: 인덱스와 같은 디렉터리에 verse-counts.json으로 저장
+        verse_counts_out = os.path.join(
+            os.path.dirname(search_index_out), 'verse-counts.json')
+        try:
+            verse_counts = (search_spool.verse_counts(slug_by_abbr) if search_spool
+                            else build_verse_counts(search_entries, slug_by_abbr))
+            emit(verse_counts_out, json.dumps(verse_counts, ensure_ascii=False, separators=(',', ':')))
+            print(f"🗂️  절 수 테이블 생성: {verse_counts_out}")
+        except Exception as e:
+            print(f"❌ 절 수 테이블 생성 실패: {e}")
+
+        # 바이너리 인덱스: JSON과 같은 위치에 확장자만 .bin으로 저장
+        if emit_binary_index:
+            binary_index_out = os.path.splitext(search_index_out)[0] + '.bin'
+            try:
+                if search_spool:
+                    binary_index_file = os.path.join(scratch_dir, 'search-index.bin')
+                    with open(binary_index_file, 'wb') as f, \
+                            tempfile.TemporaryFile(dir=scratch_dir) as blob, \
+                            tempfile.TemporaryFile(dir=scratch_dir) as folded:
+                        _write_binary_search_index(
+                            search_spool.iter_entries(), slug_by_abbr, f, blob, folded)
+                    emit_file(binary_index_out, binary_index_file)
+                else:
+                    emit(binary_index_out, _build_binary_search_index(
+                        search_entries, slug_by_abbr))
+                print(f"🗂️  바이너리 검색 인덱스 생성: {binary_index_out}")
+            except Exception as e:
+                print(f"❌ 바이너리 검색 인덱스 생성 실패: {e}")
+
+    if search_spool:
+        search_spool.close()
+
     # index.html 생성
     if emit_index:
         try:
@@ -898,35 +2048,81 @@ def main():
                 books_meta_full = None
 
             index_html = generator.generate_index_html(
-                chapters, static_base, books_meta=books_meta_full)
+                chapters, static_base, books_meta=books_meta_full,
+                asset_manifest=asset_manifest, service_worker_url=service_worker_url)
 
             # 가능한 경우, 파일명 슬러그를 실제 생성 규칙에 맞춰 보정
-            # main 내부의 compute_slug와 동일 규칙으로 링크를 치환한다.
-            # 각 책의 첫 장 파일명을 재계산하여 치환
-            # 책별 첫 장 계산
-            first_chapter_by_book: dict[str, int] = {}
-            book_name_by_book: dict[str, str] = {}
-            for ch in chapters:
-                if ch.book_abbr not in first_chapter_by_book or ch.chapter_number < first_chapter_by_book[ch.book_abbr]:
-                    first_chapter_by_book[ch.book_abbr] = ch.chapter_number
-                    book_name_by_book[ch.book_abbr] = ch.book_name
-
-            for book_abbr, first_ch in first_chapter_by_book.items():
-                real_slug = compute_slug(book_abbr)
-                base_slug = generator._get_book_slug(book_abbr)
-                # generate_index_html에서 사용한 기본 파일명을 실제 파일명으로 교체
-                src_name = f"{base_slug}-{first_ch}.html"
-                dst_name = f"{real_slug}-{first_ch}.html"
-                if src_name != dst_name:
-                    index_html = index_html.replace(src_name, dst_name)
-
-            with open(os.path.join(output_dir, "index.html"), "w", encoding="utf-8") as f:
-                f.write(index_html)
+            index_html = index_with_file_slugs(generator, index_html, chapters, compute_slug)
+
+            if shell_mode:
+                # 셸 모드: 장 링크를 셸 페이지 주소로 치환 (reader.html?c=<slug>-<장>)
+                index_html = re.sub(r'href="([a-z0-9]+-\d+)\.html"',
+                                    rf'href="{SHELL_PAGE}?c=\1"', index_html)
+            if minifier:
+                index_html = minifier.minify_output('html', index_html, persist=False)
+            sink.write_text("index.html", index_html)
             print("📄 index.html 생성 완료")
         except Exception as e:
             print(f"❌ index.html 생성 실패: {e}")
 
-    print(f"\n✅ HTML 생성 완료! 파일 위치: {output_dir}")
+    # 서비스 워커: 모든 출력(index.html, 검색 인덱스, 해시 자원)이 싱크에 기록된 뒤 그 항목의 내용 해시로 매니페스트 구성
+    if emit_service_worker and archive_path:
+        print("⚠️ --service-worker는 --archive와 함께 사용할 수 없습니다. 서비스 워커를 건너뜁니다.")
+    elif emit_service_worker:
+        try:
+            book_slugs: list[str] = []
+            for abbr in precache_books:
+                if abbr in slug_by_abbr:
+                    book_slugs.append(slug_by_abbr[abbr])
+                else:
+                    print(f"⚠️ 생성 대상에 없는 책은 미리 캐시하지 않습니다: {abbr}")
+            emitted = sink.paths()
+            hashed_names = set(asset_manifest.values()) if asset_manifest else None
+            precache_files = [*select_shell_files(emitted, hashed_names),
+                              *select_book_chapter_files(emitted, book_slugs)]
+            sw_manifest = precache_manifest(
+                {rel: sink.entry(rel)[0][:16] for rel in precache_files})
+            manifest_name, manifest_json, sw_source = render_service_worker(sw_manifest)
+            sink.write_text(manifest_name, manifest_json)
+            sink.write_text("sw.js", sw_source)
+            # 이전 빌드의 매니페스트는 새 sw.js가 참조하지 않으므로 commit 때 정리
+            for stale in stale_precache_manifests(output_dir, manifest_name):
+                sink.remove(stale)
+            print(
+                f"🧭 서비스 워커 생성: sw.js (프리캐시 {len(sw_manifest['files'])}개, 버전 {sw_manifest['version']})")
+        except Exception as e:
+            print(f"❌ 서비스 워커 생성 실패: {e}")
+
+    if minifier and minifier.bytes_in:
+        saved = minifier.bytes_in - minifier.bytes_out
+        print(
+            f"🗜️  최소화: {minifier.bytes_in:,} → {minifier.bytes_out:,} bytes ({saved / minifier.bytes_in:.1%} 감소)")
+
+    sink.commit()
+    for outside in outside_sinks.values():
+        outside.commit()
+
+    # 빌드 매니페스트: 이번 빌드가 싱크로 내보낸 파일 → 내용 해시 (직전 매니페스트는 *.prev.json으로 보관)
+    # 출력 디렉터리에 남은 이전 빌드 파일은 포함하지 않으므로 직전 매니페스트와 비교하면 삭제로 나온다
+    if emit_build_manifest:
+        try:
+            if isinstance(sink, ArchiveSink):
+                manifest_path = f"{archive_path}.manifest.json"
+            else:
+                manifest_path = os.path.join(output_dir, MANIFEST_NAME)
+            build = manifest_from_entries(sink.entries)
+            delta = rotate_and_write(manifest_path, build)
+            summary = f"파일 {len(build['files'])}개"
+            if delta is not None:
+                summary += (f", 직전 빌드 대비 추가 {len(delta['added'])}개"
+                            f" · 변경 {len(delta['changed'])}개 · 삭제 {len(delta['removed'])}개")
+            print(f"🧾 빌드 매니페스트: {manifest_path} ({summary})")
+        except Exception as e:
+            print(f"❌ 빌드 매니페스트 생성 실패: {e}")
+    if file_hash_cache:
+        file_hash_cache.save()
+
+    print(f"\n✅ HTML 생성 완료! 파일 위치: {archive_path or output_dir}")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,448 @@
+"""
+출력 최소화(minify) 모듈
+생성 HTML과 복사되는 정적 자원(CSS/JS)의 공백/주석을 제거하는 순수 파이썬 최소화기
+"""
+
+import os
+import re
+import hashlib
+from typing import Optional
+
+
+# 최소화 규칙이 바뀌면 올려서 디스크 캐시를 무효화한다
+MINIFIER_VERSION = "2"
+
+# 공백을 그대로 유지해야 하는 요소 (pre 계열 + white-space: pre-wrap 본문 단락)
+_PRESERVE_RE = re.compile(
+    r'<(pre|textarea)\b[^>]*>.*?</\1\s*>'
+    r'|<p\b[^>]*\bclass="[^"]*\bscripture-paragraph\b[^"]*"[^>]*>.*?</p\s*>',
+    re.S | re.I)
+_RAW_TEXT_RE = re.compile(
+    r'(<(script|style)\b(?:"[^"]*"|\'[^\']*\'|[^\'">])*>)(.*?)(</\2\s*>)', re.S | re.I)
+_TAG_RE = re.compile(r'<(?:"[^"]*"|\'[^\']*\'|[^\'">])*>')
+_QUOTED_RE = re.compile(r'("[^"]*"|\'[^\']*\')')
+_UNQUOTED_VALUE_END_RE = re.compile(r'=\s*[^\s"\'=<>`]+$')
+_COMMENT_RE = re.compile(r'<!--(?!\[if).*?-->', re.S)
+_TAG_NAME_RE = re.compile(r'</?([a-zA-Z][a-zA-Z0-9-]*|!doctype)', re.I)
+
+# 앞뒤 공백이 렌더링에 영향을 주지 않는 블록/메타 요소
+_BLOCK_TAGS = frozenset((
+    '!doctype', 'html', 'head', 'body', 'meta', 'link', 'title', 'script', 'style',
+    'noscript', 'header', 'footer', 'main', 'nav', 'section', 'article', 'div',
+    'form', 'ul', 'ol', 'p', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'audio', 'source',
+    'svg', 'path', 'br', 'hr',
+))
+
+_CSS_COMMENT_OR_STRING_RE = re.compile(
+    r'("(?:\\.|[^"\\])*"|\'(?:\\.|[^\'\\])*\')|/\*.*?\*/', re.S)
+
+_JS_IDENT_RE = re.compile(r'[\w$\u0080-\uffff]')
+# 이 토큰 뒤의 '/'는 나눗셈이 아니라 정규식 리터럴 시작
+_JS_REGEX_PREFIX_WORDS = frozenset((
+    'return', 'typeof', 'instanceof', 'case', 'do', 'else', 'in', 'of', 'new',
+    'delete', 'void', 'throw', 'yield', 'await',
+))
+_JS_REGEX_PREFIX_PUNCT = set('(,=:[!&|?{};+-*%<>~^')
+# 이 토큰 뒤의 '{'는 블록이 아니라 객체 리터럴 (닫는 '}' 뒤의 '/'는 나눗셈)
+_JS_OBJECT_PREFIX_PUNCT = set('(,=:[!&|?+-*%<>~^')
+# 이 문자 앞뒤의 줄바꿈은 ASI(자동 세미콜론 삽입)와 무관하므로 제거 가능
+_JS_JOIN_AFTER = set(';{,([:')
+_JS_JOIN_BEFORE = set(')]},;.?:')
+
+
+def _skip_js_string(src: str, i: int) -> int:
+    """따옴표 문자열의 끝(닫는 따옴표 다음) 위치"""
+    quote = src[i]
+    i += 1
+    n = len(src)
+    while i < n and src[i] != quote:
+        i += 2 if src[i] == '\\' else 1
+    return i + 1
+
+
+def _skip_js_template(src: str, i: int) -> int:
+    """템플릿 리터럴의 끝 위치 (`${...}` 내부의 문자열/중첩 템플릿 포함)"""
+    i += 1
+    n = len(src)
+    while i < n:
+        c = src[i]
+        if c == '\\':
+            i += 2
+            continue
+        if c == '`':
+            return i + 1
+        if c == '$' and i + 1 < n and src[i + 1] == '{':
+            depth = 1
+            i += 2
+            while i < n and depth:
+                d = src[i]
+                if d in '"\'':
+                    i = _skip_js_string(src, i)
+                    continue
+                if d == '`':
+                    i = _skip_js_template(src, i)
+                    continue
+                if d == '{':
+                    depth += 1
+                elif d == '}':
+                    depth -= 1
+                i += 1
+            continue
+        i += 1
+    return i
+
+
+def _skip_js_regex(src: str, i: int) -> int:
+    """정규식 리터럴(플래그 포함)의 끝 위치"""
+    i += 1
+    n = len(src)
+    in_class = False
+    while i < n:
+        c = src[i]
+        if c == '\\':
+            i += 2
+            continue
+        if c == '\n':
+            break
+        if in_class:
+            if c == ']':
+                in_class = False
+        elif c == '[':
+            in_class = True
+        elif c == '/':
+            i += 1
+            break
+        i += 1
+    while i < n and (src[i].isalnum() or src[i] == '_'):
+        i += 1
+    return i
+
+
+def minify_js(src: str) -> str:
+    """
+    JavaScript 최소화 (보수적)
+
+    주석과 들여쓰기/불필요한 공백을 제거한다. 문자열/템플릿/정규식 리터럴은 그대로 두고,
+    ASI에 영향을 줄 수 있는 줄바꿈은 유지한다. 식별자 변경(mangling)은 하지 않는다.
+    """
+    out: list[str] = []
+    last = ''          # 마지막으로 출력한 토큰
+    last_kind = ''     # 'word' | 'punct' | 'literal'
+    prev = ''          # last 바로 앞 토큰
+    pending = ''       # 출력 대기 중인 공백 ('' | ' ' | '\n')
+    braces: list[bool] = []  # 열린 '{'마다 블록(True)/객체 리터럴(False)
+    closed_block = True      # 마지막 '}'가 블록을 닫았는지
+    i = 0
+    n = len(src)
+
+    def regex_allowed() -> bool:
+        if not last:
+            return True
+        if last_kind == 'word':
+            return last in _JS_REGEX_PREFIX_WORDS
+        if last_kind == 'punct':
+            if last in ('++', '--'):
+                # 후위 증감 연산자 뒤는 피연산자 위치가 아니다 (a++ / 2)
+                return False
+            if last == '}':
+                # 블록 뒤는 새 문장, 객체 리터럴 뒤는 나눗셈
+                return closed_block
+            return last[-1] in _JS_REGEX_PREFIX_PUNCT
+        return False
+
+    def brace_opens_block() -> bool:
+        if not last:
+            return True
+        if last_kind == 'word':
+            return last not in _JS_REGEX_PREFIX_WORDS or last in ('do', 'else')
+        if last_kind == 'punct':
+            if last == '>' and prev == '=':
+                return True  # 화살표 함수 본문
+            return last not in _JS_OBJECT_PREFIX_PUNCT
+        return False
+
+    def emit(token: str, kind: str) -> None:
+        nonlocal last, last_kind, prev, pending
+        if out and pending:
+            prev_ch = last[-1]
+            next_ch = token[0]
+            if pending == '\n' and not (prev_ch in _JS_JOIN_AFTER or next_ch in _JS_JOIN_BEFORE):
+                out.append('\n')
+            elif _JS_IDENT_RE.match(prev_ch) and _JS_IDENT_RE.match(next_ch):
+                out.append(' ')
+            elif prev_ch in '+-/' and next_ch == prev_ch:
+                out.append(' ')
+        pending = ''
+        out.append(token)
+        prev = last
+        last = token
+        last_kind = kind
+
+    while i < n:
+        c = src[i]
+        if c in ' \t\r\n\f\v\u00a0\ufeff':
+            j = i
+            while j < n and src[j] in ' \t\r\n\f\v\u00a0\ufeff':
+                j += 1
+            if '\n' in src[i:j]:
+                pending = '\n'
+            elif not pending:
+                pending = ' '
+            i = j
+            continue
+        if c == '/' and i + 1 < n and src[i + 1] == '/':
+            j = src.find('\n', i)
+            i = n if j < 0 else j
+            continue
+        if c == '/' and i + 1 < n and src[i + 1] == '*':
+            j = src.find('*/', i + 2)
+            j = n if j < 0 else j + 2
+            if '\n' in src[i:j]:
+                pending = '\n'
+            elif not pending:
+                pending = ' '
+            i = j
+            continue
+        if c in '"\'':
+            j = _skip_js_string(src, i)
+            emit(src[i:j], 'literal')
+            i = j
+            continue
+        if c == '`':
+            j = _skip_js_template(src, i)
+            emit(src[i:j], 'literal')
+            i = j
+            continue
+        if c == '/' and regex_allowed():
+            j = _skip_js_regex(src, i)
+            emit(src[i:j], 'literal')
+            i = j
+            continue
+        if _JS_IDENT_RE.match(c):
+            j = i + 1
+            while j < n and (_JS_IDENT_RE.match(src[j]) or
+                             (c.isdigit() and src[j] == '.')):
+                j += 1
+            emit(src[i:j], 'literal' if c.isdigit() else 'word')
+            i = j
+            continue
+        if c in '+-' and i + 1 < n and src[i + 1] == c:
+            emit(c * 2, 'punct')
+            i += 2
+            continue
+        if c == '{':
+            braces.append(brace_opens_block())
+        elif c == '}':
+            closed_block = braces.pop() if braces else True
+        emit(c, 'punct')
+        i += 1
+
+    return ''.join(out).strip()
+
+
+def minify_css(src: str) -> str:
+    """CSS 최소화: 주석 제거, 공백 축약, 구분자/선언 콜론 주변 공백 제거"""
+    # 주석 제거 후 문자열과 그 밖의 구간을 나눠 문자열은 보존
+    src = _CSS_COMMENT_OR_STRING_RE.sub(lambda m: m.group(1) or '', src)
+    parts = re.split(r'("(?:\\.|[^"\\])*"|\'(?:\\.|[^\'\\])*\')', src)
+    code: list[str] = []
+    for idx, part in enumerate(parts):
+        if idx % 2:
+            code.append(part)
+            continue
+        part = re.sub(r'\s+', ' ', part)
+        part = re.sub(r'\s*([{};,])\s*', r'\1', part)
+        part = re.sub(r'\s+!important', '!important', part)
+        code.append(part)
+    joined = ''.join(code)
+
+    # 선언 블록 안에서만 콜론 뒤 공백 제거 (선택자의 `a :hover`는 의미가 다르므로 유지)
+    out: list[str] = []
+    stack: list[bool] = []   # True: 선언 블록
+    prelude_start = 0
+    i = 0
+    n = len(joined)
+    while i < n:
+        c = joined[i]
+        if c in '"\'':
+            j = _skip_js_string(joined, i)
+            out.append(joined[i:j])
+            i = j
+            continue
+        if c == '{':
+            prelude = ''.join(out[prelude_start:]).strip()
+            is_rules = prelude.startswith('@') and not re.match(r'@(font-face|page)\b', prelude)
+            stack.append(not is_rules)
+            out.append(c)
+            prelude_start = len(out)
+        elif c == '}':
+            if stack:
+                stack.pop()
+            if out and out[-1] == ';':
+                out.pop()
+            out.append(c)
+            prelude_start = len(out)
+        elif c == ';':
+            out.append(c)
+            prelude_start = len(out)
+        elif c == ':' and stack and stack[-1]:
+            out.append(c)
+            if i + 1 < n and joined[i + 1] == ' ':
+                i += 1
+        else:
+            out.append(c)
+        i += 1
+    return ''.join(out).strip()
+
+
+def _tag_name(tag: str) -> str:
+    m = _TAG_NAME_RE.match(tag)
+    return m.group(1).lower() if m else ''
+
+
+def _collapse_tag(tag: str) -> str:
+    """태그 내부 속성 사이 줄바꿈/들여쓰기 축약 (따옴표로 감싼 속성값은 그대로 둔다)"""
+    parts = _QUOTED_RE.split(tag)
+    for k in range(0, len(parts), 2):
+        parts[k] = re.sub(r'\s+', ' ', parts[k])
+    tail = parts[-1]
+    if tail.endswith(' />'):
+        # 따옴표 없는 속성값 바로 뒤의 공백은 지우면 '/'가 값에 붙는다 (<a href=x />)
+        if not _UNQUOTED_VALUE_END_RE.search(tail[:-3]):
+            parts[-1] = tail[:-3] + '/>'
+    elif tail.endswith(' >'):
+        parts[-1] = tail[:-2] + '>'
+    return ''.join(parts)
+
+
+def _collapse_markup(html: str) -> str:
+    """보존 구간이 아닌 마크업의 주석 제거/공백 축약"""
+    html = _COMMENT_RE.sub('', html)
+    pieces: list[str] = []
+    pos = 0
+    tags = list(_TAG_RE.finditer(html))
+    for idx, m in enumerate(tags):
+        text = html[pos:m.start()]
+        if text:
+            text = re.sub(r'\s+', ' ', text)
+            prev_block = idx > 0 and _tag_name(tags[idx - 1].group(0)) in _BLOCK_TAGS
+            next_block = _tag_name(m.group(0)) in _BLOCK_TAGS
+            if prev_block or pos == 0:
+                text = text.lstrip()
+            if next_block:
+                text = text.rstrip()
+            pieces.append(text)
+        pieces.append(_collapse_tag(m.group(0)))
+        pos = m.end()
+    tail = html[pos:]
+    if tail:
+        pieces.append(re.sub(r'\s+', ' ', tail).strip())
+    return ''.join(pieces)
+
+
+def minify_html(html: str, cache: Optional["MinifyCache"] = None) -> str:
+    """
+    HTML 최소화
+
+    주석을 지우고 공백을 축약한다. `<pre>`/`<textarea>`와 공백을 유지하는 본문 단락은 그대로 두며,
+    인라인 `<script>`/`<style>` 내용은 JS/CSS 최소화기로 처리한다.
+
+    Args:
+        html: HTML 문자열
+        cache: 인라인 스크립트/스타일 최소화 결과를 재사용할 캐시 (장마다 같은 메타 스크립트가 반복됨)
+    """
+    protected: list[str] = []
+
+    def protect(text: str) -> str:
+        protected.append(text)
+        return f'\x00{len(protected) - 1}\x00'
+
+    def raw_text(m: re.Match) -> str:
+        open_tag, name, body, close_tag = m.group(1), m.group(2).lower(), m.group(3), m.group(4)
+        if body.strip():
+            if name == 'style':
+                body = cache.minify('css', body, persist=False) if cache else minify_css(body)
+            elif not re.search(r'\btype\s*=\s*"(?!(?:text|application)/javascript|module)[^"]*"', open_tag, re.I):
+                body = cache.minify('js', body, persist=False) if cache else minify_js(body)
+        return open_tag + protect(body) + close_tag
+
+    html = _RAW_TEXT_RE.sub(raw_text, html)
+    html = _PRESERVE_RE.sub(lambda m: protect(m.group(0)), html)
+    html = _collapse_markup(html)
+    return re.sub(r'\x00(\d+)\x00', lambda m: protected[int(m.group(1))], html)
+
+
+_MINIFIERS = {
+    'js': minify_js,
+    'css': minify_css,
+    'html': minify_html,
+}
+
+
+def minifier_kind(path: str) -> Optional[str]:
+    """파일 확장자로 최소화기 종류 결정 (대상이 아니면 None)"""
+    ext = os.path.splitext(path)[1].lower()
+    if ext in ('.js', '.mjs'):
+        # 이미 최소화된 번들은 건드리지 않음
+        return None if path.endswith('.min.js') else 'js'
+    if ext == '.css':
+        return None if path.endswith('.min.css') else 'css'
+    if ext in ('.html', '.htm'):
+        return 'html'
+    return None
+
+
+class MinifyCache:
+    """내용 해시 기반 최소화 결과 캐시 (메모리 + 선택적 디스크)"""
+
+    def __init__(self, cache_dir: Optional[str] = None):
+        """
+        Args:
+            cache_dir: 최소화 결과를 `<해시>.<종류>`로 저장할 디렉터리 (None이면 메모리만 사용)
+        """
+        self.cache_dir = cache_dir
+        self._memory: dict[str, str] = {}
+        self.bytes_in = 0
+        self.bytes_out = 0
+
+    def minify(self, kind: str, text: str, persist: bool = True) -> str:
+        """
+        종류별 최소화 (같은 내용이면 다시 처리하지 않음)
+
+        Args:
+            kind: 'js' | 'css' | 'html'
+            text: 원문
+            persist: 디스크 캐시 사용 여부 (장 HTML처럼 매번 다른 내용은 False)
+        """
+        key = hashlib.sha256(
+            f"{MINIFIER_VERSION}:{kind}:".encode('utf-8') + text.encode('utf-8')).hexdigest()
+        cached = self._memory.get(key)
+        if cached is not None:
+            return cached
+        disk_path = os.path.join(self.cache_dir, f"{key}.{kind}") if (
+            persist and self.cache_dir) else None
+        if disk_path and os.path.exists(disk_path):
+            with open(disk_path, 'r', encoding='utf-8') as f:
+                result = f.read()
+        else:
+            if kind == 'html':
+                result = minify_html(text, self)
+            else:
+                result = _MINIFIERS[kind](text)
+            if disk_path:
+                os.makedirs(self.cache_dir, exist_ok=True)
+                tmp_path = disk_path + '.tmp'
+                with open(tmp_path, 'w', encoding='utf-8') as f:
+                    f.write(result)
+                os.replace(tmp_path, disk_path)
+        if persist or kind != 'html':
+            # 장 HTML처럼 한 번만 나오는 페이지는 메모리에 쌓지 않는다 (인라인 CSS/JS 조각만 재사용)
+            self._memory[key] = result
+        return result
+
+    def minify_output(self, kind: str, text: str, persist: bool = True) -> str:
+        """출력 파일용 최소화 + 절감 바이트 집계"""
+        result = self.minify(kind, text, persist=persist)
+        self.bytes_in += len(text.encode('utf-8'))
+        self.bytes_out += len(result.encode('utf-8'))
+        return result
@@ -0,0 +1,355 @@
+"""
+출력 싱크 모듈
+생성기 출력 파일을 디렉터리(임시 파일 + 일괄 원자적 이름 변경) 또는 단일 아카이브(tar/zip)로 기록
+"""
+
+import abc
+import os
+import io
+import hashlib
+import shutil
+import tarfile
+import zipfile
+import threading
+from typing import Optional
+
+from src.file_sync import FileHashCache, place_file, sha256_of_file, write_bytes
+
+
+# 아카이브 확장자 → tarfile 모드 (zip은 별도 처리)
+_TAR_MODES = {
+    '.tar': 'w',
+    '.tar.gz': 'w:gz',
+    '.tgz': 'w:gz',
+    '.tar.bz2': 'w:bz2',
+    '.tar.xz': 'w:xz',
+}
+# 아카이브 항목 시각 고정 (같은 입력이면 같은 아카이브 바이트, zip은 1980년 이전 불가)
+_ARCHIVE_EPOCH = (1980, 1, 1, 0, 0, 0)
+_ARCHIVE_EPOCH_TS = 315532800  # 1980-01-01T00:00:00Z
+
+
+def archive_format(path: str) -> Optional[str]:
+    """경로 확장자로 아카이브 형식 판정 ('.zip' | tar 확장자 | 아카이브가 아니면 None)"""
+    lower = path.lower()
+    if lower.endswith('.zip'):
+        return '.zip'
+    for ext in sorted(_TAR_MODES, key=len, reverse=True):
+        if lower.endswith(ext):
+            return ext
+    return None
+
+
+class _HashingReader:
+    """읽은 바이트의 SHA-256을 함께 계산하는 파일 래퍼 (스트리밍 추가용)"""
+
+    def __init__(self, raw):
+        self._raw = raw
+        self.hash = hashlib.sha256()
+
+    def read(self, size: int = -1) -> bytes:
+        data = self._raw.read(size)
+        self.hash.update(data)
+        return data
+
+
+class OutputSink(abc.ABC):
+    """
+    출력 싱크 기본 클래스
+
+    경로는 사이트 루트 기준 상대 경로('/' 구분)로 받는다.
+    with 블록이 예외 없이 끝나면 commit, 예외로 끝나면 abort한다.
+    """
+
+    def write_text(self, rel_path: str, text: str) -> None:
+        """텍스트 파일 기록 (UTF-8)"""
+        self.write_bytes(rel_path, text.encode('utf-8'))
+
+    @abc.abstractmethod
+    def write_bytes(self, rel_path: str, data: bytes) -> None:
+        """바이트 파일 기록"""
+
+    def add_file(self, rel_path: str, src_path: str) -> None:
+        """기존 파일을 그대로 출력에 추가"""
+        with open(src_path, 'rb') as f:
+            self.write_bytes(rel_path, f.read())
+
+    @abc.abstractmethod
+    def commit(self) -> None:
+        """지금까지 기록한 파일을 반영"""
+
+    @abc.abstractmethod
+    def abort(self) -> None:
+        """반영하지 않은 기록을 버림"""
+
+    def __enter__(self) -> "OutputSink":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if exc_type is None:
+            self.commit()
+        else:
+            self.abort()
+
+
+class DirectorySink(OutputSink):
+    """
+    디렉터리 싱크: 임시 파일에 쓰고 commit 때 한꺼번에 이름을 바꾼다
+
+    commit 전에 중단되면 기존 트리는 그대로이고 임시 파일만 지워진다.
+    같은 파일 시스템 안의 os.replace이므로 각 파일은 완전히 이전 내용이거나 완전히 새 내용이다.
+    내용이 같아 다시 쓰지 않은 파일도 keep으로 기록하므로 entries는 이번 출력 전체 목록이다.
+    """
+
+    def __init__(self, root: str, hash_cache: Optional[FileHashCache] = None, copy_mode: str = "copy"):
+        """
+        Args:
+            root: 출력 디렉터리
+            hash_cache: 복사/유지한 파일의 해시 캐시 (크기/mtime이 같으면 다시 읽지 않음)
+            copy_mode: add_file 배치 방식 (file_sync.COPY_MODES)
+        """
+        self.root = root
+        self.hash_cache = hash_cache or FileHashCache()
+        self.copy_mode = copy_mode
+        self._pending: dict[str, str] = {}  # 대상 경로 → 임시 파일 경로
+        # 이번 출력 항목: 상대 경로 → (SHA-256, 크기), 또는 처음 조회할 때 해시할 대상 경로
+        self._entries: dict[str, tuple[str, int] | str] = {}
+        self._removals: set[str] = set()  # commit 때 지울 대상 경로
+        self._stat_updates: dict[str, str] = {}  # commit 때 메타데이터를 맞출 대상 경로 → 소스 파일
+        self._lock = threading.Lock()
+
+    def path(self, rel_path: str) -> str:
+        return os.path.join(self.root, *rel_path.split('/'))
+
+    def staged_path(self, rel_path: str) -> str:
+        """기록한 내용의 현재 위치 (commit 전이면 임시 파일)"""
+        target = self.path(rel_path)
+        return self._pending.get(target, target)
+
+    def _stage(self, rel_path: str) -> tuple[str, str]:
+        target = self.path(rel_path)
+        directory = os.path.dirname(target)
+        os.makedirs(directory, exist_ok=True)
+        return target, os.path.join(directory, f".{os.path.basename(target)}.{os.getpid()}.tmp")
+
+    def _set_pending(self, target: str, tmp_path: str) -> None:
+        with self._lock:
+            previous = self._pending.get(target)
+            if previous and previous != tmp_path:
+                os.remove(previous)
+            self._pending[target] = tmp_path
+
+    def write_bytes(self, rel_path: str, data: bytes) -> None:
+        target, tmp_path = self._stage(rel_path)
+        # 임시 파일이 add_file의 하드 링크일 수 있으므로 제자리에 덮어쓰지 않고 새로 만든다
+        write_bytes(tmp_path, data)
+        self._set_pending(target, tmp_path)
+        self._entries[rel_path.lstrip('/')] = (hashlib.sha256(data).hexdigest(), len(data))
+
+    def add_file(self, rel_path: str, src_path: str) -> str:
+        """
+        기존 파일을 copy_mode로 임시 위치에 배치 (hardlink/reflink가 불가능하면 복사)
+
+        Returns:
+            실제 사용한 방식 ("copy" | "hardlink" | "reflink")
+        """
+        target, tmp_path = self._stage(rel_path)
+        used = place_file(src_path, tmp_path, self.copy_mode)
+        self._set_pending(target, tmp_path)
+        self._entries[rel_path.lstrip('/')] = target
+        return used
+
+    def add_copy(self, rel_path: str, src_rel: str) -> None:
+        """이번 출력의 다른 항목(src_rel)과 같은 내용으로 기록 (commit 전이면 임시 파일에서 배치)"""
+        target, tmp_path = self._stage(rel_path)
+        place_file(self.staged_path(src_rel), tmp_path, self.copy_mode)
+        self._set_pending(target, tmp_path)
+        self._entries[rel_path.lstrip('/')] = self.entry(src_rel)
+
+    def keep(self, rel_path: str, stat_src: Optional[str] = None) -> None:
+        """
+        대상에 이미 같은 내용이 있는 파일을 다시 쓰지 않고 이번 출력에 포함
+
+        stat_src를 주면 commit 때 대상의 mtime/권한을 stat_src에 맞춘다 (그 전에는 대상을 건드리지 않음)
+        """
+        target = self.path(rel_path)
+        self._entries[rel_path.lstrip('/')] = target
+        if stat_src:
+            with self._lock:
+                self._stat_updates[target] = stat_src
+
+    def remove(self, rel_path: str) -> None:
+        """commit 때 대상 파일 삭제 (이번 출력이 더 이상 참조하지 않는 이전 파일 정리)"""
+        self._removals.add(self.path(rel_path))
+
+    def paths(self) -> list[str]:
+        """이번 출력 항목의 상대 경로 목록 (해시는 계산하지 않음)"""
+        return list(self._entries)
+
+    def entry(self, rel_path: str) -> tuple[str, int]:
+        """출력 항목 하나의 (SHA-256, 크기)"""
+        value = self._entries[rel_path]
+        if isinstance(value, str):
+            staged = self._pending.get(value)
+            if staged:
+                # commit 전 임시 파일은 이름이 매번 달라 해시 캐시에 남기지 않는다
+                value = (sha256_of_file(staged), os.path.getsize(staged))
+            else:
+                # 대상 경로로 캐시해 두면 다음 빌드의 keep이 파일을 다시 읽지 않는다
+                value = (self.hash_cache.sha256(value), os.path.getsize(value))
+            self._entries[rel_path] = value
+        return value
+
+    @property
+    def entries(self) -> dict[str, tuple[str, int]]:
+        """이번 출력 항목: 상대 경로 → (SHA-256, 크기) (ArchiveSink.entries와 같은 형식)"""
+        return {rel: self.entry(rel) for rel in list(self._entries)}
+
+    def commit(self) -> None:
+        for target, tmp_path in self._pending.items():
+            os.replace(tmp_path, target)
+        self._pending.clear()
+        for target, src_path in self._stat_updates.items():
+            try:
+                shutil.copystat(src_path, target)
+            except OSError:
+                pass
+        self._stat_updates.clear()
+        for target in self._removals:
+            try:
+                os.remove(target)
+            except OSError:
+                pass
+        self._removals.clear()
+
+    def abort(self) -> None:
+        for tmp_path in self._pending.values():
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+        self._pending.clear()
+        self._entries.clear()
+        self._removals.clear()
+        self._stat_updates.clear()
+
+
+class ArchiveSink(OutputSink):
+    """
+    아카이브 싱크: 사이트 전체를 tar(.tar/.tar.gz/.tgz/.tar.bz2/.tar.xz) 또는 zip 하나로 스트리밍
+
+    `<경로>.tmp`에 쓰고 commit 때 이름을 바꾸므로 중단되어도 이전 아카이브가 남는다.
+    항목 시각/권한을 고정해 같은 입력이면 같은 아카이브를 만든다(gzip 헤더 시각 포함).
+    """
+
+    def __init__(self, path: str, prefix: str = ''):
+        """
+        Args:
+            path: 아카이브 경로 (확장자로 형식 결정)
+            prefix: 아카이브 안의 사이트 루트 디렉터리 이름 (빈 문자열이면 최상위)
+        """
+        fmt = archive_format(path)
+        if fmt is None:
+            raise ValueError(f"지원하지 않는 아카이브 형식: {path}")
+        self.path = path
+        self.prefix = prefix.strip('/')
+        self._tmp_path = path + '.tmp'
+        self._names: set[str] = set()
+        # 기록한 항목: 상대 경로 → (SHA-256, 크기) (빌드 매니페스트용)
+        self.entries: dict[str, tuple[str, int]] = {}
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._raw = open(self._tmp_path, 'wb')
+        self._zip: Optional[zipfile.ZipFile] = None
+        self._tar: Optional[tarfile.TarFile] = None
+        self._gzip = None
+        if fmt == '.zip':
+            self._zip = zipfile.ZipFile(self._raw, 'w', zipfile.ZIP_DEFLATED)
+        elif _TAR_MODES[fmt] == 'w:gz':
+            import gzip
+            # tarfile의 gz 모드는 현재 시각을 헤더에 기록하므로 직접 감싸 mtime=0 고정
+            self._gzip = gzip.GzipFile(filename='', mode='wb', fileobj=self._raw, mtime=0)
+            self._tar = tarfile.open(fileobj=self._gzip, mode='w', format=tarfile.PAX_FORMAT)
+        else:
+            self._tar = tarfile.open(
+                fileobj=self._raw, mode=_TAR_MODES[fmt], format=tarfile.PAX_FORMAT)
+
+    def _name(self, rel_path: str) -> str:
+        rel_path = rel_path.lstrip('/')
+        return f"{self.prefix}/{rel_path}" if self.prefix else rel_path
+
+    def write_bytes(self, rel_path: str, data: bytes) -> None:
+        name = self._name(rel_path)
+        if name in self._names:
+            # 아카이브는 덮어쓰기가 불가능하므로 같은 경로를 두 번 쓰는 것은 생성기 오류
+            raise ValueError(f"아카이브에 이미 있는 경로: {name}")
+        self._names.add(name)
+        self.entries[rel_path.lstrip('/')] = (hashlib.sha256(data).hexdigest(), len(data))
+        if self._zip is not None:
+            info = zipfile.ZipInfo(name, date_time=_ARCHIVE_EPOCH)
+            info.compress_type = zipfile.ZIP_DEFLATED
+            info.external_attr = 0o644 << 16
+            self._zip.writestr(info, data)
+        else:
+            info = tarfile.TarInfo(name)
+            info.size = len(data)
+            info.mode = 0o644
+            info.mtime = _ARCHIVE_EPOCH_TS
+            self._tar.addfile(info, io.BytesIO(data))
+
+    def add_file(self, rel_path: str, src_path: str) -> None:
+        # 오디오처럼 큰 파일은 메모리에 올리지 않고 스트리밍
+        name = self._name(rel_path)
+        if name in self._names:
+            raise ValueError(f"아카이브에 이미 있는 경로: {name}")
+        self._names.add(name)
+        with open(src_path, 'rb') as raw:
+            src = _HashingReader(raw)
+            size = os.fstat(raw.fileno()).st_size
+            if self._zip is not None:
+                info = zipfile.ZipInfo(name, date_time=_ARCHIVE_EPOCH)
+                info.compress_type = zipfile.ZIP_DEFLATED
+                info.external_attr = 0o644 << 16
+                with self._zip.open(info, 'w') as dst:
+                    shutil.copyfileobj(src, dst, 1024 * 1024)
+            else:
+                info = tarfile.TarInfo(name)
+                info.size = size
+                info.mode = 0o644
+                info.mtime = _ARCHIVE_EPOCH_TS
+                self._tar.addfile(info, src)
+        self.entries[rel_path.lstrip('/')] = (src.hash.hexdigest(), size)
+
+    def _close(self) -> None:
+        if self._zip is not None:
+            self._zip.close()
+        if self._tar is not None:
+            self._tar.close()
+        if self._gzip is not None:
+            self._gzip.close()
+        self._raw.close()
+
+    def commit(self) -> None:
+        if self._raw.closed:
+            return
+        self._close()
+        os.replace(self._tmp_path, self.path)
+
+    def abort(self) -> None:
+        if not self._raw.closed:
+            self._close()
+        try:
+            os.remove(self._tmp_path)
+        except OSError:
+            pass
+
+
+def open_sink(
+    output_dir: str,
+    archive_path: Optional[str] = None,
+    hash_cache: Optional[FileHashCache] = None,
+    copy_mode: str = "copy",
+) -> OutputSink:
+    """아카이브 경로가 있으면 ArchiveSink, 없으면 출력 디렉터리 DirectorySink (해시 캐시/복사 방식 전달)"""
+    if archive_path:
+        return ArchiveSink(archive_path)
+    return DirectorySink(output_dir, hash_cache, copy_mode)
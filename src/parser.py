@@ -6,7 +6,7 @@
 import re
 import json
 import os
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Iterable, Iterator
 from dataclasses import dataclass, asdict
 
 
@@ -70,19 +70,25 @@ class BibleParser:
         """텍스트 파일을 파싱하여 장 리스트 반환"""
         with open(file_path, 'r', encoding='utf-8') as f:
             content = f.read()
+        return self.parse_text(content)
 
-        chapters = []
+    def parse_text(self, content: str) -> List[Chapter]:
+        """텍스트(파일 전체 또는 장 단위 일부)를 파싱하여 장 리스트 반환"""
+        return list(self.iter_chapters(content.split('\n')))
+
+    def iter_chapters(self, lines: Iterable[str]) -> Iterator[Chapter]:
+        """줄 단위 입력을 파싱하여 장이 완성될 때마다 반환"""
         current_chapter = None
         current_verses = []
 
-        for line in content.split('\n'):
+        for line in lines:
             # 장 시작 확인
             match = self.chapter_pattern.match(line)
             if match:
-                # 이전 장 저장
+                # 이전 장 반환
                 if current_chapter:
                     current_chapter.verses = current_verses
-                    chapters.append(current_chapter)
+                    yield current_chapter
 
                 # 새 장 시작
                 book_abbr = match.group(1)
@@ -108,12 +114,10 @@ class BibleParser:
                 if verse:
                     current_verses.append(verse)
 
-        # 마지막 장 저장
+        # 마지막 장 반환
         if current_chapter:
             current_chapter.verses = current_verses
-            chapters.append(current_chapter)
-
-        return chapters
+            yield current_chapter
 
     def _parse_verse_line(self, line: str) -> Optional[Verse]:
         """절 라인 파싱"""
@@ -181,28 +185,78 @@ class BibleParser:
         with open(json_path, 'r', encoding='utf-8') as f:
             data = json.load(f)
 
-        chapters = []
-        for chapter_data in data:
-            verses = [
-                Verse(
-                    number=verse_data['number'],
-                    text=verse_data['text'],
-                    has_paragraph=verse_data['has_paragraph']
-                )
-                for verse_data in chapter_data['verses']
-            ]
-
-            chapter = Chapter(
-                book_name=chapter_data['book_name'],
-                book_abbr=chapter_data['book_abbr'],
-                chapter_number=chapter_data['chapter_number'],
-                verses=verses
-            )
-            chapters.append(chapter)
+        chapters = [self._chapter_from_dict(chapter_data) for chapter_data in data]
 
         print(f"{json_path}에서 {len(chapters)}개 장을 로드했습니다.")
         return chapters
 
+    def iter_json(self, json_path: str, chunk_size: int = 1 << 16) -> Iterator[Chapter]:
+        """
+        JSON 파일(장 객체 배열)을 조금씩 읽으며 장 단위로 반환 (전체 배열을 메모리에 올리지 않음)
+
+        Args:
+            json_path: save_to_json으로 저장한 파일
+            chunk_size: 한 번에 읽을 문자 수 (장 하나가 더 크면 두 배씩 늘려 읽음)
+        """
+        decoder = json.JSONDecoder()
+        with open(json_path, 'r', encoding='utf-8') as f:
+            buf = ''
+            pos = 0
+            eof = False
+            started = False
+
+            while True:
+                # 공백/구분자 건너뛰기
+                while pos < len(buf) and buf[pos] in ' \t\r\n,':
+                    if buf[pos] == ',' and not started:
+                        raise ValueError(f"장 배열 형식이 아닙니다: {json_path}")
+                    pos += 1
+                if pos == len(buf):
+                    if eof:
+                        raise ValueError(f"JSON 배열이 끝나지 않았습니다: {json_path}")
+                    chunk = f.read(chunk_size)
+                    buf, pos, eof = chunk, 0, not chunk
+                    continue
+
+                if not started:
+                    if buf[pos] != '[':
+                        raise ValueError(f"장 배열 형식이 아닙니다: {json_path}")
+                    started = True
+                    pos += 1
+                    continue
+                if buf[pos] == ']':
+                    return
+
+                try:
+                    chapter_data, end = decoder.raw_decode(buf, pos)
+                except json.JSONDecodeError:
+                    # 장 객체가 버퍼 끝에서 잘림 → 남은 부분 뒤에 이어 읽기
+                    if eof:
+                        raise
+                    chunk = f.read(max(chunk_size, len(buf) - pos))
+                    buf, pos, eof = buf[pos:] + chunk, 0, not chunk
+                    continue
+                pos = end
+                yield self._chapter_from_dict(chapter_data)
+
+    @staticmethod
+    def _chapter_from_dict(chapter_data: dict) -> Chapter:
+        """JSON 장 객체 → Chapter"""
+        verses = [
+            Verse(
+                number=verse_data['number'],
+                text=verse_data['text'],
+                has_paragraph=verse_data['has_paragraph']
+            )
+            for verse_data in chapter_data['verses']
+        ]
+        return Chapter(
+            book_name=chapter_data['book_name'],
+            book_abbr=chapter_data['book_abbr'],
+            chapter_number=chapter_data['chapter_number'],
+            verses=verses
+        )
+
     def parse_file_with_cache(self, file_path: str, cache_path: str = "output/parsed_bible.json") -> List[Chapter]:
         """캐시 파일이 있으면 로드, 없으면 파싱 후 캐시 저장"""
         # 캐시 파일이 존재하고 원본보다 최신이면 캐시 사용
@@ -0,0 +1,268 @@
+"""
+PWA 빌더 모듈
+생성된 정적 사이트에 서비스 워커(sw.js)와 버전별 프리캐시 매니페스트를 추가
+"""
+
+import os
+import re
+import sys
+import json
+import hashlib
+import argparse
+from typing import Iterable, Optional
+
+from src.file_sync import FileHashCache
+
+
+DEFAULT_SW_TEMPLATE = "templates/sw.js"
+# 이미 내용 해시가 붙은 자원 파일명 (html_generator --hash-assets 규칙)
+_HASHED_ASSET_RE = re.compile(r'^.+\.[0-9a-f]{8}\.(?:js|css)$')
+_PRECACHE_MANIFEST_RE = re.compile(r'^precache-manifest\.[0-9a-f]{16}\.json$')
+
+
+def select_shell_files(paths: Iterable[str], hashed_names: Optional[set[str]] = None) -> list[str]:
+    """
+    사이트 셸 자원 목록 (사이트 루트 기준 상대 경로 목록에서 선택)
+
+    - index.html, reader.html (셸 출력 모드)
+    - static/ 최상위 CSS/JS (hashed_names가 있으면 해시 파일명만)
+    - static/search/ 아래 검색 인덱스/절 수 테이블
+    """
+    paths = set(paths)
+    files = [page for page in ('index.html', 'reader.html') if page in paths]
+    static_files: list[str] = []
+    search_files: list[str] = []
+    for rel in sorted(paths):
+        parts = rel.split('/')
+        if len(parts) == 2 and parts[0] == 'static':
+            fname = parts[1]
+            if os.path.splitext(fname)[1].lower() not in ('.js', '.css'):
+                continue
+            if hashed_names is not None:
+                if fname not in hashed_names:
+                    continue
+            elif _HASHED_ASSET_RE.match(fname):
+                continue
+            static_files.append(rel)
+        elif len(parts) == 3 and parts[:2] == ['static', 'search']:
+            search_files.append(rel)
+    return files + static_files + search_files
+
+
+def _site_files(site_dir: str, *subdirs: str) -> list[str]:
+    """사이트 루트와 하위 디렉터리 바로 아래 파일의 상대 경로 목록"""
+    files: list[str] = []
+    for sub in ('', *subdirs):
+        directory = os.path.join(site_dir, *sub.split('/')) if sub else site_dir
+        if not os.path.isdir(directory):
+            continue
+        for fname in os.listdir(directory):
+            if os.path.isfile(os.path.join(directory, fname)):
+                files.append(f'{sub}/{fname}' if sub else fname)
+    return files
+
+
+def collect_shell_files(site_dir: str) -> list[str]:
+    """디스크의 사이트 디렉터리에서 셸 자원 목록 수집 (`select_shell_files` 참고)"""
+    hashed_names: Optional[set[str]] = None
+    manifest_path = os.path.join(site_dir, 'static', 'asset-manifest.json')
+    if os.path.isfile(manifest_path):
+        with open(manifest_path, 'r', encoding='utf-8') as f:
+            hashed_names = set(json.load(f).values())
+    return select_shell_files(_site_files(site_dir, 'static', 'static/search'), hashed_names)
+
+
+def select_book_chapter_files(paths: Iterable[str], slugs: Iterable[str]) -> list[str]:
+    """책 슬러그 목록에 해당하는 장 HTML(`<slug>-<장>.html`) 또는 셸 모드 장 JSON(`chapters/<slug>-<장>.json`) 선택"""
+    wanted = set(slugs)
+    pages: list[str] = []
+    chapter_files: list[str] = []
+    for rel in sorted(set(paths)):
+        m = re.match(r'^([^/]+)-\d+\.html$', rel)
+        if m and m.group(1) in wanted:
+            pages.append(rel)
+            continue
+        m = re.match(r'^chapters/([^/]+)-\d+\.json$', rel)
+        if m and m.group(1) in wanted:
+            chapter_files.append(rel)
+    return pages + chapter_files
+
+
+def book_chapter_files(site_dir: str, slugs: Iterable[str]) -> list[str]:
+    """디스크의 사이트 디렉터리에서 책의 장 파일 목록 수집 (`select_book_chapter_files` 참고)"""
+    return select_book_chapter_files(_site_files(site_dir, 'chapters'), slugs)
+
+
+def precache_manifest(hashes: dict[str, str]) -> dict:
+    """
+    (경로 → 내용 해시)로 프리캐시 매니페스트 구성
+
+    Returns:
+        {"version": 매니페스트 내용 해시, "files": {경로: 내용 해시}}
+    """
+    digest = hashlib.sha256(
+        json.dumps(hashes, sort_keys=True, separators=(',', ':')).encode('utf-8'))
+    return {"version": digest.hexdigest()[:16], "files": dict(sorted(hashes.items()))}
+
+
+def build_precache_manifest(
+    site_dir: str, files: Iterable[str], hash_cache: Optional[FileHashCache] = None
+) -> dict:
+    """
+    디스크의 파일 내용으로 프리캐시 매니페스트 구성
+
+    Args:
+        site_dir: 사이트 루트 (서비스 워커 스코프)
+        files: 사이트 루트 기준 상대 경로 목록 (없는 파일은 건너뜀)
+        hash_cache: 파일 해시 캐시 (크기/mtime이 같은 파일은 다시 읽지 않음)
+    """
+    hasher = hash_cache or FileHashCache()
+    entries: dict[str, str] = {}
+    for rel in files:
+        rel = rel.replace(os.sep, '/').lstrip('/')
+        path = os.path.join(site_dir, rel)
+        if os.path.isfile(path):
+            entries[rel] = hasher.sha256(path)[:16]
+    return precache_manifest(entries)
+
+
+def render_service_worker(manifest: dict, template_path: str = DEFAULT_SW_TEMPLATE) -> tuple[str, str, str]:
+    """
+    매니페스트로 서비스 워커 파일 내용 구성
+
+    매니페스트는 `precache-manifest.<version>.json`으로 저장하고 sw.js에 버전/경로를 새겨 넣는다.
+    내용이 바뀌면 버전이 바뀌어 sw.js 바이트도 달라지므로 브라우저가 새 워커를 설치한다.
+
+    Returns:
+        (매니페스트 파일명, 매니페스트 JSON, sw.js 소스)
+    """
+    manifest_name = f"precache-manifest.{manifest['version']}.json"
+    with open(template_path, 'r', encoding='utf-8') as f:
+        sw_source = f.read()
+    sw_source = (sw_source
+                 .replace('__PRECACHE_VERSION__', manifest['version'])
+                 .replace('__PRECACHE_MANIFEST_URL__', manifest_name))
+    return (manifest_name,
+            json.dumps(manifest, ensure_ascii=False, separators=(',', ':')),
+            sw_source)
+
+
+def stale_precache_manifests(site_dir: str, manifest_name: str) -> list[str]:
+    """새 sw.js가 참조하지 않는 이전 빌드의 매니페스트 파일명"""
+    if not os.path.isdir(site_dir):
+        return []
+    return sorted(fname for fname in os.listdir(site_dir)
+                  if _PRECACHE_MANIFEST_RE.match(fname) and fname != manifest_name)
+
+
+def write_service_worker(
+    site_dir: str,
+    extra_files: Iterable[str] = (),
+    template_path: str = DEFAULT_SW_TEMPLATE,
+    output_file: Optional[str] = None,
+    hash_cache: Optional[FileHashCache] = None,
+) -> dict:
+    """
+    디스크의 사이트에 서비스 워커와 프리캐시 매니페스트 작성 (이전 버전 매니페스트는 삭제)
+
+    Args:
+        site_dir: 사이트 루트 (sw.js 위치이자 스코프)
+        extra_files: 셸 자원 외에 미리 캐시할 파일 (예: 선택한 책의 장 HTML)
+        template_path: 서비스 워커 템플릿 경로
+        output_file: sw.js 출력 경로 (기본: `<site_dir>/sw.js`)
+        hash_cache: 파일 해시 캐시
+
+    Returns:
+        작성한 매니페스트
+    """
+    manifest = build_precache_manifest(
+        site_dir, [*collect_shell_files(site_dir), *extra_files], hash_cache)
+    manifest_name, manifest_json, sw_source = render_service_worker(manifest, template_path)
+    with open(os.path.join(site_dir, manifest_name), 'w', encoding='utf-8') as f:
+        f.write(manifest_json)
+    for fname in stale_precache_manifests(site_dir, manifest_name):
+        os.remove(os.path.join(site_dir, fname))
+    with open(output_file or os.path.join(site_dir, 'sw.js'), 'w', encoding='utf-8') as f:
+        f.write(sw_source)
+    return manifest
+
+
+def _book_slugs(book_abbrs: Iterable[str], mappings_path: str = 'data/book_mappings.json') -> list[str]:
+    """책 약칭/별칭 → 장 파일명 슬러그 (html_generator.chapter_file_slug 사용)"""
+    # html_generator가 이 모듈을 import하므로 호출 시점에 가져온다
+    from src.html_generator import chapter_file_slug
+
+    with open(mappings_path, 'r', encoding='utf-8') as f:
+        books = json.load(f)
+    # 매핑 파일은 영문 키(abbr/korean_name/english_name)와 한글 키(약칭/전체 이름/영문 이름) 형식이 모두 있음
+    mappings: dict[str, dict] = {}
+    abbr_by_name: dict[str, str] = {}
+    for b in books:
+        abbr = b.get('abbr') or b.get('약칭')
+        if not abbr:
+            continue
+        mappings[abbr] = {'english_name': b.get('english_name') or b.get('영문 이름') or ''}
+        for name in (abbr, b.get('korean_name') or b.get('전체 이름'), *(b.get('aliases') or [])):
+            if name:
+                abbr_by_name.setdefault(name, abbr)
+    slugs: list[str] = []
+    for name in book_abbrs:
+        abbr = abbr_by_name.get(name)
+        if abbr is None:
+            print(f"⚠️ 알 수 없는 책: {name}")
+            continue
+        slugs.append(chapter_file_slug(None, mappings, abbr))
+    return slugs
+
+
+def main():
+    """CLI: 생성된 사이트에 서비스 워커/프리캐시 매니페스트 추가"""
+    parser = argparse.ArgumentParser(description="공동번역성서 PWA 빌더")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    sw = sub.add_parser("service-worker", help="sw.js와 프리캐시 매니페스트 생성")
+    sw.add_argument(
+        "--input-dir",
+        default="output/html",
+        help="생성된 사이트 루트 (기본: output/html)",
+    )
+    sw.add_argument(
+        "--output-file",
+        default=None,
+        help="sw.js 출력 경로 (기본: <input-dir>/sw.js)",
+    )
+    sw.add_argument(
+        "--template",
+        default=DEFAULT_SW_TEMPLATE,
+        help=f"서비스 워커 템플릿 (기본: {DEFAULT_SW_TEMPLATE})",
+    )
+    sw.add_argument(
+        "--precache-files",
+        default="",
+        help="추가로 미리 캐시할 파일 (사이트 루트 기준, 쉼표 구분)",
+    )
+    sw.add_argument(
+        "--books",
+        default="",
+        help="오프라인용으로 모든 장을 미리 캐시할 책 약칭 (쉼표 구분, 예: 창세,마태)",
+    )
+
+    args = parser.parse_args()
+
+    if args.command == "service-worker":
+        site_dir = args.input_dir
+        if not os.path.isdir(site_dir):
+            print(f"❌ 사이트 디렉터리가 없습니다: {site_dir}")
+            sys.exit(1)
+        extra = [p.strip() for p in args.precache_files.split(',') if p.strip()]
+        books = [b.strip() for b in args.books.split(',') if b.strip()]
+        if books:
+            extra.extend(book_chapter_files(site_dir, _book_slugs(books)))
+        manifest = write_service_worker(
+            site_dir, extra, template_path=args.template, output_file=args.output_file)
+        print(
+            f"🧭 서비스 워커 생성: 프리캐시 {len(manifest['files'])}개 (버전 {manifest['version']})")
+
+
+if __name__ == "__main__":
+    main()
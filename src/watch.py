@@ -0,0 +1,419 @@
+"""
+감시(watch) 모듈
+원본 텍스트/템플릿/정적 자원/책 매핑을 주기적으로 확인해 바뀐 장과 그 영향 범위만 다시 생성 (교정용 미리보기)
+"""
+
+import os
+import sys
+import json
+import time
+import argparse
+import threading
+from functools import partial
+from itertools import groupby
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from typing import Optional
+
+from src.parser import BibleParser, Chapter
+from src.html_generator import (
+    HtmlGenerator,
+    build_navigation,
+    build_search_entries,
+    build_verse_counts,
+    chapter_file_slug,
+    copy_dir_dedup,
+    index_with_file_slugs,
+    nav_button_html,
+)
+from src.output_sink import DirectorySink
+
+
+ChapterKey = tuple[str, int]
+
+
+def split_chapter_blocks(content: str, parser: BibleParser) -> dict[ChapterKey, str]:
+    """
+    원본 텍스트를 장 단위 블록으로 분리 (파서와 같은 장 시작 규칙)
+
+    Returns:
+        (약칭, 장) → 장 시작 줄부터 다음 장 시작 전까지의 텍스트 (원본 순서)
+    """
+    blocks: dict[ChapterKey, str] = {}
+    key: Optional[ChapterKey] = None
+    lines: list[str] = []
+    for line in content.split('\n'):
+        match = parser.chapter_pattern.match(line)
+        if match:
+            if key is not None:
+                blocks[key] = '\n'.join(lines)
+            key = (match.group(1), int(match.group(2)))
+            lines = [line]
+        elif key is not None:
+            lines.append(line)
+    if key is not None:
+        blocks[key] = '\n'.join(lines)
+    return blocks
+
+
+class SiteWatcher:
+    """원본 변경을 감지해 영향받는 장 페이지/검색 인덱스/목차만 다시 생성"""
+
+    def __init__(
+        self,
+        source_path: str,
+        template_path: str,
+        output_dir: str,
+        mappings_path: str = 'data/book_mappings.json',
+        static_dir: str = 'static',
+        audio_base: Optional[str] = None,
+        css_href: str = "static/verse-style.css",
+        js_src: str = "static/verse-navigator.js",
+    ):
+        self.source_path = source_path
+        self.template_path = template_path
+        self.output_dir = output_dir
+        self.mappings_path = mappings_path
+        self.static_dir = static_dir
+        # 기본: 출력 디렉터리에서 data/audio로 가는 상대 경로 (html_generator와 같은 보정)
+        self.audio_base = audio_base or os.path.relpath(
+            os.path.abspath('data/audio'), start=os.path.abspath(output_dir))
+        self.css_href = css_href
+        self.js_src = js_src
+        # 미리보기 페이지는 인덱스 내용 해시를 넣지 않는다: 해시가 바뀔 때마다 모든 장을 다시 쓰지 않도록
+        # (해시가 없으면 워커는 IndexedDB 캐시 없이 인덱스를 받는다)
+        self.search_meta = {"counts": True}
+
+        self._blocks: dict[ChapterKey, str] = {}
+        self._chapters: dict[ChapterKey, Chapter] = {}
+        self._search_fragments: dict[ChapterKey, list[dict]] = {}
+        self._search_json: dict[ChapterKey, str] = {}
+        self._navigation: dict[str, tuple[Optional[str], Optional[str]]] = {}
+        self._stats: dict[str, tuple[int, int]] = {}
+        self._load_config()
+
+    # ----- 설정/상태 -----
+
+    def _load_config(self) -> None:
+        """책 매핑/템플릿 로드 (바뀌면 전체 재생성)"""
+        self.parser = BibleParser(self.mappings_path)
+        self.generator = HtmlGenerator(self.template_path)
+        with open(self.mappings_path, 'r', encoding='utf-8') as f:
+            self.books_meta: list[dict] = json.load(f)
+        self._slugs: dict[str, str] = {}
+        self._orders: dict[str, int] = {}
+
+    def slug(self, book_abbr: str) -> str:
+        cached = self._slugs.get(book_abbr)
+        if cached is None:
+            cached = chapter_file_slug(self.generator, self.parser.book_mappings, book_abbr)
+            self._slugs[book_abbr] = cached
+        return cached
+
+    def chapter_id(self, key: ChapterKey) -> str:
+        return f"{self.slug(key[0])}-{key[1]}"
+
+    def _watched_files(self) -> dict[str, str]:
+        """감시 대상 파일 → 종류 (source/template/mappings/static)"""
+        files = {
+            self.source_path: 'source',
+            self.template_path: 'template',
+            self.mappings_path: 'mappings',
+        }
+        for root, _dirs, names in os.walk(self.static_dir):
+            for name in names:
+                files[os.path.join(root, name)] = 'static'
+        return files
+
+    def _snapshot(self) -> dict[str, tuple[int, int]]:
+        stats: dict[str, tuple[int, int]] = {}
+        for path in self._watched_files():
+            try:
+                st = os.stat(path)
+            except OSError:
+                continue
+            stats[path] = (st.st_mtime_ns, st.st_size)
+        return stats
+
+    # ----- 생성 -----
+
+    def _render_chapter(self, sink: DirectorySink, key: ChapterKey) -> None:
+        chapter = self._chapters[key]
+        prev_id, next_id = self._navigation.get(self.chapter_id(key), (None, None))
+        html = self.generator.generate_chapter_html(
+            chapter,
+            audio_base_url=self.audio_base,
+            static_base="static",
+            audio_check_base=(self.audio_base if '://' in self.audio_base
+                              else os.path.join(os.path.abspath(self.output_dir), self.audio_base)),
+            css_href=self.css_href,
+            js_src=self.js_src,
+            books_meta=self.books_meta,
+            prev_button_html=nav_button_html(f"{prev_id}.html" if prev_id else None, True),
+            next_button_html=nav_button_html(f"{next_id}.html" if next_id else None, False),
+            search_meta=self.search_meta,
+        )
+        sink.write_text(f"{self.chapter_id(key)}.html", html)
+
+    def _write_search_index(self, sink: DirectorySink) -> None:
+        """
+        장별로 보관한 엔트리/직렬화 조각을 정규 순서로 이어 붙여 인덱스/절 수 테이블 기록
+
+        결과는 `_serialize_search_index(build_search_entries(전체 장))`과 같은 바이트다.
+        """
+        position = {key: pos for pos, key in enumerate(self._chapters)}
+        keys = sorted((key for key, fragment in self._search_fragments.items() if fragment),
+                      key=lambda k: (self._book_order(k[0]), k[1], position[k]))
+        entries: list[dict] = []
+        parts: list[str] = []
+        for _, group in groupby(keys, key=lambda k: (self._book_order(k[0]), k[1])):
+            group = list(group)
+            if len(group) == 1:
+                entries.extend(self._search_fragments[group[0]])
+                parts.append(self._search_json[group[0]])
+                continue
+            # 책 순서가 같은 장(순서 미정의 책 등)은 전체 정렬처럼 절 순서로 병합
+            merged = sorted((e for key in group for e in self._search_fragments[key]),
+                            key=lambda e: e["v"])
+            entries.extend(merged)
+            parts.append(','.join(json.dumps(e, ensure_ascii=False, separators=(',', ':'))
+                                  for e in merged))
+        sink.write_text("static/search/search-index.json",
+                        '{"format":2,"sorted":true,"entries":[' + ','.join(parts) + ']}')
+        slug_by_abbr = {abbr: self.slug(abbr) for abbr, _ in self._chapters}
+        sink.write_text("static/search/verse-counts.json",
+                        json.dumps(build_verse_counts(entries, slug_by_abbr),
+                                   ensure_ascii=False, separators=(',', ':')))
+
+    def _write_index(self, sink: DirectorySink) -> None:
+        chapters = list(self._chapters.values())
+        index_html = self.generator.generate_index_html(
+            chapters, "static", books_meta=self.books_meta)
+        sink.write_text("index.html", index_with_file_slugs(
+            self.generator, index_html, chapters, self.slug))
+
+    def _book_order(self, book_abbr: str) -> int:
+        order = self._orders.get(book_abbr)
+        if order is None:
+            order = HtmlGenerator.get_book_order_index(book_abbr)
+            self._orders[book_abbr] = order
+        return order
+
+    def _update_search_fragments(self, keys) -> None:
+        """장별 검색 엔트리와 그 JSON 조각 갱신 (바뀐 장만 다시 직렬화)"""
+        for key in keys:
+            chapter = self._chapters[key]
+            entries = build_search_entries(
+                [chapter], {chapter.book_abbr: self.slug(chapter.book_abbr)})
+            self._search_fragments[key] = entries
+            self._search_json[key] = ','.join(
+                json.dumps(e, ensure_ascii=False, separators=(',', ':')) for e in entries)
+
+    def _copy_static(self) -> None:
+        sink = DirectorySink(self.output_dir)
+        copy_dir_dedup(self.static_dir, sink, "static")
+        sink.commit()
+
+    def build_all(self) -> int:
+        """전체 생성 (시작 시, 템플릿/책 매핑 변경 시)"""
+        with open(self.source_path, 'r', encoding='utf-8') as f:
+            self._blocks = split_chapter_blocks(f.read(), self.parser)
+        self._chapters = {}
+        for key, block in self._blocks.items():
+            parsed = self.parser.parse_text(block)
+            if parsed:
+                self._chapters[key] = parsed[0]
+        self._navigation = build_navigation(
+            list(self._chapters.values()), self.books_meta, self.slug)
+        self._search_fragments = {}
+        self._search_json = {}
+        self._update_search_fragments(self._chapters)
+
+        self._copy_static()
+        sink = DirectorySink(self.output_dir)
+        for key in self._chapters:
+            self._render_chapter(sink, key)
+        self._write_search_index(sink)
+        self._write_index(sink)
+        sink.commit()
+        return len(self._chapters)
+
+    def update_source(self) -> list[str]:
+        """
+        원본 텍스트 변경 반영: 내용이 바뀐 장만 다시 파싱하고,
+        그 장과 이전/다음 링크가 달라진 이웃 장, 검색 인덱스(바뀐 장 엔트리만 재구성), 목차(장 구성이 바뀐 경우)만 다시 쓴다
+
+        Returns:
+            다시 쓴 장 ID 목록
+        """
+        with open(self.source_path, 'r', encoding='utf-8') as f:
+            blocks = split_chapter_blocks(f.read(), self.parser)
+        changed = [key for key, block in blocks.items() if self._blocks.get(key) != block]
+        removed = [key for key in self._blocks if key not in blocks]
+        if not changed and not removed:
+            self._blocks = blocks
+            return []
+
+        for key in changed:
+            parsed = self.parser.parse_text(blocks[key])
+            if parsed:
+                self._chapters[key] = parsed[0]
+            else:
+                self._chapters.pop(key, None)
+                self._search_fragments.pop(key, None)
+                self._search_json.pop(key, None)
+        for key in removed:
+            self._chapters.pop(key, None)
+            self._search_fragments.pop(key, None)
+            self._search_json.pop(key, None)
+        # 원본 순서 유지
+        self._chapters = {key: self._chapters[key] for key in blocks if key in self._chapters}
+        self._blocks = blocks
+
+        structure_changed = set(self._navigation) != {
+            self.chapter_id(key) for key in self._chapters}
+        navigation = build_navigation(
+            list(self._chapters.values()), self.books_meta, self.slug)
+        to_render = {key for key in changed if key in self._chapters}
+        for key in self._chapters:
+            chapter_id = self.chapter_id(key)
+            if navigation.get(chapter_id) != self._navigation.get(chapter_id):
+                to_render.add(key)
+        self._navigation = navigation
+        self._update_search_fragments([key for key in changed if key in self._chapters])
+
+        sink = DirectorySink(self.output_dir)
+        for key in to_render:
+            self._render_chapter(sink, key)
+        self._write_search_index(sink)
+        if structure_changed:
+            self._write_index(sink)
+        sink.commit()
+        for key in removed:
+            stale = os.path.join(self.output_dir, f"{self.chapter_id(key)}.html")
+            if os.path.exists(stale):
+                os.remove(stale)
+        return [self.chapter_id(key) for key in to_render]
+
+    # ----- 감시 루프 -----
+
+    def poll_once(self) -> Optional[str]:
+        """한 번 확인하고 바뀐 것이 있으면 다시 생성. 반환: 진행 요약(변경 없으면 None)"""
+        current = self._snapshot()
+        if current == self._stats:
+            return None
+        kinds = self._watched_files()
+        changed_kinds = {kinds.get(path, 'static')
+                         for path in set(current) | set(self._stats)
+                         if current.get(path) != self._stats.get(path)}
+        self._stats = current
+
+        started = time.perf_counter()
+        if changed_kinds & {'template', 'mappings'}:
+            self._load_config()
+            summary = f"전체 재생성 {self.build_all()}개 장"
+        else:
+            parts = []
+            if 'static' in changed_kinds:
+                self._copy_static()
+                parts.append("정적 자원 복사")
+            if 'source' in changed_kinds:
+                rendered = self.update_source()
+                parts.append(f"장 {len(rendered)}개 재생성" +
+                             (f" ({', '.join(rendered[:5])}{' …' if len(rendered) > 5 else ''})" if rendered else ""))
+            summary = ", ".join(parts) or "변경 없음"
+        elapsed = (time.perf_counter() - started) * 1000
+        return f"{summary} ({elapsed:.0f}ms)"
+
+    def run(self, interval: float = 0.3) -> None:
+        """초기 전체 생성 후 interval초마다 변경 확인 (Ctrl+C로 종료)"""
+        started = time.perf_counter()
+        self._stats = self._snapshot()
+        count = self.build_all()
+        print(f"📚 초기 생성: {count}개 장 ({(time.perf_counter() - started) * 1000:.0f}ms) → {self.output_dir}")
+        print("👀 변경 감시 중... (Ctrl+C로 종료)")
+        try:
+            while True:
+                time.sleep(interval)
+                try:
+                    summary = self.poll_once()
+                except Exception as e:
+                    # 편집 중간 상태(잘못된 JSON 등)는 다음 저장 때 다시 시도
+                    print(f"❌ 재생성 실패: {e}")
+                    continue
+                if summary:
+                    print(f"🔁 {time.strftime('%H:%M:%S')} {summary}")
+        except KeyboardInterrupt:
+            print("\n감시를 종료합니다.")
+
+
+class _QuietHandler(SimpleHTTPRequestHandler):
+    """요청 로그를 출력하지 않는 정적 파일 핸들러"""
+
+    def log_message(self, format, *args):
+        pass
+
+
+def serve(directory: str, port: int) -> ThreadingHTTPServer:
+    """출력 디렉터리를 로컬 HTTP 서버로 제공 (백그라운드 스레드)"""
+    server = ThreadingHTTPServer(('127.0.0.1', port), partial(_QuietHandler, directory=directory))
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    return server
+
+
+def main():
+    """CLI: 원본 텍스트 감시 + 증분 재생성 (+ 선택적 로컬 서버)"""
+    parser = argparse.ArgumentParser(description="공동번역성서 미리보기 감시 모드")
+    parser.add_argument(
+        "source",
+        nargs="?",
+        default="data/common-bible-kr.txt",
+        help="원본 텍스트 경로 (기본: data/common-bible-kr.txt)",
+    )
+    parser.add_argument(
+        "--template",
+        default="templates/chapter.html",
+        help="장 템플릿 (기본: templates/chapter.html)",
+    )
+    parser.add_argument(
+        "--output-dir",
+        default="output/preview",
+        help="미리보기 출력 디렉터리 (기본: output/preview)",
+    )
+    parser.add_argument(
+        "--audio-base",
+        default=None,
+        help="오디오 기본 경로/URL (기본: 출력 디렉터리 기준 data/audio 상대 경로)",
+    )
+    parser.add_argument(
+        "--interval",
+        type=float,
+        default=0.3,
+        help="변경 확인 주기(초, 기본: 0.3)",
+    )
+    parser.add_argument(
+        "--serve",
+        nargs="?",
+        type=int,
+        const=8000,
+        default=None,
+        metavar="PORT",
+        help="출력 디렉터리를 http://127.0.0.1:PORT/ 로 제공 (PORT 생략 시 8000)",
+    )
+    args = parser.parse_args()
+
+    if not os.path.exists(args.source):
+        print(f"❌ 원본 텍스트가 없습니다: {args.source}")
+        sys.exit(1)
+
+    watcher = SiteWatcher(args.source, args.template, args.output_dir,
+                          audio_base=args.audio_base)
+    if args.serve is not None:
+        os.makedirs(args.output_dir, exist_ok=True)
+        serve(args.output_dir, args.serve)
+        print(f"🌐 미리보기 서버: http://127.0.0.1:{args.serve}/index.html")
+    watcher.run(args.interval)
+
+
+if __name__ == "__main__":
+    main()
@@ -20,14 +20,19 @@ import hashlib
 import json
 import logging
 from pathlib import Path
+import threading
 import time
 import mimetypes
+from concurrent.futures import ThreadPoolExecutor
 from urllib.parse import urljoin
 import requests
+from requests.adapters import HTTPAdapter
 from requests.auth import HTTPBasicAuth
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from .config import Config
+from .html_generator import HtmlGenerator, NavigationTable
+from .parser import BibleParser, Chapter
 
 
 # -----------------------------
@@ -43,6 +48,9 @@ class AssetRecord:
     source_url: Optional[str]
     mime_type: Optional[str]
     uploaded_at: Optional[str]
+    # 기록 당시 로컬 파일의 크기/mtime(ns) — 그대로면 해시를 다시 계산하지 않음
+    size: Optional[int] = None
+    mtime_ns: Optional[int] = None
 
 
 @dataclasses.dataclass
@@ -53,23 +61,51 @@ class ChapterPostMeta:
     division: str
     chapter_number: int
 
+    @property
+    def post_slug(self) -> str:
+        return f"{_to_slug(self.english_name)}-{self.chapter_number}"
+
+
+@dataclasses.dataclass
+class ChapterPost:
+    """A chapter rendered straight from parsed data (no intermediate HTML file)."""
+
+    chapter: Chapter
+    meta: ChapterPostMeta
+    prev_slug: Optional[str] = None
+    next_slug: Optional[str] = None
+
 
 # -----------------------------
 # Asset Registry
 # -----------------------------
 
 
+# 자산 인덱스 파일 안의 용어(name → id) 캐시 키 (로컬 파일 경로와 겹치지 않음)
+TERMS_KEY = "_terms"
+TAXONOMIES = ("categories", "tags")
+
+
 class AssetRegistry:
-    """Local registry mapping local files to WP media info."""
+    """Local registry mapping local files to WP media info.
+
+    Also persists category/tag name → term id so later runs skip term searches.
+    """
 
     def __init__(self, index_path: Path) -> None:
         self.index_path: Path = index_path
         self._records: Dict[str, AssetRecord] = {}
+        self._terms: Dict[str, Dict[str, int]] = {t: {} for t in TAXONOMIES}
+        # publish-batch 작업 스레드가 동시에 기록
+        self._lock = threading.Lock()
 
     def load(self) -> None:
         if self.index_path.exists():
             try:
                 raw = json.loads(self.index_path.read_text(encoding="utf-8"))
+                for taxonomy, terms in (raw.pop(TERMS_KEY, None) or {}).items():
+                    self._terms.setdefault(taxonomy, {}).update(
+                        {name: int(term_id) for name, term_id in terms.items()})
                 for local_path, record in raw.items():
                     self._records[local_path] = AssetRecord(**record)
             except Exception as exc:
@@ -78,16 +114,38 @@ class AssetRegistry:
 
     def save(self) -> None:
         self.index_path.parent.mkdir(parents=True, exist_ok=True)
-        serializable = {k: dataclasses.asdict(
-            v) for k, v in self._records.items()}
+        with self._lock:
+            serializable: Dict[str, Any] = {k: dataclasses.asdict(
+                v) for k, v in self._records.items()}
+            if any(self._terms.values()):
+                serializable[TERMS_KEY] = {
+                    t: dict(sorted(terms.items())) for t, terms in self._terms.items()}
         self.index_path.write_text(json.dumps(
             serializable, ensure_ascii=False, indent=2), encoding="utf-8")
 
     def get(self, local_path: Path) -> Optional[AssetRecord]:
-        return self._records.get(str(local_path))
+        with self._lock:
+            return self._records.get(str(local_path))
 
     def upsert(self, local_path: Path, record: AssetRecord) -> None:
-        self._records[str(local_path)] = record
+        with self._lock:
+            self._records[str(local_path)] = record
+
+    def get_term(self, taxonomy: str, name: str) -> Optional[int]:
+        with self._lock:
+            return self._terms.get(taxonomy, {}).get(name)
+
+    def set_term(self, taxonomy: str, name: str, term_id: int) -> None:
+        with self._lock:
+            self._terms.setdefault(taxonomy, {})[name] = term_id
+
+    def drop_term(self, taxonomy: str, name: str) -> None:
+        with self._lock:
+            self._terms.get(taxonomy, {}).pop(name, None)
+
+    def replace_terms(self, taxonomy: str, terms: Dict[str, int]) -> None:
+        with self._lock:
+            self._terms[taxonomy] = dict(terms)
 
 
 # -----------------------------
@@ -100,9 +158,10 @@ class WordPressClient:
 
     - Application Password 기반 기본 인증 사용
     - 재시도/백오프/타임아웃/로깅 적용
+    - 세션은 스레드 간 공유: pool_size를 주면 연결 풀을 그 크기로 고정 (초과 요청은 대기)
     """
 
-    def __init__(self, config: Config) -> None:
+    def __init__(self, config: Config, pool_size: Optional[int] = None) -> None:
         self.config = config
         self.base_api = config.get_wordpress_api_url()
         self.timeout_sec = int(getattr(config, "wp_timeout", 5))
@@ -116,6 +175,11 @@ class WordPressClient:
                 "Missing WordPress credentials: set WP_USERNAME and WP_PASSWORD"
             )
         self.session.auth = HTTPBasicAuth(username, password)
+        if pool_size:
+            adapter = HTTPAdapter(
+                pool_connections=1, pool_maxsize=pool_size, pool_block=True)
+            self.session.mount("https://", adapter)
+            self.session.mount("http://", adapter)
 
     def _request(
         self,
@@ -237,23 +301,43 @@ class WordPressClient:
 
     # Terms
     def ensure_category(self, name: str) -> int:
-        params = {"search": name, "per_page": 100}
-        resp = self._request("GET", "/categories", params=params)
-        for item in resp.json():
-            if item.get("name") == name:
-                return int(item.get("id"))
-        data = {"name": name}
-        created = self._request("POST", "/categories", json=data).json()
-        return int(created.get("id"))
+        return self.ensure_term("categories", name)
 
     def ensure_tag(self, name: str) -> int:
+        return self.ensure_term("tags", name)
+
+    def list_terms(self, taxonomy: str, per_page: int = 100) -> Dict[str, int]:
+        """All terms of a taxonomy as name → id (follows X-WP-TotalPages)."""
+        terms: Dict[str, int] = {}
+        page = 1
+        while True:
+            resp = self._request(
+                "GET", f"/{taxonomy}", params={"per_page": per_page, "page": page})
+            items = resp.json()
+            for item in items:
+                terms.setdefault(item.get("name"), int(item.get("id")))
+            total_pages = int(resp.headers.get("X-WP-TotalPages") or page)
+            if not items or page >= total_pages:
+                return terms
+            page += 1
+
+    def term_exists(self, taxonomy: str, term_id: int) -> bool:
+        try:
+            self._request("GET", f"/{taxonomy}/{term_id}")
+        except requests.HTTPError as exc:
+            if exc.response is not None and exc.response.status_code == 404:
+                return False
+            raise
+        return True
+
+    def ensure_term(self, taxonomy: str, name: str) -> int:
         params = {"search": name, "per_page": 100}
-        resp = self._request("GET", "/tags", params=params)
+        resp = self._request("GET", f"/{taxonomy}", params=params)
         for item in resp.json():
             if item.get("name") == name:
                 return int(item.get("id"))
         data = {"name": name}
-        created = self._request("POST", "/tags", json=data).json()
+        created = self._request("POST", f"/{taxonomy}", json=data).json()
         return int(created.get("id"))
 
     # Posts
@@ -325,10 +409,63 @@ class WordPressClient:
 
 
 class Publisher:
-    def __init__(self, config: Config, registry: AssetRegistry, client: WordPressClient) -> None:
+    def __init__(
+        self,
+        config: Config,
+        registry: AssetRegistry,
+        client: WordPressClient,
+        generator: Optional[HtmlGenerator] = None,
+    ) -> None:
         self.config = config
         self.registry = registry
         self.client = client
+        # 게시물 본문 조각 렌더링용 (parsed JSON에서 바로 게시할 때만 필요)
+        self.generator = generator
+        # 같은 이름의 용어를 두 스레드가 동시에 검색/생성하지 않도록 (이름별 잠금)
+        self._term_locks: Dict[Tuple[str, str], threading.Lock] = {}
+        self._term_locks_guard = threading.Lock()
+
+    def _term_lock(self, taxonomy: str, name: str) -> threading.Lock:
+        with self._term_locks_guard:
+            return self._term_locks.setdefault((taxonomy, name), threading.Lock())
+
+    # Terms (name → id: 자산 인덱스 캐시 우선, 없으면 검색/생성 후 기록)
+    def prefetch_terms(self) -> Dict[str, int]:
+        """Replace the cached term ids with one paginated listing per taxonomy."""
+        counts: Dict[str, int] = {}
+        for taxonomy in TAXONOMIES:
+            terms = self.client.list_terms(taxonomy)
+            self.registry.replace_terms(taxonomy, terms)
+            counts[taxonomy] = len(terms)
+        return counts
+
+    def ensure_term(self, taxonomy: str, name: str) -> int:
+        term_id = self.registry.get_term(taxonomy, name)
+        if term_id is not None:
+            return term_id
+        with self._term_lock(taxonomy, name):
+            term_id = self.registry.get_term(taxonomy, name)
+            if term_id is None:
+                term_id = self.client.ensure_term(taxonomy, name)
+                self.registry.set_term(taxonomy, name, term_id)
+            return term_id
+
+    def _revalidate_terms(self, names: List[Tuple[str, str]]) -> bool:
+        """Drop cached ids that now 404 (term deleted on the site) and re-resolve them.
+
+        Returns True when any id changed.
+        """
+        changed = False
+        for taxonomy, name in names:
+            term_id = self.registry.get_term(taxonomy, name)
+            if term_id is None or self.client.term_exists(taxonomy, term_id):
+                continue
+            logging.warning("Cached %s id %s for %s is gone; resolving again",
+                            taxonomy, term_id, name)
+            self.registry.drop_term(taxonomy, name)
+            self.ensure_term(taxonomy, name)
+            changed = True
+        return changed
 
     def ensure_policy_assets(self, css_path: Path, audio_dir: Optional[Path] = None) -> Dict[str, Any]:
         results: Dict[str, Any] = {"css": None, "audio": []}
@@ -373,7 +510,52 @@ class Publisher:
         self.registry.upsert(local_audio_path, uploaded)
         return uploaded
 
-    def render_and_publish_chapter(self, html_path: Path, meta: ChapterPostMeta, status: Optional[str] = None, dry_run: bool = True) -> int:
+    def resolve_audio_url(self, meta: ChapterPostMeta) -> Optional[str]:
+        """Public URL of the chapter audio, or None when there is no local mp3.
+
+        An asset index record whose size/mtime (or, failing that, hash) still matches
+        the local file is used as is (no HTTP). Otherwise the asset is looked
+        up/uploaded and recorded.
+        """
+        english_slug = _to_slug(meta.english_name)
+        local_audio = _local_audio_path(meta)
+        if not local_audio.exists():
+            return None
+        st = local_audio.stat()
+        record = self.registry.get(local_audio)
+        if record and record.source_url:
+            if (record.size, record.mtime_ns) == (st.st_size, st.st_mtime_ns):
+                return record.source_url
+            if record.sha256 == _hash_file(local_audio):
+                # 내용은 같고 mtime만 바뀐 경우 (복사/touch) → 크기/mtime만 갱신
+                self.registry.upsert(local_audio, dataclasses.replace(
+                    record, size=st.st_size, mtime_ns=st.st_mtime_ns))
+                return record.source_url
+        record = self.ensure_audio_asset(
+            english_slug, meta.chapter_number, local_audio)
+        if record:
+            # 기존 미디어와 일치해 업로드하지 않은 경우도 기록 (다음 실행은 HTTP 없이 해석)
+            self.registry.upsert(local_audio, dataclasses.replace(
+                record, size=st.st_size, mtime_ns=st.st_mtime_ns))
+        return record.source_url if record else None
+
+    def post_url(self, slug: str) -> str:
+        """Post permalink, assuming the 'Post name' (/%postname%/) permalink structure."""
+        return f"{self.config.wp_site_url.rstrip('/')}/{slug}/"
+
+    def render_chapter_fragment(self, post: ChapterPost) -> str:
+        """Render the post `content` fragment (article body + nav) for a chapter."""
+        if self.generator is None:
+            raise ValueError("HtmlGenerator is required to render chapters from parsed data")
+        return self.generator.generate_wordpress_fragment(
+            post.chapter,
+            audio_url=self.resolve_audio_url(post.meta),
+            prev_href=self.post_url(post.prev_slug) if post.prev_slug else None,
+            next_href=self.post_url(post.next_slug) if post.next_slug else None,
+        )
+
+    def _content_from_document(self, html_path: Path, meta: ChapterPostMeta) -> str:
+        """Legacy path: full standalone document from disk with audio links rewritten."""
         if not html_path.exists():
             raise FileNotFoundError(f"HTML not found: {html_path}")
 
@@ -381,7 +563,7 @@ class Publisher:
         # 링크 재작성: 오디오
         english_slug = _to_slug(meta.english_name)
         expected_name = f"{english_slug}-{meta.chapter_number}.mp3"
-        local_audio = Path("data") / "audio" / expected_name
+        local_audio = _local_audio_path(meta)
         audio_record: Optional[AssetRecord] = None
         if local_audio.exists():
             audio_record = self.ensure_audio_asset(
@@ -393,17 +575,40 @@ class Publisher:
                 # 절대 URL로 바꾸기
                 content_html = content_html.replace(
                     f"src=\"{Path(audio_record.source_url).name}\"", f"src=\"{audio_record.source_url}\"")
+        return content_html
+
+    def render_and_publish_chapter(
+        self,
+        html_path: Optional[Path],
+        meta: ChapterPostMeta,
+        status: Optional[str] = None,
+        dry_run: bool = True,
+        post: Optional[ChapterPost] = None,
+    ) -> int:
+        """Publish one chapter.
+
+        With `post`, the content is a fragment rendered in memory by HtmlGenerator
+        (audio URL from the asset index). Otherwise the standalone document at
+        `html_path` is posted as before.
+        """
+        if post is not None:
+            content_html = self.render_chapter_fragment(post)
+        elif html_path is not None:
+            content_html = self._content_from_document(html_path, meta)
+        else:
+            raise ValueError("Either html_path or post is required")
 
         title = f"{meta.book_name} {meta.chapter_number}장"
-        slug = f"{_to_slug(meta.english_name)}-{meta.chapter_number}"
+        slug = meta.post_slug
         status_to_use = status or self.config.wp_default_status
 
-        category_id = self.client.ensure_category(self.config.wp_base_category)
-        tag_ids = [
-            self.client.ensure_tag(self.config.wp_base_tag),
-            self.client.ensure_tag(meta.division),
-            self.client.ensure_tag(meta.book_name),
+        term_names = [
+            ("categories", self.config.wp_base_category),
+            ("tags", self.config.wp_base_tag),
+            ("tags", meta.division),
+            ("tags", meta.book_name),
         ]
+        category_id, *tag_ids = [self.ensure_term(t, n) for t, n in term_names]
 
         if dry_run:
             logging.info(
@@ -416,14 +621,51 @@ class Publisher:
             )
             return 0
 
-        return self.client.create_or_update_post(
-            slug=slug,
-            title=title,
-            content_html=content_html,
-            status=status_to_use,
-            category_ids=[category_id],
-            tag_ids=tag_ids,
-        )
+        def write_post() -> int:
+            return self.client.create_or_update_post(
+                slug=slug,
+                title=title,
+                content_html=content_html,
+                status=status_to_use,
+                category_ids=[category_id],
+                tag_ids=tag_ids,
+            )
+
+        try:
+            return write_post()
+        except requests.HTTPError as exc:
+            # 캐시된 용어 id가 사이트에서 삭제된 경우 (잘못된 파라미터로 거절) 한 번만 재확인 후 재시도
+            if exc.response is None or exc.response.status_code not in (400, 404):
+                raise
+            if not self._revalidate_terms(term_names):
+                raise
+            category_id, *tag_ids = [self.ensure_term(t, n) for t, n in term_names]
+            return write_post()
+
+    def publish_batch(
+        self,
+        jobs: List[Tuple[Optional[Path], ChapterPostMeta, Optional[ChapterPost]]],
+        status: Optional[str] = None,
+        dry_run: bool = True,
+        concurrency: int = 1,
+    ) -> List[Dict[str, Any]]:
+        """Publish (html_path, meta, post) jobs on a bounded thread pool.
+
+        Results come back in job order; a failed chapter is reported as
+        {"error": ...} instead of aborting the rest of the batch.
+        """
+        def publish(job: Tuple[Optional[Path], ChapterPostMeta, Optional[ChapterPost]]) -> Dict[str, Any]:
+            html_path, meta, post = job
+            try:
+                post_id = self.render_and_publish_chapter(
+                    html_path=html_path, meta=meta, status=status, dry_run=dry_run, post=post)
+                return {"post_id": post_id}
+            except Exception as exc:
+                logging.error("Failed to publish %s: %s", meta.post_slug, exc)
+                return {"error": str(exc)}
+
+        with ThreadPoolExecutor(max_workers=max(1, concurrency)) as executor:
+            return list(executor.map(publish, jobs))
 
     def bulk_update_status(
         self,
@@ -436,10 +678,10 @@ class Publisher:
         dry_run: bool = False,
         per_page: int = 100,
     ) -> Dict[str, Any]:
-        category_id = self.client.ensure_category(category)
+        category_id = self.ensure_term("categories", category)
         tag_ids: List[int] = []
         if division_tag:
-            tag_ids.append(self.client.ensure_tag(division_tag))
+            tag_ids.append(self.ensure_term("tags", division_tag))
 
         page = 1
         total = succeeded = failed = skipped = 0
@@ -492,6 +734,56 @@ def _to_slug(text: str) -> str:
     return "".join(ch.lower() if ch.isalnum() else "-" for ch in text).strip("-").replace("--", "-")
 
 
+def _local_audio_path(meta: ChapterPostMeta) -> Path:
+    return Path("data") / "audio" / f"{meta.post_slug}.mp3"
+
+
+def load_chapter_posts(
+    json_path: Path,
+    book_mappings_path: str,
+    book_abbr: Optional[str] = None,
+    chapter_range: Optional[Tuple[Optional[int], Optional[int]]] = None,
+) -> List[ChapterPost]:
+    """Build ChapterPost items (meta + prev/next post slugs) from parsed bible JSON.
+
+    Prev/next links follow the whole text regardless of the book/chapter filter.
+    """
+    parser = BibleParser(book_mappings_path)
+    chapters = parser.load_from_json(str(json_path))
+
+    def english_name(abbr: str) -> str:
+        info = parser.book_mappings.get(abbr) or {}
+        return info.get("english_name") or abbr
+
+    with open(book_mappings_path, "r", encoding="utf-8") as f:
+        books_meta = json.load(f)
+    navigation = NavigationTable(books_meta, lambda abbr: _to_slug(english_name(abbr)))
+    for chapter in chapters:
+        navigation.add(chapter.book_abbr, chapter.chapter_number)
+
+    low, high = chapter_range or (None, None)
+    posts: List[ChapterPost] = []
+    for chapter in chapters:
+        if book_abbr and chapter.book_abbr != book_abbr:
+            continue
+        if low is not None and chapter.chapter_number < low:
+            continue
+        if high is not None and chapter.chapter_number > high:
+            continue
+        info = parser.book_mappings.get(chapter.book_abbr) or {}
+        meta = ChapterPostMeta(
+            book_name=chapter.book_name,
+            book_abbr=chapter.book_abbr,
+            english_name=english_name(chapter.book_abbr),
+            division=info.get("구분", "구약"),
+            chapter_number=chapter.chapter_number,
+        )
+        prev_slug, next_slug = navigation.neighbours(
+            navigation.chapter_id(chapter.book_abbr, chapter.chapter_number))
+        posts.append(ChapterPost(chapter, meta, prev_slug, next_slug))
+    return posts
+
+
 def _configure_logging(config: Config) -> None:
     level = getattr(logging, config.log_level, logging.INFO)
     logging.basicConfig(level=level, format="%(levelname)s %(message)s")
@@ -517,7 +809,9 @@ def _build_parser() -> argparse.ArgumentParser:
     # publish-chapter
     p_publish = sub.add_parser(
         "publish-chapter", help="Publish or update a single chapter HTML")
-    p_publish.add_argument("--html", type=Path, required=True)
+    p_publish.add_argument("--html", type=Path, required=False)
+    p_publish.add_argument("--json", type=Path, required=False,
+                           help="Parsed bible JSON; render the post body fragment in memory (needs --book-abbr/--chapter)")
     p_publish.add_argument("--book-name", required=False)
     p_publish.add_argument("--book-abbr", required=False)
     p_publish.add_argument("--english-name", required=False)
@@ -532,7 +826,9 @@ def _build_parser() -> argparse.ArgumentParser:
     # publish-batch
     p_batch = sub.add_parser(
         "publish-batch", help="Batch publish chapters from a directory")
-    p_batch.add_argument("--html-dir", type=Path, required=True)
+    p_batch.add_argument("--html-dir", type=Path, required=False)
+    p_batch.add_argument("--json", type=Path, required=False,
+                         help="Parsed bible JSON; render post body fragments in memory instead of reading --html-dir")
     p_batch.add_argument("--book-abbr", required=False)
     p_batch.add_argument("--from-chapter", type=int, required=False)
     p_batch.add_argument("--to-chapter", type=int, required=False)
@@ -601,8 +897,12 @@ def main(argv: Optional[List[str]] = None) -> int:
     registry = AssetRegistry(index_path=Path(args.index) if hasattr(
         args, "index") else Path("output/wp_asset_index.json"))
     registry.load()
-    client = WordPressClient(config)
-    publisher = Publisher(config, registry, client)
+    concurrency = max(1, getattr(args, "concurrency", 1))
+    client = WordPressClient(
+        config, pool_size=concurrency if args.command == "publish-batch" else None)
+    generator = HtmlGenerator(config.template_path) if getattr(
+        args, "json", None) else None
+    publisher = Publisher(config, registry, client, generator)
 
     if args.command == "ensure-assets":
         results = publisher.ensure_policy_assets(
@@ -612,6 +912,27 @@ def main(argv: Optional[List[str]] = None) -> int:
         return 0
 
     if args.command == "publish-chapter":
+        if args.json:
+            if args.book_abbr is None or args.chapter is None:
+                parser.error("--json requires --book-abbr and --chapter")
+            posts = load_chapter_posts(
+                args.json, config.book_mappings_path, args.book_abbr, (args.chapter, args.chapter))
+            if not posts:
+                parser.error(
+                    f"Chapter not found in {args.json}: {args.book_abbr} {args.chapter}")
+            post = posts[0]
+            post_id = publisher.render_and_publish_chapter(
+                html_path=None,
+                meta=post.meta,
+                status=args.status,
+                dry_run=args.dry_run,
+                post=post,
+            )
+            registry.save()
+            print(json.dumps({"post_id": post_id}, ensure_ascii=False))
+            return 0
+        if args.html is None:
+            parser.error("--html or --json is required")
         meta = _load_meta_from_args(args)
         post_id = publisher.render_and_publish_chapter(
             html_path=args.html,
@@ -624,8 +945,25 @@ def main(argv: Optional[List[str]] = None) -> int:
         return 0
 
     if args.command == "publish-batch":
-        html_files = sorted(Path(args.html_dir).glob("*.html"))
+        # 장마다 용어 검색을 하지 않도록 시작 시 전체 목록으로 캐시 갱신
+        counts = publisher.prefetch_terms()
+        logging.info("Prefetched terms: %s", counts)
         summary: List[Dict[str, Any]] = []
+        if args.json:
+            posts = load_chapter_posts(
+                args.json, config.book_mappings_path, args.book_abbr,
+                (args.from_chapter, args.to_chapter))
+            results = publisher.publish_batch(
+                [(None, post.meta, post) for post in posts],
+                status=args.status, dry_run=args.dry_run, concurrency=concurrency)
+            for post, result in zip(posts, results):
+                summary.append({"slug": post.meta.post_slug, **result})
+            registry.save()
+            print(json.dumps(summary, ensure_ascii=False, indent=2))
+            return 1 if any("error" in item for item in summary) else 0
+        if args.html_dir is None:
+            parser.error("--html-dir or --json is required")
+        html_files = sorted(Path(args.html_dir).glob("*.html"))
         for html in html_files:
             # Skeleton: cannot infer meta from filename reliably; skip if insufficient
             if args.book_abbr is None or args.from_chapter is None or args.to_chapter is None:
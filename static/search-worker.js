@@ -2,62 +2,781 @@
  * 전역 검색 Web Worker
  * 메시지 프로토콜
  * - { type: 'init' }
- * - { type: 'config', indexUrl: '.../search-index.json' }
- * - { type: 'query', q: '키워드', limit: 50 }
+ * - { type: 'config', indexUrl: '.../search-index.json', binaryIndexUrl?: '.../search-index.bin', indexHash?: '<내용 해시>', countsUrl?: '.../verse-counts.json' }
+ * - { type: 'query', q: '키워드', limit: 50, page?: 1, offset?: 0, seq?: 1 }
+ *   offset을 주면 page 대신 매치 목록의 시작 위치로 쓰고, limit 0이면 총 건수만 응답한다.
+ *   seq는 응답(results/total)에 그대로 실어 보낸다. 같은 클라이언트(포트)에서 더 큰 seq의 쿼리가
+ *   도착하면 이전 쿼리는 스캔 청크 사이에서 중단하고 응답하지 않는다.
+ *
+ * 인덱스 포맷
+ * - JSON: { format, sorted, entries: [{ i, t, h, b, c, v, bo }] } (구버전: 엔트리 배열)
+ * - 바이너리(선택): 책/장/절 Uint16 열 + 텍스트 오프셋 Uint32 열 + UTF-8 블롭
+ *   (+ 대문자가 있으면 생성기가 소문자로 접어 둔 검색용 오프셋/블롭 열).
+ *   객체를 만들지 않고 typed array로 바로 스캔하며, 텍스트는 결과 항목만 디코딩한다.
+ *
+ * 전송 방식: 전용 Worker(페이지마다 1개) 또는 SharedWorker(출처당 1개, 탭/페이지 공유).
+ * SharedWorker에서는 연결된 포트마다 같은 프로토콜로 응답한다. 설정(URL/해시/구간)은 포트별로
+ * 따로 두고, 로드한 인덱스는 내용 해시 단위로 공유한다. 한 탭이 다른 해시로 설정을 바꿔도 다른 탭이
+ * 쓰는 인덱스는 건드리지 않으며, 어떤 포트도 쓰지 않게 된(참조 수 0) 인덱스만 버린다.
+ * - { type: 'release' }: 포트가 더 이상 인덱스를 쓰지 않음 (페이지를 떠날 때)
+ *
+ * JSON 모드의 검색 텍스트는 로드 시 한 번만 정규화(소문자)해 두고(바이너리는 생성기가 접어 둠), 최근 쿼리 결과(매치 행 번호)는
+ * LRU로 보관한다. 이전 쿼리를 포함하는 새 쿼리("하느" → "하느님")는 전체를 다시 훑지 않고
+ * 이전 매치 집합만 좁히며, 페이지 이동/뒤로 가기는 캐시에서 바로 응답한다.
+ *
+ * 생성기가 정규 순서(bo → c → v)를 보장하면(헤더 sorted 플래그) 쿼리마다 정렬하지 않는다.
+ * 새 쿼리는 순서대로 스캔하다 요청 페이지가 채워지면 결과를 먼저 보내고(totalExact: false),
+ * 스캔을 마친 뒤 정확한 총 건수를 { type: 'total' }로 보낸다.
+ *
+ * 워커 풀: config의 slice [k, n]을 받으면 정렬된 인덱스를 n등분한 k번째 연속 구간만 남기고
+ * (로드 직후 잘라 내 나머지는 메모리에서 버림) 그 구간만 스캔한다. check/chapters도 자기 구간 안에서만 답한다.
+ * 구간이 책/장/절 순서로 이어지므로 코디네이터(verse-search.js)는 구간 순서대로 이어 붙이기만 하면 된다.
+ * 풀에서 쓰도록 check/chapters 응답에도 요청의 seq를 실어 보낸다.
+ *
+ * countsUrl(책 → 장 → 절 수 테이블)이 설정되면 check/chapters는 전문 인덱스를 로드하지 않고
+ * 테이블의 산술 비교로 답한다. 테이블을 읽지 못하면 기존처럼 인덱스를 스캔한다.
+ *
+ * 로드한 인덱스는 생성기가 페이지에 주입한 내용 해시(indexHash)를 키로 IndexedDB에 보관한다.
+ * 다음 장 페이지의 워커는 네트워크/파싱 없이 바로 재사용하고, 해시가 바뀔 때만 다시 받는다.
  */
 
-let INDEX_URL = null;
-let entries = null; // [{ i, t, h, b, c, v, bo }]
-let byId = null; // Map id -> href (built after load)
-let isLoading = false;
-let pendingQuery = null;
-let chaptersCache = new Map(); // bookAbbr -> [chapters]
+const indexStates = new Map(); // stateKey(설정) -> 인덱스 상태 (createIndexState)
+const clients = new Map(); // 응답 함수(클라이언트/포트) -> { indexUrl, binaryIndexUrl, countsUrl, indexHash, slice, state }
+const latestSeq = new WeakMap(); // 응답 함수(클라이언트/포트) -> 마지막으로 받은 쿼리 seq
+
+const QUERY_CACHE_LIMIT = 16;
+// 전체 스캔은 이 행 수마다 이벤트 루프에 양보해 새 쿼리(취소 신호)를 받는다
+const SCAN_CHUNK_ROWS = 4096;
+
+const BINARY_MAGIC = "CBSI";
+const BINARY_VERSION = 2;
+const INDEX_FLAG_SORTED = 0x1;
+const INDEX_FLAG_CASELESS = 0x2; // 텍스트 블롭이 이미 소문자
+const INDEX_FLAG_FOLDED = 0x4; // 텍스트 블롭 뒤에 소문자로 접은 검색용 열이 있음
+const utf8Decoder = new TextDecoder("utf-8");
+const utf8Encoder = new TextEncoder();
+const IDB_NAME = "common-bible-search";
+const IDB_STORE = "indexes";
 
 function post(type, payload) {
   postMessage(Object.assign({ type }, payload || {}));
 }
 
+/** SharedWorker 포트별 응답 함수 (post와 같은 시그니처) */
+function portReply(port) {
+  return (type, payload) =>
+    port.postMessage(Object.assign({ type }, payload || {}));
+}
+
+/**
+ * 로드한 인덱스 한 벌 (같은 해시/URL로 설정한 포트들이 공유).
+ * 필드는 로드 때 한 번 채운 뒤 바꾸지 않으므로, 진행 중인 스캔은 설정이 바뀌어도 끝까지 같은 인덱스를 본다.
+ */
+function createIndexState(key, cfg) {
+  return {
+    key,
+    refs: 0, // 이 인덱스를 설정한 포트 수 + 진행 중인 요청 수
+    indexUrl: cfg.indexUrl,
+    binaryIndexUrl: cfg.binaryIndexUrl,
+    countsUrl: cfg.countsUrl,
+    hash: cfg.indexHash,
+    entries: null, // JSON 모드: [{ i, t, h, b, c, v, bo }]
+    normTexts: null, // JSON 모드: 정규화(소문자)된 절 텍스트
+    binIndex: null, // 바이너리 모드: parseBinaryIndex() 결과
+    sorted: false, // 인덱스 헤더의 정렬 플래그
+    byId: null, // Map id -> href (JSON 모드에서 로드 후 구성)
+    loadingPromise: null, // 동시 요청이 같은 로드를 기다리도록 공유
+    chaptersCache: new Map(), // bookAbbr -> [chapters]
+    verseCounts: null, // Map bookAbbr -> { b, s, bo, c: [장별 마지막 절], x?: { 장: [빠진 절] } }
+    countsPromise: null,
+    slice: cfg.slice, // 워커 풀 구간 [k, n] (없으면 전체) — 로드 후 이 구간의 행만 남긴다
+    queryCache: new Map(), // 정규화된 쿼리 -> 정렬된 매치 행 번호 (삽입 순서 = LRU 순서)
+  };
+}
+
+function stateKey(cfg) {
+  const slice = cfg.slice ? cfg.slice.join("/") : "";
+  return [cfg.indexHash, cfg.indexUrl, cfg.binaryIndexUrl, cfg.countsUrl, slice].join("\n");
+}
+
+function acquire(st) {
+  st.refs += 1;
+}
+
+/** 참조가 모두 풀린 인덱스는 목록에서 빼서 메모리를 돌려준다 */
+function release(st) {
+  st.refs -= 1;
+  if (st.refs <= 0 && indexStates.get(st.key) === st) indexStates.delete(st.key);
+}
+
+/** 포트 설정 갱신: 빠진 URL은 이전 설정을 유지하고, 해시는 메시지 값을 그대로 쓴다 */
+function configure(reply, data) {
+  const prev = clients.get(reply) || {};
+  const cfg = {
+    indexUrl: data.indexUrl || prev.indexUrl || null,
+    binaryIndexUrl: data.binaryIndexUrl || prev.binaryIndexUrl || null,
+    countsUrl: data.countsUrl || prev.countsUrl || null,
+    indexHash: data.indexHash || null,
+    slice: Array.isArray(data.slice) ? data.slice : prev.slice || null, // 워커 풀 구간 [k, n] (없으면 전체)
+  };
+  const key = stateKey(cfg);
+  let st = indexStates.get(key);
+  if (!st) {
+    st = createIndexState(key, cfg);
+    indexStates.set(key, st);
+  }
+  acquire(st);
+  cfg.state = st;
+  clients.set(reply, cfg);
+  if (prev.state) release(prev.state);
+}
+
+function unconfigure(reply) {
+  const client = clients.get(reply);
+  if (!client) return;
+  clients.delete(reply);
+  release(client.state);
+}
+
+/** 요청 동안 포트의 인덱스를 붙잡아 둔다 (그 사이 포트가 다른 해시로 바뀌어도 버려지지 않음) */
+async function withClient(reply, fn) {
+  const client = clients.get(reply);
+  if (!client) throw new Error("INDEX_URL이 설정되지 않았습니다.");
+  const st = client.state;
+  acquire(st);
+  try {
+    return await fn(st, client);
+  } finally {
+    release(st);
+  }
+}
+
 function normalize(str) {
   return (str || "").toString();
 }
 
-function includesIgnoreCase(text, query) {
-  return text.toLowerCase().includes(query.toLowerCase());
+function normalizeForSearch(str) {
+  return normalize(str).toLowerCase();
 }
 
-async function ensureIndexLoaded() {
-  if (entries) return;
-  if (isLoading) return;
-  if (!INDEX_URL) {
-    throw new Error("INDEX_URL이 설정되지 않았습니다.");
+/**
+ * 바이너리 인덱스 파싱: ArrayBuffer 위에 typed array 뷰만 만든다(복사/디코딩 없음).
+ * 검색은 생성기가 접어 둔 소문자 열(없으면 이미 소문자인 원문 블롭)을 바이트로 스캔한다.
+ * 레이아웃은 html_generator._write_binary_search_index 참고.
+ */
+function parseBinaryIndex(buffer) {
+  const view = new DataView(buffer);
+  const magic = utf8Decoder.decode(new Uint8Array(buffer, 0, 4));
+  if (magic !== BINARY_MAGIC) throw new Error("바이너리 인덱스 형식 오류");
+  // 접은 열이 없는 구버전 인덱스는 JSON 인덱스로 폴백 (loadIndex)
+  if (view.getUint16(4, true) < BINARY_VERSION) {
+    throw new Error("바이너리 인덱스 버전이 낮습니다");
+  }
+  const flags = view.getUint16(6, true);
+  const count = view.getUint32(8, true);
+  const headerLength = view.getUint32(12, true);
+  const header = JSON.parse(
+    utf8Decoder.decode(new Uint8Array(buffer, 16, headerLength))
+  );
+  let offset = 16 + headerLength;
+  const book = new Uint16Array(buffer, offset, count);
+  offset += count * 2;
+  const chapter = new Uint16Array(buffer, offset, count);
+  offset += count * 2;
+  const verse = new Uint16Array(buffer, offset, count);
+  offset += count * 2;
+  offset += (4 - (offset % 4)) % 4;
+  const textOffsets = new Uint32Array(buffer, offset, count + 1);
+  offset += (count + 1) * 4;
+  const blob = new Uint8Array(buffer, offset, textOffsets[count]);
+  offset += textOffsets[count];
+  let folded = blob;
+  let foldedOffsets = textOffsets;
+  if (flags & INDEX_FLAG_FOLDED) {
+    offset += (4 - (offset % 4)) % 4;
+    foldedOffsets = new Uint32Array(buffer, offset, count + 1);
+    offset += (count + 1) * 4;
+    folded = new Uint8Array(buffer, offset, foldedOffsets[count]);
+  } else if (!(flags & INDEX_FLAG_CASELESS)) {
+    throw new Error("바이너리 인덱스에 검색용 열이 없습니다");
   }
-  isLoading = true;
+  return {
+    folded,
+    foldedOffsets,
+    flags,
+    count,
+    books: Array.isArray(header.books) ? header.books : [],
+    book,
+    chapter,
+    verse,
+    textOffsets,
+    blob,
+  };
+}
+
+// -----------------------------
+// IndexedDB 캐시 (키: `<indexHash>:<format>`)
+// -----------------------------
+
+let idbPromise = null; // 연결 한 개를 지연 생성해 get/put이 함께 쓴다
+
+function idbOpen() {
+  if (idbPromise) return idbPromise;
+  idbPromise = new Promise((resolve) => {
+    if (typeof indexedDB === "undefined") {
+      resolve(null);
+      return;
+    }
+    let blocked = false;
+    try {
+      const req = indexedDB.open(IDB_NAME, 1);
+      req.onupgradeneeded = () => req.result.createObjectStore(IDB_STORE);
+      req.onsuccess = () => {
+        const db = req.result;
+        // 다른 탭/워커가 버전을 올리거나 DB를 지우려 하면 연결을 닫아 막지 않는다 (다음 사용 시 다시 연결)
+        db.onversionchange = () => {
+          db.close();
+          idbPromise = null;
+        };
+        db.onclose = () => {
+          idbPromise = null;
+        };
+        if (blocked) idbPromise = Promise.resolve(db);
+        resolve(db);
+      };
+      // 다른 연결이 업그레이드를 막고 있으면 이번 요청은 캐시 없이 진행 (열리면 그때부터 재사용)
+      req.onblocked = () => {
+        blocked = true;
+        resolve(null);
+      };
+      req.onerror = () => {
+        idbPromise = null;
+        resolve(null);
+      };
+    } catch (error) {
+      // 프라이빗 모드 등에서 IndexedDB 사용 불가 시 캐시 없이 동작
+      resolve(null);
+    }
+  });
+  return idbPromise;
+}
+
+async function idbGet(key) {
+  const db = await idbOpen();
+  if (!db) return null;
+  return new Promise((resolve) => {
+    try {
+      const req = db.transaction(IDB_STORE, "readonly")
+        .objectStore(IDB_STORE)
+        .get(key);
+      req.onsuccess = () => resolve(req.result || null);
+      req.onerror = () => resolve(null);
+    } catch (error) {
+      resolve(null);
+    }
+  });
+}
+
+/** 해시가 바뀐 이전 인덱스는 지우고 현재 인덱스만 보관 */
+async function idbReplace(key, value) {
+  const db = await idbOpen();
+  if (!db) return;
   try {
-    const res = await fetch(INDEX_URL, { credentials: "same-origin" });
+    const store = db.transaction(IDB_STORE, "readwrite").objectStore(IDB_STORE);
+    store.clear();
+    store.put(value, key);
+  } catch (error) {
+    // 저장 용량 초과 등은 무시 (다음 페이지에서 다시 받음)
+  }
+}
+
+function cacheKey(st, format) {
+  return st.hash ? `${st.hash}:${format}` : null;
+}
+
+/** 내용 해시를 쿼리 문자열로 붙여 HTTP 캐시도 해시 단위로 갱신되게 한다 */
+function versionedUrl(st, url) {
+  if (!st.hash) return url;
+  return url + (url.includes("?") ? "&" : "?") + "v=" + st.hash;
+}
+
+/**
+ * 오프라인에서 서비스 워커(sw.js)가 요청한 버전 대신 프리캐시 사본으로 응답했는지.
+ * 내용이 indexHash와 다를 수 있으므로 IndexedDB에 그 해시 키로 저장하지 않는다.
+ */
+function isPrecacheFallback(res) {
+  return res.headers.get("X-Precache-Fallback") === "1";
+}
+
+/** 로드 결과는 지역 변수에 모았다가 끝에 한 번에 상태에 싣는다 (로드 중인 상태를 다른 요청이 보지 않도록) */
+async function loadBinaryIndex(st) {
+  const key = cacheKey(st, "binary");
+  const cached = key ? await idbGet(key) : null;
+  let buffer = cached && cached.buffer;
+  let persist = !!key && !cached;
+  if (!buffer) {
+    const res = await fetch(versionedUrl(st, st.binaryIndexUrl), {
+      credentials: "same-origin",
+    });
+    if (!res.ok) throw new Error("바이너리 인덱스 로드 실패: " + res.status);
+    if (isPrecacheFallback(res)) persist = false;
+    buffer = await res.arrayBuffer();
+  }
+  const binIndex = parseBinaryIndex(buffer);
+  if (persist) idbReplace(key, { buffer });
+  st.sorted = (binIndex.flags & INDEX_FLAG_SORTED) !== 0;
+  st.binIndex = st.slice ? sliceBinaryIndex(binIndex, st.slice) : binIndex;
+}
+
+async function loadJsonIndex(st) {
+  const key = cacheKey(st, "json");
+  const cached = key ? await idbGet(key) : null;
+  let entries;
+  let normTexts = null;
+  let sorted;
+  let persist = !!key;
+  if (cached && Array.isArray(cached.entries)) {
+    entries = cached.entries;
+    normTexts = Array.isArray(cached.normTexts) ? cached.normTexts : null;
+    sorted = cached.sorted === true;
+  } else {
+    const res = await fetch(versionedUrl(st, st.indexUrl), {
+      credentials: "same-origin",
+    });
     if (!res.ok) throw new Error("인덱스 로드 실패: " + res.status);
-    entries = await res.json();
-    if (!Array.isArray(entries)) entries = [];
-    // Build quick lookup map
-    byId = new Map();
+    if (isPrecacheFallback(res)) persist = false;
+    const raw = await res.json();
+    if (Array.isArray(raw)) {
+      // 구버전 인덱스: 헤더 없는 엔트리 배열
+      entries = raw;
+      sorted = false;
+    } else {
+      entries = raw && Array.isArray(raw.entries) ? raw.entries : [];
+      sorted = !!(raw && raw.sorted === true);
+    }
+  }
+  if (!normTexts || normTexts.length !== entries.length) {
+    normTexts = new Array(entries.length);
     for (let i = 0; i < entries.length; i += 1) {
-      const e = entries[i];
-      if (e && e.i && (e.h || e.href)) {
-        byId.set(e.i, e.h || e.href);
+      normTexts[i] = normalizeForSearch(entries[i] && entries[i].t);
+    }
+    if (persist) idbReplace(key, { entries, normTexts, sorted });
+  }
+  if (st.slice) {
+    // 워커 풀: 캐시에는 전체를 두고 이 워커는 자기 구간만 보관
+    const [lo, hi] = sliceBounds(entries.length, st.slice);
+    entries = entries.slice(lo, hi);
+    normTexts = normTexts.slice(lo, hi);
+  }
+  // Build quick lookup map
+  const byId = new Map();
+  for (let i = 0; i < entries.length; i += 1) {
+    const e = entries[i];
+    if (e && e.i && (e.h || e.href)) {
+      byId.set(e.i, e.h || e.href);
+    }
+  }
+  st.normTexts = normTexts;
+  st.byId = byId;
+  st.sorted = sorted;
+  st.entries = entries;
+}
+
+async function loadIndex(st) {
+  if (st.binaryIndexUrl) {
+    try {
+      await loadBinaryIndex(st);
+      return;
+    } catch (err) {
+      // 바이너리 인덱스가 없거나 손상되면 JSON 인덱스로 폴백
+      if (!st.indexUrl) throw err;
+    }
+  }
+  await loadJsonIndex(st);
+}
+
+async function ensureIndexLoaded(st) {
+  if (st.entries || st.binIndex) return;
+  if (!st.indexUrl && !st.binaryIndexUrl) {
+    throw new Error("INDEX_URL이 설정되지 않았습니다.");
+  }
+  if (!st.loadingPromise) {
+    st.loadingPromise = loadIndex(st).finally(() => {
+      st.loadingPromise = null;
+    });
+  }
+  await st.loadingPromise;
+}
+
+// -----------------------------
+// 절 수 테이블 (check/chapters 전용)
+// -----------------------------
+
+async function ensureCountsLoaded(st) {
+  if (st.verseCounts) return;
+  if (!st.countsPromise) {
+    st.countsPromise = (async () => {
+      const res = await fetch(versionedUrl(st, st.countsUrl), {
+        credentials: "same-origin",
+      });
+      if (!res.ok) throw new Error("절 수 테이블 로드 실패: " + res.status);
+      const raw = await res.json();
+      const map = new Map();
+      for (const book of raw.books || []) map.set(book.b, book);
+      st.verseCounts = map;
+    })().finally(() => {
+      st.countsPromise = null;
+    });
+  }
+  await st.countsPromise;
+}
+
+function hrefFromCounts(st, id) {
+  const m = /^(.+)-(\d+)-(\d+)$/.exec(id);
+  if (!m) return null;
+  const book = st.verseCounts.get(m[1]);
+  if (!book) return null;
+  const c = parseInt(m[2], 10);
+  const v = parseInt(m[3], 10);
+  const last = book.c[c - 1] || 0;
+  if (v < 1 || v > last) return null;
+  const gaps = book.x && book.x[String(c)];
+  if (gaps && gaps.includes(v)) return null;
+  return `${book.s}-${c}.html#${id}`;
+}
+
+function chaptersFromCounts(st, bookAbbr) {
+  const book = st.verseCounts.get(bookAbbr);
+  if (!book) return [];
+  const chapters = [];
+  book.c.forEach((last, idx) => {
+    if (last > 0) chapters.push(idx + 1);
+  });
+  return chapters;
+}
+
+/** 테이블이 설정되어 있고 읽을 수 있으면 true (실패 시 인덱스 경로로 폴백) */
+async function useCounts(st) {
+  if (!st.countsUrl) return false;
+  try {
+    await ensureCountsLoaded(st);
+    return true;
+  } catch (err) {
+    return false;
+  }
+}
+
+// -----------------------------
+// 인덱스 접근 (JSON/바이너리 공통)
+// -----------------------------
+
+function entryCount(st) {
+  if (st.binIndex) return st.binIndex.count;
+  return st.entries ? st.entries.length : 0;
+}
+
+/** 워커 풀 구간 [k, n]의 행 범위 [lo, hi) — 전체 count행을 n등분한 k번째 연속 구간 */
+function sliceBounds(count, slice) {
+  const [k, n] = slice;
+  return [Math.floor((k * count) / n), Math.floor(((k + 1) * count) / n)];
+}
+
+/**
+ * 바이너리 인덱스에서 풀 구간의 행만 새 버퍼로 복사 (오프셋은 구간 시작 기준으로 다시 맞춤).
+ * 결과는 원본 ArrayBuffer를 참조하지 않으므로 전체 인덱스는 로드 직후 버려진다.
+ */
+function sliceBinaryIndex(binIndex, slice) {
+  const [lo, hi] = sliceBounds(binIndex.count, slice);
+  const cut = (offsets, bytes) => {
+    const from = offsets[lo];
+    const rebased = offsets.slice(lo, hi + 1);
+    for (let i = 0; i < rebased.length; i += 1) rebased[i] -= from;
+    return [rebased, bytes.slice(from, offsets[hi])];
+  };
+  const [textOffsets, blob] = cut(binIndex.textOffsets, binIndex.blob);
+  const [foldedOffsets, folded] =
+    binIndex.folded === binIndex.blob
+      ? [textOffsets, blob]
+      : cut(binIndex.foldedOffsets, binIndex.folded);
+  return {
+    folded,
+    foldedOffsets,
+    flags: binIndex.flags,
+    count: hi - lo,
+    books: binIndex.books,
+    book: binIndex.book.slice(lo, hi),
+    chapter: binIndex.chapter.slice(lo, hi),
+    verse: binIndex.verse.slice(lo, hi),
+    textOffsets,
+    blob,
+  };
+}
+
+function bookAbbrAt(st, row) {
+  if (st.binIndex) return st.binIndex.books[st.binIndex.book[row]].b;
+  return st.entries[row].b;
+}
+
+function bookOrderAt(st, row) {
+  if (st.binIndex) return st.binIndex.books[st.binIndex.book[row]].bo;
+  return st.entries[row].bo;
+}
+
+function chapterAt(st, row) {
+  return st.binIndex ? st.binIndex.chapter[row] : st.entries[row].c;
+}
+
+function verseAt(st, row) {
+  return st.binIndex ? st.binIndex.verse[row] : st.entries[row].v;
+}
+
+function textAt(st, row) {
+  if (!st.binIndex) return normalize(st.entries[row].t);
+  const offsets = st.binIndex.textOffsets;
+  return utf8Decoder.decode(
+    st.binIndex.blob.subarray(offsets[row], offsets[row + 1])
+  );
+}
+
+/** 결과 항목 객체 생성 (바이너리 모드에서는 이 시점에만 텍스트를 디코딩) */
+function entryAt(st, row) {
+  const { binIndex } = st;
+  if (!binIndex) return st.entries[row];
+  const meta = binIndex.books[binIndex.book[row]];
+  const c = binIndex.chapter[row];
+  const v = binIndex.verse[row];
+  const id = `${meta.b}-${c}-${v}`;
+  return {
+    i: id,
+    t: textAt(st, row),
+    h: `${meta.s}-${c}.html#${id}`,
+    b: meta.b,
+    c,
+    v,
+    bo: meta.bo,
+  };
+}
+
+/**
+ * 바이너리 모드의 (책, 장) → [첫 행, 마지막 행] 표 (처음 필요할 때 한 번 구성).
+ * 같은 책 순서를 공유하는 책은 장 안에서 행이 섞일 수 있어 구간 안에서도 책을 확인한다.
+ */
+function chapterSpans(binIndex) {
+  if (!binIndex.spans) {
+    const spans = new Map();
+    const bookIndex = new Map();
+    binIndex.books.forEach((meta, idx) => bookIndex.set(meta.b, idx));
+    for (let row = 0; row < binIndex.count; row += 1) {
+      const key = binIndex.book[row] * 65536 + binIndex.chapter[row];
+      const span = spans.get(key);
+      if (span) span[1] = row;
+      else spans.set(key, [row, row]);
+    }
+    binIndex.spans = spans;
+    binIndex.bookIndex = bookIndex;
+  }
+  return binIndex.spans;
+}
+
+function findHrefById(st, id) {
+  const { binIndex } = st;
+  if (!binIndex) return (st.byId && st.byId.get(id)) || null;
+  const m = /^(.+)-(\d+)-(\d+)$/.exec(id);
+  if (!m) return null;
+  const spans = chapterSpans(binIndex);
+  const bookIdx = binIndex.bookIndex.get(m[1]);
+  if (bookIdx === undefined) return null;
+  const c = parseInt(m[2], 10);
+  const v = parseInt(m[3], 10);
+  const span = spans.get(bookIdx * 65536 + c);
+  if (!span) return null;
+  for (let row = span[0]; row <= span[1]; row += 1) {
+    if (binIndex.book[row] === bookIdx && binIndex.verse[row] === v) {
+      return entryAt(st, row).h;
+    }
+  }
+  return null;
+}
+
+function encodeNeedle(st, query) {
+  return st.binIndex ? utf8Encoder.encode(query) : query;
+}
+
+/** 한 절(행)이 정규화된 쿼리를 포함하는지 검사 */
+function rowMatches(st, row, needle) {
+  if (!st.binIndex) return st.normTexts[row].includes(needle);
+  const { folded, foldedOffsets } = st.binIndex;
+  const n = needle.length;
+  const end = foldedOffsets[row + 1] - n;
+  const first = needle[0];
+  for (let p = foldedOffsets[row]; p <= end; p += 1) {
+    if (folded[p] !== first) continue;
+    let k = 1;
+    while (k < n && folded[p + k] === needle[k]) k += 1;
+    if (k === n) return true;
+  }
+  return false;
+}
+
+// 양보용 채널: setTimeout(0)의 최소 지연(중첩 시 ~4ms) 없이 다음 태스크로 넘긴다
+const yieldChannel =
+  typeof MessageChannel !== "undefined" ? new MessageChannel() : null;
+const yieldResolvers = [];
+if (yieldChannel) {
+  yieldChannel.port1.onmessage = () => {
+    const resolve = yieldResolvers.shift();
+    if (resolve) resolve();
+  };
+}
+
+/** 대기 중인 메시지가 처리되도록 이벤트 루프에 한 번 양보 */
+function yieldToEvents() {
+  return new Promise((resolve) => {
+    if (!yieldChannel) {
+      setTimeout(resolve, 0);
+      return;
+    }
+    yieldResolvers.push(resolve);
+    yieldChannel.port2.postMessage(null);
+  });
+}
+
+/**
+ * 바이너리 블롭에서 UTF-8 바이트 단위로 부분 문자열 검색.
+ * 한 절에서 한 번 매치되면 다음 절로 건너뛴다.
+ * 매치가 `want`개가 되는 순간 onFilled(rows)를 한 번 호출한다(스트리밍 응답용).
+ * SCAN_CHUNK_ROWS 행마다 양보하며, 그 사이 isStale()이면 null을 반환(중단)
+ */
+async function scanBinary(st, bounds, needle, want, onFilled, isStale) {
+  const n = needle.length;
+  // 접은 사본의 오프셋 기준으로 스캔 (원본 textOffsets는 결과 텍스트 디코딩용)
+  const { folded, foldedOffsets: textOffsets } = st.binIndex;
+  const rows = [];
+  if (n === 0) return rows;
+  const first = needle[0];
+  const [lo, hi] = bounds;
+  let row = lo;
+  while (row < hi) {
+    const chunkHi = Math.min(hi, row + SCAN_CHUNK_ROWS);
+    let p = textOffsets[row];
+    const end = textOffsets[chunkHi] - n;
+    while (p <= end && row < chunkHi) {
+      if (folded[p] !== first) {
+        p += 1;
+        continue;
+      }
+      while (textOffsets[row + 1] <= p) row += 1;
+      if (p + n > textOffsets[row + 1]) {
+        // 절 경계를 넘어가는 매치는 무시하고 다음 절로
+        p = textOffsets[row + 1];
+        continue;
+      }
+      let k = 1;
+      while (k < n && folded[p + k] === needle[k]) k += 1;
+      if (k === n) {
+        rows.push(row);
+        if (rows.length === want && onFilled) onFilled(rows);
+        p = textOffsets[row + 1];
+        row += 1;
+      } else {
+        p += 1;
       }
     }
-  } finally {
-    isLoading = false;
+    row = chunkHi;
+    if (row < hi) {
+      await yieldToEvents();
+      if (isStale && isStale()) return null;
+    }
+  }
+  return rows;
+}
+
+async function scanEntries(st, bounds, needle, want, onFilled, isStale) {
+  const { normTexts } = st;
+  const rows = [];
+  const [lo, hi] = bounds;
+  for (let start = lo; start < hi; start += SCAN_CHUNK_ROWS) {
+    if (start > lo) {
+      await yieldToEvents();
+      if (isStale && isStale()) return null;
+    }
+    const chunkHi = Math.min(hi, start + SCAN_CHUNK_ROWS);
+    for (let i = start; i < chunkHi; i += 1) {
+      if (normTexts[i].includes(needle)) {
+        rows.push(i);
+        if (rows.length === want && onFilled) onFilled(rows);
+      }
+    }
+  }
+  return rows;
+}
+
+function rememberQuery(queryCache, key, rows) {
+  queryCache.delete(key);
+  queryCache.set(key, rows);
+  while (queryCache.size > QUERY_CACHE_LIMIT) {
+    queryCache.delete(queryCache.keys().next().value);
+  }
+}
+
+/**
+ * 정규화된 쿼리의 매치 행 번호(책/장/절 순)를 구한다.
+ * 1) LRU 적중 → 그대로 2) 캐시된 더 짧은 쿼리를 포함 → 그 매치 집합만 좁힘 3) 전체 스캔
+ * 정렬된 인덱스의 전체 스캔에서는 매치가 `want`개 모이는 즉시 onFilled(rows)를 호출한다.
+ * 전체 스캔 중 isStale()이 참이 되면 null을 반환하고 캐시에 남기지 않는다.
+ */
+async function matchRows(st, key, want, onFilled, isStale) {
+  const { queryCache } = st;
+  const hit = queryCache.get(key);
+  if (hit) {
+    rememberQuery(queryCache, key, hit);
+    return hit;
   }
+  const needle = encodeNeedle(st, key);
+  const bounds = [0, entryCount(st)];
+  let base = null;
+  let baseKey = "";
+  for (const [cachedKey, rows] of queryCache) {
+    if (cachedKey.length > baseKey.length && key.includes(cachedKey)) {
+      base = rows;
+      baseKey = cachedKey;
+    }
+  }
+  let rows;
+  if (base) {
+    // 정렬된 집합을 순서대로 거르므로 재정렬 불필요
+    rows = base.filter((row) => rowMatches(st, row, needle));
+  } else if (st.sorted) {
+    // 정렬된 인덱스: 스캔 순서가 곧 책/장/절 순서
+    rows = st.binIndex
+      ? await scanBinary(st, bounds, needle, want, onFilled, isStale)
+      : await scanEntries(st, bounds, needle, want, onFilled, isStale);
+  } else {
+    rows = st.binIndex
+      ? await scanBinary(st, bounds, needle, 0, null, isStale)
+      : await scanEntries(st, bounds, needle, 0, null, isStale);
+    if (rows) rows.sort((a, b) => compareRows(st, a, b));
+  }
+  if (!rows) return null;
+  rememberQuery(queryCache, key, rows);
+  return rows;
 }
 
-function getChaptersForBook(bookAbbr) {
-  if (!entries) return [];
+function getChaptersForBook(st, bookAbbr) {
+  const { binIndex, entries, chaptersCache } = st;
+  if (!entries && !binIndex) return [];
   if (chaptersCache.has(bookAbbr)) return chaptersCache.get(bookAbbr);
   const set = new Set();
-  for (let i = 0; i < entries.length; i += 1) {
-    const e = entries[i];
-    if (e && e.b === bookAbbr && typeof e.c === "number") {
-      set.add(e.c);
+  if (binIndex) {
+    // 장 구간 표의 키에서 바로 (행 스캔 없음)
+    const spans = chapterSpans(binIndex);
+    const bookIdx = binIndex.bookIndex.get(bookAbbr);
+    for (const key of spans.keys()) {
+      if (Math.floor(key / 65536) === bookIdx) set.add(key % 65536);
+    }
+  } else {
+    for (let row = 0; row < entries.length; row += 1) {
+      if (bookAbbrAt(st, row) === bookAbbr) set.add(chapterAt(st, row));
     }
   }
   const arr = Array.from(set).sort((a, b) => a - b);
@@ -65,18 +784,31 @@ function getChaptersForBook(bookAbbr) {
   return arr;
 }
 
-function compareByBookChapterVerse(a, b) {
+function compareRows(st, a, b) {
   // 책 순서(bo) → 장(c) → 절(v)
-  if (a.bo !== b.bo) return a.bo - b.bo;
-  if (a.c !== b.c) return a.c - b.c;
-  return a.v - b.v;
+  const boA = bookOrderAt(st, a);
+  const boB = bookOrderAt(st, b);
+  if (boA !== boB) return boA - boB;
+  const cA = chapterAt(st, a);
+  const cB = chapterAt(st, b);
+  if (cA !== cB) return cA - cB;
+  return verseAt(st, a) - verseAt(st, b);
 }
 
-async function handleQuery(q, limit = 50, page = 1) {
-  await ensureIndexLoaded();
+async function handleQuery(st, q, limit = 50, page = 1, reply = post, opts = {}) {
+  // 같은 클라이언트가 더 새로운 쿼리를 보냈으면 이 쿼리는 버린다
+  const isStale = () =>
+    opts.seq !== undefined && latestSeq.get(reply) !== opts.seq;
+  await ensureIndexLoaded(st);
+  if (isStale()) return;
   const query = normalize(q).trim();
+  // seq가 있으면 모든 응답에 실어 보낸다 (워커 풀 코디네이터가 요청과 응답을 짝짓는 데 사용)
+  const send = (type, payload) => {
+    if (opts.seq !== undefined) payload.seq = opts.seq;
+    reply(type, payload);
+  };
   if (!query) {
-    post("results", {
+    send("results", {
       q: query,
       results: [],
       page: 1,
@@ -85,69 +817,129 @@ async function handleQuery(q, limit = 50, page = 1) {
     });
     return;
   }
-  const matched = [];
-  // 선형 스캔 → 매치 컬렉션 → 책/장/절 정렬 → 페이지 슬라이스
-  for (let i = 0; i < entries.length; i += 1) {
-    const e = entries[i];
-    const text = normalize(e.t);
-    if (includesIgnoreCase(text, query)) matched.push(e);
-  }
-  matched.sort(compareByBookChapterVerse);
-  const total = matched.length;
+  // 매치 행 번호(캐시/좁히기/순차 스캔) → 페이지 슬라이스 → 결과 객체 생성
   const pageIndex = Math.max(0, (page || 1) - 1);
-  const start = pageIndex * limit;
-  const end = Math.min(total, start + limit);
-  const results = matched.slice(start, end);
-  post("results", {
+  const start =
+    typeof opts.offset === "number"
+      ? Math.max(0, opts.offset)
+      : pageIndex * limit;
+  const pageResults = (rows) => {
+    const end = Math.min(rows.length, start + limit);
+    const results = [];
+    for (let k = start; k < end; k += 1) results.push(entryAt(st, rows[k]));
+    return results;
+  };
+  let sentEarly = false;
+  const matched = await matchRows(
+    st,
+    normalizeForSearch(query),
+    start + limit,
+    (partial) => {
+      // 요청 페이지가 채워짐: 총 건수는 하한값으로 먼저 응답
+      sentEarly = true;
+      send("results", {
+        q: query,
+        results: pageResults(partial),
+        page: page || 1,
+        total: partial.length,
+        totalExact: false,
+        pageSize: limit,
+      });
+    },
+    isStale
+  );
+  if (!matched) return;
+  if (sentEarly) {
+    send("total", {
+      q: query,
+      page: page || 1,
+      total: matched.length,
+      pageSize: limit,
+    });
+    return;
+  }
+  send("results", {
     q: query,
-    results,
+    results: pageResults(matched),
     page: page || 1,
-    total,
+    total: matched.length,
     pageSize: limit,
   });
 }
 
-onmessage = (ev) => {
-  const data = ev.data || {};
+function handleMessage(data, reply) {
   if (data.type === "init") {
-    post("ready", {});
+    reply("ready", {});
     return;
   }
   if (data.type === "config") {
-    INDEX_URL = data.indexUrl || INDEX_URL;
-    // config 후 즉시 로드하지 않고 지연 로드
+    // 이 포트의 설정만 바꾼다 (다른 포트가 쓰는 인덱스는 그대로). config 후 즉시 로드하지 않고 지연 로드
+    configure(reply, data);
+    return;
+  }
+  if (data.type === "release") {
+    unconfigure(reply);
     return;
   }
   if (data.type === "check") {
     // 존재 여부 확인: id 기반
-    const doCheck = async () => {
-      await ensureIndexLoaded();
+    const doCheck = async (st) => {
       const id = String(data.id || "");
-      const href = byId && byId.get(id);
-      post("checkResult", { id, ok: !!href, href: href || null });
+      let href;
+      if (await useCounts(st)) {
+        href = hrefFromCounts(st, id);
+      } else {
+        await ensureIndexLoaded(st);
+        href = findHrefById(st, id);
+      }
+      reply("checkResult", { id, ok: !!href, href: href || null, seq: data.seq });
     };
-    doCheck().catch((err) =>
-      post("error", { message: String((err && err.message) || err) })
+    withClient(reply, doCheck).catch((err) =>
+      reply("error", { message: String((err && err.message) || err) })
     );
     return;
   }
   if (data.type === "chapters") {
-    const doCh = async () => {
-      await ensureIndexLoaded();
+    const doCh = async (st) => {
       const book = String(data.book || "");
-      const chapters = getChaptersForBook(book);
-      post("chapters", { book, chapters });
+      let chapters;
+      if (await useCounts(st)) {
+        chapters = chaptersFromCounts(st, book);
+      } else {
+        await ensureIndexLoaded(st);
+        chapters = getChaptersForBook(st, book);
+      }
+      reply("chapters", { book, chapters, seq: data.seq });
     };
-    doCh().catch((err) =>
-      post("error", { message: String((err && err.message) || err) })
+    withClient(reply, doCh).catch((err) =>
+      reply("error", { message: String((err && err.message) || err) })
     );
     return;
   }
   if (data.type === "query") {
-    pendingQuery = data.q;
-    handleQuery(data.q, data.limit, data.page).catch((err) => {
-      post("error", { message: String((err && err.message) || err) });
+    if (data.seq !== undefined) latestSeq.set(reply, data.seq);
+    withClient(reply, (st) =>
+      handleQuery(st, data.q, data.limit, data.page, reply, {
+        offset: data.offset,
+        seq: data.seq,
+      })
+    ).catch((err) => {
+      reply("error", { message: String((err && err.message) || err) });
     });
     return;
   }
-};
+}
+
+if (
+  typeof SharedWorkerGlobalScope !== "undefined" &&
+  self instanceof SharedWorkerGlobalScope
+) {
+  // SharedWorker: 탭/페이지마다 새 포트가 연결된다
+  onconnect = (ev) => {
+    const port = ev.ports[0];
+    const reply = portReply(port);
+    port.onmessage = (msg) => handleMessage(msg.data || {}, reply);
+  };
+} else {
+  onmessage = (ev) => handleMessage(ev.data || {}, post);
+}
@@ -1,6 +1,9 @@
 /**
- * 공동번역성서 프로젝트 - 성경 구절 네비게이션 스크립트
- * 절 검색 및 하이라이트 기능 제공
+ * 공동번역성서 프로젝트 - 성경 구절 네비게이션 스크립트 (코어)
+ * 브레드크럼, 오디오, 절 앵커/하이라이트, 본문 내 검색어 하이라이트를 담당한다.
+ * 전역 검색 UI(결과 패널, 모바일 검색 시트, 페이지네이션, 검색 워커)는 verse-search.js로 분리되어
+ * 검색창 첫 포커스, 검색 FAB/결과 패널 버튼 탭, 검색 제출 때 처음 로드한다.
+ * 이전 검색 상태(sessionStorage)가 남아 있으면 복원을 위해 시작 시 바로 로드한다.
  */
 
 (function () {
@@ -15,51 +18,25 @@
   // 현재 하이라이트된 요소
   let currentHighlight = null;
 
-  // 전역 검색(Web Worker) 관련
-  let searchWorker = null;
-  let resultsPanel = null;
-  // 모바일 바텀시트 결과 렌더 타깃
-  let mobileResultsContainer = null;
-  let useMobileResults = false;
-  let mobileResultsBody = null; // 높이 측정용
-  let mobilePagesContainer = null; // 모바일 페이지 번호 컨테이너
-  let lastTotalResults = 0; // 총 결과 수 저장
+  // 검색 결과 패널 토글 버튼 (모바일)
   let resultsToggleBtn = null;
-  let pagination = { page: 1, pageSize: 50, q: "" };
-  let isWorkerReady = false;
-  let pendingQueries = [];
-  // 로컬/전역 검색 메시지 조율용 상태
-  let suppressLocalToast = false;
-  let lastLocalFound = false;
-  let lastQueryText = "";
-  let pendingRefCheck = null;
-  let lastClickedItem = null; // 마지막으로 클릭한 검색 결과 항목 정보
+  // 전역 검색 구성 (resolveSearchConfig 결과, 검색 모듈과 공유)
+  let searchConfig = null;
+  // 책 → 장 → 절 수 테이블 (장 드롭다운/절 존재 확인을 인덱스 없이 처리)
+  let verseCountsUrl = null;
+  let verseCountsPromise = null;
+  let verseCountsHash = null; // 캐시 무효화용 (인덱스 내용 해시와 동일)
+  // 지연 로드하는 검색 모듈 (verse-search.js)
+  let searchModule = null;
+  let searchModulePromise = null;
   const SEARCH_STATE_KEY = "BIBLE_SEARCH_STATE";
-  const PANEL_STATE_KEY = "BIBLE_SEARCH_PANEL";
   const MOBILE_BREAKPOINT = 768; // px
 
-  function clearSavedSearchState() {
-    try {
-      sessionStorage.removeItem(SEARCH_STATE_KEY);
-    } catch (error) {
-      // sessionStorage 접근 실패 시 무시 (프라이빗 모드 등)
-    }
-    lastClickedItem = null; // 마지막 클릭 항목 초기화
-  }
-
-  function resetResultsPanel() {
-    if (!resultsPanel) return;
-    const list = resultsPanel.querySelector(".search-results-list");
-    if (list) list.innerHTML = "";
-    hideResultsPanel();
-  }
-
-  function resetSearchUI() {
-    clearSavedSearchState();
-    resetResultsPanel();
-    lastClickedItem = null; // 마지막 클릭 항목 초기화
-    if (searchInput) searchInput.value = "";
-  }
+  // 셸 출력 모드(생성기 --output-mode shell): 장 본문을 장 JSON으로 렌더링
+  const shellConfig = window.BIBLE_SHELL || null;
+  const chapterPayloads = new Map(); // 장 ID(<slug>-<장>) → Promise<장 JSON>
+  let currentShellChapter = null;
+  let shellRenderSeq = 0;
 
   // 주입된 별칭/슬러그 데이터
   const injected = window.BIBLE_ALIAS || { aliasToAbbr: {}, abbrToSlug: {} };
@@ -82,9 +59,16 @@
       return;
     }
 
-    // 이벤트 리스너 등록
-    searchForm.addEventListener("submit", handleSearch);
+    // 이벤트 리스너 등록 (검색 처리는 검색 모듈을 로드한 뒤 위임)
+    searchForm.addEventListener("submit", (event) => {
+      event.preventDefault();
+      withSearchModule((m) => m.handleSearch(event));
+    });
     searchInput.addEventListener("keydown", handleKeyDown);
+    // 입력을 시작하기 전에 미리 로드
+    searchInput.addEventListener("focus", () => loadSearchModule(), {
+      once: true,
+    });
 
     // 전역 키보드 이벤트 리스너 추가 (Esc 키 처리용)
     document.addEventListener("keydown", handleGlobalKeyDown);
@@ -137,14 +121,7 @@
       resultsToggleBtn.innerHTML = iconSvg("panel");
       resultsToggleBtn.addEventListener("click", (ev) => {
         ev.preventDefault();
-        // 패널 없으면 생성 후 열기
-        if (!resultsPanel) createResultsPanel();
-        const isHidden = !resultsPanel || resultsPanel.style.display === "none";
-        if (isHidden) {
-          showResultsPanel();
-        } else {
-          hideResultsPanel();
-        }
+        withSearchModule((m) => m.toggleResultsPanel());
       });
 
       // 반응형 표시/숨김 처리
@@ -199,14 +176,27 @@
       window.addEventListener("resize", updateFabVisibility);
 
       fab.addEventListener("click", () => {
-        openMobileSearchSheet();
+        withSearchModule((m) => m.openMobileSearchSheet());
       });
     } catch (error) {
       // UI 요소 생성 실패 시 무시 (기본 기능은 계속 동작)
     }
 
-    // 전역 검색 초기화
-    initializeGlobalSearch();
+    // 전역 검색 구성만 확인 (워커/패널은 검색 모듈 로드 시 생성)
+    searchConfig = resolveSearchConfig();
+    if (hasSavedSearchState()) {
+      // 이전 검색 상태 복원
+      loadSearchModule();
+    }
+
+    // 이전/다음 버튼에 포인터가 올라오면 해당 장을 미리 받음
+    initNavWarmup();
+
+    // 셸 모드: 주소의 장을 JSON으로 받아 렌더링 (브레드크럼/오디오/절 이동은 렌더링 후 처리)
+    if (shellConfig) {
+      initShell();
+      return;
+    }
 
     // 브레드크럼 렌더링
     try {
@@ -224,293 +214,275 @@
     initializeAudioPlayers();
   }
 
-  // 모바일 검색 바텀시트
-  function openMobileSearchSheet() {
-    const sheetId = "mobile-search-sheet";
-    let sheet = document.getElementById(sheetId);
-    if (!sheet) {
-      sheet = document.createElement("div");
-      sheet.id = sheetId;
-      Object.assign(sheet.style, {
-        position: "fixed",
-        left: 0,
-        right: 0,
-        bottom: 0,
-        height: "65vh",
-        background: "#fff",
-        borderTopLeftRadius: "16px",
-        borderTopRightRadius: "16px",
-        boxShadow: "0 -12px 24px rgba(0,0,0,0.18)",
-        zIndex: 1101,
-        display: "none",
-        padding: "0", // 패딩 제거하여 내부 요소들이 정확한 위치에 배치되도록 함
-        display: "flex",
-        flexDirection: "column",
-      });
-
-      // 시트 외부를 덮는 오버레이(닫기 용도)
-      const overlay = document.createElement("div");
-      overlay.id = "mobile-search-overlay";
-      Object.assign(overlay.style, {
-        position: "fixed",
-        inset: 0,
-        background: "rgba(0,0,0,0.3)",
-        zIndex: 1100,
-        display: "none",
-      });
-      overlay.addEventListener("click", () => closeMobileSearchSheet());
-      document.body.appendChild(overlay);
+  /**
+   * 이전/다음 장 버튼 hover/touchstart 시 대상 장 미리 받기
+   * 정적 모드는 <link rel="prefetch">를 추가하고, 셸 모드는 장 JSON을 받아 둔다.
+   * (셸 모드는 버튼이 장마다 다시 만들어지므로 문서에 위임)
+   */
+  function initNavWarmup() {
+    const warmed = new Set();
+    for (const link of document.querySelectorAll('link[rel="prefetch"]')) {
+      warmed.add(link.href);
+    }
+    const warm = (event) => {
+      const target = event.target;
+      const btn =
+        target && target.closest && target.closest(".nav-btn[href]");
+      if (!btn || warmed.has(btn.href)) return;
+      warmed.add(btn.href);
+      if (shellConfig) {
+        const id = new URL(btn.href).searchParams.get("c");
+        if (id) loadChapterPayload(id).catch(() => {});
+        return;
+      }
+      const link = document.createElement("link");
+      link.rel = "prefetch";
+      link.href = btn.href;
+      document.head.appendChild(link);
+    };
+    document.addEventListener("mouseover", warm);
+    document.addEventListener("touchstart", warm, { passive: true });
+    document.addEventListener("focusin", warm);
+  }
 
-      const grip = document.createElement("div");
-      Object.assign(grip.style, {
-        width: "40px",
-        height: "4px",
-        background: "#e5e7eb",
-        borderRadius: "999px",
-        margin: "12px auto 16px", // 상단 여백 추가
-      });
-      sheet.appendChild(grip);
+  /**
+   * 장 페이지 URL: 정적 모드는 <slug>-<장>.html, 셸 모드는 <셸 페이지>?c=<slug>-<장>
+   */
+  function chapterPageUrl(slug, chapter, verseId) {
+    const hash = verseId ? `#${verseId}` : "";
+    if (shellConfig) {
+      return `${window.location.pathname}?c=${slug}-${chapter}${hash}`;
+    }
+    const basePath = window.location.pathname.replace(/[^/]+$/, "");
+    return `${basePath}${slug}-${chapter}.html${hash}`;
+  }
 
-      const row = document.createElement("div");
-      Object.assign(row.style, {
-        display: "flex",
-        alignItems: "center",
-        gap: "8px",
-        marginBottom: "10px",
-        padding: "0 12px", // 좌우 패딩 추가
-      });
-      const input = document.createElement("input");
-      input.type = "text";
-      input.placeholder = "절 ID 또는 단어 검색";
-      input.value = searchInput ? searchInput.value : "";
-      Object.assign(input.style, {
-        flex: 1,
-        height: "40px",
-        border: "1px solid #ccc",
-        borderRadius: "6px",
-        padding: "0 12px",
-        fontSize: "16px",
-      });
-      const goBtn = document.createElement("button");
-      goBtn.setAttribute("aria-label", "검색");
-      goBtn.title = "검색";
-      goBtn.innerHTML = iconSvg("search");
-      Object.assign(goBtn.style, {
-        height: "40px",
-        width: "40px",
-        padding: 0,
-        background: "#0066cc",
-        color: "#fff",
-        border: "none",
-        borderRadius: "8px",
-        cursor: "pointer",
-        display: "inline-flex",
-        alignItems: "center",
-        justifyContent: "center",
-      });
-      // 지우기 버튼
-      const clearBtn = document.createElement("button");
-      clearBtn.setAttribute("aria-label", "검색 결과 지우기");
-      clearBtn.title = "지우기";
-      clearBtn.innerHTML = iconSvg("trash");
-      Object.assign(clearBtn.style, {
-        height: "40px",
-        width: "40px",
-        padding: 0,
-        background: "#ffffff",
-        color: "#111",
-        border: "1px solid #d1d5db",
-        borderRadius: "8px",
-        cursor: "pointer",
-        display: "inline-flex",
-        alignItems: "center",
-        justifyContent: "center",
-      });
-      row.appendChild(input);
-      row.appendChild(goBtn);
-      row.appendChild(clearBtn);
-      sheet.appendChild(row);
-
-      const body = document.createElement("div");
-      body.id = "mobile-search-results";
-      Object.assign(body.style, {
-        position: "relative",
-        overflow: "auto", // 스크롤바 표시
-        height: "auto", // 동적 높이로 설정하여 내용에 맞게 자동 조정
-        maxHeight: "calc(65vh - 146px)", // 최대 높이 제한으로 스크롤바 표시
-        padding: "0 12px", // 좌우 패딩 추가
-        // 모바일 스크롤바 스타일링
-        scrollbarWidth: "thin",
-        scrollbarColor: "rgba(0, 0, 0, 0.2) transparent",
-        webkitOverflowScrolling: "touch",
-        overscrollBehavior: "contain",
-      });
+  /**
+   * 검색 인덱스의 장 HTML 링크(<slug>-<장>.html#절)를 현재 출력 모드의 주소로 변환
+   */
+  function resolveChapterHref(href) {
+    if (!shellConfig || !href) return href;
+    const m = /^(?:.*\/)?([^/?#]+-\d+)\.html(#.*)?$/.exec(href);
+    if (!m) return href;
+    return `${window.location.pathname}?c=${m[1]}${m[2] || ""}`;
+  }
 
-      // 웹킷 기반 브라우저용 스크롤바 스타일링
-      const scrollbarStyle = document.createElement("style");
-      scrollbarStyle.textContent = `
-        #mobile-search-results::-webkit-scrollbar {
-          width: 6px;
-        }
-        #mobile-search-results::-webkit-scrollbar-track {
-          background: transparent;
-        }
-        #mobile-search-results::-webkit-scrollbar-thumb {
-          background: rgba(0, 0, 0, 0.2);
-          border-radius: 3px;
-        }
-        #mobile-search-results::-webkit-scrollbar-thumb:hover {
-          background: rgba(0, 0, 0, 0.3);
-        }
-      `;
-      document.head.appendChild(scrollbarStyle);
+  function openChapter(slug, chapter, verseId) {
+    const url = chapterPageUrl(slug, chapter, verseId);
+    if (shellConfig) {
+      navigateShell(url);
+    } else {
+      window.location.href = url;
+    }
+  }
 
-      // 모바일 전용 결과 컨테이너 설정
-      const list = document.createElement("div");
-      list.className = "search-results-list";
-      Object.assign(list.style, { padding: "8px 0 0 0" }); // 상단 패딩만 유지, 하단 패딩 제거
-      body.appendChild(list);
-      mobileResultsContainer = list;
-      mobileResultsBody = body;
-      sheet.appendChild(body);
-
-      // 모바일 페이지네이션 푸터
-      const footer = document.createElement("div");
-      Object.assign(footer.style, {
-        display: "flex",
-        alignItems: "center",
-        justifyContent: "space-between",
-        padding: "12px 12px 12px 12px", // 좌우 패딩 추가, 하단 여백 유지
-        gap: "8px",
-        borderTop: "none", // 상단 테두리 제거하여 여백 감소
-        marginTop: "0", // 상단 여백 제거
-        flexShrink: "0",
-        background: "#fff",
-        position: "absolute", // 절대 위치로 변경
-        bottom: "0", // 하단에 고정
-        left: "0",
-        right: "0",
-        zIndex: "1",
-      });
-      const mPrev = document.createElement("button");
-      mPrev.id = "mobile-search-prev";
-      mPrev.setAttribute("aria-label", "이전 페이지");
-      mPrev.title = "이전 페이지";
-      mPrev.innerHTML = iconSvg("chevronLeft");
-      Object.assign(mPrev.style, {
-        width: "40px",
-        height: "40px",
-        padding: "0",
-        border: "1px solid #d1d5db",
-        background: "#fff",
-        borderRadius: "6px",
-        cursor: "pointer",
-        display: "inline-flex",
-        alignItems: "center",
-        justifyContent: "center",
-      });
-      const mInfo = document.createElement("span");
-      mInfo.id = "mobile-search-info";
-      Object.assign(mInfo.style, {
-        color: "#555",
-        fontSize: "14px",
-        textAlign: "center",
-        flex: "1",
-      });
-      const mNext = document.createElement("button");
-      mNext.id = "mobile-search-next";
-      mNext.setAttribute("aria-label", "다음 페이지");
-      mNext.title = "다음 페이지";
-      mNext.innerHTML = iconSvg("chevronRight");
-      Object.assign(mNext.style, {
-        width: "40px",
-        height: "40px",
-        padding: "0",
-        border: "1px solid #d1d5db",
-        background: "#fff",
-        borderRadius: "6px",
-        cursor: "pointer",
-        display: "inline-flex",
-        alignItems: "center",
-        justifyContent: "center",
-      });
-      mPrev.addEventListener("click", () => navigatePage(-1));
-      mNext.addEventListener("click", () => navigatePage(1));
-      footer.appendChild(mPrev);
-      footer.appendChild(mInfo);
-      footer.appendChild(mNext);
-      sheet.appendChild(footer);
-
-      document.body.appendChild(sheet);
-
-      function triggerMobileSearch() {
-        if (!input.value.trim()) return;
-        if (searchInput) searchInput.value = input.value;
-        // 모바일 검색 모드 강제 설정
-        useMobileResults = true;
-        // 검색 실행
-        handleSearch(new Event("submit"));
+  function initShell() {
+    // 셸 주소 링크(이전/다음 버튼, 검색 결과)는 페이지 이동 없이 렌더링
+    document.addEventListener("click", (event) => {
+      if (
+        event.defaultPrevented ||
+        event.button !== 0 ||
+        event.metaKey ||
+        event.ctrlKey ||
+        event.shiftKey ||
+        event.altKey
+      ) {
+        return;
       }
-      goBtn.addEventListener("click", triggerMobileSearch);
-      input.addEventListener("keydown", (ev) => {
-        if (ev.key === "Enter") {
-          ev.preventDefault();
-          triggerMobileSearch();
-        } else if (ev.key === "Escape") {
-          ev.preventDefault();
-          closeMobileSearchSheet();
-        }
-      });
+      const a = event.target.closest && event.target.closest("a[href]");
+      if (!a || a.target) return;
+      const u = new URL(a.href, window.location.href);
+      if (
+        u.origin !== window.location.origin ||
+        u.pathname !== window.location.pathname ||
+        !u.searchParams.get("c")
+      ) {
+        return;
+      }
+      event.preventDefault();
+      navigateShell(u.href);
+    });
+    window.addEventListener("popstate", () => {
+      const id = shellChapterFromLocation();
+      if (id !== currentShellChapter) {
+        renderShellChapter(id, window.location.hash.substring(1));
+      }
+    });
+    renderShellChapter(
+      shellChapterFromLocation(),
+      window.location.hash.substring(1)
+    );
+  }
 
-      clearBtn.addEventListener("click", () => {
-        try {
-          clearSavedSearchState();
-        } catch (error) {
-          // 상태 초기화 실패 시 무시
-        }
-        // 입력값 초기화
-        if (searchInput) searchInput.value = "";
-        input.value = "";
-        // 마지막 클릭 항목 초기화
-        lastClickedItem = null;
-        // 본문 하이라이트 제거 (절/텍스트 모두)
-        try {
-          clearHighlight();
-        } catch (error) {
-          // 하이라이트 제거 실패 시 무시
-        }
-        // 결과/페이지네이션 초기화
-        pagination.q = "";
-        pagination.page = 1;
-        lastLocalFound = false;
-        lastTotalResults = 0;
-        // UI에 빈 상태 메시지 표시
-        showGlobalResultsMessage("검색 결과 없음");
-        updatePageInfo(0, 0, 0);
-        // 모바일 검색 시트 닫기
-        closeMobileSearchSheet();
+  function shellChapterFromLocation() {
+    const params = new URLSearchParams(window.location.search);
+    return params.get("c") || shellConfig.first;
+  }
+
+  function navigateShell(url) {
+    const u = new URL(url, window.location.href);
+    const id = u.searchParams.get("c") || shellConfig.first;
+    const verseId = u.hash ? safeDecodeVerseId(u.hash.substring(1)) : "";
+    history.pushState(null, "", u.pathname + u.search + u.hash);
+    if (id === currentShellChapter) {
+      // 같은 장의 절 링크
+      if (verseId) highlightVerse(verseId);
+      return Promise.resolve();
+    }
+    return renderShellChapter(id, verseId);
+  }
+
+  function loadChapterPayload(id) {
+    if (!chapterPayloads.has(id)) {
+      const promise = fetch(
+        shellConfig.chapterBase + encodeURIComponent(id) + ".json"
+      ).then((res) => {
+        if (!res.ok) throw new Error("HTTP " + res.status);
+        return res.json();
       });
+      // 실패한 요청은 다음 이동 때 다시 시도
+      promise.catch(() => chapterPayloads.delete(id));
+      chapterPayloads.set(id, promise);
+    }
+    return chapterPayloads.get(id);
+  }
+
+  /**
+   * 다음 장 JSON 미리 받기 (유휴 시간에 요청해 현재 장 렌더링과 경쟁하지 않음)
+   */
+  function prefetchShellChapter(id) {
+    if (!id || chapterPayloads.has(id)) return;
+    const run = () => loadChapterPayload(id).catch(() => {});
+    if (window.requestIdleCallback) {
+      window.requestIdleCallback(run, { timeout: 2000 });
+    } else {
+      setTimeout(run, 200);
     }
-    // 열기
-    const overlay = document.getElementById("mobile-search-overlay");
-    if (overlay) overlay.style.display = "block";
-    sheet.style.display = "block";
-    const inputEl = sheet.querySelector("input");
+  }
+
+  async function renderShellChapter(id, verseId) {
+    const seq = ++shellRenderSeq;
+    let payload;
     try {
-      inputEl && inputEl.focus();
+      payload = await loadChapterPayload(id);
     } catch (error) {
-      // 포커스 설정 실패 시 무시
+      if (seq === shellRenderSeq) {
+        showMessage("장을 불러오지 못했습니다.", "error");
+      }
+      return;
+    }
+    // 더 최근 이동이 있으면 버림
+    if (seq !== shellRenderSeq) return;
+    currentShellChapter = id;
+    renderChapterPayload(payload);
+
+    try {
+      renderBreadcrumb();
+    } catch (e) {
+      console.warn("브레드크럼 렌더링 실패:", e);
+    }
+    initializeAudioPlayers();
+    if (!verseId || !highlightVerse(safeDecodeVerseId(verseId))) {
+      window.scrollTo(0, 0);
     }
+    prefetchShellChapter(payload.n);
   }
 
-  function closeMobileSearchSheet() {
-    const sheet = document.getElementById("mobile-search-sheet");
-    const overlay = document.getElementById("mobile-search-overlay");
-    if (sheet) sheet.style.display = "none";
-    if (overlay) overlay.style.display = "none";
-    // 모바일 렌더 모드는 유지하여 결과를 보존
-    useMobileResults = true;
+  /**
+   * 장 JSON을 정적 모드와 같은 마크업으로 렌더링 (html_generator의 절/단락 규칙과 동일)
+   */
+  function renderChapterPayload(payload) {
+    const article = document.querySelector("article");
+    if (!article) return;
+    const title = `${payload.b} ${payload.c}장`;
+    document.title = title;
+    article.id = `${payload.a}-${payload.c}`;
+    const heading = document.querySelector(".chapter-title");
+    if (heading) heading.textContent = title;
+    if (searchInput) {
+      searchInput.placeholder = `절 ID 또는 단어 검색 (예: '${payload.b} ${payload.c}:3' 또는 '하느님')`;
+    }
+    clearHighlight();
+
+    // 본문 단락
+    for (const p of article.querySelectorAll("p.scripture-paragraph")) {
+      p.remove();
+    }
+    const paragraphs = [];
+    let current = [];
+    for (const [num, text, startsParagraph] of payload.v) {
+      const verseId = `${payload.a}-${payload.c}-${num}`;
+      // 1절이 문단 기호로 시작하면 절 번호(1)를 생략
+      const omitNumber = num === 1 && text.trimStart().startsWith("¶");
+      const body = text.includes("¶")
+        ? text
+            .split("¶")
+            .join('<span class="paragraph-marker" aria-hidden="true">¶</span>')
+            .trim()
+        : text;
+      const span = omitNumber
+        ? `<span id="${verseId}">${body}</span>`
+        : `<span id="${verseId}"><span aria-hidden="true" class="verse-number">${num}</span> ${body}</span>`;
+      if (startsParagraph && current.length) {
+        paragraphs.push(current);
+        current = [span];
+      } else {
+        current.push(span);
+      }
+    }
+    if (current.length) paragraphs.push(current);
+    article.insertAdjacentHTML(
+      "beforeend",
+      paragraphs
+        .map((p) => `<p class="scripture-paragraph">${p.join(" ")}</p>`)
+        .join("\n    ")
+    );
+
+    // 오디오
+    const container = document.getElementById("audio-container");
+    const notice = document.getElementById("audio-unavailable");
+    const audio = container && container.querySelector("audio");
+    if (audio) {
+      try {
+        audio.pause();
+      } catch (error) {
+        // 정지 실패 시 무시
+      }
+      if (payload.au) {
+        const source = audio.querySelector("source");
+        if (source) source.src = payload.au;
+        const fallback = audio.querySelector("a");
+        if (fallback) fallback.href = payload.au;
+        audio.setAttribute("aria-label", `${title} 오디오`);
+        audio.load();
+      }
+    }
+    if (container) container.classList.toggle("hidden", !payload.au);
+    if (notice) notice.classList.toggle("hidden", !!payload.au);
+
+    // 이전/다음 버튼
+    const buttons = document.querySelectorAll(".chapter-title-row > .nav-btn");
+    if (buttons.length === 2) {
+      renderNavButton(buttons[0], payload.p, true);
+      renderNavButton(buttons[1], payload.n, false);
+    }
+  }
+
+  function renderNavButton(el, targetId, isPrev) {
+    const btn = document.createElement(targetId ? "a" : "span");
+    if (targetId) {
+      btn.className = "nav-btn";
+      btn.href = `${window.location.pathname}?c=${targetId}`;
+      btn.setAttribute("aria-label", isPrev ? "이전 장" : "다음 장");
+    } else {
+      btn.className = "nav-btn disabled";
+      btn.setAttribute("aria-disabled", "true");
+    }
+    const svg = el.querySelector("svg");
+    if (svg) btn.appendChild(svg);
+    el.replaceWith(btn);
   }
+
   function renderBreadcrumb() {
     if (!breadcrumbNav) return;
     const booksData = window.BIBLE_BOOKS || [];
@@ -766,7 +738,7 @@
     // 드롭다운 버튼 클릭 시, 최신 장 목록을 보장하기 위해 재요청
     try {
       div3.button.addEventListener("click", () => {
-        if (isWorkerReady)
+        if (verseCountsUrl || searchModule)
           requestChaptersAndRender(
             (document.querySelector("article").id || "").split("-")[0],
             div3
@@ -810,37 +782,79 @@
       }
       drop.button._mobileItems = mobileItems;
     };
-    // 워커 준비 전이면 잠시 후 재시도
-    if (!searchWorker || !isWorkerReady) {
-      // 로딩 표시
-      try {
-        drop.list.innerHTML = "";
-        const p = document.createElement("li");
-        p.textContent = "로딩 중…";
-        Object.assign(p.style, { padding: "6px 8px", color: "#666" });
-        drop.list.appendChild(p);
-      } catch (error) {
-        // 로딩 표시 생성 실패 시 무시
-      }
-      setTimeout(() => requestChaptersAndRender(bookAbbr, drop), 200);
+    // 절 수 테이블이 있으면 워커/인덱스 없이 바로 렌더
+    if (verseCountsUrl) {
+      loadVerseCounts().then((counts) => {
+        if (counts) {
+          render(bookAbbr, chaptersFromCounts(counts, bookAbbr));
+        } else {
+          verseCountsUrl = null;
+          requestChaptersAndRender(bookAbbr, drop);
+        }
+      });
       return;
     }
-    if (searchWorker) {
-      const handler = (ev) => {
-        const d = ev.data || {};
-        if (d.type === "chapters" && d.book === bookAbbr) {
-          searchWorker.removeEventListener("message", handler);
-          render(bookAbbr, d.chapters);
-        }
-      };
-      searchWorker.addEventListener("message", handler);
-      try {
-        searchWorker.postMessage({ type: "chapters", book: bookAbbr });
-      } catch (error) {
-        // 워커 메시지 전송 실패 시 리스너 정리 후 무시
-        searchWorker.removeEventListener("message", handler);
-      }
+    // 테이블이 없으면 검색 모듈의 워커에 장 목록 요청 (로딩 표시 후 대기)
+    try {
+      drop.list.innerHTML = "";
+      const p = document.createElement("li");
+      p.textContent = "로딩 중…";
+      Object.assign(p.style, { padding: "6px 8px", color: "#666" });
+      drop.list.appendChild(p);
+    } catch (error) {
+      // 로딩 표시 생성 실패 시 무시
     }
+    withSearchModule((m) =>
+      m.requestChapters(bookAbbr).then((chapters) => render(bookAbbr, chapters))
+    );
+  }
+
+  /**
+   * 절 수 테이블 로드 (한 번만 요청, 실패 시 null)
+   * @returns {Promise<Map<string, object>|null>} 약칭 → { s, c: [장별 마지막 절], x?: { 장: [빠진 절] } }
+   */
+  function loadVerseCounts() {
+    if (!verseCountsUrl) return Promise.resolve(null);
+    if (!verseCountsPromise) {
+      const url = verseCountsHash
+        ? verseCountsUrl +
+          (verseCountsUrl.includes("?") ? "&" : "?") +
+          "v=" +
+          verseCountsHash
+        : verseCountsUrl;
+      verseCountsPromise = fetch(url, { credentials: "same-origin" })
+        .then((res) => (res.ok ? res.json() : null))
+        .then((raw) => {
+          if (!raw || !Array.isArray(raw.books)) return null;
+          const map = new Map();
+          for (const book of raw.books) map.set(book.b, book);
+          return map;
+        })
+        .catch(() => null);
+    }
+    return verseCountsPromise;
+  }
+
+  function chaptersFromCounts(counts, bookAbbr) {
+    const book = counts.get(bookAbbr);
+    if (!book) return [];
+    const chapters = [];
+    book.c.forEach((last, idx) => {
+      if (last > 0) chapters.push(idx + 1);
+    });
+    return chapters;
+  }
+
+  function verseExistsInCounts(counts, verseId) {
+    const m = /^(.+)-(\d+)-(\d+)$/.exec(verseId);
+    if (!m) return false;
+    const book = counts.get(m[1]);
+    if (!book) return false;
+    const chapter = parseInt(m[2], 10);
+    const verse = parseInt(m[3], 10);
+    if (verse < 1 || verse > (book.c[chapter - 1] || 0)) return false;
+    const gaps = book.x && book.x[String(chapter)];
+    return !(gaps && gaps.includes(verse));
   }
 
   function navigateToBookChapter(bookAbbr, chapterNumber) {
@@ -851,89 +865,117 @@
       showMessage("해당 책을 찾을 수 없습니다.", "error");
       return;
     }
-    const basePath = window.location.pathname.replace(/[^/]+$/, "");
-    const filename = `${slug}-${chapterNumber}.html`;
-    window.location.href = basePath + filename;
+    openChapter(slug, chapterNumber);
   }
 
   /**
-   * 전역 검색 초기화: Web Worker 및 결과 패널 준비
+   * 전역 검색 구성: 외부 주입 설정(BIBLE_SEARCH_CONFIG) 우선, 없으면 verse-navigator.js 로딩 경로 기준으로
+   * 같은 디렉터리의 search-worker.js, verse-search.js, search/search-index.json을 추정한다.
    */
-  function initializeGlobalSearch() {
-    try {
-      // verse-navigator.js의 로딩 경로 기반으로 Worker/Index URL 추정
-      const currentScripts = document.getElementsByTagName("script");
-      let baseUrl = null;
-      for (const s of currentScripts) {
-        const src = s.getAttribute("src") || "";
-        if (src && /verse-navigator\.js(\?.*)?$/.test(src)) {
-          // 절대 URL로 변환
-          const u = new URL(src, window.location.href);
-          baseUrl = u.origin + u.pathname.replace(/[^/]+$/, "");
-          break;
-        }
+  function resolveSearchConfig() {
+    let baseUrl = null;
+    let searchModuleSrc = null;
+    let workerSrc = null;
+    for (const s of document.getElementsByTagName("script")) {
+      const src = s.getAttribute("src") || "";
+      // 내용 해시 파일명(verse-navigator.3f9a1c2b.js)도 허용
+      if (src && /verse-navigator(\.[0-9a-f]{8})?\.js(\?.*)?$/.test(src)) {
+        // 절대 URL로 변환
+        const u = new URL(src, window.location.href);
+        baseUrl = u.origin + u.pathname.replace(/[^/]+$/, "");
+        // 생성기가 지정한 검색 모듈/워커 경로 (data-search-src, data-worker-src)
+        const dataSrc = s.getAttribute("data-search-src");
+        if (dataSrc) searchModuleSrc = new URL(dataSrc, u).href;
+        const dataWorkerSrc = s.getAttribute("data-worker-src");
+        if (dataWorkerSrc) workerSrc = new URL(dataWorkerSrc, u).href;
+        break;
       }
+    }
 
-      // 구성: 외부에서 주입한 설정 우선
-      const injectedConfig = window.BIBLE_SEARCH_CONFIG || {};
-      const workerUrl =
+    const injectedConfig = window.BIBLE_SEARCH_CONFIG || {};
+    const searchMeta = window.BIBLE_SEARCH_META || {};
+    const indexUrl =
+      injectedConfig.searchIndexUrl ||
+      (baseUrl ? baseUrl + "search/search-index.json" : null);
+    // 절 수 테이블: 생성기가 인덱스와 같은 디렉터리에 만든 경우(BIBLE_SEARCH_META.counts)
+    verseCountsUrl =
+      injectedConfig.verseCountsUrl ||
+      (searchMeta.counts && indexUrl
+        ? indexUrl.replace(/[^/?]+(\?.*)?$/, "verse-counts.json")
+        : null);
+    verseCountsHash = injectedConfig.indexHash || searchMeta.hash || null;
+
+    return {
+      workerUrl:
         injectedConfig.workerUrl ||
-        (baseUrl ? baseUrl + "search-worker.js" : null);
-      const indexUrl =
-        injectedConfig.searchIndexUrl ||
-        (baseUrl ? baseUrl + "search/search-index.json" : null);
-
-      if (!workerUrl || !indexUrl) {
-        // 설정을 찾지 못해도 기능 전체를 차단하지는 않음(로컬 DOM 검색만 동작)
-        console.warn(
-          "전역 검색 구성을 찾을 수 없어 로컬 검색만 지원됩니다. BIBLE_SEARCH_CONFIG.workerUrl/searchIndexUrl를 설정하세요."
-        );
-        return;
-      }
+        workerSrc ||
+        (baseUrl ? baseUrl + "search-worker.js" : null),
+      indexUrl,
+      // 생성기가 바이너리 인덱스를 함께 만든 경우(BIBLE_SEARCH_META.format) 같은 위치의 .bin 사용
+      binaryIndexUrl:
+        injectedConfig.binaryIndexUrl ||
+        (searchMeta.format === "binary" && indexUrl
+          ? indexUrl.replace(/\.json(\?.*)?$/, ".bin$1")
+          : null),
+      // 인덱스 내용 해시: 워커가 IndexedDB 캐시 키로 사용
+      indexHash: verseCountsHash,
+      countsUrl: verseCountsUrl,
+      moduleUrl:
+        injectedConfig.searchModuleUrl ||
+        searchModuleSrc ||
+        (baseUrl ? baseUrl + "verse-search.js" : null),
+      sharedWorker:
+        injectedConfig.sharedWorker === true || searchMeta.sharedWorker === true,
+      workerPool:
+        injectedConfig.workerPool !== undefined
+          ? injectedConfig.workerPool
+          : searchMeta.workerPool,
+      liveSearch: injectedConfig.liveSearch === true,
+    };
+  }
 
-      // 결과 패널 생성
-      createResultsPanel();
-
-      // Web Worker 생성 및 구성 전달
-      searchWorker = new Worker(workerUrl);
-      searchWorker.onmessage = (ev) => {
-        const data = ev.data || {};
-        if (data.type === "ready") {
-          isWorkerReady = true;
-          // 인덱스 URL 전달
-          searchWorker.postMessage({ type: "config", indexUrl });
-          // 대기 중이던 쿼리 처리
-          if (pendingQueries.length > 0) {
-            for (const q of pendingQueries.splice(0)) {
-              searchWorker.postMessage({ type: "query", q, limit: 50 });
-            }
-          }
-          // 저장된 상태 복구
-          restoreSearchState();
-          return;
-        }
-        if (data.type === "results") {
-          renderGlobalResults(
-            data.q,
-            data.results || [],
-            data.page || 1,
-            data.total || 0,
-            data.pageSize || 50
-          );
-          return;
-        }
-        if (data.type === "error") {
-          showMessage(`검색 오류: ${data.message || "알 수 없음"}`, "error");
-          return;
-        }
-      };
-      // Worker 기동 신호
-      searchWorker.postMessage({ type: "init" });
-    } catch (e) {
-      console.warn("전역 검색 초기화 실패:", e);
+  function hasSavedSearchState() {
+    try {
+      return !!sessionStorage.getItem(SEARCH_STATE_KEY);
+    } catch (error) {
+      return false;
     }
   }
 
+  /**
+   * 검색 모듈(verse-search.js) 지연 로드. 한 번만 요청하며, 모듈은 실행 시
+   * window.BibleNavigator._core.registerSearch()로 자신을 등록한다.
+   * @returns {Promise<object|null>} 검색 모듈 API (로드 실패 시 null)
+   */
+  function loadSearchModule() {
+    if (searchModule) return Promise.resolve(searchModule);
+    if (searchModulePromise) return searchModulePromise;
+    const url = searchConfig && searchConfig.moduleUrl;
+    if (!url) {
+      console.warn(
+        "검색 모듈 경로를 찾을 수 없습니다. BIBLE_SEARCH_CONFIG.searchModuleUrl을 설정하세요."
+      );
+      return Promise.resolve(null);
+    }
+    searchModulePromise = new Promise((resolve) => {
+      const script = document.createElement("script");
+      script.src = url;
+      script.async = true;
+      script.onload = () => resolve(searchModule);
+      script.onerror = () => {
+        console.warn("검색 모듈 로드 실패:", url);
+        searchModulePromise = null;
+        resolve(null);
+      };
+      document.head.appendChild(script);
+    });
+    return searchModulePromise;
+  }
+
+  function withSearchModule(fn) {
+    return loadSearchModule().then((m) => (m ? fn(m) : null));
+  }
+
   // 아이콘 SVG 헬퍼 (헤더/툴바 공용)
   function iconSvg(icon) {
     const map = {
@@ -1089,355 +1131,16 @@
     if (exist && exist.parentNode) exist.parentNode.removeChild(exist);
   }
 
-  function saveSearchState() {
-    try {
-      const state = {
-        q: pagination.q || "",
-        page: pagination.page || 1,
-        lastClickedItem: lastClickedItem,
-      };
-      sessionStorage.setItem(SEARCH_STATE_KEY, JSON.stringify(state));
-      if (history && history.replaceState) {
-        history.replaceState(state, document.title);
-      }
-    } catch (error) {
-      // 상태 저장 실패 시 무시 (프라이빗 모드 등)
-    }
-  }
-
-  function getSavedState() {
-    try {
-      const h = (history && history.state) || null;
-      if (h && typeof h === "object" && (h.q || h.page)) return h;
-      const raw = sessionStorage.getItem(SEARCH_STATE_KEY);
-      if (raw) return JSON.parse(raw);
-    } catch (error) {
-      // 저장된 상태 읽기 실패 시 무시
-    }
-    return null;
-  }
-
-  function restoreSearchState() {
-    const st = getSavedState();
-    if (!st || !st.q) return;
-    if (searchInput) searchInput.value = st.q;
-    // 마지막 클릭 항목 정보 복원
-    lastClickedItem = st.lastClickedItem || null;
-    // 패널 생성만 하고 표시하지 않음 (사용자가 직접 열어야 함)
-    createResultsPanel();
-    // 데스크탑에서는 패널을 숨김 상태로 유지
-    if (window.innerWidth >= MOBILE_BREAKPOINT) {
-      resultsPanel.style.display = "none";
-    } else {
-      resultsPanel.style.display = "block";
-    }
-    renderGlobalResults(st.q, null);
-    pagination.q = st.q;
-    pagination.page = st.page || 1;
-    try {
-      if (searchWorker && isWorkerReady) {
-        searchWorker.postMessage({
-          type: "query",
-          q: pagination.q,
-          limit: pagination.pageSize,
-          page: pagination.page,
-        });
-      } else {
-        pendingQueries.push(pagination.q);
-      }
-    } catch (error) {
-      // 검색 상태 복원 실패 시 무시
-    }
-  }
-
-  /**
-   * 검색 결과 패널 생성
-   */
-  function createResultsPanel() {
-    if (resultsPanel) return;
-    resultsPanel = document.createElement("div");
-    resultsPanel.className = "search-results-panel";
-    resultsPanel.id = "bible-search-results-panel";
-    resultsPanel.setAttribute("role", "dialog");
-    resultsPanel.setAttribute("aria-label", "검색 결과");
-
-    Object.assign(resultsPanel.style, {
-      position: "fixed",
-      top: "70px",
-      right: "20px",
-      width: "480px", // 380px에서 480px로 폭 확장
-      height: "60vh", // maxHeight에서 height로 변경하여 고정 높이 설정
-      overflow: "hidden",
-      backgroundColor: "#ffffff",
-      border: "1px solid #ddd",
-      boxShadow: "0 4px 12px rgba(0,0,0,0.12)",
-      borderRadius: "6px",
-      zIndex: "1001",
-      display: "none",
-    });
-
-    const header = document.createElement("div");
-    Object.assign(header.style, {
-      padding: "10px 12px",
-      fontWeight: "bold",
-      borderBottom: "1px solid #eee",
-      background: "#f9fafb",
-      display: "flex",
-      alignItems: "center",
-      justifyContent: "space-between",
-      position: "sticky",
-      top: "0",
-      zIndex: "1",
-    });
-    resultsPanel.appendChild(header);
-
-    // 제목(줄바꿈 방지, 여유 여백)
-    const headerTitle = document.createElement("span");
-    headerTitle.textContent = "검색 결과";
-    Object.assign(headerTitle.style, {
-      whiteSpace: "nowrap",
-      overflow: "hidden",
-      textOverflow: "ellipsis",
-      padding: "0 8px",
-      marginRight: "6px",
-    });
-    header.appendChild(headerTitle);
-
-    // 헤더 액션 컨테이너
-    const headerActions = document.createElement("div");
-    Object.assign(headerActions.style, {
-      display: "flex",
-      gap: "6px",
-      alignItems: "center",
-    });
-    header.appendChild(headerActions);
-
-    // 버튼 공통 스타일 함수
-    function setButtonBaseStyles(btn) {
-      Object.assign(btn.style, {
-        padding: "4px 8px",
-        border: "1px solid #d1d5db",
-        background: "#ffffff",
-        borderRadius: "999px",
-        cursor: "pointer",
-        fontSize: "12px",
-        lineHeight: "1",
-        display: "inline-flex",
-        alignItems: "center",
-        gap: "6px",
-      });
-      btn.addEventListener(
-        "mouseenter",
-        () => (btn.style.background = "#f3f4f6")
-      );
-      btn.addEventListener(
-        "mouseleave",
-        () => (btn.style.background = "#ffffff")
-      );
-    }
-
-    // 바디 컨테이너
-    const body = document.createElement("div");
-    body.className = "search-results-body";
-
-    // 정확한 높이 설정: 패널 전체 높이 - 헤더 높이 - 푸터 높이
-    const calculateBodyHeight = () => {
-      const panelHeight = (60 * window.innerHeight) / 100; // 60vh
-      const headerHeight = 40; // 헤더 높이 (고정값)
-      const footerHeight = 40; // 푸터 높이 (고정값)
-      return Math.max(0, panelHeight - headerHeight - footerHeight);
-    };
-
-    // 초기 높이 설정
-    Object.assign(body.style, {
-      height: `${calculateBodyHeight()}px`,
-      zIndex: "1", // 스크롤바 스타일링을 위한 z-index
-    });
-
-    // 웹킷 기반 브라우저용 스크롤바 스타일링
-    const scrollbarStyle = document.createElement("style");
-    scrollbarStyle.textContent = `
-      .search-results-body::-webkit-scrollbar {
-        width: 6px;
-      }
-      .search-results-body::-webkit-scrollbar-track {
-        background: transparent;
-      }
-      .search-results-body::-webkit-scrollbar-thumb {
-        background: rgba(0, 0, 0, 0.2);
-        border-radius: 3px;
-      }
-      .search-results-body::-webkit-scrollbar-thumb:hover {
-        background: rgba(0, 0, 0, 0.3);
-      }
-    `;
-    document.head.appendChild(scrollbarStyle);
-
-    resultsPanel.appendChild(body);
-
-    const list = document.createElement("div");
-    list.className = "search-results-list";
-    // 스크롤을 위한 스타일 설정
-    Object.assign(list.style, {
-      height: "100%",
-      overflowY: "auto",
-      overflowX: "hidden",
-    });
-    body.appendChild(list);
-    // 초기 상태: 검색 결과 없음 메시지 표시
-    try {
-      const empty = document.createElement("p");
-      empty.textContent = "검색 결과 없음";
-      Object.assign(empty.style, { color: "#666", margin: "8px 4px 0px 4px" }); // 하단 여백 제거
-      list.appendChild(empty);
-    } catch (error) {
-      // 초기 메시지 생성 실패 시 무시
-    }
-
-    const footer = document.createElement("div");
-    footer.className = "search-results-footer";
-    // 명시적으로 높이 설정
-    Object.assign(footer.style, {
-      height: "40px",
-      minHeight: "40px",
-      zIndex: "1", // 헤더와 동일한 z-index
-    });
-    const navLeft = document.createElement("button");
-    navLeft.type = "button";
-    navLeft.className = "search-page-prev";
-    navLeft.setAttribute("aria-label", "이전 페이지");
-    navLeft.title = "이전 페이지";
-    navLeft.innerHTML = iconSvg("chevronLeft");
-    Object.assign(navLeft.style, {
-      width: "32px",
-      height: "32px",
-      padding: "0",
-      border: "1px solid #d0d7de",
-      background: "#fff",
-      borderRadius: "6px",
-      cursor: "pointer",
-      display: "inline-flex",
-      alignItems: "center",
-      justifyContent: "center",
-      flexShrink: "0",
-      marginRight: "8px",
-    });
-    navLeft.addEventListener("click", () => navigatePage(-1));
-
-    const pageInfo = document.createElement("span");
-    pageInfo.className = "search-page-info";
-    Object.assign(pageInfo.style, {
-      color: "#555",
-      fontSize: "14px",
-      textAlign: "center",
-      flex: "1",
-    });
-    pageInfo.textContent = "";
-
-    const navRight = document.createElement("button");
-    navRight.type = "button";
-    navRight.className = "search-page-next";
-    navRight.setAttribute("aria-label", "다음 페이지");
-    navRight.title = "다음 페이지";
-    navRight.innerHTML = iconSvg("chevronRight");
-    Object.assign(navRight.style, {
-      width: "32px",
-      height: "32px",
-      padding: "0",
-      border: "1px solid #d0d7de",
-      background: "#fff",
-      borderRadius: "6px",
-      cursor: "pointer",
-      display: "inline-flex",
-      alignItems: "center",
-      justifyContent: "center",
-      flexShrink: "0",
-      marginLeft: "8px",
-    });
-    navRight.addEventListener("click", () => navigatePage(1));
-
-    const clearBtn = document.createElement("button");
-    clearBtn.type = "button";
-    clearBtn.innerHTML = iconSvg("trash");
-    clearBtn.setAttribute("aria-label", "검색 결과 지우기");
-    clearBtn.title = "검색 결과 지우기";
-    setButtonBaseStyles(clearBtn);
-    clearBtn.addEventListener("click", () => {
-      // 검색 상태/입력/결과/페이지네이션 완전 초기화
-      try {
-        clearSavedSearchState();
-      } catch (error) {
-        // 상태 초기화 실패 시 무시
-      }
-      if (searchInput) searchInput.value = "";
-      // 마지막 클릭 항목 초기화
-      lastClickedItem = null;
-      const listEl = resultsPanel.querySelector(".search-results-list");
-      if (listEl) listEl.innerHTML = "";
-      // 페이지네이션 초기화 및 버튼 비활성화
-      pagination.q = "";
-      pagination.page = 1;
-      updatePageInfo(0, 0, 0);
-      // 본문 하이라이트 제거 (절/텍스트 모두)
-      try {
-        clearHighlight();
-      } catch (error) {
-        // 하이라이트 제거 실패 시 무시
-      }
-      // 패널 닫기 (검색 결과 지우고 패널 닫기)
-      hideResultsPanel();
-    });
-
-    const closeBtn = document.createElement("button");
-    closeBtn.type = "button";
-    closeBtn.innerHTML = iconSvg("close");
-    closeBtn.title = "패널 닫기";
-    setButtonBaseStyles(closeBtn);
-    closeBtn.addEventListener("click", () => {
-      hideResultsPanel();
-    });
-    // 왼쪽에 이전 버튼 배치
-    footer.appendChild(navLeft);
-    // 중앙에 페이지 정보 배치
-    footer.appendChild(pageInfo);
-    // 오른쪽에 다음 버튼 배치
-    footer.appendChild(navRight);
-    headerActions.appendChild(clearBtn);
-    headerActions.appendChild(closeBtn);
-
-    // 푸터를 패널에 직접 추가 (body가 아닌)
-    resultsPanel.appendChild(footer);
-
-    document.body.appendChild(resultsPanel);
-
-    // 패널 바깥 클릭 시 패널 완전히 숨기기
-    document.addEventListener("click", (ev) => {
-      if (!resultsPanel || resultsPanel.style.display === "none") return;
-      const target = ev.target;
-      // 패널 자체나 검색 토글 버튼 클릭은 무시
-      if (
-        resultsPanel.contains(target) ||
-        (resultsToggleBtn && resultsToggleBtn.contains(target))
-      )
-        return;
-      // 패널을 완전히 숨김
-      hideResultsPanel();
-    });
-
-    // 기본적으로 패널을 숨김 상태로 설정
-    resultsPanel.style.display = "none";
-  }
-
-  /**
-   * 오디오 플레이어 초기화: 초기에 항상 멈춤 상태로 고정
-   */
-  function initializeAudioPlayers() {
-    const audios = document.querySelectorAll("audio.bible-audio");
-    for (const audio of audios) {
-      try {
-        audio.autoplay = false;
-      } catch (error) {
-        // autoplay 설정 실패 시 무시
+  /**
+   * 오디오 플레이어 초기화: 초기에 항상 멈춤 상태로 고정
+   */
+  function initializeAudioPlayers() {
+    const audios = document.querySelectorAll("audio.bible-audio");
+    for (const audio of audios) {
+      try {
+        audio.autoplay = false;
+      } catch (error) {
+        // autoplay 설정 실패 시 무시
       }
       try {
         audio.preload = "metadata";
@@ -1469,64 +1172,11 @@
   }
 
   /**
-   * 검색 폼 제출 처리
+   * 전역 키보드 이벤트 처리 (Esc 키로 검색 UI 닫기 - 검색 모듈이 로드된 경우만)
    */
-  function handleSearch(event) {
-    event.preventDefault();
-
-    const query = searchInput.value.trim();
-
-    // 빈 입력창인 경우: 빈 검색 결과 패널 열기
-    if (!query) {
-      createResultsPanel();
-      showResultsPanel();
-      showGlobalResultsMessage("검색 결과 없음");
-      return;
-    }
-
-    // 동일한 검색어로 기존 결과가 있는지 확인
-    const savedState = getSavedState();
-    if (savedState && savedState.q === query && pagination.q === query) {
-      // 기존 검색 결과가 있으면 패널을 열고 마지막 페이지로 이동
-      createResultsPanel();
-      showResultsPanel();
-
-      // 마지막 클릭 항목 정보 복원
-      lastClickedItem = savedState.lastClickedItem || null;
-
-      // 저장된 페이지로 이동 (워커가 준비되어 있으면 검색 재실행)
-      if (searchWorker && isWorkerReady) {
-        searchWorker.postMessage({
-          type: "query",
-          q: pagination.q,
-          limit: pagination.pageSize,
-          page: savedState.page || pagination.page,
-        });
-      }
-      return;
-    }
-
-    // 절 참조 형식인지 확인 (예: "창세 1:1", "창세기 1:1")
-    const verseRefMatch = query.match(/^(.+?)\s+(\d+):(\d+)$/);
-    if (verseRefMatch) {
-      // 참조 검색은 상태를 저장하지 않고, 기존 키워드 검색 상태를 제거
-      resetSearchUI();
-      // 참조 검색 전 존재 검증(워커가 준비되어 있으면 빠르게 체크)
-      const bookName = verseRefMatch[1];
-      const chapter = verseRefMatch[2];
-      const verse = verseRefMatch[3];
-      searchByReference(bookName, chapter, verse);
-    } else {
-      // 텍스트 검색: 1) 현재 문서 내 검색 2) 전역 검색
-      suppressLocalToast = true;
-      lastQueryText = query;
-      searchByText(query);
-      suppressLocalToast = false;
-      // 새로운 키워드 검색: 기존 결과 초기화 후 저장
-      lastClickedItem = null; // 새로운 검색어이므로 마지막 클릭 항목 초기화
-      resetResultsPanel();
-      globalSearch(query);
-      saveSearchState();
+  function handleGlobalKeyDown(event) {
+    if (event.key === "Escape" && searchModule) {
+      searchModule.handleEscape(event);
     }
   }
 
@@ -1542,128 +1192,19 @@
   }
 
   /**
-   * 전역 키보드 이벤트 처리 (Esc 키로 UI 닫기)
-   */
-  function handleGlobalKeyDown(event) {
-    if (event.key === "Escape") {
-      // 검색 결과 패널이 열려있으면 닫기
-      if (resultsPanel && resultsPanel.style.display !== "none") {
-        hideResultsPanel();
-        return;
-      }
-
-      // 모바일 바텀시트가 열려있으면 닫기
-      const mobileSheet = document.getElementById("mobile-search-sheet");
-      if (mobileSheet && mobileSheet.style.display !== "none") {
-        closeMobileSearchSheet();
-        return;
-      }
-    }
-  }
-
-  /**
-   * 절 참조로 검색
+   * 텍스트로 검색
    */
-  function searchByReference(bookName, chapter, verse) {
-    // 현재 페이지의 책 이름과 장 번호 추출
-    const articleId = document.querySelector("article").id;
-    const currentMatch = articleId.match(/^(.+?)-(\d+)$/);
-
-    if (!currentMatch) {
-      showMessage("현재 페이지 정보를 찾을 수 없습니다.", "error");
-      return;
-    }
-
-    const currentBookAbbr = currentMatch[1];
-    const currentChapter = currentMatch[2];
-
-    const targetBookAbbr = bookNameToAbbr[bookName] || bookName;
-
-    // 같은 책·장 → 현재 페이지에서 이동 (존재 검증 포함)
-    if (targetBookAbbr === currentBookAbbr && chapter === currentChapter) {
-      const verseId = `${targetBookAbbr}-${chapter}-${verse}`;
-      // 우선 DOM에서 시도
-      const found = highlightVerse(verseId);
-      if (found) {
-        showMessage(
-          `${bookName} ${chapter}:${verse}로 이동했습니다.`,
-          "success"
-        );
-        history.replaceState(null, null, `#${verseId}`);
-        return;
-      }
-      // DOM에 없으면 전역 인덱스에서 존재 여부 확인(워커 사용)
-      checkReferenceExistence(verseId, (ok) => {
-        if (ok) {
-          // 현재 문서에 없으면 전역 파일로 이동
-          const slug = abbrToSlug[targetBookAbbr];
-          const basePath = window.location.pathname.replace(/[^/]+$/, "");
-          const filename = `${slug}-${chapter}.html#${verseId}`;
-          window.location.href = basePath + filename;
-        } else {
-          showMessage(
-            `${bookName} ${chapter}:${verse}은(는) 없는 구절입니다.`,
-            "error"
-          );
-        }
-      });
-    } else {
-      // 다른 책/장 → 파일로 리다이렉트
-      const slug = abbrToSlug[targetBookAbbr];
-      if (!slug) {
-        showMessage("해당 책을 찾을 수 없습니다.", "error");
-        return;
-      }
-      const verseId = `${targetBookAbbr}-${chapter}-${verse}`;
-      // 이동 전 전역 인덱스에서 존재 여부 확인(워커)
-      checkReferenceExistence(verseId, (ok) => {
-        if (!ok) {
-          showMessage(
-            `${bookName} ${chapter}:${verse}은(는) 없는 구절입니다.`,
-            "error"
-          );
-          return;
-        }
-        const basePath = window.location.pathname.replace(/[^/]+$/, "");
-        const filename = `${slug}-${chapter}.html#${verseId}`;
-        window.location.href = basePath + filename;
-      });
-    }
-  }
+  function searchByText(query, quiet = false) {
+    // 이전 하이라이트 제거
+    clearTextHighlight();
 
-  // 전역 인덱스에서 해당 절 ID 존재 여부 확인
-  function checkReferenceExistence(verseId, cb) {
-    if (!searchWorker) {
-      // 워커 미구성: 보수적으로 존재한다고 가정하고 이동 시도
-      cb(true);
-      return;
-    }
-    const handler = (ev) => {
-      const data = ev.data || {};
-      if (data.type === "checkResult" && data.id === verseId) {
-        searchWorker.removeEventListener("message", handler);
-        cb(!!data.ok);
-      }
-    };
-    searchWorker.addEventListener("message", handler);
-    try {
-      searchWorker.postMessage({ type: "check", id: verseId });
-    } catch (error) {
-      searchWorker.removeEventListener("message", handler);
-      cb(true);
+    if (supportsCssHighlights()) {
+      return reportLocalSearch(query, highlightWithRanges(query), quiet);
     }
-  }
 
-  /**
-   * 텍스트로 검색
-   */
-  function searchByText(query) {
     const verses = document.querySelectorAll('span[id*="-"]');
     let found = false;
 
-    // 이전 하이라이트 제거
-    clearTextHighlight();
-
     for (const verse of verses) {
       const text = verse.textContent || verse.innerText;
       if (text.toLowerCase().includes(query.toLowerCase())) {
@@ -1678,11 +1219,106 @@
       }
     }
 
-    // 로컬 검색 결과 토스트는 전역 검색과 충돌하지 않도록 조절
-    lastLocalFound = found;
-    if (found && !suppressLocalToast) {
+    return reportLocalSearch(query, found, quiet);
+  }
+
+  function reportLocalSearch(query, found, quiet) {
+    // 전역 검색과 함께 실행할 때(quiet)는 토스트를 띄우지 않는다
+    if (found && !quiet) {
       showMessage(`"${query}" 검색 완료`, "success");
     }
+    return found;
+  }
+
+  const TEXT_HIGHLIGHT_NAME = "verse-search";
+
+  function supportsCssHighlights() {
+    return (
+      typeof CSS !== "undefined" &&
+      !!CSS.highlights &&
+      typeof Highlight === "function"
+    );
+  }
+
+  /**
+   * 대소문자 접기 + 원문 오프셋 표
+   * toLowerCase()는 글자 길이를 바꿀 수 있으므로(예: "İ" → "i̇") 길이가 같을 때만 그대로 쓰고,
+   * 다르면 글자(코드 포인트)마다 접으며 접힌 위치 → 원문 [시작, 끝) 위치를 기록한다.
+   * @returns {{ text: string, start: number[]|null, end: number[]|null }} 표가 null이면 위치가 같음
+   */
+  function foldWithOffsets(source) {
+    const lower = source.toLowerCase();
+    if (lower.length === source.length) {
+      return { text: lower, start: null, end: null };
+    }
+    let text = "";
+    const start = [];
+    const end = [];
+    let pos = 0;
+    for (const ch of source) {
+      const folded = ch.toLowerCase();
+      for (let k = 0; k < folded.length; k += 1) {
+        start.push(pos);
+        end.push(pos + ch.length);
+      }
+      text += folded;
+      pos += ch.length;
+    }
+    return { text, start, end };
+  }
+
+  /**
+   * CSS Custom Highlight API로 본문 검색어 하이라이트
+   * 본문을 TreeWalker로 한 번만 훑으며 일치 구간을 Range로 등록한다(DOM 변경/재배치 없음).
+   * @returns {boolean} 일치 항목이 있으면 true (첫 절로 스크롤)
+   */
+  function highlightWithRanges(query) {
+    const needle = query.toLowerCase();
+    if (!needle) return false;
+    const root = document.querySelector("article") || document.body;
+    const walker = document.createTreeWalker(root, NodeFilter.SHOW_TEXT, {
+      acceptNode(node) {
+        const parent = node.parentElement;
+        if (
+          !parent ||
+          parent.classList.contains("verse-number") ||
+          parent.classList.contains("paragraph-marker")
+        ) {
+          return NodeFilter.FILTER_REJECT; // 절 번호나 단락 마커는 제외
+        }
+        return NodeFilter.FILTER_ACCEPT;
+      },
+    });
+
+    const highlight = new Highlight();
+    let firstVerse = null;
+    let node;
+    while ((node = walker.nextNode())) {
+      const folded = foldWithOffsets(node.data);
+      const text = folded.text;
+      let idx = text.indexOf(needle);
+      if (idx < 0) continue;
+      const verse = node.parentElement.closest('span[id*="-"]');
+      if (!verse) continue;
+      if (!firstVerse) firstVerse = verse;
+      while (idx >= 0) {
+        // 접힌 텍스트의 일치 구간을 원문 오프셋으로 되돌려 Range를 만든다
+        const last = idx + needle.length - 1;
+        const from = folded.start ? folded.start[idx] : idx;
+        const to = folded.end ? folded.end[last] : last + 1;
+        const range = document.createRange();
+        range.setStart(node, from);
+        range.setEnd(node, to);
+        highlight.add(range);
+        idx = text.indexOf(needle, idx + needle.length);
+      }
+    }
+
+    if (!firstVerse) return false;
+    CSS.highlights.set(TEXT_HIGHLIGHT_NAME, highlight);
+    // 첫 번째 결과로 스크롤 (고정 헤더 높이 고려)
+    scrollToElementWithOffset(firstVerse);
+    return true;
   }
 
   /**
@@ -1830,6 +1466,9 @@
    * 텍스트 하이라이트 제거
    */
   function clearTextHighlight() {
+    if (supportsCssHighlights()) {
+      CSS.highlights.delete(TEXT_HIGHLIGHT_NAME);
+    }
     const highlighted = document.querySelectorAll(".text-highlight");
     for (const element of highlighted) {
       const parent = element.parentNode;
@@ -1841,441 +1480,6 @@
     }
   }
 
-  /**
-   * 전역 검색 실행 (Web Worker)
-   */
-  function globalSearch(query) {
-    if (!searchWorker) {
-      // 초기화 중이거나 미구성 상태
-      showGlobalResultsMessage("전역 검색을 사용할 수 없습니다.");
-      return;
-    }
-
-    // 모바일 검색 시트가 열려있으면 모바일 모드로 설정
-    const mobileSheet = document.getElementById("mobile-search-sheet");
-    if (mobileSheet && mobileSheet.style.display !== "none") {
-      useMobileResults = true;
-    }
-
-    if (useMobileResults) {
-      // 바텀시트 높이에 맞춰 페이지 크기 산정
-      try {
-        const newSize = getMobilePageSize();
-        if (newSize && newSize !== pagination.pageSize) {
-          pagination.pageSize = newSize;
-        }
-      } catch (error) {
-        // 모바일 페이지 크기 계산 실패 시 무시
-      }
-      // 모바일: 패널 생성/표시는 생략, 바텀시트 컨테이너에 렌더
-      renderGlobalResults(query, null);
-    } else {
-      createResultsPanel();
-      showResultsPanel();
-      renderGlobalResults(query, null); // 로딩 상태
-    }
-
-    const trimmed = query.trim();
-    if (!trimmed) return;
-
-    pagination.q = trimmed;
-    pagination.page = 1;
-
-    if (!isWorkerReady) {
-      pendingQueries.push(trimmed);
-      saveSearchState();
-      return;
-    }
-    try {
-      searchWorker.postMessage({
-        type: "query",
-        q: trimmed,
-        limit: pagination.pageSize,
-        page: pagination.page,
-      });
-      saveSearchState();
-    } catch (error) {
-      // 검색 요청 실패 시 사용자 메시지 표시
-      showGlobalResultsMessage("검색 요청 중 오류가 발생했습니다.");
-    }
-  }
-
-  function navigatePage(delta) {
-    if (!searchWorker || !isWorkerReady || !pagination.q) return;
-    const next = Math.max(1, pagination.page + delta);
-    pagination.page = next;
-    try {
-      searchWorker.postMessage({
-        type: "query",
-        q: pagination.q,
-        limit: pagination.pageSize,
-        page: pagination.page,
-      });
-      saveSearchState();
-    } catch (error) {
-      // 페이지 이동 실패 시 무시
-    }
-  }
-
-  function showGlobalResultsMessage(message) {
-    // 모바일 검색 시트가 열려있으면 모바일 모드로 강제 설정
-    const mobileSheet = document.getElementById("mobile-search-sheet");
-    if (mobileSheet && mobileSheet.style.display !== "none") {
-      useMobileResults = true;
-    }
-
-    if (useMobileResults && mobileResultsContainer) {
-      mobileResultsContainer.innerHTML = "";
-      const p = document.createElement("p");
-      p.textContent = message || "검색 결과가 없습니다.";
-      Object.assign(p.style, {
-        color: "#666",
-        margin: "8px 4px",
-        textAlign: "center",
-        fontSize: "14px",
-        padding: "20px 0",
-        display: "block", // 명시적으로 표시
-        visibility: "visible", // 가시성 보장
-        opacity: "1", // 투명도 보장
-        position: "static", // 위치 보장
-        zIndex: "1", // 레이어 순서 보장
-      });
-      mobileResultsContainer.appendChild(p);
-      updatePageInfo(0, 0, 0);
-    } else {
-      createResultsPanel();
-      const list = resultsPanel.querySelector(".search-results-list");
-      if (!list) return;
-      list.innerHTML = "";
-      const p = document.createElement("p");
-      p.textContent = message || "검색 결과가 없습니다.";
-      Object.assign(p.style, { color: "#666", margin: "8px 4px" });
-      list.appendChild(p);
-      updatePageInfo(0, 0, 0);
-      showResultsPanel();
-    }
-  }
-
-  function renderGlobalResults(
-    query,
-    results,
-    page = 1,
-    total = 0,
-    pageSize = 50
-  ) {
-    // 모바일 검색 시트가 열려있으면 모바일 모드로 강제 설정
-    const mobileSheet = document.getElementById("mobile-search-sheet");
-    if (mobileSheet && mobileSheet.style.display !== "none") {
-      useMobileResults = true;
-      // 디버그 로깅 제거
-    }
-
-    let list;
-    if (useMobileResults && mobileResultsContainer) {
-      list = mobileResultsContainer;
-      list.innerHTML = "";
-      // 디버그 로깅 제거
-    } else {
-      createResultsPanel();
-      list = resultsPanel.querySelector(".search-results-list");
-      if (!list) return;
-      list.innerHTML = "";
-      // 디버그 로깅 제거
-    }
-
-    if (results === null) {
-      const loading = document.createElement("p");
-      loading.textContent = `"${query}" 검색 중…`;
-      Object.assign(loading.style, {
-        color: "#666",
-        margin: "8px 4px 0px 4px", // 하단 여백 제거
-      });
-      list.appendChild(loading);
-      return;
-    }
-
-    if (!Array.isArray(results) || results.length === 0) {
-      // 이전 로딩 메시지 제거
-      const existingLoading = list.querySelector("p");
-      if (existingLoading && existingLoading.textContent.includes("검색 중")) {
-        existingLoading.remove();
-      }
-
-      const empty = document.createElement("p");
-      if (useMobileResults && mobileResultsContainer) {
-        empty.textContent = "검색 결과가 없습니다.";
-        Object.assign(empty.style, {
-          color: "#666",
-          margin: "8px 4px",
-          textAlign: "center",
-          fontSize: "14px",
-          padding: "20px 0",
-          display: "block", // 명시적으로 표시
-          visibility: "visible", // 가시성 보장
-          opacity: "1", // 투명도 보장
-          position: "static", // 위치 보장
-          zIndex: "1", // 레이어 순서 보장
-        });
-      } else {
-        empty.textContent = `"${query}" 결과가 없습니다.`;
-        Object.assign(empty.style, {
-          color: "#666",
-          margin: "8px 4px 0px 4px", // 하단 여백 제거
-        });
-      }
-      list.appendChild(empty);
-      // 디버그 상세 로깅 제거
-
-      updatePageInfo(0, 0, 0);
-      // 전역/로컬 모두 실패한 경우에만 에러 토스트 표시
-      if (query === lastQueryText && !lastLocalFound) {
-        showMessage(`"${query}"를 찾을 수 없습니다.`, "error");
-      }
-      return;
-    }
-
-    for (const item of results) {
-      const a = document.createElement("a");
-      a.href = item.h || item.href;
-      a.title = item.i || item.id;
-      a.innerHTML = highlightSnippet(item.t || item.text || "", query);
-
-      // 마지막으로 클릭한 항목인지 확인
-      const isLastClicked =
-        lastClickedItem &&
-        lastClickedItem.href === (item.h || item.href) &&
-        lastClickedItem.id === (item.i || item.id);
-
-      Object.assign(a.style, {
-        display: "block",
-        padding: "8px 6px",
-        borderRadius: "4px",
-        color: "#111",
-        textDecoration: "none",
-        pointerEvents: "auto", // 명시적으로 클릭 가능하도록 설정
-        // 마지막 클릭 항목이면 하이라이트 배경 적용
-        background: isLastClicked ? "#e3f2fd" : "transparent",
-        borderLeft: isLastClicked ? "3px solid #2196f3" : "none",
-      });
-
-      // 레퍼런스(책 장:절) 표시 추가
-      const bookAbbr = item.b || (item.i || item.id || "").split("-")[0] || "";
-      let chap = item.c;
-      let ver = item.v;
-      if (chap == null || ver == null) {
-        const parts = String(item.i || item.id || "").split("-");
-        if (parts.length >= 3) {
-          chap = chap == null ? parseInt(parts[1], 10) : chap;
-          ver = ver == null ? parseInt(parts[2], 10) : ver;
-        }
-      }
-      if (bookAbbr && chap && ver) {
-        const ref = document.createElement("span");
-        ref.className = "search-result-ref";
-        ref.textContent = ` — ${bookAbbr} ${chap}:${ver}`;
-        Object.assign(ref.style, {
-          marginLeft: "6px",
-          color: "#555",
-          fontSize: "12px",
-        });
-        a.appendChild(ref);
-      }
-
-      a.addEventListener("mouseenter", () => {
-        if (!isLastClicked) {
-          a.style.background = "#f3f4f6";
-        }
-      });
-      a.addEventListener("mouseleave", () => {
-        // 마지막 클릭 항목이면 원래 하이라이트로 되돌리기
-        a.style.background = isLastClicked ? "#e3f2fd" : "transparent";
-      });
-
-      // 클릭 시 고정 헤더를 고려한 스크롤
-      a.addEventListener("click", (e) => {
-        // 클릭한 항목 정보 저장 (페이지 이동 전에 먼저 저장)
-        lastClickedItem = {
-          href: item.h || item.href,
-          id: item.i || item.id,
-          text: item.t || item.text || "",
-        };
-        saveSearchState(); // 즉시 상태 저장
-
-        const href = a.href;
-        const currentUrl = window.location.href.split("#")[0];
-        const linkUrl = href.split("#")[0];
-
-        // 같은 페이지 내의 해시 링크인 경우에만 커스텀 처리
-        if (currentUrl === linkUrl && href.includes("#")) {
-          e.preventDefault(); // 이 경우에만 기본 동작 방지
-
-          // 모바일 바텀시트가 열려있으면 먼저 닫기
-          const mobileSheet = document.getElementById("mobile-search-sheet");
-          if (mobileSheet && mobileSheet.style.display !== "none") {
-            closeMobileSearchSheet();
-          }
-
-          const verseId = href.split("#")[1];
-          if (verseId) {
-            // 안전한 URL 디코딩으로 실제 절 ID 얻기
-            const decodedVerseId = safeDecodeVerseId(verseId);
-            // 우리의 highlightVerse 함수 사용 (고정 헤더 오프셋 포함)
-            const success = highlightVerse(decodedVerseId);
-            if (success) {
-              // URL 해시 업데이트 (디코딩된 ID 사용)
-              history.replaceState(null, null, `#${decodedVerseId}`);
-            }
-          }
-        }
-        // 다른 페이지로의 링크는 기본 동작 허용
-      });
-
-      // 마지막 항목인 경우 하단 여백 제거
-      if (results.indexOf(item) === results.length - 1) {
-        a.style.marginBottom = "0";
-      }
-
-      list.appendChild(a);
-    }
-
-    updatePageInfo(page, pageSize, total);
-  }
-
-  // 패널 표시/숨김 공통 처리 (토글 버튼 접근성 상태 포함)
-  function showResultsPanel() {
-    createResultsPanel();
-    if (resultsPanel) {
-      resultsPanel.style.display = "block";
-    }
-    if (resultsToggleBtn) {
-      resultsToggleBtn.setAttribute("aria-expanded", "true");
-      resultsToggleBtn.setAttribute("aria-label", "검색 결과 패널 닫기");
-    }
-  }
-
-  function hideResultsPanel() {
-    if (resultsPanel) {
-      resultsPanel.style.display = "none";
-    }
-    if (resultsToggleBtn) {
-      resultsToggleBtn.setAttribute("aria-expanded", "false");
-      resultsToggleBtn.setAttribute("aria-label", "검색 결과 패널 열기");
-    }
-  }
-
-  function updatePageInfo(page, pageSize, total) {
-    const pageInfo =
-      resultsPanel && resultsPanel.querySelector(".search-page-info");
-    const prevBtn =
-      resultsPanel && resultsPanel.querySelector(".search-page-prev");
-    const nextBtn =
-      resultsPanel && resultsPanel.querySelector(".search-page-next");
-    if (!pageInfo) return;
-    const totalPages =
-      pageSize > 0 ? Math.max(1, Math.ceil(total / pageSize)) : 1;
-    pageInfo.textContent =
-      total > 0 ? `${page}/${totalPages} (총 ${total}건)` : "";
-    // 버튼 활성/비활성
-    if (prevBtn) prevBtn.disabled = !(total > 0 && page > 1);
-    if (nextBtn) nextBtn.disabled = !(total > 0 && page < totalPages);
-    pagination.page = page || 1;
-    pagination.pageSize = pageSize || 50;
-    // 검색어가 없거나 total=0이면 상태 저장 지움
-    if (!pagination.q || !(total > 0)) {
-      try {
-        sessionStorage.removeItem(SEARCH_STATE_KEY);
-      } catch (error) {
-        // 상태 저장 지우기 실패 시 무시
-      }
-    } else {
-      saveSearchState();
-    }
-
-    // 모바일 바텀시트 푸터 동기화
-    const mPrev = document.getElementById("mobile-search-prev");
-    const mInfo = document.getElementById("mobile-search-info");
-    const mNext = document.getElementById("mobile-search-next");
-    if (mInfo) mInfo.textContent = total > 0 ? `${page}/${totalPages}` : "";
-    if (mPrev) mPrev.disabled = !(total > 0 && page > 1);
-    if (mNext) mNext.disabled = !(total > 0 && page < totalPages);
-
-    // 모바일 페이지 번호 렌더링
-    lastTotalResults = total || 0;
-  }
-
-  function getMobilePageSize() {
-    // 바텀시트의 높이를 고려해서 검색 결과 영역에 표시할 수 있는 항목 수 계산
-    try {
-      const sheet = document.getElementById("mobile-search-sheet");
-      if (!sheet) return pagination.pageSize;
-
-      // 바텀시트 전체 높이 (65vh)
-      const sheetHeight = sheet.clientHeight || 0;
-
-      // 검색 행 높이 (44px + 여백 10px)
-      const searchRowHeight = 54;
-
-      // 페이지네이션 네비게이션 높이 (44px + 여백 8px)
-      const paginationHeight = 52;
-
-      // 검색 결과 영역에 사용 가능한 높이
-      const availableHeight = sheetHeight - searchRowHeight - paginationHeight;
-
-      // 각 검색 결과 항목의 높이 (대략 68px/항목: 링크 2줄 + 여백)
-      const perItemHeight = 68;
-
-      // 표시 가능한 항목 수 (최소 4개)
-      const items = Math.max(4, Math.floor(availableHeight / perItemHeight));
-
-      return items;
-    } catch (error) {
-      return pagination.pageSize;
-    }
-  }
-
-  function gotoPage(targetPage) {
-    if (!searchWorker || !isWorkerReady || !pagination.q) return;
-    const totalPages =
-      pagination.pageSize > 0
-        ? Math.max(1, Math.ceil((lastTotalResults || 0) / pagination.pageSize))
-        : 1;
-    const next = Math.min(Math.max(1, targetPage), totalPages);
-    pagination.page = next;
-    try {
-      searchWorker.postMessage({
-        type: "query",
-        q: pagination.q,
-        limit: pagination.pageSize,
-        page: pagination.page,
-      });
-      saveSearchState();
-    } catch (error) {
-      // 페이지 이동 실패 시 무시
-    }
-  }
-
-  // 브라우저 뒤/앞 이동 시 상태 복구
-  window.addEventListener("popstate", () => {
-    restoreSearchState();
-  });
-
-  function highlightSnippet(text, query) {
-    const q = escapeRegExp(query);
-    const regex = new RegExp(`(${q})`, "gi");
-    // 주변 40자 스니펫
-    const idx = text.toLowerCase().indexOf(query.toLowerCase());
-    if (idx >= 0) {
-      const start = Math.max(0, idx - 40);
-      const end = Math.min(text.length, idx + query.length + 40);
-      const slice =
-        (start > 0 ? "…" : "") +
-        text.slice(start, end) +
-        (end < text.length ? "…" : "");
-      return slice.replace(regex, '<span class="text-highlight">$1</span>');
-    }
-    return text.replace(regex, '<span class="text-highlight">$1</span>');
-  }
-
   /**
    * 메시지 표시
    */
@@ -2350,6 +1554,30 @@
   window.BibleNavigator = {
     highlightVerse: highlightVerse,
     clearHighlight: clearHighlight,
-    searchByText: searchByText,
+    searchByText: (query) => searchByText(query),
+    // 검색 모듈(verse-search.js) 전용 내부 인터페이스
+    _core: {
+      elements: () => ({ searchForm, searchInput, searchButton, resultsToggleBtn }),
+      config: () => searchConfig,
+      registerSearch: (api) => {
+        searchModule = api;
+      },
+      MOBILE_BREAKPOINT,
+      SEARCH_STATE_KEY,
+      bookNameToAbbr,
+      abbrToSlug,
+      iconSvg,
+      showMessage,
+      highlightVerse,
+      clearHighlight,
+      safeDecodeVerseId,
+      escapeRegExp,
+      searchByText,
+      loadVerseCounts,
+      verseExistsInCounts,
+      openChapter,
+      resolveChapterHref,
+      isShell: () => !!shellConfig,
+    },
   };
 })();
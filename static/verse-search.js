@@ -0,0 +1,1885 @@
+/**
+ * 공동번역성서 프로젝트 - 전역 검색 UI 모듈
+ * verse-navigator.js(코어)가 검색을 처음 쓸 때 지연 로드한다.
+ * 결과 패널, 모바일 검색 시트, 페이지네이션, 검색 워커(search-worker.js)를 담당하며
+ * 코어의 내부 인터페이스(window.BibleNavigator._core)로 하이라이트/메시지/구성을 공유한다.
+ */
+
+(function () {
+  "use strict";
+
+  const core = window.BibleNavigator && window.BibleNavigator._core;
+  if (!core) {
+    console.warn("verse-navigator.js가 먼저 로드되어야 합니다.");
+    return;
+  }
+
+  // 코어와 공유하는 DOM 요소/함수
+  const { searchInput, resultsToggleBtn } = core.elements();
+  const MOBILE_BREAKPOINT = core.MOBILE_BREAKPOINT;
+  const SEARCH_STATE_KEY = core.SEARCH_STATE_KEY;
+  const bookNameToAbbr = core.bookNameToAbbr;
+  const abbrToSlug = core.abbrToSlug;
+  const iconSvg = core.iconSvg;
+  const showMessage = core.showMessage;
+  const highlightVerse = core.highlightVerse;
+  const clearHighlight = core.clearHighlight;
+  const safeDecodeVerseId = core.safeDecodeVerseId;
+  const escapeRegExp = core.escapeRegExp;
+  const searchByText = core.searchByText;
+  const loadVerseCounts = core.loadVerseCounts;
+  const verseExistsInCounts = core.verseExistsInCounts;
+  const openChapter = core.openChapter;
+  const resolveChapterHref = core.resolveChapterHref;
+
+  // 전역 검색(Web Worker) 관련
+  let searchWorker = null;
+  let resultsPanel = null;
+  // 모바일 바텀시트 결과 렌더 타깃
+  let mobileResultsContainer = null;
+  let useMobileResults = false;
+  let mobileResultsBody = null; // 높이 측정용
+  let mobilePagesContainer = null; // 모바일 페이지 번호 컨테이너
+  let lastTotalResults = 0; // 총 결과 수 저장
+  let totalPending = false; // 워커가 총 건수를 아직 집계 중인지 (하한값 표시)
+  let pagination = { page: 1, pageSize: 50, q: "" };
+  let isWorkerReady = false;
+  let pendingQueries = [];
+  // 쿼리 순번: 워커가 이전 쿼리 스캔을 중단하고, 늦게 도착한 이전 응답은 무시하는 데 사용
+  let querySeq = 0;
+  let queryTimer = null;
+  let liveSearchTimer = null;
+  // 로컬/전역 검색 메시지 조율용 상태
+  let lastLocalFound = false;
+  let lastQueryText = "";
+  let pendingRefCheck = null;
+  let lastClickedItem = null; // 마지막으로 클릭한 검색 결과 항목 정보
+  const QUERY_DEBOUNCE_MS = 150; // 페이지 이동 연타 병합
+  const LIVE_SEARCH_DEBOUNCE_MS = 300; // 입력 중 검색(liveSearch) 대기 시간
+  const LIVE_SEARCH_MIN_LENGTH = 2;
+  // 워커 풀 크기 상한 (로드 순간에는 워커마다 인덱스 전체를 한 번씩 읽음)
+  const SEARCH_WORKER_POOL_DEFAULT = 2; // workerPool: true일 때
+  const SEARCH_WORKER_POOL_MAX = 4; // 숫자로 지정할 때
+
+  function clearSavedSearchState() {
+    try {
+      sessionStorage.removeItem(SEARCH_STATE_KEY);
+    } catch (error) {
+      // sessionStorage 접근 실패 시 무시 (프라이빗 모드 등)
+    }
+    lastClickedItem = null; // 마지막 클릭 항목 초기화
+  }
+
+  function resetResultsPanel() {
+    if (!resultsPanel) return;
+    const list = resultsPanel.querySelector(".search-results-list");
+    if (list) getVirtualList(list).reset();
+    hideResultsPanel();
+  }
+
+  function resetSearchUI() {
+    clearSavedSearchState();
+    resetResultsPanel();
+    lastClickedItem = null; // 마지막 클릭 항목 초기화
+    if (searchInput) searchInput.value = "";
+  }
+
+  // 모바일 검색 바텀시트
+  function openMobileSearchSheet() {
+    const sheetId = "mobile-search-sheet";
+    let sheet = document.getElementById(sheetId);
+    if (!sheet) {
+      sheet = document.createElement("div");
+      sheet.id = sheetId;
+      Object.assign(sheet.style, {
+        position: "fixed",
+        left: 0,
+        right: 0,
+        bottom: 0,
+        height: "65vh",
+        background: "#fff",
+        borderTopLeftRadius: "16px",
+        borderTopRightRadius: "16px",
+        boxShadow: "0 -12px 24px rgba(0,0,0,0.18)",
+        zIndex: 1101,
+        display: "none",
+        padding: "0", // 패딩 제거하여 내부 요소들이 정확한 위치에 배치되도록 함
+        display: "flex",
+        flexDirection: "column",
+      });
+
+      // 시트 외부를 덮는 오버레이(닫기 용도)
+      const overlay = document.createElement("div");
+      overlay.id = "mobile-search-overlay";
+      Object.assign(overlay.style, {
+        position: "fixed",
+        inset: 0,
+        background: "rgba(0,0,0,0.3)",
+        zIndex: 1100,
+        display: "none",
+      });
+      overlay.addEventListener("click", () => closeMobileSearchSheet());
+      document.body.appendChild(overlay);
+
+      const grip = document.createElement("div");
+      Object.assign(grip.style, {
+        width: "40px",
+        height: "4px",
+        background: "#e5e7eb",
+        borderRadius: "999px",
+        margin: "12px auto 16px", // 상단 여백 추가
+      });
+      sheet.appendChild(grip);
+
+      const row = document.createElement("div");
+      Object.assign(row.style, {
+        display: "flex",
+        alignItems: "center",
+        gap: "8px",
+        marginBottom: "10px",
+        padding: "0 12px", // 좌우 패딩 추가
+      });
+      const input = document.createElement("input");
+      input.type = "text";
+      input.placeholder = "절 ID 또는 단어 검색";
+      input.value = searchInput ? searchInput.value : "";
+      Object.assign(input.style, {
+        flex: 1,
+        height: "40px",
+        border: "1px solid #ccc",
+        borderRadius: "6px",
+        padding: "0 12px",
+        fontSize: "16px",
+      });
+      const goBtn = document.createElement("button");
+      goBtn.setAttribute("aria-label", "검색");
+      goBtn.title = "검색";
+      goBtn.innerHTML = iconSvg("search");
+      Object.assign(goBtn.style, {
+        height: "40px",
+        width: "40px",
+        padding: 0,
+        background: "#0066cc",
+        color: "#fff",
+        border: "none",
+        borderRadius: "8px",
+        cursor: "pointer",
+        display: "inline-flex",
+        alignItems: "center",
+        justifyContent: "center",
+      });
+      // 지우기 버튼
+      const clearBtn = document.createElement("button");
+      clearBtn.setAttribute("aria-label", "검색 결과 지우기");
+      clearBtn.title = "지우기";
+      clearBtn.innerHTML = iconSvg("trash");
+      Object.assign(clearBtn.style, {
+        height: "40px",
+        width: "40px",
+        padding: 0,
+        background: "#ffffff",
+        color: "#111",
+        border: "1px solid #d1d5db",
+        borderRadius: "8px",
+        cursor: "pointer",
+        display: "inline-flex",
+        alignItems: "center",
+        justifyContent: "center",
+      });
+      row.appendChild(input);
+      row.appendChild(goBtn);
+      row.appendChild(clearBtn);
+      sheet.appendChild(row);
+
+      const body = document.createElement("div");
+      body.id = "mobile-search-results";
+      Object.assign(body.style, {
+        position: "relative",
+        overflow: "auto", // 스크롤바 표시
+        height: "auto", // 동적 높이로 설정하여 내용에 맞게 자동 조정
+        maxHeight: "calc(65vh - 146px)", // 최대 높이 제한으로 스크롤바 표시
+        padding: "0 12px", // 좌우 패딩 추가
+        // 모바일 스크롤바 스타일링
+        scrollbarWidth: "thin",
+        scrollbarColor: "rgba(0, 0, 0, 0.2) transparent",
+        webkitOverflowScrolling: "touch",
+        overscrollBehavior: "contain",
+      });
+
+      // 웹킷 기반 브라우저용 스크롤바 스타일링
+      const scrollbarStyle = document.createElement("style");
+      scrollbarStyle.textContent = `
+        #mobile-search-results::-webkit-scrollbar {
+          width: 6px;
+        }
+        #mobile-search-results::-webkit-scrollbar-track {
+          background: transparent;
+        }
+        #mobile-search-results::-webkit-scrollbar-thumb {
+          background: rgba(0, 0, 0, 0.2);
+          border-radius: 3px;
+        }
+        #mobile-search-results::-webkit-scrollbar-thumb:hover {
+          background: rgba(0, 0, 0, 0.3);
+        }
+      `;
+      document.head.appendChild(scrollbarStyle);
+
+      // 모바일 전용 결과 컨테이너 설정
+      const list = document.createElement("div");
+      list.className = "search-results-list";
+      Object.assign(list.style, { padding: "8px 0 0 0" }); // 상단 패딩만 유지, 하단 패딩 제거
+      body.appendChild(list);
+      mobileResultsContainer = list;
+      mobileResultsBody = body;
+      sheet.appendChild(body);
+
+      // 모바일 페이지네이션 푸터
+      const footer = document.createElement("div");
+      Object.assign(footer.style, {
+        display: "flex",
+        alignItems: "center",
+        justifyContent: "space-between",
+        padding: "12px 12px 12px 12px", // 좌우 패딩 추가, 하단 여백 유지
+        gap: "8px",
+        borderTop: "none", // 상단 테두리 제거하여 여백 감소
+        marginTop: "0", // 상단 여백 제거
+        flexShrink: "0",
+        background: "#fff",
+        position: "absolute", // 절대 위치로 변경
+        bottom: "0", // 하단에 고정
+        left: "0",
+        right: "0",
+        zIndex: "1",
+      });
+      const mPrev = document.createElement("button");
+      mPrev.id = "mobile-search-prev";
+      mPrev.setAttribute("aria-label", "이전 페이지");
+      mPrev.title = "이전 페이지";
+      mPrev.innerHTML = iconSvg("chevronLeft");
+      Object.assign(mPrev.style, {
+        width: "40px",
+        height: "40px",
+        padding: "0",
+        border: "1px solid #d1d5db",
+        background: "#fff",
+        borderRadius: "6px",
+        cursor: "pointer",
+        display: "inline-flex",
+        alignItems: "center",
+        justifyContent: "center",
+      });
+      const mInfo = document.createElement("span");
+      mInfo.id = "mobile-search-info";
+      Object.assign(mInfo.style, {
+        color: "#555",
+        fontSize: "14px",
+        textAlign: "center",
+        flex: "1",
+      });
+      const mNext = document.createElement("button");
+      mNext.id = "mobile-search-next";
+      mNext.setAttribute("aria-label", "다음 페이지");
+      mNext.title = "다음 페이지";
+      mNext.innerHTML = iconSvg("chevronRight");
+      Object.assign(mNext.style, {
+        width: "40px",
+        height: "40px",
+        padding: "0",
+        border: "1px solid #d1d5db",
+        background: "#fff",
+        borderRadius: "6px",
+        cursor: "pointer",
+        display: "inline-flex",
+        alignItems: "center",
+        justifyContent: "center",
+      });
+      mPrev.addEventListener("click", () => navigatePage(-1));
+      mNext.addEventListener("click", () => navigatePage(1));
+      footer.appendChild(mPrev);
+      footer.appendChild(mInfo);
+      footer.appendChild(mNext);
+      sheet.appendChild(footer);
+
+      document.body.appendChild(sheet);
+
+      function triggerMobileSearch() {
+        if (!input.value.trim()) return;
+        if (searchInput) searchInput.value = input.value;
+        // 모바일 검색 모드 강제 설정
+        useMobileResults = true;
+        // 검색 실행
+        handleSearch(new Event("submit"));
+      }
+      goBtn.addEventListener("click", triggerMobileSearch);
+      input.addEventListener("keydown", (ev) => {
+        if (ev.key === "Enter") {
+          ev.preventDefault();
+          triggerMobileSearch();
+        } else if (ev.key === "Escape") {
+          ev.preventDefault();
+          closeMobileSearchSheet();
+        }
+      });
+
+      clearBtn.addEventListener("click", () => {
+        try {
+          clearSavedSearchState();
+        } catch (error) {
+          // 상태 초기화 실패 시 무시
+        }
+        // 입력값 초기화
+        if (searchInput) searchInput.value = "";
+        input.value = "";
+        // 마지막 클릭 항목 초기화
+        lastClickedItem = null;
+        // 본문 하이라이트 제거 (절/텍스트 모두)
+        try {
+          clearHighlight();
+        } catch (error) {
+          // 하이라이트 제거 실패 시 무시
+        }
+        // 결과/페이지네이션 초기화
+        pagination.q = "";
+        pagination.page = 1;
+        lastLocalFound = false;
+        lastTotalResults = 0;
+        // UI에 빈 상태 메시지 표시
+        showGlobalResultsMessage("검색 결과 없음");
+        updatePageInfo(0, 0, 0);
+        // 모바일 검색 시트 닫기
+        closeMobileSearchSheet();
+      });
+    }
+    // 열기
+    const overlay = document.getElementById("mobile-search-overlay");
+    if (overlay) overlay.style.display = "block";
+    sheet.style.display = "block";
+    const inputEl = sheet.querySelector("input");
+    try {
+      inputEl && inputEl.focus();
+    } catch (error) {
+      // 포커스 설정 실패 시 무시
+    }
+  }
+
+  function closeMobileSearchSheet() {
+    const sheet = document.getElementById("mobile-search-sheet");
+    const overlay = document.getElementById("mobile-search-overlay");
+    if (sheet) sheet.style.display = "none";
+    if (overlay) overlay.style.display = "none";
+    // 모바일 렌더 모드는 유지하여 결과를 보존
+    useMobileResults = true;
+  }
+  /**
+   * 전역 검색 초기화: Web Worker 및 결과 패널 준비
+   */
+  function initializeGlobalSearch() {
+    try {
+      const config = core.config() || {};
+      const workerUrl = config.workerUrl;
+      const indexUrl = config.indexUrl;
+
+      if (!workerUrl || !indexUrl) {
+        // 설정을 찾지 못해도 기능 전체를 차단하지는 않음(로컬 DOM 검색만 동작)
+        console.warn(
+          "전역 검색 구성을 찾을 수 없어 로컬 검색만 지원됩니다. BIBLE_SEARCH_CONFIG.workerUrl/searchIndexUrl를 설정하세요."
+        );
+        return;
+      }
+
+      // 결과 패널 생성
+      createResultsPanel();
+
+      // Web Worker 생성 및 구성 전달 (공유 모드면 SharedWorker 포트)
+      searchWorker = createSearchWorker(
+        workerUrl,
+        config.sharedWorker,
+        searchWorkerPoolSize(config.workerPool)
+      );
+      searchWorker.onmessage = (ev) => {
+        const data = ev.data || {};
+        if (data.type === "ready") {
+          isWorkerReady = true;
+          // 인덱스 URL 전달
+          searchWorker.postMessage({
+            type: "config",
+            indexUrl,
+            binaryIndexUrl: config.binaryIndexUrl,
+            // 인덱스 내용 해시: 워커가 IndexedDB 캐시 키로 사용
+            indexHash: config.indexHash,
+            countsUrl: config.countsUrl,
+          });
+          // 대기 중이던 쿼리 처리
+          if (pendingQueries.length > 0) {
+            for (const q of pendingQueries.splice(0)) {
+              postQuery(q, 1);
+            }
+          }
+          // 저장된 상태 복구
+          restoreSearchState();
+          return;
+        }
+        if (
+          (data.type === "results" || data.type === "total") &&
+          data.seq !== undefined &&
+          data.seq !== querySeq
+        ) {
+          // 이미 새 쿼리를 보냈으면 이전 쿼리의 늦은 응답은 버린다
+          return;
+        }
+        if (data.type === "results") {
+          // totalExact === false: 페이지는 채워졌고 총 건수는 집계 중(하한값)
+          totalPending = data.totalExact === false;
+          renderGlobalResults(
+            data.q,
+            data.results || [],
+            data.page || 1,
+            data.total || 0,
+            data.pageSize || 50
+          );
+          return;
+        }
+        if (data.type === "total") {
+          // 스트리밍 응답 이후 도착한 정확한 총 건수로 페이지 정보 갱신
+          if (data.q === pagination.q && totalPending) {
+            totalPending = false;
+            updatePageInfo(
+              data.page || pagination.page,
+              data.pageSize || pagination.pageSize,
+              data.total || 0
+            );
+          }
+          return;
+        }
+        if (data.type === "error") {
+          showMessage(`검색 오류: ${data.message || "알 수 없음"}`, "error");
+          return;
+        }
+      };
+      // Worker 기동 신호
+      searchWorker.postMessage({ type: "init" });
+    } catch (e) {
+      console.warn("전역 검색 초기화 실패:", e);
+    }
+  }
+
+  /**
+   * 검색 워커 생성: 공유 모드면 SharedWorker 포트, 아니면 전용 Worker.
+   * 둘 다 postMessage/onmessage/addEventListener 인터페이스가 같아 호출부는 구분하지 않는다.
+   */
+  function createSearchWorker(workerUrl, preferShared, poolSize) {
+    if (poolSize > 1 && preferShared) {
+      // 공유 워커는 탭 사이에서 인덱스 한 벌을 나누는 것이 목적이라 워커마다 사본을 갖는 풀과 함께 쓰지 않는다
+      console.warn("workerPool은 sharedWorker와 함께 쓸 수 없어 무시합니다.");
+    }
+    if (poolSize > 1 && !preferShared) {
+      try {
+        return createSearchWorkerPool(workerUrl, poolSize);
+      } catch (error) {
+        // 풀 생성 실패 시 단일 워커로 폴백
+      }
+    }
+    if (preferShared && typeof SharedWorker !== "undefined") {
+      try {
+        const shared = new SharedWorker(workerUrl, { name: "bible-search" });
+        // addEventListener로 붙는 핸들러도 메시지를 받도록 포트를 시작
+        shared.port.start();
+        // 공유 워커는 포트가 닫힌 것을 알 수 없으므로 페이지를 떠날 때 인덱스 참조를 직접 푼다
+        window.addEventListener("pagehide", (ev) => {
+          if (!ev.persisted) shared.port.postMessage({ type: "release" });
+        });
+        return shared.port;
+      } catch (error) {
+        // SharedWorker 생성 실패 시 전용 Worker로 폴백
+      }
+    }
+    return new Worker(workerUrl);
+  }
+
+  /**
+   * 워커 풀 크기: true면 코어 수 기준(최대 SEARCH_WORKER_POOL_DEFAULT), 숫자면 그 값(최대 SEARCH_WORKER_POOL_MAX).
+   * 2 미만이면 풀 미사용.
+   * 워커마다 인덱스를 받아 자기 구간만 남기므로 상주 메모리는 인덱스 한 벌 정도지만,
+   * 로드 순간에는 워커마다 전체를 한 번씩 읽는다(다운로드는 IndexedDB 캐시로 한 번). 그래서 기본 크기는 작게 잡는다.
+   */
+  function searchWorkerPoolSize(option) {
+    if (typeof option === "number") {
+      const size = Math.floor(option);
+      if (size > SEARCH_WORKER_POOL_MAX) {
+        console.warn(
+          `workerPool ${size}개는 최대 ${SEARCH_WORKER_POOL_MAX}개로 줄입니다 (워커마다 로드 때 인덱스 전체를 읽음).`
+        );
+        return SEARCH_WORKER_POOL_MAX;
+      }
+      return size;
+    }
+    if (option !== true) return 1;
+    const cores = navigator.hardwareConcurrency || 1;
+    return Math.max(1, Math.min(SEARCH_WORKER_POOL_DEFAULT, cores - 1));
+  }
+
+  /**
+   * 검색 워커 풀: 정렬된 인덱스를 워커 수만큼 연속 구간으로 나눠 병렬 스캔한다.
+   * 각 워커는 인덱스를 받은 뒤 자기 구간만 남기고 나머지는 버린다 (상주 메모리 ≈ 인덱스 한 벌).
+   * Worker와 같은 인터페이스(postMessage/onmessage/addEventListener)를 흉내 내므로
+   * 나머지 코드는 단일 워커와 구분하지 않는다.
+   * - query: 모든 워커에 앞에서부터 (요청 페이지 끝)개를 요청하고 응답을 구간 순서(0번 먼저)로 이어 붙인다.
+   *   앞 구간들의 건수가 확정되고 요청 페이지가 채워지는 즉시 결과를 보내고(totalExact: false),
+   *   모든 구간의 건수가 확정되면(워커의 'total') 정확한 총 건수를 { type: 'total' }로 보낸다.
+   * - check/chapters: 모든 워커에 보내 구간 순서대로 합친다 (첫 매치 / 장 번호 합집합)
+   */
+  function createSearchWorkerPool(workerUrl, size) {
+    const workers = [];
+    for (let k = 0; k < size; k += 1) workers.push(new Worker(workerUrl));
+    const target = new EventTarget();
+    const pool = {
+      onmessage: null,
+      addEventListener: (type, fn) => target.addEventListener(type, fn),
+      removeEventListener: (type, fn) => target.removeEventListener(type, fn),
+      postMessage: (data) => dispatch(data || {}),
+      terminate: () => workers.forEach((w) => w.terminate()),
+    };
+    let readyCount = 0;
+    let seq = 0;
+    const jobs = new Map(); // seq -> 응답 처리 함수 (k, data)
+
+    const emit = (data) => {
+      const ev = new MessageEvent("message", { data });
+      if (typeof pool.onmessage === "function") pool.onmessage(ev);
+      target.dispatchEvent(ev);
+    };
+
+    workers.forEach((w, k) => {
+      w.onmessage = (ev) => {
+        const data = ev.data || {};
+        if (data.type === "ready") {
+          readyCount += 1;
+          if (readyCount === size) emit(data);
+          return;
+        }
+        if (data.seq !== undefined) {
+          // 새 쿼리로 대체된 작업의 응답은 버린다
+          const onReply = jobs.get(data.seq);
+          if (onReply) onReply(k, data);
+          return;
+        }
+        if (data.type === "error") emit(data);
+      };
+    });
+
+    // 모든 워커에 같은 요청을 보내고 응답마다 onReply(k, data) 호출 (작업 seq 반환)
+    const startJob = (message, onReply) => {
+      seq += 1;
+      const id = seq;
+      jobs.set(id, onReply);
+      workers.forEach((w) => w.postMessage(Object.assign({}, message, { seq: id })));
+      return id;
+    };
+
+    let activeQuery = 0;
+    const runQuery = (data) => {
+      // 이전 쿼리 작업 폐기: 워커도 더 큰 seq를 받으면 이전 스캔을 중단한다
+      jobs.delete(activeQuery);
+      const limit = data.limit || 50;
+      const page = data.page || 1;
+      const start = (page - 1) * limit;
+      // 구간별 { rows: 앞에서부터 최대 start + limit개, total: 아는 건수, exact: 건수 확정 }
+      const shards = workers.map(() => null);
+      let q = data.q;
+      let sent = false;
+
+      // 구간 순서대로 이어 붙여 [start, start + limit)가 정해지면 그 결과, 아직이면 null
+      const pageFromShards = () => {
+        const results = [];
+        let base = 0;
+        for (const shard of shards) {
+          if (!shard) return null;
+          for (let i = Math.max(0, start - base); i < shard.rows.length; i += 1) {
+            if (results.length === limit) break;
+            results.push(shard.rows[i]);
+          }
+          if (results.length === limit) return results;
+          // 건수가 확정되지 않은 구간은 요청 페이지 끝까지 채운 뒤에만 응답하므로 여기 오지 않는다
+          if (!shard.exact) return null;
+          base += shard.total;
+        }
+        return results;
+      };
+
+      const progress = (id) => {
+        const exact = shards.every((shard) => shard && shard.exact);
+        const total = shards.reduce((n, shard) => n + (shard ? shard.total : 0), 0);
+        if (exact) jobs.delete(id);
+        if (!sent) {
+          const results = pageFromShards();
+          if (!results) return;
+          sent = true;
+          const reply = { type: "results", q, results, page, total, pageSize: limit, seq: data.seq };
+          if (!exact) reply.totalExact = false;
+          emit(reply);
+          return;
+        }
+        if (exact) {
+          emit({ type: "total", q, page, total, pageSize: limit, seq: data.seq });
+        }
+      };
+
+      const id = startJob(
+        { type: "query", q: data.q, offset: 0, limit: start + limit },
+        (k, reply) => {
+          if (reply.type === "error") {
+            jobs.delete(id);
+            emit({ type: "error", message: reply.message });
+            return;
+          }
+          if (reply.type === "results") {
+            q = reply.q;
+            shards[k] = {
+              rows: reply.results || [],
+              total: reply.total || 0,
+              exact: reply.totalExact !== false,
+            };
+          } else if (reply.type === "total" && shards[k]) {
+            shards[k].total = reply.total || 0;
+            shards[k].exact = true;
+          } else {
+            return;
+          }
+          progress(id);
+        }
+      );
+      activeQuery = id;
+    };
+
+    // check/chapters: 모든 워커의 응답이 모이면 merge(replies[k])를 한 번 보낸다
+    const gather = (message, merge) => {
+      const replies = workers.map(() => null);
+      let remaining = size;
+      const id = startJob(message, (k, reply) => {
+        if (reply.type === "error") {
+          jobs.delete(id);
+          emit({ type: "error", message: reply.message });
+          return;
+        }
+        replies[k] = reply;
+        remaining -= 1;
+        if (remaining === 0) {
+          jobs.delete(id);
+          emit(merge(replies));
+        }
+      });
+    };
+
+    function dispatch(data) {
+      if (data.type === "config") {
+        workers.forEach((w, k) =>
+          w.postMessage(Object.assign({}, data, { slice: [k, size] }))
+        );
+        return;
+      }
+      if (data.type === "query") {
+        runQuery(data);
+        return;
+      }
+      if (data.type === "check") {
+        gather(data, (replies) => {
+          const found = replies.find((r) => r.ok);
+          return {
+            type: "checkResult",
+            id: replies[0].id,
+            ok: !!found,
+            href: found ? found.href : null,
+          };
+        });
+        return;
+      }
+      if (data.type === "chapters") {
+        gather(data, (replies) => {
+          const chapters = new Set();
+          replies.forEach((r) => (r.chapters || []).forEach((c) => chapters.add(c)));
+          return {
+            type: "chapters",
+            book: replies[0].book,
+            chapters: Array.from(chapters).sort((a, b) => a - b),
+          };
+        });
+        return;
+      }
+      workers.forEach((w) => w.postMessage(data));
+    }
+
+    return pool;
+  }
+
+  function saveSearchState() {
+    try {
+      const state = {
+        q: pagination.q || "",
+        page: pagination.page || 1,
+        lastClickedItem: lastClickedItem,
+      };
+      sessionStorage.setItem(SEARCH_STATE_KEY, JSON.stringify(state));
+      if (history && history.replaceState) {
+        history.replaceState(state, document.title);
+      }
+    } catch (error) {
+      // 상태 저장 실패 시 무시 (프라이빗 모드 등)
+    }
+  }
+
+  function getSavedState() {
+    try {
+      const h = (history && history.state) || null;
+      if (h && typeof h === "object" && (h.q || h.page)) return h;
+      const raw = sessionStorage.getItem(SEARCH_STATE_KEY);
+      if (raw) return JSON.parse(raw);
+    } catch (error) {
+      // 저장된 상태 읽기 실패 시 무시
+    }
+    return null;
+  }
+
+  function restoreSearchState() {
+    const st = getSavedState();
+    if (!st || !st.q) return;
+    if (searchInput) searchInput.value = st.q;
+    // 마지막 클릭 항목 정보 복원
+    lastClickedItem = st.lastClickedItem || null;
+    // 패널 생성만 하고 표시하지 않음 (사용자가 직접 열어야 함)
+    createResultsPanel();
+    // 데스크탑에서는 패널을 숨김 상태로 유지
+    if (window.innerWidth >= MOBILE_BREAKPOINT) {
+      resultsPanel.style.display = "none";
+    } else {
+      resultsPanel.style.display = "block";
+    }
+    renderGlobalResults(st.q, null);
+    pagination.q = st.q;
+    pagination.page = st.page || 1;
+    try {
+      if (searchWorker && isWorkerReady) {
+        postQuery(pagination.q, pagination.page);
+      } else {
+        pendingQueries.push(pagination.q);
+      }
+    } catch (error) {
+      // 검색 상태 복원 실패 시 무시
+    }
+  }
+
+  /**
+   * 검색 결과 패널 생성
+   */
+  function createResultsPanel() {
+    if (resultsPanel) return;
+    resultsPanel = document.createElement("div");
+    resultsPanel.className = "search-results-panel";
+    resultsPanel.id = "bible-search-results-panel";
+    resultsPanel.setAttribute("role", "dialog");
+    resultsPanel.setAttribute("aria-label", "검색 결과");
+
+    Object.assign(resultsPanel.style, {
+      position: "fixed",
+      top: "70px",
+      right: "20px",
+      width: "480px", // 380px에서 480px로 폭 확장
+      height: "60vh", // maxHeight에서 height로 변경하여 고정 높이 설정
+      overflow: "hidden",
+      backgroundColor: "#ffffff",
+      border: "1px solid #ddd",
+      boxShadow: "0 4px 12px rgba(0,0,0,0.12)",
+      borderRadius: "6px",
+      zIndex: "1001",
+      display: "none",
+    });
+
+    const header = document.createElement("div");
+    Object.assign(header.style, {
+      padding: "10px 12px",
+      fontWeight: "bold",
+      borderBottom: "1px solid #eee",
+      background: "#f9fafb",
+      display: "flex",
+      alignItems: "center",
+      justifyContent: "space-between",
+      position: "sticky",
+      top: "0",
+      zIndex: "1",
+    });
+    resultsPanel.appendChild(header);
+
+    // 제목(줄바꿈 방지, 여유 여백)
+    const headerTitle = document.createElement("span");
+    headerTitle.textContent = "검색 결과";
+    Object.assign(headerTitle.style, {
+      whiteSpace: "nowrap",
+      overflow: "hidden",
+      textOverflow: "ellipsis",
+      padding: "0 8px",
+      marginRight: "6px",
+    });
+    header.appendChild(headerTitle);
+
+    // 헤더 액션 컨테이너
+    const headerActions = document.createElement("div");
+    Object.assign(headerActions.style, {
+      display: "flex",
+      gap: "6px",
+      alignItems: "center",
+    });
+    header.appendChild(headerActions);
+
+    // 버튼 공통 스타일 함수
+    function setButtonBaseStyles(btn) {
+      Object.assign(btn.style, {
+        padding: "4px 8px",
+        border: "1px solid #d1d5db",
+        background: "#ffffff",
+        borderRadius: "999px",
+        cursor: "pointer",
+        fontSize: "12px",
+        lineHeight: "1",
+        display: "inline-flex",
+        alignItems: "center",
+        gap: "6px",
+      });
+      btn.addEventListener(
+        "mouseenter",
+        () => (btn.style.background = "#f3f4f6")
+      );
+      btn.addEventListener(
+        "mouseleave",
+        () => (btn.style.background = "#ffffff")
+      );
+    }
+
+    // 바디 컨테이너
+    const body = document.createElement("div");
+    body.className = "search-results-body";
+
+    // 정확한 높이 설정: 패널 전체 높이 - 헤더 높이 - 푸터 높이
+    const calculateBodyHeight = () => {
+      const panelHeight = (60 * window.innerHeight) / 100; // 60vh
+      const headerHeight = 40; // 헤더 높이 (고정값)
+      const footerHeight = 40; // 푸터 높이 (고정값)
+      return Math.max(0, panelHeight - headerHeight - footerHeight);
+    };
+
+    // 초기 높이 설정
+    Object.assign(body.style, {
+      height: `${calculateBodyHeight()}px`,
+      zIndex: "1", // 스크롤바 스타일링을 위한 z-index
+    });
+
+    // 웹킷 기반 브라우저용 스크롤바 스타일링
+    const scrollbarStyle = document.createElement("style");
+    scrollbarStyle.textContent = `
+      .search-results-body::-webkit-scrollbar {
+        width: 6px;
+      }
+      .search-results-body::-webkit-scrollbar-track {
+        background: transparent;
+      }
+      .search-results-body::-webkit-scrollbar-thumb {
+        background: rgba(0, 0, 0, 0.2);
+        border-radius: 3px;
+      }
+      .search-results-body::-webkit-scrollbar-thumb:hover {
+        background: rgba(0, 0, 0, 0.3);
+      }
+    `;
+    document.head.appendChild(scrollbarStyle);
+
+    resultsPanel.appendChild(body);
+
+    const list = document.createElement("div");
+    list.className = "search-results-list";
+    // 스크롤을 위한 스타일 설정
+    Object.assign(list.style, {
+      height: "100%",
+      overflowY: "auto",
+      overflowX: "hidden",
+    });
+    body.appendChild(list);
+    // 초기 상태: 검색 결과 없음 메시지 표시
+    try {
+      const empty = document.createElement("p");
+      empty.textContent = "검색 결과 없음";
+      Object.assign(empty.style, { color: "#666", margin: "8px 4px 0px 4px" }); // 하단 여백 제거
+      list.appendChild(empty);
+    } catch (error) {
+      // 초기 메시지 생성 실패 시 무시
+    }
+
+    const footer = document.createElement("div");
+    footer.className = "search-results-footer";
+    // 명시적으로 높이 설정
+    Object.assign(footer.style, {
+      height: "40px",
+      minHeight: "40px",
+      zIndex: "1", // 헤더와 동일한 z-index
+    });
+    const navLeft = document.createElement("button");
+    navLeft.type = "button";
+    navLeft.className = "search-page-prev";
+    navLeft.setAttribute("aria-label", "이전 페이지");
+    navLeft.title = "이전 페이지";
+    navLeft.innerHTML = iconSvg("chevronLeft");
+    Object.assign(navLeft.style, {
+      width: "32px",
+      height: "32px",
+      padding: "0",
+      border: "1px solid #d0d7de",
+      background: "#fff",
+      borderRadius: "6px",
+      cursor: "pointer",
+      display: "inline-flex",
+      alignItems: "center",
+      justifyContent: "center",
+      flexShrink: "0",
+      marginRight: "8px",
+    });
+    navLeft.addEventListener("click", () => navigatePage(-1));
+
+    const pageInfo = document.createElement("span");
+    pageInfo.className = "search-page-info";
+    Object.assign(pageInfo.style, {
+      color: "#555",
+      fontSize: "14px",
+      textAlign: "center",
+      flex: "1",
+    });
+    pageInfo.textContent = "";
+
+    const navRight = document.createElement("button");
+    navRight.type = "button";
+    navRight.className = "search-page-next";
+    navRight.setAttribute("aria-label", "다음 페이지");
+    navRight.title = "다음 페이지";
+    navRight.innerHTML = iconSvg("chevronRight");
+    Object.assign(navRight.style, {
+      width: "32px",
+      height: "32px",
+      padding: "0",
+      border: "1px solid #d0d7de",
+      background: "#fff",
+      borderRadius: "6px",
+      cursor: "pointer",
+      display: "inline-flex",
+      alignItems: "center",
+      justifyContent: "center",
+      flexShrink: "0",
+      marginLeft: "8px",
+    });
+    navRight.addEventListener("click", () => navigatePage(1));
+
+    const clearBtn = document.createElement("button");
+    clearBtn.type = "button";
+    clearBtn.innerHTML = iconSvg("trash");
+    clearBtn.setAttribute("aria-label", "검색 결과 지우기");
+    clearBtn.title = "검색 결과 지우기";
+    setButtonBaseStyles(clearBtn);
+    clearBtn.addEventListener("click", () => {
+      // 검색 상태/입력/결과/페이지네이션 완전 초기화
+      try {
+        clearSavedSearchState();
+      } catch (error) {
+        // 상태 초기화 실패 시 무시
+      }
+      if (searchInput) searchInput.value = "";
+      // 마지막 클릭 항목 초기화
+      lastClickedItem = null;
+      const listEl = resultsPanel.querySelector(".search-results-list");
+      if (listEl) getVirtualList(listEl).reset();
+      // 페이지네이션 초기화 및 버튼 비활성화
+      pagination.q = "";
+      pagination.page = 1;
+      updatePageInfo(0, 0, 0);
+      // 본문 하이라이트 제거 (절/텍스트 모두)
+      try {
+        clearHighlight();
+      } catch (error) {
+        // 하이라이트 제거 실패 시 무시
+      }
+      // 패널 닫기 (검색 결과 지우고 패널 닫기)
+      hideResultsPanel();
+    });
+
+    const closeBtn = document.createElement("button");
+    closeBtn.type = "button";
+    closeBtn.innerHTML = iconSvg("close");
+    closeBtn.title = "패널 닫기";
+    setButtonBaseStyles(closeBtn);
+    closeBtn.addEventListener("click", () => {
+      hideResultsPanel();
+    });
+    // 왼쪽에 이전 버튼 배치
+    footer.appendChild(navLeft);
+    // 중앙에 페이지 정보 배치
+    footer.appendChild(pageInfo);
+    // 오른쪽에 다음 버튼 배치
+    footer.appendChild(navRight);
+    headerActions.appendChild(clearBtn);
+    headerActions.appendChild(closeBtn);
+
+    // 푸터를 패널에 직접 추가 (body가 아닌)
+    resultsPanel.appendChild(footer);
+
+    document.body.appendChild(resultsPanel);
+
+    // 패널 바깥 클릭 시 패널 완전히 숨기기
+    document.addEventListener("click", (ev) => {
+      if (!resultsPanel || resultsPanel.style.display === "none") return;
+      const target = ev.target;
+      // 패널 자체나 검색 토글 버튼 클릭은 무시
+      if (
+        resultsPanel.contains(target) ||
+        (resultsToggleBtn && resultsToggleBtn.contains(target))
+      )
+        return;
+      // 패널을 완전히 숨김
+      hideResultsPanel();
+    });
+
+    // 기본적으로 패널을 숨김 상태로 설정
+    resultsPanel.style.display = "none";
+  }
+
+  /**
+   * 검색 폼 제출 처리
+   */
+  function handleSearch(event) {
+    event.preventDefault();
+    if (liveSearchTimer) {
+      clearTimeout(liveSearchTimer);
+      liveSearchTimer = null;
+    }
+
+    const query = searchInput.value.trim();
+
+    // 빈 입력창인 경우: 빈 검색 결과 패널 열기
+    if (!query) {
+      createResultsPanel();
+      showResultsPanel();
+      showGlobalResultsMessage("검색 결과 없음");
+      return;
+    }
+
+    // 동일한 검색어로 기존 결과가 있는지 확인
+    const savedState = getSavedState();
+    if (savedState && savedState.q === query && pagination.q === query) {
+      // 기존 검색 결과가 있으면 패널을 열고 마지막 페이지로 이동
+      createResultsPanel();
+      showResultsPanel();
+
+      // 마지막 클릭 항목 정보 복원
+      lastClickedItem = savedState.lastClickedItem || null;
+
+      // 저장된 페이지로 이동 (워커가 준비되어 있으면 검색 재실행)
+      if (searchWorker && isWorkerReady) {
+        postQuery(pagination.q, savedState.page || pagination.page);
+      }
+      return;
+    }
+
+    // 절 참조 형식인지 확인 (예: "창세 1:1", "창세기 1:1")
+    const verseRefMatch = query.match(/^(.+?)\s+(\d+):(\d+)$/);
+    if (verseRefMatch) {
+      // 참조 검색은 상태를 저장하지 않고, 기존 키워드 검색 상태를 제거
+      resetSearchUI();
+      // 참조 검색 전 존재 검증(워커가 준비되어 있으면 빠르게 체크)
+      const bookName = verseRefMatch[1];
+      const chapter = verseRefMatch[2];
+      const verse = verseRefMatch[3];
+      searchByReference(bookName, chapter, verse);
+    } else {
+      // 텍스트 검색: 1) 현재 문서 내 검색 2) 전역 검색
+      lastQueryText = query;
+      lastLocalFound = searchByText(query, true);
+      // 새로운 키워드 검색: 기존 결과 초기화 후 저장
+      lastClickedItem = null; // 새로운 검색어이므로 마지막 클릭 항목 초기화
+      resetResultsPanel();
+      globalSearch(query);
+      saveSearchState();
+    }
+  }
+
+  /**
+   * Esc 키로 검색 UI 닫기 (코어의 전역 keydown 처리에서 호출)
+   */
+  function handleEscape() {
+    // 검색 결과 패널이 열려있으면 닫기
+    if (resultsPanel && resultsPanel.style.display !== "none") {
+      hideResultsPanel();
+      return;
+    }
+
+    // 모바일 바텀시트가 열려있으면 닫기
+    const mobileSheet = document.getElementById("mobile-search-sheet");
+    if (mobileSheet && mobileSheet.style.display !== "none") {
+      closeMobileSearchSheet();
+    }
+  }
+
+  /**
+   * 결과 패널 토글 (코어의 결과 패널 버튼에서 호출)
+   */
+  function toggleResultsPanel() {
+    // 패널 없으면 생성 후 열기
+    if (!resultsPanel) createResultsPanel();
+    const isHidden = !resultsPanel || resultsPanel.style.display === "none";
+    if (isHidden) {
+      showResultsPanel();
+    } else {
+      hideResultsPanel();
+    }
+  }
+
+  /**
+   * 워커에 책의 장 목록 요청 (절 수 테이블이 없을 때 브레드크럼 장 드롭다운용)
+   * @returns {Promise<number[]>} 워커가 없으면 빈 배열
+   */
+  function requestChapters(bookAbbr) {
+    return new Promise((resolve) => {
+      const ask = () => {
+        if (!searchWorker) {
+          resolve([]);
+          return;
+        }
+        // 워커 준비 전이면 잠시 후 재시도
+        if (!isWorkerReady) {
+          setTimeout(ask, 200);
+          return;
+        }
+        const handler = (ev) => {
+          const d = ev.data || {};
+          if (d.type === "chapters" && d.book === bookAbbr) {
+            searchWorker.removeEventListener("message", handler);
+            resolve(d.chapters);
+          }
+        };
+        searchWorker.addEventListener("message", handler);
+        try {
+          searchWorker.postMessage({ type: "chapters", book: bookAbbr });
+        } catch (error) {
+          // 워커 메시지 전송 실패 시 리스너 정리 후 빈 목록
+          searchWorker.removeEventListener("message", handler);
+          resolve([]);
+        }
+      };
+      ask();
+    });
+  }
+
+  /**
+   * 절 참조로 검색
+   */
+  function searchByReference(bookName, chapter, verse) {
+    // 현재 페이지의 책 이름과 장 번호 추출
+    const articleId = document.querySelector("article").id;
+    const currentMatch = articleId.match(/^(.+?)-(\d+)$/);
+
+    if (!currentMatch) {
+      showMessage("현재 페이지 정보를 찾을 수 없습니다.", "error");
+      return;
+    }
+
+    const currentBookAbbr = currentMatch[1];
+    const currentChapter = currentMatch[2];
+
+    const targetBookAbbr = bookNameToAbbr[bookName] || bookName;
+
+    // 같은 책·장 → 현재 페이지에서 이동 (존재 검증 포함)
+    if (targetBookAbbr === currentBookAbbr && chapter === currentChapter) {
+      const verseId = `${targetBookAbbr}-${chapter}-${verse}`;
+      // 우선 DOM에서 시도
+      const found = highlightVerse(verseId);
+      if (found) {
+        showMessage(
+          `${bookName} ${chapter}:${verse}로 이동했습니다.`,
+          "success"
+        );
+        history.replaceState(null, null, `#${verseId}`);
+        return;
+      }
+      // DOM에 없으면 전역 인덱스에서 존재 여부 확인(워커 사용)
+      checkReferenceExistence(verseId, (ok) => {
+        if (ok) {
+          // 현재 문서에 없으면 전역 파일로 이동
+          openChapter(abbrToSlug[targetBookAbbr], chapter, verseId);
+        } else {
+          showMessage(
+            `${bookName} ${chapter}:${verse}은(는) 없는 구절입니다.`,
+            "error"
+          );
+        }
+      });
+    } else {
+      // 다른 책/장 → 파일로 리다이렉트
+      const slug = abbrToSlug[targetBookAbbr];
+      if (!slug) {
+        showMessage("해당 책을 찾을 수 없습니다.", "error");
+        return;
+      }
+      const verseId = `${targetBookAbbr}-${chapter}-${verse}`;
+      // 이동 전 전역 인덱스에서 존재 여부 확인(워커)
+      checkReferenceExistence(verseId, (ok) => {
+        if (!ok) {
+          showMessage(
+            `${bookName} ${chapter}:${verse}은(는) 없는 구절입니다.`,
+            "error"
+          );
+          return;
+        }
+        openChapter(slug, chapter, verseId);
+      });
+    }
+  }
+
+  // 전역 인덱스에서 해당 절 ID 존재 여부 확인
+  function checkReferenceExistence(verseId, cb) {
+    // 절 수 테이블이 있으면 산술 비교로 확인 (전문 인덱스 로드 없음)
+    loadVerseCounts().then((counts) => {
+      if (counts) {
+        cb(verseExistsInCounts(counts, verseId));
+      } else {
+        checkReferenceExistenceInIndex(verseId, cb);
+      }
+    });
+  }
+
+  function checkReferenceExistenceInIndex(verseId, cb) {
+    if (!searchWorker) {
+      // 워커 미구성: 보수적으로 존재한다고 가정하고 이동 시도
+      cb(true);
+      return;
+    }
+    const handler = (ev) => {
+      const data = ev.data || {};
+      if (data.type === "checkResult" && data.id === verseId) {
+        searchWorker.removeEventListener("message", handler);
+        cb(!!data.ok);
+      }
+    };
+    searchWorker.addEventListener("message", handler);
+    try {
+      searchWorker.postMessage({ type: "check", id: verseId });
+    } catch (error) {
+      searchWorker.removeEventListener("message", handler);
+      cb(true);
+    }
+  }
+
+  /**
+   * 전역 검색 실행 (Web Worker)
+   */
+  function globalSearch(query) {
+    if (!searchWorker) {
+      // 초기화 중이거나 미구성 상태
+      showGlobalResultsMessage("전역 검색을 사용할 수 없습니다.");
+      return;
+    }
+
+    // 모바일 검색 시트가 열려있으면 모바일 모드로 설정
+    const mobileSheet = document.getElementById("mobile-search-sheet");
+    if (mobileSheet && mobileSheet.style.display !== "none") {
+      useMobileResults = true;
+    }
+
+    if (useMobileResults) {
+      // 바텀시트 높이에 맞춰 페이지 크기 산정
+      try {
+        const newSize = getMobilePageSize();
+        if (newSize && newSize !== pagination.pageSize) {
+          pagination.pageSize = newSize;
+        }
+      } catch (error) {
+        // 모바일 페이지 크기 계산 실패 시 무시
+      }
+      // 모바일: 패널 생성/표시는 생략, 바텀시트 컨테이너에 렌더
+      renderGlobalResults(query, null);
+    } else {
+      createResultsPanel();
+      showResultsPanel();
+      renderGlobalResults(query, null); // 로딩 상태
+    }
+
+    const trimmed = query.trim();
+    if (!trimmed) return;
+
+    pagination.q = trimmed;
+    pagination.page = 1;
+
+    if (!isWorkerReady) {
+      pendingQueries.push(trimmed);
+      saveSearchState();
+      return;
+    }
+    try {
+      postQuery(trimmed, pagination.page);
+      saveSearchState();
+    } catch (error) {
+      // 검색 요청 실패 시 사용자 메시지 표시
+      showGlobalResultsMessage("검색 요청 중 오류가 발생했습니다.");
+    }
+  }
+
+  /**
+   * 워커에 검색 쿼리 전송 (새 순번 부여)
+   * delay > 0이면 그 사이 들어온 요청과 병합해 마지막 것만 보낸다.
+   */
+  function postQuery(q, page, delay = 0) {
+    if (queryTimer) {
+      clearTimeout(queryTimer);
+      queryTimer = null;
+    }
+    const send = () => {
+      queryTimer = null;
+      querySeq += 1;
+      searchWorker.postMessage({
+        type: "query",
+        q,
+        limit: pagination.pageSize,
+        page,
+        seq: querySeq,
+      });
+    };
+    if (delay > 0) {
+      queryTimer = setTimeout(() => {
+        try {
+          send();
+        } catch (error) {
+          showGlobalResultsMessage("검색 요청 중 오류가 발생했습니다.");
+        }
+      }, delay);
+      return;
+    }
+    send();
+  }
+
+  /**
+   * 입력 중 검색(BIBLE_SEARCH_CONFIG.liveSearch): 타이핑이 멈추면 전역 검색 실행
+   */
+  function handleLiveSearchInput() {
+    if (liveSearchTimer) clearTimeout(liveSearchTimer);
+    liveSearchTimer = setTimeout(() => {
+      liveSearchTimer = null;
+      const query = searchInput.value.trim();
+      // 절 참조("창세 1:1")는 제출 시에만 처리
+      if (
+        query.length < LIVE_SEARCH_MIN_LENGTH ||
+        /^(.+?)\s+(\d+):(\d+)$/.test(query) ||
+        query === pagination.q
+      ) {
+        return;
+      }
+      lastClickedItem = null;
+      globalSearch(query);
+      saveSearchState();
+    }, LIVE_SEARCH_DEBOUNCE_MS);
+  }
+
+  function navigatePage(delta) {
+    if (!searchWorker || !isWorkerReady || !pagination.q) return;
+    const next = Math.max(1, pagination.page + delta);
+    pagination.page = next;
+    try {
+      postQuery(pagination.q, pagination.page, QUERY_DEBOUNCE_MS);
+      saveSearchState();
+    } catch (error) {
+      // 페이지 이동 실패 시 무시
+    }
+  }
+
+  function showGlobalResultsMessage(message) {
+    // 모바일 검색 시트가 열려있으면 모바일 모드로 강제 설정
+    const mobileSheet = document.getElementById("mobile-search-sheet");
+    if (mobileSheet && mobileSheet.style.display !== "none") {
+      useMobileResults = true;
+    }
+
+    if (useMobileResults && mobileResultsContainer) {
+      getVirtualList(mobileResultsContainer).reset();
+      const p = document.createElement("p");
+      p.textContent = message || "검색 결과가 없습니다.";
+      Object.assign(p.style, {
+        color: "#666",
+        margin: "8px 4px",
+        textAlign: "center",
+        fontSize: "14px",
+        padding: "20px 0",
+        display: "block", // 명시적으로 표시
+        visibility: "visible", // 가시성 보장
+        opacity: "1", // 투명도 보장
+        position: "static", // 위치 보장
+        zIndex: "1", // 레이어 순서 보장
+      });
+      mobileResultsContainer.appendChild(p);
+      updatePageInfo(0, 0, 0);
+    } else {
+      createResultsPanel();
+      const list = resultsPanel.querySelector(".search-results-list");
+      if (!list) return;
+      getVirtualList(list).reset();
+      const p = document.createElement("p");
+      p.textContent = message || "검색 결과가 없습니다.";
+      Object.assign(p.style, { color: "#666", margin: "8px 4px" });
+      list.appendChild(p);
+      updatePageInfo(0, 0, 0);
+      showResultsPanel();
+    }
+  }
+
+  function renderGlobalResults(
+    query,
+    results,
+    page = 1,
+    total = 0,
+    pageSize = 50
+  ) {
+    // 모바일 검색 시트가 열려있으면 모바일 모드로 강제 설정
+    const mobileSheet = document.getElementById("mobile-search-sheet");
+    if (mobileSheet && mobileSheet.style.display !== "none") {
+      useMobileResults = true;
+      // 디버그 로깅 제거
+    }
+
+    let list;
+    if (useMobileResults && mobileResultsContainer) {
+      list = mobileResultsContainer;
+      // 디버그 로깅 제거
+    } else {
+      createResultsPanel();
+      list = resultsPanel.querySelector(".search-results-list");
+      if (!list) return;
+      // 디버그 로깅 제거
+    }
+    // 목록 비우기는 가상 목록을 거친다 (행 요소/뷰포트는 유지하고 안내 문구만 지움)
+    getVirtualList(list).reset();
+
+    if (results === null) {
+      const loading = document.createElement("p");
+      loading.textContent = `"${query}" 검색 중…`;
+      Object.assign(loading.style, {
+        color: "#666",
+        margin: "8px 4px 0px 4px", // 하단 여백 제거
+      });
+      list.appendChild(loading);
+      return;
+    }
+
+    if (!Array.isArray(results) || results.length === 0) {
+      // 이전 로딩 메시지 제거
+      const existingLoading = list.querySelector("p");
+      if (existingLoading && existingLoading.textContent.includes("검색 중")) {
+        existingLoading.remove();
+      }
+
+      const empty = document.createElement("p");
+      if (useMobileResults && mobileResultsContainer) {
+        empty.textContent = "검색 결과가 없습니다.";
+        Object.assign(empty.style, {
+          color: "#666",
+          margin: "8px 4px",
+          textAlign: "center",
+          fontSize: "14px",
+          padding: "20px 0",
+          display: "block", // 명시적으로 표시
+          visibility: "visible", // 가시성 보장
+          opacity: "1", // 투명도 보장
+          position: "static", // 위치 보장
+          zIndex: "1", // 레이어 순서 보장
+        });
+      } else {
+        empty.textContent = `"${query}" 결과가 없습니다.`;
+        Object.assign(empty.style, {
+          color: "#666",
+          margin: "8px 4px 0px 4px", // 하단 여백 제거
+        });
+      }
+      list.appendChild(empty);
+      // 디버그 상세 로깅 제거
+
+      updatePageInfo(0, 0, 0);
+      // 전역/로컬 모두 실패한 경우에만 에러 토스트 표시
+      if (query === lastQueryText && !lastLocalFound) {
+        showMessage(`"${query}"를 찾을 수 없습니다.`, "error");
+      }
+      return;
+    }
+
+    // 보이는 행만 렌더하는 가상 목록 (행 요소 재사용, 클릭은 컨테이너에서 위임)
+    getVirtualList(list).setItems(results, query);
+
+    updatePageInfo(page, pageSize, total);
+  }
+
+  const RESULT_ROW_ESTIMATE = 52; // 측정 전 결과 행 높이 추정치(px)
+  const RESULT_OVERSCAN = 6; // 화면 위/아래로 미리 렌더할 행 수
+
+  /**
+   * 검색 결과 가상 목록
+   * - 스크롤 영역에 보이는 행(+여유분)만 DOM에 두고, 스크롤 시 같은 행 요소에 내용만 바꿔 재사용
+   * - 행 높이는 렌더 후 측정해 기억하고, 화면 밖 구간은 위/아래 패딩으로 대신한다
+   * - 클릭은 목록 컨테이너 한 곳에서 위임 처리 (행별 리스너 없음, hover는 CSS)
+   * - 뷰포트는 목록에 한 번만 붙이고, 목록 비우기는 reset()으로만 한다 (안내 문구는 뷰포트 뒤에 붙음)
+   */
+  function getVirtualList(list) {
+    if (list._virtualList) return list._virtualList;
+
+    const viewport = document.createElement("div");
+    viewport.className = "search-results-viewport";
+    list.appendChild(viewport);
+    // 데스크탑은 목록 자체가, 모바일은 바텀시트 본문이 스크롤된다
+    const scroller =
+      list === mobileResultsContainer && mobileResultsBody
+        ? mobileResultsBody
+        : list;
+    const rows = []; // 재사용하는 행 요소 (화면 순서)
+    const state = { items: [], query: "", heights: [] };
+    let frame = 0;
+
+    const heightOf = (index) => state.heights[index] || RESULT_ROW_ESTIMATE;
+
+    function createRow() {
+      const a = document.createElement("a");
+      a.className = "search-result-item";
+      const text = document.createElement("span");
+      text.className = "search-result-text";
+      const ref = document.createElement("span");
+      ref.className = "search-result-ref";
+      a.appendChild(text);
+      a.appendChild(ref);
+      return a;
+    }
+
+    function fillRow(a, item, index) {
+      const href = item.h || item.href;
+      const id = item.i || item.id;
+      // 셸 출력 모드면 장 HTML 링크를 셸 주소로 변환
+      a.href = resolveChapterHref(href);
+      a.title = id;
+      a.dataset.index = String(index);
+      a.firstChild.innerHTML = highlightSnippet(
+        item.t || item.text || "",
+        state.query
+      );
+
+      // 레퍼런스(책 장:절) 표시
+      const bookAbbr = item.b || (id || "").split("-")[0] || "";
+      let chap = item.c;
+      let ver = item.v;
+      if (chap == null || ver == null) {
+        const parts = String(id || "").split("-");
+        if (parts.length >= 3) {
+          chap = chap == null ? parseInt(parts[1], 10) : chap;
+          ver = ver == null ? parseInt(parts[2], 10) : ver;
+        }
+      }
+      a.lastChild.textContent =
+        bookAbbr && chap && ver ? ` — ${bookAbbr} ${chap}:${ver}` : "";
+
+      // 마지막으로 클릭한 항목 하이라이트
+      const isLastClicked =
+        !!lastClickedItem &&
+        lastClickedItem.href === href &&
+        lastClickedItem.id === id;
+      a.classList.toggle("is-last-clicked", isLastClicked);
+    }
+
+    function render() {
+      frame = 0;
+      const n = state.items.length;
+      // 목록 시작점 기준 스크롤 위치 (모바일은 바깥 스크롤러 안에서 목록의 위치를 뺀다)
+      const top = Math.max(
+        0,
+        scroller.scrollTop - (scroller === list ? 0 : list.offsetTop)
+      );
+      const bottom = top + (scroller.clientHeight || window.innerHeight);
+
+      let start = 0;
+      let y = 0;
+      while (start < n && y + heightOf(start) <= top) {
+        y += heightOf(start);
+        start += 1;
+      }
+      let end = start;
+      while (end < n && y < bottom) {
+        y += heightOf(end);
+        end += 1;
+      }
+      start = Math.max(0, start - RESULT_OVERSCAN);
+      end = Math.min(n, end + RESULT_OVERSCAN);
+
+      let padTop = 0;
+      for (let k = 0; k < start; k += 1) padTop += heightOf(k);
+
+      const count = end - start;
+      for (let k = 0; k < count; k += 1) {
+        if (!rows[k]) rows.push(createRow());
+        fillRow(rows[k], state.items[start + k], start + k);
+        if (rows[k].parentNode !== viewport) viewport.appendChild(rows[k]);
+      }
+      for (let k = count; k < rows.length; k += 1) {
+        if (rows[k].parentNode) rows[k].remove();
+      }
+      viewport.style.paddingTop = `${padTop}px`;
+
+      // 실제 높이 측정 후 아래쪽 패딩 계산 (위쪽은 측정 대상이 아니므로 그대로)
+      for (let k = 0; k < count; k += 1) {
+        const h = rows[k].offsetHeight;
+        if (h) state.heights[start + k] = h;
+      }
+      let padBottom = 0;
+      for (let k = end; k < n; k += 1) padBottom += heightOf(k);
+      viewport.style.paddingBottom = `${padBottom}px`;
+    }
+
+    function scheduleRender() {
+      if (!frame) frame = requestAnimationFrame(render);
+    }
+
+    scroller.addEventListener("scroll", scheduleRender, { passive: true });
+    window.addEventListener("resize", () => {
+      state.heights = [];
+      scheduleRender();
+    });
+    list.addEventListener("click", (e) => {
+      const a =
+        e.target && e.target.closest
+          ? e.target.closest("a.search-result-item")
+          : null;
+      if (!a || !viewport.contains(a)) return;
+      const item = state.items[Number(a.dataset.index)];
+      if (item) handleResultClick(e, a, item);
+    });
+
+    list._virtualList = {
+      setItems(items, query) {
+        this.reset();
+        state.items = items;
+        state.query = query;
+        render();
+      },
+      // 행과 안내 문구(로딩/결과 없음)를 모두 지운다. 행 요소는 다음 렌더에 재사용
+      reset() {
+        if (frame) cancelAnimationFrame(frame);
+        frame = 0;
+        state.items = [];
+        state.query = "";
+        state.heights = [];
+        rows.forEach((row) => row.parentNode && row.remove());
+        viewport.style.paddingTop = "0px";
+        viewport.style.paddingBottom = "0px";
+        Array.from(list.childNodes).forEach((node) => {
+          if (node !== viewport) node.remove();
+        });
+      },
+    };
+    return list._virtualList;
+  }
+
+  /**
+   * 검색 결과 항목 클릭 처리 (가상 목록에서 위임 호출)
+   */
+  function handleResultClick(e, a, item) {
+    // 클릭한 항목 정보 저장 (페이지 이동 전에 먼저 저장)
+    lastClickedItem = {
+      href: item.h || item.href,
+      id: item.i || item.id,
+      text: item.t || item.text || "",
+    };
+    saveSearchState(); // 즉시 상태 저장
+
+    const href = a.href;
+    const currentUrl = window.location.href.split("#")[0];
+    const linkUrl = href.split("#")[0];
+
+    // 셸 출력 모드는 다른 장으로 가도 페이지가 바뀌지 않으므로 모바일 시트를 먼저 닫는다
+    if (core.isShell()) {
+      const sheet = document.getElementById("mobile-search-sheet");
+      if (sheet && sheet.style.display !== "none") {
+        closeMobileSearchSheet();
+      }
+    }
+
+    // 같은 페이지 내의 해시 링크인 경우에만 커스텀 처리
+    if (currentUrl === linkUrl && href.includes("#")) {
+      e.preventDefault(); // 이 경우에만 기본 동작 방지
+
+      // 모바일 바텀시트가 열려있으면 먼저 닫기
+      const mobileSheet = document.getElementById("mobile-search-sheet");
+      if (mobileSheet && mobileSheet.style.display !== "none") {
+        closeMobileSearchSheet();
+      }
+
+      const verseId = href.split("#")[1];
+      if (verseId) {
+        // 안전한 URL 디코딩으로 실제 절 ID 얻기
+        const decodedVerseId = safeDecodeVerseId(verseId);
+        // 우리의 highlightVerse 함수 사용 (고정 헤더 오프셋 포함)
+        const success = highlightVerse(decodedVerseId);
+        if (success) {
+          // URL 해시 업데이트 (디코딩된 ID 사용)
+          history.replaceState(null, null, `#${decodedVerseId}`);
+        }
+      }
+    }
+    // 다른 페이지로의 링크는 기본 동작 허용
+  }
+
+  // 패널 표시/숨김 공통 처리 (토글 버튼 접근성 상태 포함)
+  function showResultsPanel() {
+    createResultsPanel();
+    if (resultsPanel) {
+      resultsPanel.style.display = "block";
+    }
+    if (resultsToggleBtn) {
+      resultsToggleBtn.setAttribute("aria-expanded", "true");
+      resultsToggleBtn.setAttribute("aria-label", "검색 결과 패널 닫기");
+    }
+  }
+
+  function hideResultsPanel() {
+    if (resultsPanel) {
+      resultsPanel.style.display = "none";
+    }
+    if (resultsToggleBtn) {
+      resultsToggleBtn.setAttribute("aria-expanded", "false");
+      resultsToggleBtn.setAttribute("aria-label", "검색 결과 패널 열기");
+    }
+  }
+
+  function updatePageInfo(page, pageSize, total) {
+    const pageInfo =
+      resultsPanel && resultsPanel.querySelector(".search-page-info");
+    const prevBtn =
+      resultsPanel && resultsPanel.querySelector(".search-page-prev");
+    const nextBtn =
+      resultsPanel && resultsPanel.querySelector(".search-page-next");
+    if (!pageInfo) return;
+    const totalPages =
+      pageSize > 0 ? Math.max(1, Math.ceil(total / pageSize)) : 1;
+    if (totalPending && total > 0) {
+      // 집계 중: 다음 페이지가 있을 수 있으므로 다음 버튼은 열어 둔다
+      pageInfo.textContent = `${page}/… (${total}건 이상)`;
+    } else {
+      pageInfo.textContent =
+        total > 0 ? `${page}/${totalPages} (총 ${total}건)` : "";
+    }
+    const hasNext = total > 0 && (totalPending || page < totalPages);
+    // 버튼 활성/비활성
+    if (prevBtn) prevBtn.disabled = !(total > 0 && page > 1);
+    if (nextBtn) nextBtn.disabled = !hasNext;
+    pagination.page = page || 1;
+    pagination.pageSize = pageSize || 50;
+    // 검색어가 없거나 total=0이면 상태 저장 지움
+    if (!pagination.q || !(total > 0)) {
+      try {
+        sessionStorage.removeItem(SEARCH_STATE_KEY);
+      } catch (error) {
+        // 상태 저장 지우기 실패 시 무시
+      }
+    } else {
+      saveSearchState();
+    }
+
+    // 모바일 바텀시트 푸터 동기화
+    const mPrev = document.getElementById("mobile-search-prev");
+    const mInfo = document.getElementById("mobile-search-info");
+    const mNext = document.getElementById("mobile-search-next");
+    if (mInfo)
+      mInfo.textContent =
+        total > 0 ? `${page}/${totalPending ? "…" : totalPages}` : "";
+    if (mPrev) mPrev.disabled = !(total > 0 && page > 1);
+    if (mNext) mNext.disabled = !hasNext;
+
+    // 모바일 페이지 번호 렌더링
+    lastTotalResults = total || 0;
+  }
+
+  function getMobilePageSize() {
+    // 바텀시트의 높이를 고려해서 검색 결과 영역에 표시할 수 있는 항목 수 계산
+    try {
+      const sheet = document.getElementById("mobile-search-sheet");
+      if (!sheet) return pagination.pageSize;
+
+      // 바텀시트 전체 높이 (65vh)
+      const sheetHeight = sheet.clientHeight || 0;
+
+      // 검색 행 높이 (44px + 여백 10px)
+      const searchRowHeight = 54;
+
+      // 페이지네이션 네비게이션 높이 (44px + 여백 8px)
+      const paginationHeight = 52;
+
+      // 검색 결과 영역에 사용 가능한 높이
+      const availableHeight = sheetHeight - searchRowHeight - paginationHeight;
+
+      // 각 검색 결과 항목의 높이 (대략 68px/항목: 링크 2줄 + 여백)
+      const perItemHeight = 68;
+
+      // 표시 가능한 항목 수 (최소 4개)
+      const items = Math.max(4, Math.floor(availableHeight / perItemHeight));
+
+      return items;
+    } catch (error) {
+      return pagination.pageSize;
+    }
+  }
+
+  function gotoPage(targetPage) {
+    if (!searchWorker || !isWorkerReady || !pagination.q) return;
+    const totalPages =
+      pagination.pageSize > 0
+        ? Math.max(1, Math.ceil((lastTotalResults || 0) / pagination.pageSize))
+        : 1;
+    const next = Math.min(Math.max(1, targetPage), totalPages);
+    pagination.page = next;
+    try {
+      postQuery(pagination.q, pagination.page, QUERY_DEBOUNCE_MS);
+      saveSearchState();
+    } catch (error) {
+      // 페이지 이동 실패 시 무시
+    }
+  }
+
+  function highlightSnippet(text, query) {
+    const q = escapeRegExp(query);
+    const regex = new RegExp(`(${q})`, "gi");
+    // 주변 40자 스니펫
+    const idx = text.toLowerCase().indexOf(query.toLowerCase());
+    if (idx >= 0) {
+      const start = Math.max(0, idx - 40);
+      const end = Math.min(text.length, idx + query.length + 40);
+      const slice =
+        (start > 0 ? "…" : "") +
+        text.slice(start, end) +
+        (end < text.length ? "…" : "");
+      return slice.replace(regex, '<span class="text-highlight">$1</span>');
+    }
+    return text.replace(regex, '<span class="text-highlight">$1</span>');
+  }
+
+  // 브라우저 뒤/앞 이동 시 상태 복구
+  window.addEventListener("popstate", () => {
+    restoreSearchState();
+  });
+
+  core.registerSearch({
+    handleSearch,
+    handleEscape,
+    openMobileSearchSheet,
+    toggleResultsPanel,
+    requestChapters,
+  });
+
+  // 입력 중 검색(liveSearch)은 모듈 로드 후부터 동작 (로드는 검색창 첫 포커스에서 시작)
+  if ((core.config() || {}).liveSearch && searchInput) {
+    searchInput.addEventListener("input", handleLiveSearchInput);
+  }
+
+  // 워커 기동 및 결과 패널 준비
+  initializeGlobalSearch();
+})();
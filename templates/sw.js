@@ -0,0 +1,193 @@
+/**
+ * 공동번역성서 서비스 워커 (src/pwa_builder.py가 생성)
+ *
+ * - 설치: 버전별 프리캐시 매니페스트(파일 → 내용 해시)의 파일을 미리 캐시한다.
+ *   이전 버전 캐시에 같은 해시로 저장된 파일은 네트워크 대신 그대로 옮긴다.
+ * - 장 페이지(HTML) 및 셸 모드 장 JSON(chapters/*.json): stale-while-revalidate
+ *   (캐시로 즉시 응답, 백그라운드 갱신)
+ * - 해시 파일명 자원(name.3f9a1c2b.js) 및 프리캐시 자원: cache-first
+ * - ?v=<해시>가 붙은 자원(검색 인덱스): 같은 URL 캐시 → 네트워크 → (오프라인) 프리캐시 사본
+ * - 그 밖의 요청은 네트워크로 그대로 보낸다.
+ */
+const VERSION = "__PRECACHE_VERSION__";
+const MANIFEST_URL = "__PRECACHE_MANIFEST_URL__";
+
+const PRECACHE_PREFIX = "bible-precache-";
+const PRECACHE = PRECACHE_PREFIX + VERSION;
+// 런타임 캐시는 버전과 무관하게 유지 (페이지는 SWR로 스스로 갱신, 해시 자원은 이름이 곧 버전)
+const PAGE_CACHE = "bible-pages";
+const ASSET_CACHE = "bible-assets";
+const HASH_HEADER = "X-Precache-Hash";
+// 요청한 버전 대신 프리캐시 사본으로 응답했음을 알리는 헤더 (search-worker.js가 확인)
+const FALLBACK_HEADER = "X-Precache-Fallback";
+const HASHED_ASSET_RE = /\.[0-9a-f]{8}\.(?:js|css)$/;
+const CHAPTER_JSON_RE = /\/chapters\/[^/]+-\d+\.json$/;
+const PRECACHE_CONCURRENCY = 6;
+
+self.addEventListener("install", (event) => {
+  event.waitUntil(precache().then(() => self.skipWaiting()));
+});
+
+self.addEventListener("activate", (event) => {
+  event.waitUntil(
+    caches
+      .keys()
+      .then((keys) =>
+        Promise.all(
+          keys
+            .filter((key) => key.startsWith(PRECACHE_PREFIX) && key !== PRECACHE)
+            .map((key) => caches.delete(key))
+        )
+      )
+      .then(() => self.clients.claim())
+  );
+});
+
+self.addEventListener("fetch", (event) => {
+  const request = event.request;
+  if (request.method !== "GET") return;
+  const url = new URL(request.url);
+  if (url.origin !== self.location.origin) return;
+
+  if (
+    request.mode === "navigate" ||
+    /\.html?$/.test(url.pathname) ||
+    CHAPTER_JSON_RE.test(url.pathname)
+  ) {
+    event.respondWith(staleWhileRevalidate(event, request));
+    return;
+  }
+  if (HASHED_ASSET_RE.test(url.pathname)) {
+    event.respondWith(cacheFirst(request, ASSET_CACHE));
+    return;
+  }
+  if (url.searchParams.has("v")) {
+    event.respondWith(versionedResource(request));
+    return;
+  }
+  // 프리캐시된 자원은 캐시 우선, 없으면 네트워크
+  event.respondWith(
+    caches
+      .open(PRECACHE)
+      .then((cache) => cache.match(request))
+      .then((cached) => cached || fetch(request))
+  );
+});
+
+/**
+ * ?v=<내용 해시>로 요청하는 자원(검색 인덱스): 정확히 같은 URL이 캐시에 있으면 그대로,
+ * 없으면 네트워크 우선. 프리캐시는 쿼리 없는 경로로 저장되어 있어 버전이 다를 수 있으므로
+ * 오프라인일 때만 대체하고, 받은 쪽이 새 해시 키로 저장하지 않도록 표시 헤더를 붙인다.
+ */
+async function versionedResource(request) {
+  const cache = await caches.open(PRECACHE);
+  const exact = await cache.match(request);
+  if (exact) return exact;
+  try {
+    return await fetch(request);
+  } catch (err) {
+    const stale = await cache.match(request, { ignoreSearch: true });
+    if (!stale) throw err;
+    const headers = new Headers(stale.headers);
+    headers.set(FALLBACK_HEADER, "1");
+    return new Response(await stale.blob(), {
+      status: stale.status,
+      statusText: stale.statusText,
+      headers,
+    });
+  }
+}
+
+/**
+ * 매니페스트의 파일을 현재 버전 캐시에 채운다.
+ * 이전 버전 캐시에 같은 해시로 저장된 응답이 있으면 재사용한다.
+ */
+async function precache() {
+  const res = await fetch(MANIFEST_URL, { cache: "no-cache" });
+  if (!res.ok) throw new Error("precache manifest HTTP " + res.status);
+  const manifest = await res.json();
+  const cache = await caches.open(PRECACHE);
+  const previous = [];
+  for (const key of await caches.keys()) {
+    if (key.startsWith(PRECACHE_PREFIX) && key !== PRECACHE) {
+      previous.push(await caches.open(key));
+    }
+  }
+
+  const entries = Object.entries(manifest.files || {});
+  let next = 0;
+  async function worker() {
+    while (next < entries.length) {
+      const [path, hash] = entries[next++];
+      const url = new URL(path, self.registration.scope).href;
+      let reused = null;
+      for (const old of previous) {
+        const hit = await old.match(url);
+        if (hit && hit.headers.get(HASH_HEADER) === hash) {
+          reused = hit;
+          break;
+        }
+      }
+      if (reused) {
+        await cache.put(url, reused);
+        continue;
+      }
+      // HTTP 캐시를 건너뛰어 매니페스트 해시와 같은 내용을 받는다
+      const fresh = await fetch(url, { cache: "reload" });
+      if (!fresh.ok) throw new Error("precache " + path + " HTTP " + fresh.status);
+      await cache.put(url, await withHashHeader(fresh, hash));
+    }
+  }
+  await Promise.all(
+    Array.from({ length: Math.min(PRECACHE_CONCURRENCY, entries.length) }, worker)
+  );
+}
+
+async function withHashHeader(response, hash) {
+  const headers = new Headers(response.headers);
+  headers.set(HASH_HEADER, hash);
+  return new Response(await response.blob(), {
+    status: response.status,
+    statusText: response.statusText,
+    headers,
+  });
+}
+
+async function cacheFirst(request, cacheName) {
+  const cached = await caches.match(request);
+  if (cached) return cached;
+  const response = await fetch(request);
+  if (response.ok) {
+    const cache = await caches.open(cacheName);
+    await cache.put(request, response.clone());
+  }
+  return response;
+}
+
+async function staleWhileRevalidate(event, request) {
+  const pageCache = await caches.open(PAGE_CACHE);
+  // 페이지 이동은 ?q= 같은 쿼리와 무관하게 같은 문서, 그 밖의 요청은 URL이 정확히 같아야 한다
+  const matchOptions = { ignoreSearch: request.mode === "navigate" };
+  const cached =
+    (await pageCache.match(request, matchOptions)) ||
+    (await caches.match(request, matchOptions));
+  const network = fetch(request)
+    .then((response) => {
+      if (response.ok) {
+        return pageCache.put(request, response.clone()).then(() => response);
+      }
+      return response;
+    })
+    .catch(() => null);
+
+  if (cached) {
+    // 백그라운드 갱신이 끝날 때까지 워커를 유지
+    event.waitUntil(network);
+    return cached;
+  }
+  const response = await network;
+  if (response) return response;
+  // 오프라인이고 캐시에도 없으면 목차로 대체
+  const fallback = await caches.match(new URL("index.html", self.registration.scope).href);
+  return fallback || Response.error();
+}
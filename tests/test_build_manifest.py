@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+빌드 매니페스트 모듈 테스트
+"""
+
+import unittest
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+# 프로젝트 루트 경로 추가
+PROJECT_ROOT = Path(__file__).parent.parent.absolute()
+sys.path.append(str(PROJECT_ROOT))
+
+from src.build_manifest import (
+    MANIFEST_NAME, build_manifest, diff_manifests, load_manifest,
+    manifest_from_entries, previous_manifest_path, rotate_and_write,
+)
+from src.output_sink import DirectorySink
+
+
+def _manifest(**files):
+    return {"version": 1, "files": {k: {"sha256": v, "size": 1} for k, v in files.items()}}
+
+
+class TestBuildManifest(unittest.TestCase):
+    """빌드 매니페스트 테스트 클래스"""
+
+    def setUp(self):
+        """테스트 준비"""
+        self._tmp = tempfile.TemporaryDirectory()
+        self.site_dir = self._tmp.name
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def _write(self, rel_path, text):
+        path = os.path.join(self.site_dir, *rel_path.split('/'))
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(text)
+
+    def test_diff_manifests(self):
+        """추가/변경/삭제 경로 계산"""
+        old = _manifest(**{'a.html': '1', 'b.html': '2', 'c.html': '3'})
+        new = _manifest(**{'a.html': '1', 'b.html': '9', 'd.html': '4'})
+        self.assertEqual(diff_manifests(old, new),
+                         {"added": ['d.html'], "changed": ['b.html'], "removed": ['c.html']})
+
+    def test_build_manifest_skips_hidden(self):
+        """점 파일(매니페스트 자신 등)은 제외, 경로는 '/' 구분"""
+        self._write('index.html', 'x')
+        self._write('static/app.js', 'y')
+        self._write(MANIFEST_NAME, '{}')
+        manifest = build_manifest(self.site_dir)
+        self.assertEqual(list(manifest["files"]), ['index.html', 'static/app.js'])
+        self.assertEqual(manifest["files"]['index.html']["size"], 1)
+
+    def test_manifest_from_entries(self):
+        """아카이브 항목 기록으로 구성 (숨김 경로 제외)"""
+        manifest = manifest_from_entries({'b.html': ('h2', 2), 'a.html': ('h1', 1), '.x': ('h', 0)})
+        self.assertEqual(list(manifest["files"]), ['a.html', 'b.html'])
+
+    def test_sink_entries_report_removed_files(self):
+        """디렉터리 출력은 싱크 항목으로 구성하므로 이번 빌드가 내보내지 않은 파일은 삭제로 나옴"""
+        first = DirectorySink(self.site_dir)
+        first.write_text('a.html', 'a')
+        first.write_text('b.html', 'b')
+        first.commit()
+        second = DirectorySink(self.site_dir)
+        second.keep('a.html')
+        second.write_text('c.html', 'c')
+        second.commit()
+        # b.html은 디스크에 남아 있지만 이번 출력이 아님
+        self.assertTrue(os.path.exists(os.path.join(self.site_dir, 'b.html')))
+        delta = diff_manifests(manifest_from_entries(first.entries), manifest_from_entries(second.entries))
+        self.assertEqual(delta, {"added": ['c.html'], "changed": [], "removed": ['b.html']})
+
+    def test_rotate_and_write(self):
+        """기존 매니페스트는 *.prev.json으로 보관하고 차이를 반환"""
+        path = os.path.join(self.site_dir, MANIFEST_NAME)
+        self.assertIsNone(rotate_and_write(path, _manifest(**{'a.html': '1'})))
+        delta = rotate_and_write(path, _manifest(**{'a.html': '2'}))
+        self.assertEqual(delta["changed"], ['a.html'])
+        self.assertEqual(load_manifest(previous_manifest_path(path))["files"]['a.html']["sha256"], '1')
+        self.assertEqual(load_manifest(path)["files"]['a.html']["sha256"], '2')
+
+    def test_missing_manifest_is_empty(self):
+        """없는 매니페스트는 빈 매니페스트 (모든 파일이 추가로 보임)"""
+        self.assertEqual(load_manifest(os.path.join(self.site_dir, 'none.json'))["files"], {})
+
+
+if __name__ == '__main__':
+    unittest.main()
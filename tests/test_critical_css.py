@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+크리티컬 CSS 추출 모듈 테스트
+"""
+
+import unittest
+import os
+import sys
+from pathlib import Path
+
+# 프로젝트 루트 경로 추가
+PROJECT_ROOT = Path(__file__).parent.parent.absolute()
+sys.path.append(str(PROJECT_ROOT))
+
+from src.critical_css import above_the_fold_markup, collect_layout_tokens, extract_critical_css
+
+
+LAYOUT = '<body><main id="content" class="chapter wide"><h1 class="title">창세기</h1></main></body>'
+
+
+class TestCriticalCSS(unittest.TestCase):
+    """크리티컬 CSS 테스트 클래스"""
+
+    def test_collect_layout_tokens(self):
+        """태그/클래스/ID 토큰 수집"""
+        tokens = collect_layout_tokens(LAYOUT)
+        self.assertTrue({'body', 'main', 'h1', '.chapter', '.wide', '.title', '#content'} <= tokens)
+
+    def test_keeps_only_layout_rules(self):
+        """레이아웃에 있는 선택자만, 원래 순서대로"""
+        css = ('/* 주석 */ .title { color: red; }\n'
+               '.search-results { display: none; }\n'
+               'main.chapter, .modal { margin: 0 auto; }\n'
+               '#content h1 { font-size: 2em; }')
+        self.assertEqual(extract_critical_css(css, LAYOUT),
+                         '.title{color: red;}main.chapter{margin: 0 auto;}#content h1{font-size: 2em;}')
+
+    def test_skips_interaction_and_print(self):
+        """상호작용 상태와 인쇄 전용 미디어 규칙은 제외"""
+        css = ('.title:hover { color: blue; }\n'
+               '@media print { .title { color: black; } }\n'
+               '@media (max-width: 600px) { .title { font-size: 1em; } }')
+        self.assertEqual(extract_critical_css(css, LAYOUT),
+                         '@media (max-width: 600px){.title{font-size: 1em;}}')
+
+    def test_above_the_fold_markup(self):
+        """head와 본문 뒤 스크립트 자리는 레이아웃에서 제외"""
+        template = ('<html><head><link class="x"></head><body><header class="fixed-header"></header>'
+                    '${verses_content}<div class="search-results-panel"></div>${js_script_tag}</body></html>')
+        markup = above_the_fold_markup(template)
+        self.assertIn('fixed-header', markup)
+        self.assertIn('scripture-paragraph', markup)
+        self.assertNotIn('search-results-panel', markup)
+        self.assertNotIn('<head>', markup)
+
+    def test_shipped_stylesheet_excludes_search_ui(self):
+        """배포 템플릿/스타일시트: 검색 결과 패널·바텀시트·페이지 이동 규칙은 빠지고 첫 화면 규칙만 남음"""
+        template_path = os.path.join(PROJECT_ROOT, 'templates', 'chapter.html')
+        css_path = os.path.join(PROJECT_ROOT, 'static', 'verse-style.css')
+        with open(template_path, 'r', encoding='utf-8') as f:
+            template = f.read()
+        with open(css_path, 'r', encoding='utf-8') as f:
+            css = f.read()
+        critical = extract_critical_css(css, above_the_fold_markup(template))
+        for deferred in ('.search-results-panel', '.search-results-list', '.search-result-item',
+                         '.search-page-', '.search-fab', '.bible-bottomsheet'):
+            self.assertNotIn(deferred, critical)
+        for needed in ('.fixed-header', '.chapter-title-row', '.nav-btn', '.verse-number'):
+            self.assertIn(needed, critical)
+        self.assertLess(len(critical), len(css))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+파일 동기화 모듈 테스트
+"""
+
+import unittest
+import os
+import sys
+import hashlib
+import tempfile
+from pathlib import Path
+
+# 프로젝트 루트 경로 추가
+PROJECT_ROOT = Path(__file__).parent.parent.absolute()
+sys.path.append(str(PROJECT_ROOT))
+
+from src.file_sync import FileHashCache, place_file, same_metadata, sha256_of_file
+
+
+class TestFileHashCache(unittest.TestCase):
+    """파일 해시 캐시 테스트 클래스"""
+
+    def setUp(self):
+        """테스트 준비"""
+        self._tmp = tempfile.TemporaryDirectory()
+        self.tmp_dir = self._tmp.name
+        self.path = os.path.join(self.tmp_dir, 'a.bin')
+        with open(self.path, 'wb') as f:
+            f.write(b'first')
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def test_sha256_of_file(self):
+        """해시는 파일 내용의 SHA-256"""
+        self.assertEqual(sha256_of_file(self.path), hashlib.sha256(b'first').hexdigest())
+
+    def test_same_size_and_mtime_skips_rehash(self):
+        """크기/mtime이 같으면 파일을 다시 읽지 않고 기록된 해시를 사용"""
+        cache = FileHashCache()
+        first = cache.sha256(self.path)
+        st = os.stat(self.path)
+        # 같은 크기로 내용만 바꾸고 mtime을 되돌림 → 캐시된 (이전) 해시가 나와야 함
+        with open(self.path, 'wb') as f:
+            f.write(b'FIRST')
+        os.utime(self.path, ns=(st.st_atime_ns, st.st_mtime_ns))
+        self.assertEqual(cache.sha256(self.path), first)
+
+    def test_changed_mtime_rehashes(self):
+        """mtime이 바뀌면 다시 해시"""
+        cache = FileHashCache()
+        cache.sha256(self.path)
+        with open(self.path, 'wb') as f:
+            f.write(b'FIRST')
+        st = os.stat(self.path)
+        os.utime(self.path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+        self.assertEqual(cache.sha256(self.path), hashlib.sha256(b'FIRST').hexdigest())
+
+    def test_save_and_reload(self):
+        """캐시 파일에 저장한 기록을 다시 읽음 (손상된 캐시는 무시)"""
+        cache_path = os.path.join(self.tmp_dir, 'cache', 'hashes.json')
+        cache = FileHashCache(cache_path)
+        digest = cache.sha256(self.path)
+        cache.save()
+        self.assertTrue(os.path.exists(cache_path))
+        reloaded = FileHashCache(cache_path)
+        self.assertEqual(reloaded._entries[os.path.abspath(self.path)][2], digest)
+
+        with open(cache_path, 'w', encoding='utf-8') as f:
+            f.write('{broken')
+        self.assertEqual(FileHashCache(cache_path)._entries, {})
+
+
+class TestPlaceFile(unittest.TestCase):
+    """파일 배치 테스트 클래스"""
+
+    def setUp(self):
+        """테스트 준비"""
+        self._tmp = tempfile.TemporaryDirectory()
+        self.src = os.path.join(self._tmp.name, 'src.txt')
+        self.dst = os.path.join(self._tmp.name, 'dst.txt')
+        with open(self.src, 'w', encoding='utf-8') as f:
+            f.write('내용')
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def test_copy_preserves_metadata(self):
+        """복사 후에는 크기/mtime이 같아 같은 파일로 판정"""
+        self.assertFalse(same_metadata(self.src, self.dst))
+        self.assertEqual(place_file(self.src, self.dst), "copy")
+        self.assertTrue(same_metadata(self.src, self.dst))
+
+    def test_hardlink_replaced_not_overwritten(self):
+        """하드 링크 대상에 다시 배치해도 소스 내용은 바뀌지 않음"""
+        self.assertEqual(place_file(self.src, self.dst, "hardlink"), "hardlink")
+        other = os.path.join(self._tmp.name, 'other.txt')
+        with open(other, 'w', encoding='utf-8') as f:
+            f.write('다른 내용')
+        place_file(other, self.dst)
+        with open(self.src, 'r', encoding='utf-8') as f:
+            self.assertEqual(f.read(), '내용')
+
+
+if __name__ == '__main__':
+    unittest.main()
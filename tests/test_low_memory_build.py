@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+저메모리 생성(--low-memory) 테스트
+"""
+
+import unittest
+import os
+import sys
+import json
+import filecmp
+import subprocess
+import tempfile
+from pathlib import Path
+
+# 프로젝트 루트 경로 추가
+PROJECT_ROOT = Path(__file__).parent.parent.absolute()
+sys.path.append(str(PROJECT_ROOT))
+
+TEMPLATE_PATH = os.path.join(PROJECT_ROOT, 'templates', 'chapter.html')
+
+# 공동번역 본문 규모(약 3만 1천 절)의 20배: 책마다 18장 × 장마다 480절 (73권 기준 약 63만 절)
+CHAPTERS_PER_BOOK = 18
+VERSES_PER_CHAPTER = 480
+# 작은 CI 컨테이너에서도 돌 수 있어야 하는 최대 RSS (기본 모드는 같은 입력에서 1GB 이상)
+PEAK_RSS_LIMIT_MB = 128
+
+
+def write_book_mappings(path: str) -> list[dict]:
+    """저장소의 책 목록을 파서가 읽는 형식(약칭/전체 이름/영문 이름/구분)으로 기록"""
+    with open(os.path.join(PROJECT_ROOT, 'data', 'book_mappings.json'), 'r', encoding='utf-8') as f:
+        source = json.load(f)
+    books = []
+    for b in source:
+        books.append({
+            '약칭': b.get('약칭', b.get('abbr')),
+            '전체 이름': b.get('전체 이름', b.get('korean_name')),
+            '영문 이름': b.get('영문 이름', b.get('english_name')),
+            '구분': b.get('구분', b.get('division', '구약')),
+            'aliases': b.get('aliases', []),
+        })
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(books, f, ensure_ascii=False, indent=2)
+    return books
+
+
+def write_corpus(path: str, books: list[dict], chapters_per_book: int, verses_per_chapter: int) -> None:
+    """합성 파서 JSON을 장 단위로 기록 (parser.save_to_json과 같은 형식, 테스트 프로세스 메모리를 쓰지 않음)"""
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write('[')
+        first = True
+        for b in books:
+            for c in range(1, chapters_per_book + 1):
+                verses = [
+                    {
+                        "number": v,
+                        "text": f"{'¶ ' if v % 7 == 1 else ''}{b['약칭']} {c}장 {v}절 하느님께서 말씀하셨다 빛이 생겨라 하시자 빛이 생겨났다",
+                        "has_paragraph": v % 7 == 1,
+                    }
+                    for v in range(1, verses_per_chapter + 1)
+                ]
+                if not first:
+                    f.write(',\n')
+                first = False
+                json.dump({"book_name": b['전체 이름'], "book_abbr": b['약칭'],
+                           "chapter_number": c, "verses": verses}, f, ensure_ascii=False, indent=2)
+        f.write(']\n')
+
+
+def run_generator(work_dir: str, output_dir: str, *extra: str) -> tuple[int, int, str]:
+    """
+    생성기를 별도 프로세스로 실행
+
+    Returns:
+        (종료 코드, 최대 RSS(KB), 표준 오류)
+    """
+    args = [
+        sys.executable, '-m', 'src.html_generator', TEMPLATE_PATH, output_dir,
+        '--json', 'corpus.json', '--emit-binary-index',
+        '--no-build-manifest', '--copy-hash-cache', '', *extra,
+    ]
+    env = dict(os.environ, PYTHONPATH=str(PROJECT_ROOT))
+    with tempfile.TemporaryFile() as err:
+        proc = subprocess.Popen(args, cwd=work_dir, env=env,
+                                stdout=subprocess.DEVNULL, stderr=err)
+        # 이 자식 프로세스만의 자원 사용량 (다른 테스트의 자식 프로세스와 섞이지 않도록 wait4)
+        _, status, usage = os.wait4(proc.pid, 0)
+        proc.returncode = os.waitstatus_to_exitcode(status)
+        err.seek(0)
+        stderr = err.read().decode('utf-8', 'replace')
+    max_rss_kb = usage.ru_maxrss
+    if sys.platform == 'darwin':
+        # macOS는 바이트 단위
+        max_rss_kb //= 1024
+    return proc.returncode, max_rss_kb, stderr
+
+
+@unittest.skipUnless(hasattr(os, 'wait4'), "자식 프로세스 자원 사용량(wait4)을 지원하지 않는 플랫폼")
+class TestLowMemoryBuild(unittest.TestCase):
+    """저메모리 파이프라인 테스트 클래스"""
+
+    def setUp(self):
+        """테스트 준비"""
+        self._tmp = tempfile.TemporaryDirectory()
+        self.work_dir = self._tmp.name
+        self.books = write_book_mappings(os.path.join(self.work_dir, 'data', 'book_mappings.json'))
+
+    def tearDown(self):
+        """임시 디렉터리 정리"""
+        self._tmp.cleanup()
+
+    def test_output_matches_default_mode(self):
+        """저메모리 모드 출력이 기본 모드와 바이트 단위로 같은지 테스트"""
+        write_corpus(os.path.join(self.work_dir, 'corpus.json'), self.books[:5], 3, 12)
+        for output_dir, extra in (('default', ()), ('low', ('--low-memory',))):
+            code, _, stderr = run_generator(self.work_dir, output_dir, '--prefetch', 'link', *extra)
+            self.assertEqual(code, 0, stderr)
+
+        default_dir = os.path.join(self.work_dir, 'default')
+        low_dir = os.path.join(self.work_dir, 'low')
+        pending = ['']
+        while pending:
+            rel = pending.pop()
+            comparison = filecmp.dircmp(os.path.join(default_dir, rel), os.path.join(low_dir, rel))
+            self.assertEqual(comparison.left_only + comparison.right_only, [], rel)
+            _, mismatch, errors = filecmp.cmpfiles(
+                comparison.left, comparison.right, comparison.common_files, shallow=False)
+            self.assertEqual(mismatch + errors, [], rel)
+            pending.extend(os.path.join(rel, d) for d in comparison.common_dirs)
+
+    def test_peak_rss_bounded_for_20x_corpus(self):
+        """20배 합성 본문에서 최대 RSS가 고정 상한 이하인지 테스트"""
+        write_corpus(os.path.join(self.work_dir, 'corpus.json'), self.books,
+                     CHAPTERS_PER_BOOK, VERSES_PER_CHAPTER)
+        code, max_rss_kb, stderr = run_generator(self.work_dir, 'site', '--low-memory')
+        self.assertEqual(code, 0, stderr)
+
+        site = os.path.join(self.work_dir, 'site')
+        self.assertTrue(os.path.exists(os.path.join(site, 'index.html')))
+        self.assertTrue(os.path.exists(os.path.join(site, f'genesis-{CHAPTERS_PER_BOOK}.html')))
+        with open(os.path.join(site, 'static', 'search', 'verse-counts.json'), 'r', encoding='utf-8') as f:
+            counts = json.load(f)
+        self.assertEqual(len(counts['books']), len(self.books))
+        self.assertEqual(counts['books'][0]['c'], [VERSES_PER_CHAPTER] * CHAPTERS_PER_BOOK)
+
+        self.assertLess(
+            max_rss_kb / 1024, PEAK_RSS_LIMIT_MB,
+            f"최대 RSS {max_rss_kb / 1024:.0f}MB > {PEAK_RSS_LIMIT_MB}MB")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+출력 최소화 모듈 테스트
+"""
+
+import unittest
+import sys
+from pathlib import Path
+
+# 프로젝트 루트 경로 추가
+PROJECT_ROOT = Path(__file__).parent.parent.absolute()
+sys.path.append(str(PROJECT_ROOT))
+
+from src.minify import minify_js, minify_css, minify_html
+
+
+class TestMinifyHTML(unittest.TestCase):
+    """HTML 최소화 테스트 클래스"""
+
+    def test_quoted_attribute_values_kept(self):
+        """따옴표 안의 속성값은 공백/'>'를 그대로 유지"""
+        html = '<p   title="x />y"\n   data-a=\'q  >  r\'   >본문</p>'
+        self.assertEqual(minify_html(html), '<p title="x />y" data-a=\'q  >  r\'>본문</p>')
+
+    def test_self_closing_tags(self):
+        """자기 닫힘 태그 앞 공백 제거 (따옴표 없는 값 뒤는 유지)"""
+        self.assertEqual(minify_html('<br  />'), '<br/>')
+        self.assertEqual(minify_html('<img src="a.png" />'), '<img src="a.png"/>')
+        self.assertEqual(minify_html('<a href=x />'), '<a href=x />')
+
+    def test_pre_and_script_preserved(self):
+        """<pre> 공백과 <script> 안의 문자열은 보존"""
+        html = ('<div>\n  <pre>  a\n    b  </pre>\n</div>\n'
+                '<script>\n  var s = "a  <b>  c";\n</script>')
+        result = minify_html(html)
+        self.assertIn('<pre>  a\n    b  </pre>', result)
+        self.assertIn('"a  <b>  c"', result)
+
+    def test_comments_removed(self):
+        """HTML 주석 제거 (조건부 주석은 유지)"""
+        self.assertEqual(minify_html('<div><!-- 주석 --></div>'), '<div></div>')
+        self.assertIn('<!--[if IE]>', minify_html('<div><!--[if IE]><p>x</p><![endif]--></div>'))
+
+
+class TestMinifyJS(unittest.TestCase):
+    """JavaScript 최소화 테스트 클래스"""
+
+    def test_division_after_increment(self):
+        """후위 증감 연산자 뒤의 '/'는 나눗셈"""
+        self.assertEqual(minify_js('x = a++ / 2 / b;'), 'x=a++/2/b;')
+        self.assertEqual(minify_js('y = i-- / 2 / 1'), 'y=i--/2/1')
+
+    def test_brace_context(self):
+        """블록 뒤 '/'는 정규식, 객체 리터럴 뒤 '/'는 나눗셈"""
+        self.assertEqual(minify_js('if (a) { b() }\n/ x /.test(s)'), 'if(a){b()}\n/ x /.test(s)')
+        self.assertEqual(minify_js('var o = { a: 1 } / 2;'), 'var o={a:1}/2;')
+        self.assertEqual(minify_js('f = () => {}\n/ x /g.exec(s)'), 'f=()=>{}\n/ x /g.exec(s)')
+
+    def test_regex_literal_kept(self):
+        """정규식 리터럴 안의 공백과 '//'는 그대로 유지"""
+        self.assertEqual(minify_js("r = s.replace(/ \\/\\/ +/g, '/');"),
+                         "r=s.replace(/ \\/\\/ +/g,'/');")
+
+    def test_strings_and_comments(self):
+        """문자열 안의 주석 표기는 유지하고 실제 주석만 제거"""
+        src = 's = \'/* a */\'; // 주석\nt = "//" /* 블록 */ + 1'
+        self.assertEqual(minify_js(src), 's=\'/* a */\';t="//"+1')
+
+    def test_adjacent_plus_minus_separated(self):
+        """'+ ++'처럼 붙이면 의미가 바뀌는 연산자는 공백 유지"""
+        self.assertEqual(minify_js('a + ++b; c - --d;'), 'a+ ++b;c- --d;')
+
+
+class TestMinifyCSS(unittest.TestCase):
+    """CSS 최소화 테스트 클래스"""
+
+    def test_comments_and_strings(self):
+        """주석 제거, 문자열 보존"""
+        css = '/* 주석 */\n.a  {\n  content: "  /* x */  ";\n  color: red;\n}\n'
+        self.assertEqual(minify_css(css), '.a{content:"  /* x */  ";color:red}')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,191 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+출력 싱크 모듈 테스트
+"""
+
+import unittest
+import os
+import sys
+import hashlib
+import tarfile
+import zipfile
+import tempfile
+from pathlib import Path
+
+# 프로젝트 루트 경로 추가
+PROJECT_ROOT = Path(__file__).parent.parent.absolute()
+sys.path.append(str(PROJECT_ROOT))
+
+from src.output_sink import ArchiveSink, DirectorySink, OutputSink, archive_format, open_sink
+
+
+class TestDirectorySink(unittest.TestCase):
+    """디렉터리 싱크 테스트 클래스"""
+
+    def setUp(self):
+        """테스트 준비"""
+        self._tmp = tempfile.TemporaryDirectory()
+        self.root = self._tmp.name
+        with open(os.path.join(self.root, 'index.html'), 'w', encoding='utf-8') as f:
+            f.write('old')
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def _read(self, rel_path):
+        with open(os.path.join(self.root, rel_path), 'r', encoding='utf-8') as f:
+            return f.read()
+
+    def test_commit_replaces_files(self):
+        """commit 전에는 기존 파일 유지, commit 후 새 내용으로 교체"""
+        sink = DirectorySink(self.root)
+        sink.write_text('index.html', 'new')
+        sink.write_text('static/app.js', 'js')
+        self.assertEqual(self._read('index.html'), 'old')
+        self.assertFalse(os.path.exists(os.path.join(self.root, 'static', 'app.js')))
+        sink.commit()
+        self.assertEqual(self._read('index.html'), 'new')
+        self.assertEqual(self._read('static/app.js'), 'js')
+        self.assertEqual([n for n in os.listdir(self.root) if n.endswith('.tmp')], [])
+
+    def test_abort_keeps_old_tree(self):
+        """abort하면 기존 트리는 그대로, 임시 파일은 삭제"""
+        sink = DirectorySink(self.root)
+        sink.write_text('index.html', 'new')
+        sink.abort()
+        self.assertEqual(self._read('index.html'), 'old')
+        self.assertEqual(os.listdir(self.root), ['index.html'])
+
+    def test_entries_cover_written_copied_and_kept_files(self):
+        """기록/복사/유지한 파일 모두 (SHA-256, 크기) 항목으로 남음"""
+        src = os.path.join(self.root, 'src.bin')
+        with open(src, 'wb') as f:
+            f.write(b'audio')
+        sink = DirectorySink(self.root)
+        sink.write_text('a.html', 'a')
+        self.assertEqual(sink.add_file('audio/x.mp3', src), 'copy')
+        sink.add_copy('audio/y.mp3', 'audio/x.mp3')
+        sink.keep('index.html')
+        sink.commit()
+        self.assertEqual(sink.entries, {
+            'a.html': (hashlib.sha256(b'a').hexdigest(), 1),
+            'audio/x.mp3': (hashlib.sha256(b'audio').hexdigest(), 5),
+            'audio/y.mp3': (hashlib.sha256(b'audio').hexdigest(), 5),
+            'index.html': (hashlib.sha256(b'old').hexdigest(), 3),
+        })
+        self.assertEqual(self._read('audio/y.mp3'), 'audio')
+
+    def test_remove_applies_on_commit(self):
+        """remove는 commit 때 반영, abort하면 취소"""
+        sink = DirectorySink(self.root)
+        sink.remove('index.html')
+        sink.abort()
+        self.assertTrue(os.path.exists(os.path.join(self.root, 'index.html')))
+        sink.remove('index.html')
+        sink.commit()
+        self.assertFalse(os.path.exists(os.path.join(self.root, 'index.html')))
+
+    def test_keep_stat_applies_on_commit(self):
+        """keep의 메타데이터 맞춤은 commit 때만 반영 (abort하면 기존 파일 그대로)"""
+        src = os.path.join(self.root, 'src.html')
+        with open(src, 'w', encoding='utf-8') as f:
+            f.write('old')
+        target = os.path.join(self.root, 'index.html')
+        os.utime(target, ns=(0, 1_000_000_000))
+        os.utime(src, ns=(0, 2_000_000_000))
+        sink = DirectorySink(self.root)
+        sink.keep('index.html', stat_src=src)
+        sink.abort()
+        self.assertEqual(os.stat(target).st_mtime_ns, 1_000_000_000)
+        sink.keep('index.html', stat_src=src)
+        self.assertEqual(os.stat(target).st_mtime_ns, 1_000_000_000)
+        sink.commit()
+        self.assertEqual(os.stat(target).st_mtime_ns, 2_000_000_000)
+
+    def test_hardlink_source_not_modified(self):
+        """하드 링크로 배치한 경로에 다시 쓰면 소스 파일은 그대로"""
+        src = os.path.join(self.root, 'src.txt')
+        with open(src, 'w', encoding='utf-8') as f:
+            f.write('source')
+        sink = DirectorySink(self.root, copy_mode='hardlink')
+        sink.add_file('out.txt', src)
+        sink.write_text('out.txt', 'replaced')
+        sink.commit()
+        self.assertEqual(self._read('src.txt'), 'source')
+        self.assertEqual(self._read('out.txt'), 'replaced')
+
+    def test_context_manager_aborts_on_error(self):
+        """with 블록이 예외로 끝나면 abort"""
+        with self.assertRaises(RuntimeError):
+            with DirectorySink(self.root) as sink:
+                sink.write_text('index.html', 'new')
+                raise RuntimeError('중단')
+        self.assertEqual(self._read('index.html'), 'old')
+
+
+class TestOutputSink(unittest.TestCase):
+    """출력 싱크 기본 클래스 테스트 클래스"""
+
+    def test_missing_hooks_fail_on_creation(self):
+        """write_bytes/commit/abort를 구현하지 않은 싱크는 생성 시점에 오류"""
+        class PartialSink(OutputSink):
+            def write_bytes(self, rel_path, data):
+                pass
+
+        with self.assertRaises(TypeError):
+            PartialSink()
+
+
+class TestArchiveSink(unittest.TestCase):
+    """아카이브 싱크 테스트 클래스"""
+
+    def setUp(self):
+        """테스트 준비"""
+        self._tmp = tempfile.TemporaryDirectory()
+        self.tmp_dir = self._tmp.name
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def test_archive_format(self):
+        """확장자로 형식 결정"""
+        self.assertEqual(archive_format('site.tgz'), '.tgz')
+        self.assertEqual(archive_format('site.tar.gz'), '.tar.gz')
+        self.assertIsNone(archive_format('site.rar'))
+        self.assertIsInstance(open_sink(self.tmp_dir), DirectorySink)
+
+    def test_commit_writes_entries(self):
+        """commit 후 아카이브 생성, 기록한 항목의 해시/크기 보관"""
+        path = os.path.join(self.tmp_dir, 'site.tar.gz')
+        with ArchiveSink(path) as sink:
+            sink.write_text('index.html', '목차')
+        self.assertFalse(os.path.exists(path + '.tmp'))
+        data = '목차'.encode('utf-8')
+        self.assertEqual(sink.entries['index.html'], (hashlib.sha256(data).hexdigest(), len(data)))
+        with tarfile.open(path) as tar:
+            self.assertEqual(tar.getnames(), ['index.html'])
+
+    def test_abort_keeps_previous_archive(self):
+        """abort하면 이전 아카이브를 그대로 두고 임시 파일 삭제"""
+        path = os.path.join(self.tmp_dir, 'site.zip')
+        with ArchiveSink(path) as sink:
+            sink.write_text('a.html', 'a')
+        sink = ArchiveSink(path)
+        sink.write_text('b.html', 'b')
+        sink.abort()
+        self.assertFalse(os.path.exists(path + '.tmp'))
+        with zipfile.ZipFile(path) as zf:
+            self.assertEqual(zf.namelist(), ['a.html'])
+
+    def test_duplicate_path_rejected(self):
+        """같은 경로를 두 번 쓰면 오류"""
+        sink = ArchiveSink(os.path.join(self.tmp_dir, 'site.tar'))
+        sink.write_text('a.html', 'a')
+        with self.assertRaises(ValueError):
+            sink.write_text('a.html', 'b')
+        sink.abort()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+PWA 빌더 모듈 테스트
+"""
+
+import unittest
+import os
+import sys
+import json
+import tempfile
+from pathlib import Path
+
+# 프로젝트 루트 경로 추가
+PROJECT_ROOT = Path(__file__).parent.parent.absolute()
+sys.path.append(str(PROJECT_ROOT))
+
+from src.pwa_builder import _book_slugs, build_precache_manifest, collect_shell_files, write_service_worker
+
+
+class TestPwaBuilder(unittest.TestCase):
+    """PWA 빌더 테스트 클래스"""
+
+    def setUp(self):
+        """테스트 준비"""
+        self._tmp = tempfile.TemporaryDirectory()
+        self.site_dir = self._tmp.name
+        self._write('index.html', '목차')
+        self._write('static/verse-style.css', 'css')
+        self._write('static/search/search-index.json', '[]')
+        self.template = os.path.join(PROJECT_ROOT, 'templates', 'sw.js')
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def _write(self, rel_path, text):
+        path = os.path.join(self.site_dir, *rel_path.split('/'))
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(text)
+
+    def test_collect_shell_files(self):
+        """목차/정적 자원/검색 인덱스 수집"""
+        self.assertEqual(collect_shell_files(self.site_dir), [
+            'index.html', 'static/verse-style.css', 'static/search/search-index.json'])
+
+    def test_precache_version_follows_content(self):
+        """내용이 같으면 버전이 같고, 바뀌면 버전도 바뀜 (없는 파일은 건너뜀)"""
+        files = ['index.html', 'missing.html']
+        first = build_precache_manifest(self.site_dir, files)
+        self.assertEqual(list(first["files"]), ['index.html'])
+        self.assertEqual(build_precache_manifest(self.site_dir, files)["version"], first["version"])
+        self._write('index.html', '새 목차')
+        self.assertNotEqual(build_precache_manifest(self.site_dir, files)["version"], first["version"])
+
+    def test_write_service_worker_prunes_old_manifests(self):
+        """sw.js에 버전을 새기고 이전 버전 매니페스트는 삭제"""
+        if not os.path.exists(self.template):
+            self.skipTest(f"템플릿 파일이 없습니다: {self.template}")
+        old = write_service_worker(self.site_dir, template_path=self.template)
+        self._write('index.html', '새 목차')
+        new = write_service_worker(self.site_dir, template_path=self.template)
+        manifests = sorted(n for n in os.listdir(self.site_dir) if n.startswith('precache-manifest.'))
+        self.assertEqual(manifests, [f"precache-manifest.{new['version']}.json"])
+        self.assertNotEqual(old["version"], new["version"])
+        with open(os.path.join(self.site_dir, 'sw.js'), 'r', encoding='utf-8') as f:
+            self.assertIn(new["version"], f.read())
+
+    def test_book_slugs_match_generator(self):
+        """배포 매핑 파일로 약칭/별칭을 생성기 장 파일명 슬러그로 변환"""
+        mappings = os.path.join(PROJECT_ROOT, 'data', 'book_mappings.json')
+        with open(mappings, 'r', encoding='utf-8') as f:
+            books = json.load(f)
+        self.assertEqual(_book_slugs(['아가', '창세기', '마태', '사무상'], mappings),
+                         ['song', 'genesis', 'matthew', '1samuel'])
+        # 모든 책이 알려진 책으로 해석되고 슬러그는 ASCII
+        slugs = _book_slugs([b.get('abbr') or b.get('약칭') for b in books], mappings)
+        self.assertEqual(len(slugs), len(books))
+        self.assertTrue(all(slug.isascii() and slug for slug in slugs))
+
+
+if __name__ == '__main__':
+    unittest.main()